@@ -10,13 +10,18 @@ from fastapi.responses import StreamingResponse
 from backend.models.pagination import Paginated, PaginationParams
 
 from ...services.academics import HiringService
+from ...services.export import ExportFormat
 
-from ...models.academics.hiring.application_review import HiringStatus
+from ...models.academics.hiring.application_review import (
+    ApplicationReviewCsvRow,
+    HiringStatus,
+)
 from ...models.academics.hiring.hiring_assignment import *
 from ...models.academics.hiring.hiring_level import *
 from ...models.academics.hiring.conflict_check import ConflictCheck
 
 from ...api.authentication import registered_user
+from ..export import export_response
 from ...models.user import User
 
 __authors__ = ["Ajay Gandecha"]
@@ -170,6 +175,8 @@ def get_hiring_summary_overview(
     page_size: int = 100,
     order_by: str = "",
     filter: str = "",
+    cursor: str | None = None,
+    count: bool = True,
     subject: User = Depends(registered_user),
     hiring_service: HiringService = Depends(),
 ) -> Paginated[HiringAssignmentSummaryOverview]:
@@ -177,7 +184,12 @@ def get_hiring_summary_overview(
     Returns the state of hiring as a summary.
     """
     pagination_params = PaginationParams(
-        page=page, page_size=page_size, order_by=order_by, filter=filter
+        page=page,
+        page_size=page_size,
+        order_by=order_by,
+        filter=filter,
+        cursor=cursor,
+        count=count,
     )
     return hiring_service.get_hiring_summary_overview(
         subject, term_id, pagination_params
@@ -193,21 +205,21 @@ def get_hiring_summary_csv(
     """
     Returns the state of hiring as a summary.
     """
-    # Get the data
-    data = hiring_service.get_hiring_summary_for_csv(subject, term_id)
-    # Create IO Stream
-    stream = io.StringIO()
-    # Create dictionary writer to convert objects to CSV rows
-    # Note: __dict__ converts the Pydantic model into a dictionary of key-value
-    # pairs, enabling access of the object's keys.
-    wr = csv.DictWriter(stream, delimiter=",", fieldnames=list(data[0].__dict__.keys()))
-    wr.writeheader()
-    wr.writerows([d.__dict__ for d in data])
-    # Create HTTP response of type `text/csv`
-    response = StreamingResponse(iter([stream.getvalue()]), media_type="text/csv")
-    response.headers["Content-Disposition"] = "attachment; filename=export.csv"
-    # Return the response
-    return response
+    return export_hiring_summary(term_id, ExportFormat.CSV, subject, hiring_service)
+
+
+@api.get("/summary/{term_id}/export", tags=["Hiring"])
+def export_hiring_summary(
+    term_id: str,
+    format: ExportFormat = ExportFormat.CSV,
+    subject: User = Depends(registered_user),
+    hiring_service: HiringService = Depends(),
+) -> StreamingResponse:
+    """
+    Streams the hires of a term as a CSV or NDJSON attachment.
+    """
+    rows = hiring_service.get_hiring_summary_for_csv(subject, term_id)
+    return export_response(rows, HiringAssignmentCsvRow, format, "export")
 
 
 @api.get("/{course_site_id}/csv", tags=["Hiring"])
@@ -219,21 +231,23 @@ def get_applicants_for_site_csv(
     """
     Returns the state of hiring as a summary.
     """
-    # Get the data
-    data = hiring_service.get_course_site_hiring_status_csv(subject, course_site_id)
-    # Create IO Stream
-    stream = io.StringIO()
-    # Create dictionary writer to convert objects to CSV rows
-    # Note: __dict__ converts the Pydantic model into a dictionary of key-value
-    # pairs, enabling access of the object's keys.
-    wr = csv.DictWriter(stream, delimiter=",", fieldnames=list(data[0].__dict__.keys()))
-    wr.writeheader()
-    wr.writerows([d.__dict__ for d in data])
-    # Create HTTP response of type `text/csv`
-    response = StreamingResponse(iter([stream.getvalue()]), media_type="text/csv")
-    response.headers["Content-Disposition"] = "attachment; filename=export.csv"
-    # Return the response
-    return response
+    return export_applicants_for_site(
+        course_site_id, ExportFormat.CSV, subject, hiring_service
+    )
+
+
+@api.get("/{course_site_id}/export", tags=["Hiring"])
+def export_applicants_for_site(
+    course_site_id: int,
+    format: ExportFormat = ExportFormat.CSV,
+    subject: User = Depends(registered_user),
+    hiring_service: HiringService = Depends(),
+) -> StreamingResponse:
+    """
+    Streams the applications to a course site as a CSV or NDJSON attachment.
+    """
+    rows = hiring_service.get_course_site_hiring_status_csv(subject, course_site_id)
+    return export_response(rows, ApplicationReviewCsvRow, format, "export")
 
 
 @api.get("/summary/{term_id}/phd_applicants", tags=["Hiring"])
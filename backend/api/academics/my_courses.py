@@ -3,8 +3,11 @@
 APIs relative to a specific user."""
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from ..authentication import registered_user
+from ..export import export_response
 from ...services.academics.course_site import CourseSiteService
+from ...services.export import ExportFormat
 
 from ...models.user import User
 
@@ -69,6 +72,8 @@ def get_course_site_roster(
     page_size: int = 10,
     order_by: str = "",
     filter: str = "",
+    cursor: str | None = None,
+    count: bool = True,
     subject: User = Depends(registered_user),
     course_site_svc: CourseSiteService = Depends(),
 ) -> Paginated[CourseMemberOverview]:
@@ -79,13 +84,37 @@ def get_course_site_roster(
         CourseRosterOverview
     """
     pagination_params = PaginationParams(
-        page=page, page_size=page_size, order_by=order_by, filter=filter
+        page=page,
+        page_size=page_size,
+        order_by=order_by,
+        filter=filter,
+        cursor=cursor,
+        count=count,
     )
     return course_site_svc.get_course_site_roster(
         subject, course_site_id, pagination_params
     )
 
 
+@api.get("/{course_site_id}/roster/export", tags=["My Courses"])
+def export_course_site_roster(
+    course_site_id: int,
+    format: ExportFormat = ExportFormat.CSV,
+    subject: User = Depends(registered_user),
+    course_site_svc: CourseSiteService = Depends(),
+) -> StreamingResponse:
+    """
+    Stream the roster of a course as a CSV or NDJSON attachment.
+
+    Returns:
+        StreamingResponse
+    """
+    rows = course_site_svc.get_course_site_roster_for_export(subject, course_site_id)
+    return export_response(
+        rows, CourseMemberOverview, format, f"course-site-{course_site_id}-roster"
+    )
+
+
 @api.get("/{course_site_id}/oh-events/current", tags=["My Courses"])
 def get_current_oh_events(
     course_site_id: int,
@@ -0,0 +1,42 @@
+"""This API is for administrative purposes only.
+
+Exposes the statistics recorded by `backend/request_profiler.py` for the worker process
+serving the request."""
+
+from fastapi import APIRouter, Depends
+from ...services import PermissionService
+from ..authentication import registered_user
+from ...models import User
+from ...models.request_profile import EndpointProfile
+from ...request_profiler import request_profiles
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+openapi_tags = {
+    "name": "(Admin) Profiling",
+    "description": "Inspect the SQL issued and the time taken by the requests of each route.",
+}
+
+api = APIRouter(prefix="/api/admin/profiling")
+
+
+@api.get("", tags=["(Admin) Profiling"])
+def get_endpoint_profiles(
+    subject: User = Depends(registered_user),
+    permission_service: PermissionService = Depends(),
+) -> list[EndpointProfile]:
+    """List the statistics of each route, the routes issuing the most statements first."""
+    permission_service.enforce(subject, "*", "*")
+    return request_profiles.profiles()
+
+
+@api.delete("", tags=["(Admin) Profiling"])
+def reset_endpoint_profiles(
+    subject: User = Depends(registered_user),
+    permission_service: PermissionService = Depends(),
+) -> None:
+    """Clear the statistics of every route."""
+    permission_service.enforce(subject, "*", "*")
+    request_profiles.reset()
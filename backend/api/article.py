@@ -1,10 +1,13 @@
 """Articles API"""
 
 from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..api.authentication import registered_user
+from ..api.authentication import registered_user, async_registered_user
+from ..database import async_db_session
 
 from ..services.article import ArticleService
+from ..services.async_bridge import run_service
 
 from ..models import User
 from ..models.articles import WelcomeOverview, ArticleOverview, ArticleDraft
@@ -22,19 +25,28 @@ openapi_tags = {
 
 
 @api.get("/welcome", tags=["Articles"])
-def get_welcome_status(
-    subject: User = Depends(registered_user), article_svc: ArticleService = Depends()
+async def get_welcome_status(
+    subject: User = Depends(async_registered_user),
+    session: AsyncSession = Depends(async_db_session),
 ) -> WelcomeOverview:
     """Retrieves the welcome status."""
-    return article_svc.get_welcome_overview(subject)
+    return await run_service(
+        session,
+        ArticleService,
+        lambda article_svc: article_svc.get_welcome_overview(subject),
+    )
 
 
 @api.get("/welcome/unauthenticated", tags=["Articles"])
-def get_welcome_status_unauthenticated(
-    article_svc: ArticleService = Depends(),
+async def get_welcome_status_unauthenticated(
+    session: AsyncSession = Depends(async_db_session),
 ) -> WelcomeOverview:
     """Retrieves the welcome status for an unauthenticated user."""
-    return article_svc.get_welcome_overview(None)
+    return await run_service(
+        session,
+        ArticleService,
+        lambda article_svc: article_svc.get_welcome_overview(None),
+    )
 
 
 @api.get("/list", tags=["Articles"])
@@ -66,8 +66,11 @@ from fastapi.exceptions import HTTPException
 from fastapi.security import HTTPBearer
 from fastapi.security.http import HTTPAuthorizationCredentials
 from fastapi.responses import RedirectResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import async_db_session
 from ..env import getenv
 from ..services import UserService, GitHubService
+from ..services.async_bridge import run_service
 from ..models import User
 
 
@@ -84,16 +87,44 @@ _JST_ALGORITHM = "HS256"
 
 
 def registered_user(
+    request: Request,
     user_service: UserService = Depends(),
     token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
 ) -> User:
-    """Returns the authenticated user or raises a 401 HTTPException if the user is not authenticated."""
+    """Returns the authenticated user or raises a 401 HTTPException if the user is not authenticated.
+
+    Recently resolved users are served from a process-wide cache. The number of queries the
+    cache avoided for the request is recorded in `request.state.avoided_queries`."""
+    if token:
+        try:
+            auth_info = jwt.decode(
+                token.credentials, _JWT_SECRET, algorithms=[_JST_ALGORITHM]
+            )
+            user, avoided_queries = user_service.get_cached(auth_info["pid"])
+            request.state.avoided_queries = avoided_queries
+            if user:
+                return user
+        except:
+            ...
+    raise HTTPException(status_code=401, detail="Unauthorized")
+
+
+async def async_registered_user(
+    request: Request,
+    session: AsyncSession = Depends(async_db_session),
+    token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
+) -> User:
+    """The `registered_user` dependency of `async def` routes, which resolves users on the
+    asyncio engine rather than in FastAPI's threadpool."""
     if token:
         try:
             auth_info = jwt.decode(
                 token.credentials, _JWT_SECRET, algorithms=[_JST_ALGORITHM]
             )
-            user = user_service.get(auth_info["pid"])
+            user, avoided_queries = await run_service(
+                session, UserService, lambda svc: svc.get_cached(auth_info["pid"])
+            )
+            request.state.avoided_queries = avoided_queries
             if user:
                 return user
         except:
@@ -3,7 +3,10 @@
 This API is used to retrieve and update a user's profile."""
 
 from fastapi import APIRouter, Depends
-from ..authentication import registered_user
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..authentication import async_registered_user
+from ...database import async_db_session
+from ...services.async_bridge import run_service
 from ...services.coworking import StatusService
 from ...models import User
 from ...models.coworking import Status
@@ -21,13 +24,21 @@ openapi_tags = {
 
 
 @api.get("", response_model=Status, tags=["Coworking"])
-def get_coworking_status(
-    subject: User = Depends(registered_user), status_svc: StatusService = Depends()
+async def get_coworking_status(
+    subject: User = Depends(async_registered_user),
+    session: AsyncSession = Depends(async_db_session),
 ):
     """Status endpoint supports the primary screen of the coworking features.
 
     It returns information about upcoming, active reservations the subject holds.
     It also fetches the current seat availability of the XL during operating hours.
     Finally, it provides a list of upcoming hours.
+
+    Every student on the XL status page polls this endpoint, so it is served from the
+    asyncio engine rather than FastAPI's threadpool.
     """
-    return status_svc.get_coworking_status(subject)
+    return await run_service(
+        session,
+        StatusService,
+        lambda status_svc: status_svc.get_coworking_status(subject),
+    )
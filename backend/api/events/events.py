@@ -3,20 +3,26 @@
 Event routes are used to create, retrieve, and update Events."""
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Sequence
 from backend.models.public_user import PublicUser
 from backend.models.pagination import EventPaginationParams, Paginated, PaginationParams
 
 from backend.services.organization import OrganizationService
 
+from ...database import async_db_session
+from ...services.async_bridge import run_service
+from ...services.export import ExportFormat
 from ...services.event import EventService
 from ...services.user import UserService
 from ...services.exceptions import ResourceNotFoundException, UserPermissionException
 from ...models.event import EventDraft, EventOverview, EventStatusOverview
 from ...models.coworking.time_range import TimeRange
-from ...api.authentication import registered_user
+from ...api.authentication import registered_user, async_registered_user
 from ...models.user import User
+from ..export import export_response
 
 __authors__ = [
     "Ajay Gandecha",
@@ -36,13 +42,15 @@ openapi_tags = {
 
 
 @api.get("/unauthenticated/paginate", tags=["Events"])
-def list_events(
-    event_service: EventService = Depends(),
+async def list_events(
+    session: AsyncSession = Depends(async_db_session),
     order_by: str = "time",
     ascending: str = "true",
     filter: str = "",
     range_start: str = "",
     range_end: str = "",
+    cursor: str | None = None,
+    count: bool = True,
 ) -> Paginated[EventOverview]:
     """List events in time range via standard backend pagination query parameters."""
 
@@ -52,19 +60,29 @@ def list_events(
         filter=filter,
         range_start=range_start,
         range_end=range_end,
+        cursor=cursor,
+        count=count,
+    )
+    return await run_service(
+        session,
+        EventService,
+        lambda event_service: event_service.get_paginated_events(
+            pagination_params, None
+        ),
     )
-    return event_service.get_paginated_events(pagination_params, None)
 
 
 @api.get("/paginate", tags=["Events"])
-def list_events(
-    subject: User = Depends(registered_user),
-    event_service: EventService = Depends(),
+async def list_events(
+    subject: User = Depends(async_registered_user),
+    session: AsyncSession = Depends(async_db_session),
     order_by: str = "time",
     ascending: str = "true",
     filter: str = "",
     range_start: str = "",
     range_end: str = "",
+    cursor: str | None = None,
+    count: bool = True,
 ) -> Paginated[EventOverview]:
     """List events in time range via standard backend pagination query parameters."""
 
@@ -74,8 +92,16 @@ def list_events(
         filter=filter,
         range_start=range_start,
         range_end=range_end,
+        cursor=cursor,
+        count=count,
+    )
+    return await run_service(
+        session,
+        EventService,
+        lambda event_service: event_service.get_paginated_events(
+            pagination_params, subject
+        ),
     )
-    return event_service.get_paginated_events(pagination_params, subject)
 
 
 @api.get("/unauthenticated/status", tags=["Events"])
@@ -289,6 +315,8 @@ def get_registered_users_of_event(
     page_size: int = 10,
     order_by: str = "first_name",
     filter: str = "",
+    cursor: str | None = None,
+    count: bool = True,
 ) -> Paginated[User]:
     """
         List registered users for an event via standard backend pagination query parameters.
@@ -303,10 +331,41 @@ def get_registered_users_of_event(
     """
     try:
         pagination_params = PaginationParams(
-            page=page, page_size=page_size, order_by=order_by, filter=filter
+            page=page,
+            page_size=page_size,
+            order_by=order_by,
+            filter=filter,
+            cursor=cursor,
+            count=count,
         )
         return event_service.get_registered_users_of_event(
             subject, event_id, pagination_params
         )
     except UserPermissionException as e:
         raise HTTPException(status_code=403, detail=str(e))
+
+
+@api.get("/{event_id}/registrations/export", tags=["Events"])
+def export_registered_users_of_event(
+    event_id: int,
+    format: ExportFormat = ExportFormat.CSV,
+    subject: User = Depends(registered_user),
+    event_service: EventService = Depends(),
+) -> StreamingResponse:
+    """
+    Stream the registered users of an event as a CSV or NDJSON attachment.
+
+    Args:
+        event_id: an int representing a unique Event
+        format: the format of the export
+        subject: a valid User model representing the currently logged in User
+        event_service: a valid EventService
+
+    Returns:
+        StreamingResponse: The registered users, written as they are fetched
+    """
+    try:
+        rows = event_service.get_registered_users_of_event_for_export(subject, event_id)
+    except UserPermissionException as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    return export_response(rows, PublicUser, format, f"event-{event_id}-registrations")
@@ -0,0 +1,40 @@
+"""Streaming responses of large exports.
+
+See `backend/services/export.py`."""
+
+from typing import Iterable
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from ..services.export import ExportFormat, write_rows
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+def export_response(
+    rows: Iterable[BaseModel],
+    model: type[BaseModel],
+    format: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    """Stream rows as a CSV or NDJSON attachment, writing them as they are fetched.
+
+    Args:
+        rows (Iterable[BaseModel]): The rows of the export, see `stream_rows`.
+        model (type[BaseModel]): The model of the rows.
+        format (ExportFormat): The format of the export.
+        filename (str): The name of the attachment, without an extension.
+
+    Returns:
+        StreamingResponse
+    """
+    response = StreamingResponse(
+        write_rows(rows, model, format), media_type=format.media_type
+    )
+    response.headers["Content-Disposition"] = (
+        f"attachment; filename={filename}.{format.value}"
+    )
+    return response
@@ -3,8 +3,8 @@
 Production systems monitor these end points upon deployment, and at regular intervals, to ensure the service is running.
 """
 
-
 from fastapi import APIRouter, Depends
+from ..models.pool_status import PoolStatus
 from ..services.health import HealthService
 
 
@@ -23,3 +23,8 @@ api = APIRouter(prefix="/api/health")
 @api.get("", tags=["System Health"])
 def health_check(health_svc: HealthService = Depends()) -> str:
     return health_svc.check()
+
+
+@api.get("/pool", tags=["System Health"])
+def pool_status(health_svc: HealthService = Depends()) -> PoolStatus:
+    return health_svc.pool_status()
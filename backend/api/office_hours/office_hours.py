@@ -1,11 +1,29 @@
 """Office Hours API
 
 APIs handling office hours.
+
+The queue and get help overviews may also be streamed as server-sent events, which push each
+change of the queue to the client rather than the client polling for it. Streams hold no
+database connection between changes, see `services/office_hours/queue_channel.py`.
 """
 
-from fastapi import APIRouter, Depends
-from ..authentication import registered_user
+import json
+from typing import AsyncIterator, Callable
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..authentication import registered_user, async_registered_user
+from ...database import async_db_session, async_engine
+from ...services.async_bridge import run_service
+from ...services.exceptions import CoursePermissionException
 from ...services.office_hours.office_hours import OfficeHoursService
+from ...services.office_hours.queue_channel import (
+    HEARTBEAT_SECONDS,
+    QueueSubscription,
+    queue_hub,
+)
 from ...models.user import User
 from ...models.office_hours.office_hours import OfficeHours, NewOfficeHours
 from ...models.academics.my_courses import (
@@ -22,10 +40,10 @@ api = APIRouter(prefix="/api/office-hours")
 
 
 @api.get("/{id}/queue", tags=["Office Hours"])
-def get_office_hours_queue(
+async def get_office_hours_queue(
     id: int,
-    subject: User = Depends(registered_user),
-    oh_event_svc: OfficeHoursService = Depends(),
+    subject: User = Depends(async_registered_user),
+    session: AsyncSession = Depends(async_db_session),
 ) -> OfficeHourQueueOverview:
     """
     Gets the queue overview for an office hour event.
@@ -33,7 +51,35 @@ def get_office_hours_queue(
     Returns:
         OfficeHourQueueOverview
     """
-    return oh_event_svc.get_office_hour_queue(subject, id)
+    return await run_service(
+        session,
+        OfficeHoursService,
+        lambda oh_event_svc: oh_event_svc.get_office_hour_queue(subject, id),
+    )
+
+
+@api.get("/{id}/queue/events", tags=["Office Hours"])
+async def stream_office_hours_queue(
+    id: int,
+    request: Request,
+    subject: User = Depends(async_registered_user),
+    session: AsyncSession = Depends(async_db_session),
+) -> StreamingResponse:
+    """
+    Streams the queue overview for an office hour event as server-sent events.
+
+    The first `overview` event is an OfficeHourQueueOverview, and each later `change`
+    event holds the fields of the overview which changed.
+
+    Returns:
+        StreamingResponse
+    """
+    return await _stream_overview(
+        request,
+        session,
+        id,
+        lambda oh_event_svc: oh_event_svc.get_office_hour_queue(subject, id),
+    )
 
 
 @api.get("/{id}/role", tags=["Office Hours"])
@@ -66,6 +112,32 @@ def get_office_hours_help(
     return oh_event_svc.get_office_hour_get_help_overview(subject, id)
 
 
+@api.get("/{id}/get-help/events", tags=["Office Hours"])
+async def stream_office_hours_help(
+    id: int,
+    request: Request,
+    subject: User = Depends(async_registered_user),
+    session: AsyncSession = Depends(async_db_session),
+) -> StreamingResponse:
+    """
+    Streams information about getting help in office hours as server-sent events.
+
+    The first `overview` event is an OfficeHourGetHelpOverview, and each later `change`
+    event holds the fields of the overview which changed.
+
+    Returns:
+        StreamingResponse
+    """
+    return await _stream_overview(
+        request,
+        session,
+        id,
+        lambda oh_event_svc: oh_event_svc.get_office_hour_get_help_overview(
+            subject, id
+        ),
+    )
+
+
 @api.post("/{site_id}", tags=["Office Hours"])
 def create_office_hours(
     site_id: int,
@@ -122,3 +194,64 @@ def get_office_hours(
     Gets office hours.
     """
     return oh_event_svc.get(subject, site_id, oh_id)
+
+
+async def _stream_overview(
+    request: Request,
+    session: AsyncSession,
+    office_hours_id: int,
+    load: Callable[[OfficeHoursService], BaseModel],
+) -> StreamingResponse:
+    # Subscribe before loading the first overview, so that no change goes unnoticed
+    subscription = queue_hub.subscribe(office_hours_id)
+    try:
+        overview = await run_service(session, OfficeHoursService, load)
+    except:
+        subscription.close()
+        raise
+    return StreamingResponse(
+        _overview_events(request, subscription, overview, load),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _overview_events(
+    request: Request,
+    subscription: QueueSubscription,
+    overview: BaseModel,
+    load: Callable[[OfficeHoursService], BaseModel],
+) -> AsyncIterator[str]:
+    previous = overview.model_dump(mode="json")
+    try:
+        yield _server_sent_event("overview", previous)
+        while not await request.is_disconnected():
+            changed = await subscription.wait(HEARTBEAT_SECONDS)
+            if not changed and queue_hub.broker.reaches_other_processes:
+                yield ": heartbeat\n\n"
+                continue
+
+            # Without a broker reaching other processes, changes committed by other
+            # workers are only noticed by re-checking the queue at each heartbeat
+            async with AsyncSession(async_engine, expire_on_commit=False) as session:
+                try:
+                    current = await run_service(session, OfficeHoursService, load)
+                except CoursePermissionException:
+                    return
+            current = current.model_dump(mode="json")
+            changes = {
+                field: value
+                for field, value in current.items()
+                if previous.get(field) != value
+            }
+            previous = current
+            if len(changes) > 0:
+                yield _server_sent_event("change", changes)
+            else:
+                yield ": heartbeat\n\n"
+    finally:
+        subscription.close()
+
+
+def _server_sent_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
@@ -1,17 +1,25 @@
-"""SQLAlchemy DB Engine and Session niceties for FastAPI dependency injection."""
+"""SQLAlchemy DB Engine and Session niceties for FastAPI dependency injection.
+
+Alongside the synchronous engine and `db_session` used by most services, an asyncio engine and
+`async_db_session` serve hot read paths from `async def` routes without occupying a thread of
+FastAPI's threadpool while waiting on the database. See `backend/services/async_bridge.py`.
+"""
 
 import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session
 from .env import getenv
+from .pool_monitor import MonitoredAsyncAdaptedQueuePool, MonitoredQueuePool
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
-def _engine_str(database: str = getenv("POSTGRES_DATABASE")) -> str:
+def _engine_str(
+    database: str = getenv("POSTGRES_DATABASE"), dialect: str = "postgresql+psycopg2"
+) -> str:
     """Helper function for reading settings from environment variables to produce connection string."""
-    dialect = "postgresql+psycopg2"
     user = getenv("POSTGRES_USER")
     password = getenv("POSTGRES_PASSWORD")
     host = getenv("POSTGRES_HOST")
@@ -24,9 +32,60 @@ def _in_production() -> bool:
     return getenv("MODE") == "production"
 
 
-engine = sqlalchemy.create_engine(_engine_str(), echo=not _in_production())
+def _getenv_bool(variable: str, default: bool) -> bool:
+    return getenv(variable, str(default)).lower() in ("1", "true", "yes", "on")
+
+
+def _engine_options(asynchronous: bool = False) -> dict:
+    """Helper function for reading optional connection pool settings from environment variables.
+
+    The settings apply to the pools of both the synchronous and asyncio engines.
+
+    Settings and their defaults:
+        POSTGRES_POOL_SIZE (5): Connections kept open in the pool of each worker process.
+        POSTGRES_MAX_OVERFLOW (10): Additional connections opened when the pool is exhausted.
+        POSTGRES_POOL_TIMEOUT (30): Seconds to wait for a connection before giving up.
+        POSTGRES_POOL_RECYCLE (-1): Seconds after which connections are replaced; -1 never.
+        POSTGRES_POOL_PRE_PING (false): Test connections for liveness upon checkout.
+        POSTGRES_STATEMENT_TIMEOUT (0): Milliseconds a statement may run; 0 is unlimited.
+        POSTGRES_ECHO (true outside of production): Log every SQL statement.
+    """
+    options = {
+        "poolclass": (
+            MonitoredAsyncAdaptedQueuePool if asynchronous else MonitoredQueuePool
+        ),
+        "pool_size": int(getenv("POSTGRES_POOL_SIZE", "5")),
+        "max_overflow": int(getenv("POSTGRES_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(getenv("POSTGRES_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(getenv("POSTGRES_POOL_RECYCLE", "-1")),
+        "pool_pre_ping": _getenv_bool("POSTGRES_POOL_PRE_PING", False),
+        "echo": _getenv_bool("POSTGRES_ECHO", not _in_production()),
+    }
+    statement_timeout = int(getenv("POSTGRES_STATEMENT_TIMEOUT", "0"))
+    if statement_timeout > 0:
+        if asynchronous:
+            options["connect_args"] = {
+                "server_settings": {"statement_timeout": str(statement_timeout)}
+            }
+        else:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={statement_timeout}"
+            }
+    return options
+
+
+engine = sqlalchemy.create_engine(_engine_str(), **_engine_options())
 """Application-level SQLAlchemy database engine."""
 
+async_engine = create_async_engine(
+    _engine_str(dialect="postgresql+asyncpg"), **_engine_options(asynchronous=True)
+)
+"""Application-level SQLAlchemy asyncio database engine. It connects lazily upon first use."""
+
+SLOW_CHECKOUT_MS = float(getenv("POSTGRES_SLOW_CHECKOUT_MS", "100"))
+engine.pool.monitor.slow_checkout_ms = SLOW_CHECKOUT_MS
+async_engine.pool.monitor.slow_checkout_ms = SLOW_CHECKOUT_MS
+
 
 def db_session():
     """Generator function offering dependency injection of SQLAlchemy Sessions."""
@@ -35,3 +94,12 @@ def db_session():
         yield session
     finally:
         session.close()
+
+
+async def async_db_session():
+    """Generator function offering dependency injection of SQLAlchemy AsyncSessions."""
+    session = AsyncSession(async_engine, expire_on_commit=False)
+    try:
+        yield session
+    finally:
+        await session.close()
@@ -4,6 +4,7 @@ from datetime import datetime
 from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .entity_base import EntityBase
+from .search import search_document, trigram_index
 from typing import Self
 from ..models.articles import ArticleState, ArticleOverview, ArticleDraft
 from sqlalchemy import Enum as SQLAlchemyEnum
@@ -19,6 +20,7 @@ class ArticleEntity(EntityBase):
 
     # Name for the article table in the PostgreSQL database
     __tablename__ = "article"
+    __table_args__ = (trigram_index("article_search_text_trgm_idx"),)
 
     # Article properties (columns in the database table)
 
@@ -46,6 +48,10 @@ class ArticleEntity(EntityBase):
     is_announcement: Mapped[bool] = mapped_column(
         Boolean, nullable=False, default=False
     )
+    # Lower-cased title and synopsis of the article, searched by `services.search`
+    search_text: Mapped[str] = mapped_column(
+        Text, search_document("title", "synopsis"), deferred=True
+    )
 
     # Organization connected to this article.
     # NOTE: This defines a one-to-many relationship between the organization and articles tables.
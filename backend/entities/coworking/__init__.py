@@ -2,3 +2,4 @@ from .operating_hours_entity import OperatingHoursEntity
 from .reservation_entity import ReservationEntity
 from .reservation_seat_table import reservation_seat_table
 from .seat_entity import SeatEntity
+from .room_usage_entity import RoomUsageEntity
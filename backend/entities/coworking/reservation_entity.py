@@ -20,6 +20,7 @@ class ReservationEntity(EntityBase):
     __tablename__ = "coworking__reservation"
     __table_args__ = (
         Index("coworking__reservation_time_idx", "start", "end", "state", unique=False),
+        Index("coworking__reservation_updated_at_idx", "updated_at", unique=False),
     )
 
     # Reservation Model Fields
@@ -0,0 +1,26 @@
+"""Entity for the ledger of the study room time each user has reserved per week."""
+
+from datetime import date, timedelta
+from sqlalchemy import Date, ForeignKey, Integer, Interval
+from sqlalchemy.orm import Mapped, mapped_column
+from ..entity_base import EntityBase
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+class RoomUsageEntity(EntityBase):
+    """The study room time a user has reserved in the calendar week starting on a Monday.
+
+    Maintained by ReservationService as reservations are drafted and change state, so that
+    a quota check reads a single row by its primary key, and reconciled with the reservations
+    by RoomUsageService#reconcile."""
+
+    __tablename__ = "coworking__room_usage"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("user.id"), primary_key=True
+    )
+    week: Mapped[date] = mapped_column(Date, primary_key=True)
+    reserved: Mapped[timedelta] = mapped_column(Interval, nullable=False)
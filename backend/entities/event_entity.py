@@ -1,13 +1,15 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Events."""
 
-from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..models.event import EventOverview
 from .entity_base import EntityBase
+from .search import search_document, trigram_index
 from typing import Self
 from ..models.event import EventOverview, EventDraft
 from ..models.registration_type import RegistrationType
 from ..models.user import User
+from ..models.public_user import PublicUser
 
 from datetime import datetime
 
@@ -21,6 +23,7 @@ class EventEntity(EntityBase):
 
     # Name for the events table in the PostgreSQL database
     __tablename__ = "event"
+    __table_args__ = (trigram_index("event_search_text_trgm_idx"),)
 
     # Event properties (columns in the database table)
 
@@ -40,10 +43,19 @@ class EventEntity(EntityBase):
     public: Mapped[bool] = mapped_column(Boolean)
     # Maximim number of people who can register for the event
     registration_limit: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Number of attendees registered for the event, maintained by `EventService` in the
+    # same transaction as the registrations themselves
+    registered_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     # URL for the image for an event.
     image_url: Mapped[str] = mapped_column(String, nullable=True)
     # This field provides a registration URL if external registration is used.
     override_registration_url: Mapped[str] = mapped_column(String, nullable=True)
+    # Lower-cased name and description of the event, searched by `services.search`
+    search_text: Mapped[str] = mapped_column(
+        Text, search_document("name", "description"), deferred=True
+    )
 
     # Organization hosting the event
     # NOTE: This defines a one-to-many relationship between the organization and events tables.
@@ -80,43 +92,34 @@ class EventEntity(EntityBase):
         )
 
     def to_overview_model(self, subject: User | None = None) -> EventOverview:
-        """Creates an overview model from an event."""
-        attendees = [
-            registration.to_flat_model()
-            for registration in self.registrations
-            if registration.registration_type == RegistrationType.ATTENDEE
-        ]
-
-        user_registration = (
-            [
-                registration
-                for registration in self.registrations
-                if registration.user_id == subject.id
-            ][0]
-            if subject is not None
-            and len(
-                [
-                    registration
-                    for registration in self.registrations
-                    if registration.user_id == subject.id
-                ]
-            )
-            > 0
-            else None
-        )
-
-        # Hide organizer info for unauthenticated users
-        organizer_registrations = [
-            registration
-            for registration in self.registrations
-            if registration.registration_type == RegistrationType.ORGANIZER
-        ]
+        """Creates an overview model from an event.
 
-        organizers = [
-            registration.user.to_public_model()
-            for registration in organizer_registrations
-        ]
+        Loads the event's registrations and organizers. Listings of many events should use
+        `EventService`, which loads them for a whole page at once.
+        """
+        organizers: list[PublicUser] = []
+        user_registration_type: RegistrationType | None = None
+        for registration in self.registrations:
+            if registration.registration_type == RegistrationType.ORGANIZER:
+                organizers.append(registration.user.to_public_model())
+            if subject is not None and registration.user_id == subject.id:
+                user_registration_type = registration.registration_type
+
+        return self.to_overview_model_with(organizers, user_registration_type)
+
+    def to_overview_model_with(
+        self,
+        organizers: list[PublicUser],
+        user_registration_type: RegistrationType | None,
+    ) -> EventOverview:
+        """Creates an overview model from an event and its preloaded organizers.
 
+        Parameters:
+            - organizers (list[PublicUser]): The organizers of the event
+            - user_registration_type (RegistrationType | None): The subject's registration
+        Returns:
+            EventOverview: The overview of the event
+        """
         return EventOverview(
             id=self.id,
             name=self.name,
@@ -126,15 +129,13 @@ class EventEntity(EntityBase):
             description=self.description,
             public=self.public,
             registration_limit=self.registration_limit,
-            number_registered=len(attendees),
+            number_registered=self.registered_count,
             organization_slug=self.organization.slug,
             organization_icon=self.organization.logo,
             organization_name=self.organization.shorthand,
             organization_id=self.organization.id,
             organizers=organizers,
-            user_registration_type=(
-                user_registration.registration_type if user_registration else None
-            ),
+            user_registration_type=user_registration_type,
             image_url=self.image_url,
             override_registration_url=self.override_registration_url,
         )
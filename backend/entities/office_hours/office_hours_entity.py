@@ -54,6 +54,11 @@ class OfficeHoursEntity(EntityBase):
     start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     # Time the event ends
     end_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # Version of the event's queue, incremented whenever its tickets change
+    # NOTE: Used to invalidate cached queue snapshots, see `services/office_hours/queue_snapshot.py`
+    queue_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     # NOTE: Many-to-one relationship of OfficeHoursEvents to OH section
     course_site_id: Mapped[int] = mapped_column(
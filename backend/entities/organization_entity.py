@@ -1,8 +1,9 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Organizations."""
 
-from sqlalchemy import Integer, String, Boolean
+from sqlalchemy import Integer, String, Boolean, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .entity_base import EntityBase
+from .search import search_document, trigram_index
 from typing import Self
 from ..models.organization import Organization
 from ..models.organization_details import OrganizationDetails
@@ -17,6 +18,7 @@ class OrganizationEntity(EntityBase):
 
     # Name for the organizations table in the PostgreSQL database
     __tablename__ = "organization"
+    __table_args__ = (trigram_index("organization_search_text_trgm_idx"),)
 
     # Organization properties (columns in the database table)
 
@@ -48,6 +50,10 @@ class OrganizationEntity(EntityBase):
     heel_life: Mapped[str] = mapped_column(String)
     # Whether the organization can be joined by anyone or not
     public: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    # Lower-cased name, shorthand and slug of the organization, searched by `services.search`
+    search_text: Mapped[str] = mapped_column(
+        Text, search_document("name", "shorthand", "slug"), deferred=True
+    )
 
     # NOTE: This field establishes a one-to-many relationship between the organizations and events table.
     events: Mapped[list["EventEntity"]] = relationship(
@@ -0,0 +1,69 @@
+"""Search documents of entities and the trigram indexes that serve substring queries on them.
+
+Searchable entities declare a `search_text` column generated by PostgreSQL from the columns
+users search by, lower-cased and joined by spaces, along with a `trigram_index` over it. With
+the pg_trgm extension, a GIN trigram index turns `search_text LIKE '%query%'` into an index
+scan rather than a sequential scan of every row.
+
+pg_trgm ships with PostgreSQL's contrib modules. Where it is not available, tables are created
+without trigram indexes and searches fall back to sequential scans with the same results.
+"""
+
+from sqlalchemy import Computed, DDL, Index, event, text
+
+from .entity_base import EntityBase
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+def search_document(*expressions: str) -> Computed:
+    """The stored, generated value of a `search_text` column.
+
+    Args:
+        *expressions (str): SQL expressions of the entity's searchable columns.
+
+    Returns:
+        Computed: The lower-cased concatenation of expressions, separated by spaces.
+    """
+    document = " || ' ' || ".join(
+        f"coalesce({expression}, '')" for expression in expressions
+    )
+    return Computed(f"lower({document})", persisted=True)
+
+
+def trigram_index(name: str, column: str = "search_text") -> Index:
+    """A GIN trigram index of column, created only when pg_trgm is available."""
+    return Index(
+        name,
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    ).ddl_if(callable_=_pg_trgm_installed)
+
+
+def pg_trgm_available(connection) -> bool:
+    """Whether the database server can install the pg_trgm extension."""
+    return (
+        connection.execute(
+            text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        ).first()
+        is not None
+    )
+
+
+def _pg_trgm_installed(ddl, target, bind, **kw) -> bool:
+    return (
+        bind is not None
+        and bind.execute(
+            text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        ).first()
+        is not None
+    )
+
+
+@event.listens_for(EntityBase.metadata, "before_create")
+def _create_pg_trgm(target, connection, **kw) -> None:
+    if pg_trgm_available(connection):
+        connection.execute(DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
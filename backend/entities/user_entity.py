@@ -1,12 +1,13 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Users."""
 
-from sqlalchemy import Boolean, Integer, String
+from sqlalchemy import Boolean, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Self
 
 from backend.entities.academics.section_member_entity import SectionMemberEntity
 from backend.models.academics.section_member import SectionMember
 from .entity_base import EntityBase
+from .search import search_document, trigram_index
 from .user_role_table import user_role_table
 from ..models import User, PublicUser
 from .article_author_entity import article_author_table
@@ -21,6 +22,7 @@ class UserEntity(EntityBase):
 
     # Name for the user table in the PostgreSQL database
     __tablename__ = "user"
+    __table_args__ = (trigram_index("user_search_text_trgm_idx"),)
 
     # Unique ID for the user entry
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -54,6 +56,12 @@ class UserEntity(EntityBase):
     linkedin: Mapped[str | None] = mapped_column(String(), nullable=True)
     # Website of the user
     website: Mapped[str | None] = mapped_column(String(), nullable=True)
+    # Lower-cased name, onyen, email and PID of the user, searched by `services.search`
+    search_text: Mapped[str] = mapped_column(
+        Text,
+        search_document("first_name", "last_name", "onyen", "email", "pid::text"),
+        deferred=True,
+    )
 
     # All of the roles for the given user.
     # NOTE: This field establishes a many-to-many relationship between the users and roles table.
@@ -1,11 +1,18 @@
 """Entrypoint of backend API exposing the FastAPI `app` to be served by an application server such as uvicorn."""
 
+import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.gzip import GZipMiddleware
 
 from backend.services.coworking.reservation import ReservationException
+from backend.services.coworking.reservation_sweeper import run_reservation_sweeper
+from backend.services.coworking.room_usage import run_room_usage_reconciler
+from backend.services.office_hours.queue_channel import queue_hub
+from .env import getenv
+from .request_profiler import ProfilingMiddleware
 
 from .api.events import events
 
@@ -29,12 +36,14 @@ from .api.office_hours import (
 from .api.admin import users as admin_users
 from .api.admin import roles as admin_roles
 from .api.admin import facts as admin_facts
+from .api.admin import profiling as admin_profiling
 
 from .services.exceptions import (
     UserPermissionException,
     ResourceNotFoundException,
     CoursePermissionException,
     CourseDataScrapingException,
+    InvalidCursorException,
 )
 
 __authors__ = ["Kris Jordan"]
@@ -45,8 +54,41 @@ description = """
 Welcome to the UNC Computer Science **Experience Labs** RESTful Application Programming Interface.
 """
 
+RESERVATION_SWEEP_INTERVAL = float(getenv("RESERVATION_SWEEP_INTERVAL", "60"))
+"""Seconds between sweeps of expired reservations; 0 disables the in-process sweeper."""
+
+ROOM_USAGE_RECONCILE_INTERVAL = float(getenv("ROOM_USAGE_RECONCILE_INTERVAL", "3600"))
+"""Seconds between reconciliations of the weekly study room ledger; 0 disables them."""
+
+SERVER_TIMING = getenv("SERVER_TIMING", "false").lower() == "true"
+"""Whether responses carry a Server-Timing header of their database and handler time."""
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the reservation sweeper and room usage reconciler in the background and the
+    office hours queue hub's broker for the lifetime of the app."""
+    tasks = []
+    if RESERVATION_SWEEP_INTERVAL > 0:
+        tasks.append(
+            asyncio.create_task(run_reservation_sweeper(RESERVATION_SWEEP_INTERVAL))
+        )
+    if ROOM_USAGE_RECONCILE_INTERVAL > 0:
+        tasks.append(
+            asyncio.create_task(
+                run_room_usage_reconciler(ROOM_USAGE_RECONCILE_INTERVAL)
+            )
+        )
+    await queue_hub.start()
+    yield
+    await queue_hub.stop()
+    for task in tasks:
+        task.cancel()
+
+
 # Metadata to improve the usefulness of OpenAPI Docs /docs API Explorer
 app = FastAPI(
+    lifespan=lifespan,
     title="UNC CS Experience Labs API",
     version="0.0.1",
     description=description,
@@ -66,6 +108,7 @@ app = FastAPI(
         my_courses.openapi_tags,
         hiring.openapi_tags,
         admin_facts.openapi_tags,
+        admin_profiling.openapi_tags,
         article.openapi_tags,
     ],
 )
@@ -73,6 +116,9 @@ app = FastAPI(
 # Use GZip middleware for compressing HTML responses over the network
 app.add_middleware(GZipMiddleware)
 
+# Record the statements and time of every request by route, see `request_profiler.py`
+app.add_middleware(ProfilingMiddleware, server_timing=SERVER_TIMING)
+
 # Plugging in each of the router APIs
 feature_apis = [
     status,
@@ -98,6 +144,7 @@ feature_apis = [
     office_hours_ticket,
     hiring,
     admin_facts,
+    admin_profiling,
     article,
 ]
 
@@ -133,6 +180,11 @@ def resource_not_found_exception_handler(
     return JSONResponse(status_code=500, content={"message": str(e)})
 
 
+@app.exception_handler(InvalidCursorException)
+def invalid_cursor_exception_handler(request: Request, e: InvalidCursorException):
+    return JSONResponse(status_code=400, content={"message": str(e)})
+
+
 # Add feature-specific exception handling middleware
 from .api import coworking
 from .api import events
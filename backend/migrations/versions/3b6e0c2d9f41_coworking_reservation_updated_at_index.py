@@ -0,0 +1,32 @@
+"""Index coworking reservations by updated_at for incremental seat availability syncs.
+
+Revision ID: 3b6e0c2d9f41
+Revises: 684f2df8b00e
+Create Date: 2024-10-18 10:12:41.530211
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3b6e0c2d9f41"
+down_revision = "684f2df8b00e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "coworking__reservation_updated_at_idx",
+        "coworking__reservation",
+        ["updated_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "coworking__reservation_updated_at_idx", table_name="coworking__reservation"
+    )
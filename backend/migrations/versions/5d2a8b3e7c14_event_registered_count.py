@@ -0,0 +1,39 @@
+"""Add a maintained registered_count column to events.
+
+Revision ID: 5d2a8b3e7c14
+Revises: 9c1f4e7a2b58
+Create Date: 2024-10-20 14:02:36.918203
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5d2a8b3e7c14"
+down_revision = "9c1f4e7a2b58"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "event",
+        sa.Column("registered_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        UPDATE event
+        SET registered_count = (
+            SELECT count(*)
+            FROM event_registration
+            WHERE event_registration.event_id = event.id
+            AND event_registration.registration_type = 'ATTENDEE'
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("event", "registered_count")
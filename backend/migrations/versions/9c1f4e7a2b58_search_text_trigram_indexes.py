@@ -0,0 +1,66 @@
+"""Add generated search_text columns with trigram indexes to users, events, organizations and articles.
+
+Revision ID: 9c1f4e7a2b58
+Revises: 3b6e0c2d9f41
+Create Date: 2024-10-19 09:41:17.204816
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "9c1f4e7a2b58"
+down_revision = "3b6e0c2d9f41"
+branch_labels = None
+depends_on = None
+
+
+SEARCH_DOCUMENTS = {
+    "user": ("first_name", "last_name", "onyen", "email", "pid::text"),
+    "event": ("name", "description"),
+    "organization": ("name", "shorthand", "slug"),
+    "article": ("title", "synopsis"),
+}
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    pg_trgm = (
+        connection.execute(
+            sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        ).first()
+        is not None
+    )
+    if pg_trgm:
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for table, expressions in SEARCH_DOCUMENTS.items():
+        document = " || ' ' || ".join(
+            f"coalesce({expression}, '')" for expression in expressions
+        )
+        op.add_column(
+            table,
+            sa.Column(
+                "search_text",
+                sa.Text(),
+                sa.Computed(f"lower({document})", persisted=True),
+                nullable=False,
+            ),
+        )
+        if pg_trgm:
+            op.create_index(
+                f"{table}_search_text_trgm_idx",
+                table,
+                ["search_text"],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={"search_text": "gin_trgm_ops"},
+            )
+
+
+def downgrade() -> None:
+    for table in SEARCH_DOCUMENTS:
+        op.execute(f'DROP INDEX IF EXISTS "{table}_search_text_trgm_idx"')
+        op.drop_column(table, "search_text")
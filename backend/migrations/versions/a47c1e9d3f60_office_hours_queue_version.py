@@ -0,0 +1,28 @@
+"""Add queue_version to office hours events for versioned queue snapshots.
+
+Revision ID: a47c1e9d3f60
+Revises: 5d2a8b3e7c14
+Create Date: 2024-10-21 11:27:54.603118
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a47c1e9d3f60"
+down_revision = "5d2a8b3e7c14"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "office_hours",
+        sa.Column("queue_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("office_hours", "queue_version")
@@ -0,0 +1,51 @@
+"""Add the weekly ledger of study room time reserved by each user.
+
+Revision ID: d2c5f8a1b7e3
+Revises: a47c1e9d3f60
+Create Date: 2024-10-28 09:14:37.250118
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d2c5f8a1b7e3"
+down_revision = "a47c1e9d3f60"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "coworking__room_usage",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("week", sa.Date(), nullable=False),
+        sa.Column("reserved", sa.Interval(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id", "week"),
+    )
+    # Backfill the current and future weeks, as RoomUsageService#reconcile does
+    op.execute(
+        """
+        INSERT INTO coworking__room_usage (user_id, week, reserved)
+        SELECT reservation_user.user_id,
+               date_trunc('week', reservation.start)::date,
+               sum(reservation.end - reservation.start)
+        FROM coworking__reservation AS reservation
+        JOIN coworking__reservation_user AS reservation_user
+          ON reservation_user.reservation_id = reservation.id
+        WHERE reservation.room_id IS NOT NULL
+          AND reservation.state IN ('DRAFT', 'CONFIRMED', 'CHECKED_IN', 'CHECKED_OUT')
+          AND reservation.start >= date_trunc('week', now())
+        GROUP BY 1, 2
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("coworking__room_usage")
@@ -13,6 +13,7 @@ from .reservation import (
     ReservationMapDetails,
     ReservationOverview,
     ReservationIdentity,
+    ReservationSweep,
 )
 
 from .availability_list import AvailabilityList
@@ -30,6 +31,7 @@ __all__ = [
     "ReservationRequest",
     "ReservationPartial",
     "ReservationIdentity",
+    "ReservationSweep",
     "AvailabilityList",
     "RoomAvailability",
     "SeatAvailability",
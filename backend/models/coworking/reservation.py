@@ -68,3 +68,12 @@ class ReservationDetails(Reservation):
     extendable: bool = False
     extendable_at: datetime | None
     extendable_until: datetime | None
+
+
+class ReservationSweep(BaseModel):
+    """Counts of the time-based transitions made by one sweep of expired reservations."""
+
+    drafts_cancelled: int = 0
+    unclaimed_cancelled: int = 0
+    checked_out: int = 0
+    swept_at: datetime
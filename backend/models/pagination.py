@@ -11,12 +11,19 @@ T = TypeVar("T")
 
 
 class PaginationParams(BaseModel):
-    """Parameters passed from the client to paginate results."""
+    """Parameters passed from the client to paginate results.
+
+    Pages are selected by `page` unless `cursor` is set, in which case the page following the
+    cursor is returned: pass "" for the first page and then each page's `next_cursor`. When
+    `count` is False, the length of the results may be served from a recent count.
+    """
 
     page: int = 0
     page_size: int = 10
     order_by: str = ""
     filter: str = ""
+    cursor: str | None = None
+    count: bool = True
 
 
 class EventPaginationParams(PaginationParams):
@@ -34,4 +41,5 @@ class Paginated(BaseModel, Generic[T]):
 
     items: list[T]
     length: int
+    next_cursor: str | None = None
     params: PaginationParams | EventPaginationParams
@@ -0,0 +1,32 @@
+"""Models of the database connection pool's health."""
+
+from pydantic import BaseModel
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+class CheckoutLatencyBucket(BaseModel):
+    """Number of checkouts that took at most `le_ms` milliseconds; None is unbounded."""
+
+    le_ms: float | None
+    count: int
+
+
+class PoolStatus(BaseModel):
+    """Gauges of the connection pool and statistics of its checkouts since startup."""
+
+    size: int
+    max_overflow: int
+    in_use: int
+    idle: int
+    overflow: int
+    peak_in_use: int = 0
+    checkouts: int = 0
+    timeouts: int = 0
+    slow_checkouts: int = 0
+    slow_checkout_ms: float | None = None
+    checkout_ms_sum: float = 0.0
+    checkout_ms_max: float = 0.0
+    checkout_latency: list[CheckoutLatencyBucket] = []
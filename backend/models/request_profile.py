@@ -0,0 +1,33 @@
+"""Models of the SQL issued and time taken by the requests of each API route."""
+
+from pydantic import BaseModel
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+class RepeatedStatement(BaseModel):
+    """A statement issued more than once within single requests of a route.
+
+    Repeats typically are the signature of lazy loads issued once per row (N+1 queries).
+    """
+
+    statement: str
+    requests: int
+    max_per_request: int
+
+
+class EndpointProfile(BaseModel):
+    """Statistics of the requests of a route, labeled by method and path template."""
+
+    route: str
+    requests: int
+    statements: int
+    statements_max: int
+    duplicate_statements: int
+    db_ms_sum: float
+    db_ms_max: float
+    handler_ms_sum: float
+    handler_ms_max: float
+    repeated_statements: list[RepeatedStatement] = []
@@ -0,0 +1,140 @@
+"""Connection pool instrumentation for the application's SQLAlchemy engine.
+
+The engine in `backend/database.py` uses a MonitoredQueuePool. It times every connection
+checkout into a latency histogram, counts pool timeouts and logs slow checkouts with the
+pool's state, so that workers waiting on connections are visible through the health API.
+"""
+
+import bisect
+import logging
+import time
+from threading import Lock
+
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection, QueuePool
+
+from .models.pool_status import CheckoutLatencyBucket, PoolStatus
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+logger = logging.getLogger(__name__)
+
+CHECKOUT_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+"""Upper bounds, in milliseconds, of the checkout latency histogram's buckets."""
+
+
+class PoolMonitor:
+    """Checkout latency histogram and counters of one connection pool."""
+
+    def __init__(self, slow_checkout_ms: float = 100.0):
+        """Initialize a monitor with empty statistics.
+
+        Args:
+            slow_checkout_ms (float): Checkouts slower than this many milliseconds are logged.
+        """
+        self.slow_checkout_ms = slow_checkout_ms
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all statistics."""
+        with self._lock:
+            self._buckets = [0] * (len(CHECKOUT_BUCKETS_MS) + 1)
+            self._checkouts = 0
+            self._timeouts = 0
+            self._slow_checkouts = 0
+            self._sum_ms = 0.0
+            self._max_ms = 0.0
+            self._peak_in_use = 0
+
+    def observe(self, pool: QueuePool, elapsed_ms: float) -> None:
+        """Record a successful checkout from pool that took elapsed_ms."""
+        in_use = pool.checkedout()
+        with self._lock:
+            self._buckets[bisect.bisect_left(CHECKOUT_BUCKETS_MS, elapsed_ms)] += 1
+            self._checkouts += 1
+            self._sum_ms += elapsed_ms
+            self._max_ms = max(self._max_ms, elapsed_ms)
+            self._peak_in_use = max(self._peak_in_use, in_use)
+            slow = elapsed_ms >= self.slow_checkout_ms
+            if slow:
+                self._slow_checkouts += 1
+        if slow:
+            logger.warning(
+                "Slow connection checkout: %.1f ms (in use %d of %d, overflow %d of %d)",
+                elapsed_ms,
+                in_use,
+                pool.size(),
+                max(pool.overflow(), 0),
+                pool._max_overflow,
+            )
+
+    def observe_timeout(self, pool: QueuePool, elapsed_ms: float) -> None:
+        """Record a checkout from pool that timed out after elapsed_ms."""
+        with self._lock:
+            self._timeouts += 1
+        logger.error(
+            "Connection checkout timed out after %.1f ms (in use %d of %d, overflow %d of %d)",
+            elapsed_ms,
+            pool.checkedout(),
+            pool.size(),
+            max(pool.overflow(), 0),
+            pool._max_overflow,
+        )
+
+    def status(self, pool: QueuePool) -> PoolStatus:
+        """Current gauges of pool along with the monitor's statistics."""
+        with self._lock:
+            cumulative = 0
+            histogram: list[CheckoutLatencyBucket] = []
+            for upper, count in zip(CHECKOUT_BUCKETS_MS + (None,), self._buckets):
+                cumulative += count
+                histogram.append(CheckoutLatencyBucket(le_ms=upper, count=cumulative))
+            return PoolStatus(
+                size=pool.size(),
+                max_overflow=pool._max_overflow,
+                in_use=pool.checkedout(),
+                idle=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                peak_in_use=self._peak_in_use,
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                slow_checkouts=self._slow_checkouts,
+                slow_checkout_ms=self.slow_checkout_ms,
+                checkout_ms_sum=round(self._sum_ms, 3),
+                checkout_ms_max=round(self._max_ms, 3),
+                checkout_latency=histogram,
+            )
+
+
+class MonitoredQueuePool(QueuePool):
+    """A QueuePool that reports every checkout to its PoolMonitor.
+
+    Use it as the `poolclass` of `create_engine`. The monitor is carried over when the engine
+    recreates its pool, for example on `Engine.dispose()`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.monitor = PoolMonitor()
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except TimeoutError:
+            self.monitor.observe_timeout(self, (time.perf_counter() - start) * 1000)
+            raise
+        self.monitor.observe(self, (time.perf_counter() - start) * 1000)
+        return connection
+
+    def recreate(self) -> "MonitoredQueuePool":
+        pool = super().recreate()
+        pool.monitor = self.monitor
+        return pool
+
+
+class MonitoredAsyncAdaptedQueuePool(MonitoredQueuePool, AsyncAdaptedQueuePool):
+    """The MonitoredQueuePool of engines created with `create_async_engine`."""
@@ -0,0 +1,230 @@
+"""Per-request SQL and latency profiling of the API.
+
+The ProfilingMiddleware around `app` in `backend/main.py` opens a RequestProfile for every
+HTTP request. Listeners of every SQLAlchemy Engine's `before_cursor_execute` and
+`after_cursor_execute` events attribute statements to the profile of the request issuing them
+through a context variable, which propagates into the threadpool running synchronous routes and
+into `AsyncSession.run_sync`. Once the response is sent, the profile is recorded in the
+process-wide `request_profiles` under the route's method and path template, which the
+`/api/admin/profiling` API exposes. Statistics are kept per worker process.
+
+Statements are counted by their SQL, whose parameters are placeholders, so a statement issued
+repeatedly within one request, such as a lazy load per row, is reported as a repeated statement.
+Optionally, responses carry a `Server-Timing` header of their database and handler time.
+"""
+
+import time
+from collections import Counter
+from contextvars import ContextVar
+from threading import Lock
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .models.request_profile import EndpointProfile, RepeatedStatement
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+UNMATCHED_ROUTE = "(unmatched)"
+"""Path of requests not routed to an API route, such as static files."""
+
+
+class RequestProfile:
+    """The statements issued and time taken by one request."""
+
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.handler_seconds = 0.0
+        self.signatures: Counter[str] = Counter()
+
+    def observe(self, statement: str, seconds: float) -> None:
+        """Record a statement that took seconds to execute."""
+        self.statements += 1
+        self.db_seconds += seconds
+        self.signatures[statement] += 1
+
+    @property
+    def duplicates(self) -> int:
+        """The number of statements repeating one issued earlier in the request."""
+        return self.statements - len(self.signatures)
+
+    def server_timing(self) -> str:
+        """The value of a `Server-Timing` header of the request's database and handler time."""
+        return (
+            f'db;dur={self.db_seconds * 1000:.1f};desc="{self.statements} statements", '
+            f"app;dur={self.handler_seconds * 1000:.1f}"
+        )
+
+
+_current_profile: ContextVar[RequestProfile | None] = ContextVar(
+    "request_profile", default=None
+)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _current_profile.get() is not None:
+        context._profile_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    started = getattr(context, "_profile_started", None)
+    if profile is not None and started is not None:
+        profile.observe(statement, time.perf_counter() - started)
+
+
+class _EndpointStats:
+    """Accumulated statistics of the requests of one route."""
+
+    def __init__(self):
+        self.requests = 0
+        self.statements = 0
+        self.statements_max = 0
+        self.duplicates = 0
+        self.db_seconds = 0.0
+        self.db_seconds_max = 0.0
+        self.handler_seconds = 0.0
+        self.handler_seconds_max = 0.0
+        self.repeated: dict[str, list[int]] = {}
+        """Requests repeating, and the most repeats within a request of, each statement."""
+
+
+class RequestProfiles:
+    """Statistics of the requests of every route, accumulated from RequestProfiles."""
+
+    def __init__(self, repeated_statements: int = 50):
+        """Initialize empty statistics.
+
+        Args:
+            repeated_statements (int): The maximum number of distinct repeated statements
+                retained for each route.
+        """
+        self._repeated_statements = repeated_statements
+        self._lock = Lock()
+        self._routes: dict[str, _EndpointStats] = {}
+
+    def record(self, route: str, profile: RequestProfile) -> None:
+        """Add the profile of a request to the statistics of its route."""
+        with self._lock:
+            stats = self._routes.get(route)
+            if stats is None:
+                stats = self._routes[route] = _EndpointStats()
+            stats.requests += 1
+            stats.statements += profile.statements
+            stats.statements_max = max(stats.statements_max, profile.statements)
+            stats.duplicates += profile.duplicates
+            stats.db_seconds += profile.db_seconds
+            stats.db_seconds_max = max(stats.db_seconds_max, profile.db_seconds)
+            stats.handler_seconds += profile.handler_seconds
+            stats.handler_seconds_max = max(
+                stats.handler_seconds_max, profile.handler_seconds
+            )
+            for statement, count in profile.signatures.items():
+                if count < 2:
+                    continue
+                repeated = stats.repeated.get(statement)
+                if repeated is None:
+                    if len(stats.repeated) >= self._repeated_statements:
+                        continue
+                    repeated = stats.repeated[statement] = [0, 0]
+                repeated[0] += 1
+                repeated[1] = max(repeated[1], count)
+
+    def profiles(self) -> list[EndpointProfile]:
+        """The statistics of every route, the routes issuing the most statements first."""
+        with self._lock:
+            profiles = [
+                EndpointProfile(
+                    route=route,
+                    requests=stats.requests,
+                    statements=stats.statements,
+                    statements_max=stats.statements_max,
+                    duplicate_statements=stats.duplicates,
+                    db_ms_sum=round(stats.db_seconds * 1000, 3),
+                    db_ms_max=round(stats.db_seconds_max * 1000, 3),
+                    handler_ms_sum=round(stats.handler_seconds * 1000, 3),
+                    handler_ms_max=round(stats.handler_seconds_max * 1000, 3),
+                    repeated_statements=sorted(
+                        (
+                            RepeatedStatement(
+                                statement=statement,
+                                requests=requests,
+                                max_per_request=max_per_request,
+                            )
+                            for statement, (
+                                requests,
+                                max_per_request,
+                            ) in stats.repeated.items()
+                        ),
+                        key=lambda repeated: -repeated.max_per_request,
+                    ),
+                )
+                for route, stats in self._routes.items()
+            ]
+        return sorted(profiles, key=lambda profile: -profile.statements)
+
+    def reset(self) -> None:
+        """Clear the statistics of every route."""
+        with self._lock:
+            self._routes.clear()
+
+
+request_profiles = RequestProfiles()
+"""Process-wide RequestProfiles recorded by the ProfilingMiddleware of `app`."""
+
+
+def route_label(scope: Scope) -> str:
+    """The method and path template of the route a request was routed to."""
+    path = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+    return f"{scope['method']} {path}"
+
+
+class ProfilingMiddleware:
+    """ASGI middleware recording the RequestProfile of every HTTP request."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        server_timing: bool = False,
+        profiles: RequestProfiles = request_profiles,
+    ):
+        """Wrap app.
+
+        Args:
+            app (ASGIApp): The application to profile.
+            server_timing (bool): Add a `Server-Timing` header to every response.
+            profiles (RequestProfiles): The statistics to record profiles in.
+        """
+        self.app = app
+        self.server_timing = server_timing
+        self.profiles = profiles
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                profile.handler_seconds = time.perf_counter() - started
+                if self.server_timing:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", profile.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_profile.reset(token)
+            self.profiles.record(route_label(scope), profile)
@@ -0,0 +1,72 @@
+"""Shared helpers for backend benchmark scripts.
+
+Benchmarks run against a dedicated `{POSTGRES_DATABASE}_benchmark` database that is
+dropped and recreated on every run, so they never disturb development data.
+
+Usage: python3 -m backend.script.benchmarks.<benchmark>
+"""
+
+import statistics
+import sys
+import time
+from typing import Callable
+
+import sqlalchemy
+from sqlalchemy import Engine
+
+from ...database import _engine_str
+from ...env import getenv
+from ... import entities
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+BENCHMARK_DATABASE = f'{getenv("POSTGRES_DATABASE")}_benchmark'
+
+
+def require_development_mode() -> None:
+    """Exit unless the backend is configured for development, like other scripts."""
+    if getenv("MODE") != "development":
+        print("This script can only be run in development mode.", file=sys.stderr)
+        print(
+            "Add MODE=development to your .env file in workspace's `backend/` directory"
+        )
+        exit(1)
+
+
+def benchmark_engine() -> Engine:
+    """Recreate the benchmark database with an empty schema and return an engine for it."""
+    server = sqlalchemy.create_engine(_engine_str(""))
+    with server.connect() as connection:
+        # Hack: CREATE/DROP DATABASE cannot run inside a transaction.
+        connection.execute(sqlalchemy.text("COMMIT"))
+        connection.execute(
+            sqlalchemy.text(f"DROP DATABASE IF EXISTS {BENCHMARK_DATABASE}")
+        )
+        connection.execute(sqlalchemy.text(f"CREATE DATABASE {BENCHMARK_DATABASE}"))
+    server.dispose()
+
+    engine = sqlalchemy.create_engine(_engine_str(BENCHMARK_DATABASE))
+    entities.EntityBase.metadata.create_all(engine)
+    return engine
+
+
+def measure(fn: Callable[[], object], repeat: int = 20) -> dict[str, float]:
+    """Time repeated calls of fn after one warm-up call.
+
+    Returns:
+        dict[str, float]: The median, p95 and max latency in milliseconds.
+    """
+    fn()
+    samples: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        "max_ms": round(samples[-1], 3),
+    }
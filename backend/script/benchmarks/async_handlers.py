@@ -0,0 +1,210 @@
+"""Load benchmark of the read endpoints served from the asyncio engine.
+
+Seeds the benchmark database with the demo data of `reset_demo`, serves this module's `app`
+with uvicorn, and drives each endpoint at a fixed concurrency through two handlers: the
+previous synchronous `def` handler, which FastAPI runs in its threadpool on the psycopg2
+engine, and the production `async def` handler on the asyncpg engine.
+
+Usage: python3 -m backend.script.benchmarks.async_handlers [--workers W] [--concurrency C]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+import jwt
+from fastapi import Depends, FastAPI
+from sqlalchemy.orm import Session
+
+from ...api import article
+from ...api.authentication import registered_user
+from ...api.coworking import status
+from ...api.office_hours import office_hours
+from ...env import getenv
+from ...models import User
+from ...services.article import ArticleService
+from ...services.coworking import StatusService
+from ...services.office_hours.office_hours import OfficeHoursService
+from ...test.services import role_data, user_data, permission_data, room_data
+from ...test.services.organization import organization_demo_data
+from ...test.services.event import event_demo_data
+from ...test.services.coworking import seat_data, operating_hours_data, time as times
+from ...test.services.coworking.reservation import reservation_data
+from ...test.services.academics import course_data, term_data, section_data
+from ...test.services.office_hours import office_hours_data
+from ...test.services.academics.hiring import hiring_data
+from ...test.services.articles import article_data
+from . import BENCHMARK_DATABASE, benchmark_engine, require_development_mode
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+PORT = 1570
+DURATION = 10.0
+"""Seconds each endpoint and handler is driven for."""
+
+app = FastAPI()
+app.include_router(status.api)
+app.include_router(article.api)
+app.include_router(office_hours.api)
+
+
+@app.get("/sync/coworking/status")
+def sync_coworking_status(
+    subject: User = Depends(registered_user), status_svc: StatusService = Depends()
+):
+    return status_svc.get_coworking_status(subject)
+
+
+@app.get("/sync/articles/welcome")
+def sync_welcome_status(
+    subject: User = Depends(registered_user), article_svc: ArticleService = Depends()
+):
+    return article_svc.get_welcome_overview(subject)
+
+
+@app.get("/sync/office-hours/{id}/queue")
+def sync_office_hours_queue(
+    id: int,
+    subject: User = Depends(registered_user),
+    oh_event_svc: OfficeHoursService = Depends(),
+):
+    return oh_event_svc.get_office_hour_queue(subject, id)
+
+
+def token(user: User) -> str:
+    return jwt.encode(
+        {"pid": user.pid, "uid": user.id}, getenv("JWT_SECRET"), algorithm="HS256"
+    )
+
+
+ENDPOINTS = {
+    "coworking_status": (
+        "/api/coworking/status",
+        "/sync/coworking/status",
+        user_data.user,
+    ),
+    "welcome": ("/api/articles/welcome", "/sync/articles/welcome", user_data.user),
+    "office_hours_queue": (
+        f"/api/office-hours/{office_hours_data.comp_110_current_office_hours.id}/queue",
+        f"/sync/office-hours/{office_hours_data.comp_110_current_office_hours.id}/queue",
+        user_data.instructor,
+    ),
+}
+
+
+def seed() -> None:
+    engine = benchmark_engine()
+    with Session(engine) as session:
+        time = times.time_data()
+        role_data.insert_fake_data(session)
+        user_data.insert_fake_data(session)
+        permission_data.insert_fake_data(session)
+        organization_demo_data.insert_fake_data(session)
+        event_demo_data.insert_fake_data(session)
+        operating_hours_data.insert_fake_data(session, time)
+        seat_data.insert_fake_data(session)
+        room_data.insert_fake_data(session)
+        reservation_data.insert_fake_data(session, time)
+        course_data.insert_fake_data(session)
+        term_data.insert_fake_data(session)
+        section_data.insert_fake_data(session)
+        office_hours_data.insert_fake_data(session)
+        hiring_data.insert_fake_data(session)
+        article_data.insert_fake_data(session)
+        session.commit()
+    engine.dispose()
+
+
+async def drive(
+    client: httpx.AsyncClient, path: str, user: User, concurrency: int
+) -> dict:
+    headers = {"Authorization": f"Bearer {token(user)}"}
+    samples: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + DURATION
+
+    async def worker():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            samples.append((time.perf_counter() - start) * 1000)
+            if response.status_code != 200:
+                errors += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    samples.sort()
+    return {
+        "requests_per_second": round(len(samples) / DURATION, 1),
+        "p50_ms": round(statistics.median(samples), 3),
+        "p99_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))], 3),
+        "errors": errors,
+    }
+
+
+async def run(concurrency: int) -> dict:
+    results: dict[str, dict] = {}
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{PORT}", limits=limits, timeout=60
+    ) as client:
+        for name, (async_path, sync_path, user) in ENDPOINTS.items():
+            results[name] = {
+                "sync": await drive(client, sync_path, user, concurrency),
+                "async": await drive(client, async_path, user, concurrency),
+            }
+    return results
+
+
+def wait_until_ready(server: subprocess.Popen) -> None:
+    while server.poll() is None:
+        try:
+            httpx.get(f"http://127.0.0.1:{PORT}/api/articles/welcome/unauthenticated")
+            return
+        except httpx.TransportError:
+            time.sleep(0.25)
+    raise RuntimeError("uvicorn exited before accepting requests")
+
+
+if __name__ == "__main__":
+    require_development_mode()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    seed()
+    environment = os.environ | {
+        "POSTGRES_DATABASE": BENCHMARK_DATABASE,
+        "POSTGRES_ECHO": "false",
+        "RESERVATION_SWEEP_INTERVAL": "0",
+    }
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "backend.script.benchmarks.async_handlers:app",
+            "--port",
+            str(PORT),
+            "--workers",
+            str(args.workers),
+            "--log-level",
+            "warning",
+        ],
+        env=environment,
+    )
+    try:
+        wait_until_ready(server)
+        print(json.dumps(asyncio.run(run(args.concurrency)), indent=2))
+    finally:
+        server.terminate()
+        server.wait()
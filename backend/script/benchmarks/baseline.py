@@ -0,0 +1,255 @@
+"""Benchmark of the API's key service entry points on synthetic data, recorded as a baseline.
+
+Loads the demo data plus the synthetic data of `script.synthetic_data` at a preset scale, then
+times each entry point and counts the statements it issues, with the process-wide caches of
+their results cleared before every call so that the database work is measured. The results
+are written to a JSON baseline along with the commit and scale they were measured at. Given
+the baseline of an earlier commit, entry points whose median latency grew by more than the
+threshold, or which issue more statements, are reported and fail the run.
+
+Usage: python3 -m backend.script.benchmarks.baseline [--preset small] [--output baseline.json]
+    [--compare previous.json] [--threshold 0.2]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from dataclasses import asdict
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from . import benchmark_engine, measure, require_development_mode
+from ..reset_demo import insert_demo_data
+from ..synthetic_data import generate, parse_scale, scale_arguments
+from ...entities import UserEntity
+from ...entities.academics import SectionEntity, SectionMemberEntity
+from ...entities.coworking.reservation_user_table import reservation_user_table
+from ...entities.office_hours import OfficeHoursEntity, OfficeHoursTicketEntity
+from ...entities.section_application_table import section_application_table
+from ...models import EventPaginationParams
+from ...models.pagination import PaginationParams
+from ...models.roster_role import RosterRole
+from ...services import ArticleService, EventService, UserService
+from ...services.academics import HiringService, SectionService
+from ...services.academics.course_site import CourseSiteService
+from ...services.async_bridge import build_service
+from ...services.coworking import ReservationService, StatusService
+from ...services.coworking.seat_availability_engine import seat_availability_engine
+from ...services.office_hours import OfficeHoursService
+from ...services.office_hours.queue_snapshot import queue_snapshot_cache
+from ...services.pagination import length_cache
+from ...services.welcome_cache import welcome_cache
+from ...test.services import user_data
+from ...test.services.academics import term_data
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+REPEAT = 20
+
+
+def invalidate_caches() -> None:
+    """Clear the process-wide caches of service results."""
+    length_cache.invalidate()
+    queue_snapshot_cache.invalidate()
+    seat_availability_engine.invalidate()
+    welcome_cache.invalidate()
+
+
+def count_statements(session: Session, fn: Callable[[], object]) -> int:
+    """The number of statements fn issues."""
+    statements = 0
+
+    def record(*args):
+        nonlocal statements
+        statements += 1
+
+    event.listen(session.get_bind(), "before_cursor_execute", record)
+    try:
+        fn()
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", record)
+    return statements
+
+
+def busiest_member(session: Session, role: RosterRole, site_id: int | None = None):
+    """The member with the most memberships in the given role, optionally of a course site."""
+    query = (
+        select(SectionMemberEntity.user_id)
+        .where(SectionMemberEntity.member_role == role)
+        .group_by(SectionMemberEntity.user_id)
+        .order_by(func.count().desc(), SectionMemberEntity.user_id)
+        .limit(1)
+    )
+    if site_id is not None:
+        query = query.join(SectionEntity).where(SectionEntity.course_site_id == site_id)
+    return session.get(UserEntity, session.scalars(query).one()).to_model()
+
+
+def entry_points(session: Session) -> dict[str, Callable[[], object]]:
+    """The entry points benchmarked, each called as the user who loads the most data."""
+    now = datetime.now()
+    term_id = term_data.current_term.id
+    root = user_data.root
+
+    hiring_site_id = session.scalars(
+        select(SectionEntity.course_site_id)
+        .join(
+            section_application_table,
+            section_application_table.c.section_id == SectionEntity.id,
+        )
+        .group_by(SectionEntity.course_site_id)
+        .order_by(func.count().desc())
+        .limit(1)
+    ).one()
+    office_hours = session.execute(
+        select(OfficeHoursEntity.id, OfficeHoursEntity.course_site_id)
+        .join(OfficeHoursTicketEntity)
+        .where(OfficeHoursEntity.end_time > now)
+        .group_by(OfficeHoursEntity.id)
+        .order_by(func.count().desc())
+        .limit(1)
+    ).one()
+    reserver = session.get(
+        UserEntity,
+        session.scalars(
+            select(reservation_user_table.c.user_id)
+            .group_by(reservation_user_table.c.user_id)
+            .order_by(func.count().desc(), reservation_user_table.c.user_id)
+            .limit(1)
+        ).one(),
+    ).to_model()
+    student = busiest_member(session, RosterRole.STUDENT)
+    hiring_instructor = busiest_member(session, RosterRole.INSTRUCTOR, hiring_site_id)
+    oh_instructor = busiest_member(
+        session, RosterRole.INSTRUCTOR, office_hours.course_site_id
+    )
+
+    article_svc = build_service(ArticleService, session)
+    course_site_svc = build_service(CourseSiteService, session)
+    event_svc = build_service(EventService, session)
+    hiring_svc = build_service(HiringService, session)
+    oh_svc = build_service(OfficeHoursService, session)
+    reservation_svc = build_service(ReservationService, session)
+    section_svc = build_service(SectionService, session)
+    status_svc = build_service(StatusService, session)
+    user_svc = build_service(UserService, session)
+
+    return {
+        "coworking_status": lambda: status_svc.get_coworking_status(reserver),
+        "reservation_map": lambda: reservation_svc.get_map_reserved_times_by_date(
+            now, reserver
+        ),
+        "welcome_overview": lambda: article_svc.get_welcome_overview(reserver),
+        "events_page": lambda: event_svc.get_paginated_events(
+            EventPaginationParams(page_size=50), root
+        ),
+        "users_search": lambda: user_svc.list(
+            root, PaginationParams(page_size=50, filter="synth1")
+        ),
+        "sections_by_term": lambda: section_svc.get_by_term(term_id),
+        "user_course_sites": lambda: course_site_svc.get_user_course_sites(student),
+        "office_hours_queue": lambda: oh_svc.get_office_hour_queue(
+            oh_instructor, office_hours.id
+        ),
+        "hiring_status": lambda: hiring_svc.get_status(
+            hiring_instructor, hiring_site_id
+        ),
+        "hiring_admin_overview": lambda: hiring_svc.get_hiring_admin_overview(
+            root, term_id
+        ),
+    }
+
+
+def run(args: argparse.Namespace) -> dict:
+    scale = parse_scale(args)
+    engine = benchmark_engine()
+    results: dict[str, dict] = {}
+    with Session(engine) as session:
+        insert_demo_data(session)
+        generate(session, scale, args.seed)
+        for name, fn in entry_points(session).items():
+
+            def call():
+                invalidate_caches()
+                session.expunge_all()
+                return fn()
+
+            results[name] = measure(call, repeat=args.repeat) | {
+                "statements": count_statements(session, call)
+            }
+            session.rollback()
+    engine.dispose()
+
+    commit = subprocess.run(
+        ["git", "rev-parse", "HEAD"], capture_output=True, text=True
+    ).stdout.strip()
+    return {
+        "commit": commit,
+        "measured": datetime.now().isoformat(timespec="seconds"),
+        "preset": args.preset,
+        "seed": args.seed,
+        "scale": asdict(scale),
+        "entry_points": results,
+    }
+
+
+def regressions(previous: dict, current: dict, threshold: float) -> list[str]:
+    """Describe each entry point slower by more than threshold, or issuing more statements,
+    than in the previous baseline."""
+    if previous["scale"] != current["scale"]:
+        print(
+            "Warning: the baselines were measured at different scales.", file=sys.stderr
+        )
+    found = []
+    for name, result in current["entry_points"].items():
+        before = previous["entry_points"].get(name)
+        if before is None:
+            continue
+        change = result["median_ms"] / before["median_ms"] - 1
+        print(
+            f"{name:24} {before['median_ms']:10.3f} -> {result['median_ms']:10.3f} ms "
+            f"({change:+.0%}), {before['statements']} -> {result['statements']} statements"
+        )
+        if change > threshold:
+            found.append(f"{name} median latency grew {change:.0%}")
+        if result["statements"] > before["statements"]:
+            found.append(
+                f"{name} issues {result['statements']} statements, "
+                f"up from {before['statements']}"
+            )
+    return found
+
+
+if __name__ == "__main__":
+    require_development_mode()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    scale_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--output", default="benchmark_baseline.json")
+    parser.add_argument("--compare", help="A baseline of an earlier commit.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="The fraction a median latency may grow by before it is a regression.",
+    )
+    args = parser.parse_args()
+
+    baseline = run(args)
+    with open(args.output, "w") as output:
+        json.dump(baseline, output, indent=2)
+    print(f"Wrote the baseline of {baseline['commit'][:7]} to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as previous:
+            found = regressions(json.load(previous), baseline, args.threshold)
+        for regression in found:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if found:
+            exit(1)
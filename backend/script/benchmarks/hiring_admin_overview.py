@@ -0,0 +1,240 @@
+"""Benchmark of HiringService#get_hiring_admin_overview on a synthetic term.
+
+Seeds the test users, courses and terms plus 150 course sites of the current term, each with
+two sections, an instructor and 10 hiring assignments, then compares the previous overview,
+which assembled each course site from lazily loaded relationships, against the aggregated
+queries of the service. The number of statements each issues is reported alongside latency.
+
+Usage: python3 -m backend.script.benchmarks.hiring_admin_overview
+"""
+
+import json
+from datetime import datetime
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.orm import Session, joinedload
+
+from . import benchmark_engine, measure, require_development_mode
+from ...entities import UserEntity
+from ...entities.academics import SectionEntity, TermEntity
+from ...entities.academics.hiring.hiring_assignment_entity import HiringAssignmentEntity
+from ...entities.academics.hiring.hiring_level_entity import HiringLevelEntity
+from ...entities.academics.section_member_entity import SectionMemberEntity
+from ...entities.office_hours import CourseSiteEntity
+from ...models.academics.hiring.hiring_assignment import (
+    HiringAdminOverview,
+    HiringAssignmentStatus,
+    HiringCourseSiteOverview,
+)
+from ...models.academics.hiring.hiring_level import HiringLevelClassification
+from ...models.academics.section_member import RosterRole
+from ...services import PermissionService
+from ...services.academics import HiringService
+from ...test.services import role_data, user_data, permission_data
+from ...test.services.academics import course_data, term_data
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+COURSE_SITES = 150
+SECTIONS_PER_SITE = 2
+ASSIGNMENTS_PER_SITE = 10
+STUDENTS = 1_000
+
+LEVELS = [
+    ("UTA", 2000.0, 1.0, HiringLevelClassification.UG),
+    ("MS GTA", 9000.0, 1.0, HiringLevelClassification.MS),
+    ("PhD GTA", 12000.0, 1.0, HiringLevelClassification.PHD),
+]
+
+
+def seed(session: Session) -> None:
+    role_data.insert_fake_data(session)
+    user_data.insert_fake_data(session)
+    permission_data.insert_fake_data(session)
+    course_data.insert_fake_data(session)
+    term_data.insert_fake_data(session)
+    term_id = term_data.current_term.id
+    course_ids = [course.id for course in course_data.courses]
+
+    user_ids = session.scalars(
+        insert(UserEntity).returning(UserEntity.id),
+        [
+            {
+                "pid": 900000000 + i,
+                "onyen": f"staff{i}",
+                "email": f"staff{i}@unc.edu",
+                "first_name": "Staff",
+                "last_name": f"Member{i}",
+            }
+            for i in range(STUDENTS + COURSE_SITES)
+        ],
+    ).all()
+    students, instructors = user_ids[:STUDENTS], user_ids[STUDENTS:]
+    level_ids = session.scalars(
+        insert(HiringLevelEntity).returning(HiringLevelEntity.id),
+        [
+            {
+                "title": title,
+                "salary": salary,
+                "load": load,
+                "classification": classification,
+                "is_active": True,
+            }
+            for title, salary, load, classification in LEVELS
+        ],
+    ).all()
+    site_ids = session.scalars(
+        insert(CourseSiteEntity).returning(CourseSiteEntity.id),
+        [
+            {"title": f"Course Site {i}", "term_id": term_id}
+            for i in range(COURSE_SITES)
+        ],
+    ).all()
+    section_ids = session.scalars(
+        insert(SectionEntity).returning(SectionEntity.id),
+        [
+            {
+                "course_id": course_ids[i % len(course_ids)],
+                "number": f"{100 + i:03}",
+                "term_id": term_id,
+                "course_site_id": site_ids[i // SECTIONS_PER_SITE],
+                "enrolled": 150 + i % 150,
+                "total_seats": 300,
+            }
+            for i in range(COURSE_SITES * SECTIONS_PER_SITE)
+        ],
+    ).all()
+    session.execute(
+        insert(SectionMemberEntity),
+        [
+            {
+                "section_id": section_id,
+                "user_id": instructors[i // SECTIONS_PER_SITE],
+                "member_role": RosterRole.INSTRUCTOR,
+            }
+            for i, section_id in enumerate(section_ids)
+        ],
+    )
+    now = datetime.now()
+    session.execute(
+        insert(HiringAssignmentEntity),
+        [
+            {
+                "term_id": term_id,
+                "course_site_id": site_id,
+                "user_id": students[(i * ASSIGNMENTS_PER_SITE + j) % STUDENTS],
+                "hiring_level_id": level_ids[j % len(level_ids)],
+                "status": HiringAssignmentStatus.COMMIT,
+                "position_number": "",
+                "epar": "",
+                "i9": True,
+                "notes": "",
+                "created": now,
+                "modified": now,
+            }
+            for i, site_id in enumerate(site_ids)
+            for j in range(ASSIGNMENTS_PER_SITE)
+        ],
+    )
+    session.commit()
+
+
+def previous_overview(session: Session, term_id: str) -> HiringAdminOverview:
+    """The overview as assembled before, from each course site's relationships."""
+    course_site_query = (
+        select(CourseSiteEntity)
+        .join(CourseSiteEntity.term)
+        .where(TermEntity.id == term_id)
+        .options(joinedload(CourseSiteEntity.sections))
+    )
+    sites: list[HiringCourseSiteOverview] = []
+    for course_site in session.scalars(course_site_query).unique().all():
+        instructors = []
+        total_enrollment = 0
+        for section in course_site.sections:
+            instructors += [
+                staff.user.to_public_model()
+                for staff in section.staff
+                if staff.member_role == RosterRole.INSTRUCTOR
+            ]
+            total_enrollment += section.enrolled
+        assignments = sorted(
+            [
+                assignment.to_overview_model()
+                for assignment in course_site.hiring_assignments
+            ],
+            key=lambda x: x.user.last_name,
+        )
+        coverage = 0.0
+        for assignment in course_site.hiring_assignments:
+            if assignment.hiring_level.classification in {
+                HiringLevelClassification.MS,
+                HiringLevelClassification.PHD,
+            }:
+                coverage += assignment.hiring_level.load
+            elif assignment.hiring_level.classification == HiringLevelClassification.UG:
+                coverage += assignment.hiring_level.load * 0.25
+        sites.append(
+            HiringCourseSiteOverview(
+                course_site_id=course_site.id,
+                sections=[
+                    section.to_catalog_identity_model()
+                    for section in course_site.sections
+                ],
+                instructors=instructors,
+                total_enrollment=total_enrollment,
+                total_cost=sum(assignment.level.salary for assignment in assignments),
+                coverage=total_enrollment / 60.0 - coverage,
+                assignments=assignments,
+            )
+        )
+    return HiringAdminOverview(sites=sites)
+
+
+def counted(session: Session, fn) -> int:
+    """The number of statements fn issues on a session without loaded entities."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    session.expunge_all()
+    event.listen(session.get_bind(), "before_cursor_execute", record)
+    try:
+        fn()
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", record)
+    return len(statements)
+
+
+def run() -> dict:
+    engine = benchmark_engine()
+    term_id = term_data.current_term.id
+    with Session(engine) as session:
+        seed(session)
+        hiring_svc = HiringService(session, PermissionService(session))
+
+        def previous():
+            session.expunge_all()
+            return previous_overview(session, term_id)
+
+        def aggregated():
+            session.expunge_all()
+            return hiring_svc.get_hiring_admin_overview(user_data.root, term_id)
+
+        results = {
+            "course_sites": len(aggregated().sites),
+            "previous": measure(previous, repeat=10)
+            | {"statements": counted(session, previous)},
+            "aggregated": measure(aggregated, repeat=10)
+            | {"statements": counted(session, aggregated)},
+        }
+    engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    require_development_mode()
+    print(json.dumps(run(), indent=2))
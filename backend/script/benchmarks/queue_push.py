@@ -0,0 +1,193 @@
+"""Load benchmark of pushing office hours queue changes to clients, compared with polling.
+
+Seeds the benchmark database with the demo data of `reset_demo` and serves this module's `app`
+with uvicorn. Clients then watch the queue of an office hours event in two ways while it
+changes periodically: polling `GET /api/office-hours/{id}/queue` every 10 seconds, as the
+frontend does, and holding open the server-sent events stream of `/queue/events`. The server's
+CPU time is reported for each, along with how many responses or events clients received and
+how many times streams were woken by a change.
+
+Usage: python3 -m backend.script.benchmarks.queue_push [--clients N] [--duration S]
+    [--change-interval S] [--broker memory|postgres]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.orm import Session
+
+from ...api.office_hours import office_hours
+from ...database import db_session
+from ...services.office_hours.queue_channel import queue_hub
+from ...services.office_hours.queue_snapshot import bump_queue_version
+from ...test.services import user_data
+from ...test.services.office_hours import office_hours_data
+from . import BENCHMARK_DATABASE, require_development_mode
+from .async_handlers import seed, token
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+PORT = 1571
+POLL_INTERVAL = 10.0
+"""Seconds between polls of a client, as in the office hours queue component."""
+
+OFFICE_HOURS_ID = office_hours_data.comp_110_current_office_hours.id
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await queue_hub.start()
+    yield
+    await queue_hub.stop()
+
+
+app = FastAPI(lifespan=lifespan)
+app.include_router(office_hours.api)
+
+
+@app.post("/bench/office-hours/{id}/change")
+def change_queue(id: int, session: Session = Depends(db_session)):
+    bump_queue_version(session, id)
+    session.commit()
+
+
+@app.get("/bench/stats")
+def stats():
+    return queue_hub.stats()
+
+
+def server_cpu_seconds(pid: int) -> float:
+    """User and system CPU time of a process, from Linux's /proc/<pid>/stat."""
+    with open(f"/proc/{pid}/stat") as stat:
+        # Fields following the parenthesized command name, whose 12th and 13th are utime and stime
+        fields = stat.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+async def change_periodically(
+    client: httpx.AsyncClient, interval: float, duration: float
+) -> None:
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        await asyncio.sleep(interval)
+        await client.post(f"/bench/office-hours/{OFFICE_HOURS_ID}/change")
+
+
+async def poll(client: httpx.AsyncClient, headers: dict, duration: float) -> int:
+    received = 0
+    deadline = time.perf_counter() + duration
+    # Stagger clients across the interval, as they would open the page at different times
+    await asyncio.sleep(random.uniform(0, POLL_INTERVAL))
+    while time.perf_counter() < deadline:
+        response = await client.get(
+            f"/api/office-hours/{OFFICE_HOURS_ID}/queue", headers=headers
+        )
+        received += response.status_code == 200
+        await asyncio.sleep(POLL_INTERVAL)
+    return received
+
+
+async def listen(client: httpx.AsyncClient, headers: dict, duration: float) -> int:
+    received = 0
+    try:
+        async with asyncio.timeout(duration):
+            async with client.stream(
+                "GET",
+                f"/api/office-hours/{OFFICE_HOURS_ID}/queue/events",
+                headers=headers,
+            ) as response:
+                async for line in response.aiter_lines():
+                    received += line.startswith("event:")
+    except TimeoutError:
+        ...
+    return received
+
+
+async def drive(pid: int, mode: str, args: argparse.Namespace) -> dict:
+    headers = {"Authorization": f"Bearer {token(user_data.instructor)}"}
+    watch = poll if mode == "polling" else listen
+    limits = httpx.Limits(max_connections=args.clients + 1)
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{PORT}", limits=limits, timeout=60
+    ) as client:
+        cpu = server_cpu_seconds(pid)
+        start = time.perf_counter()
+        received = await asyncio.gather(
+            change_periodically(client, args.change_interval, args.duration),
+            *(watch(client, headers, args.duration) for _ in range(args.clients)),
+        )
+        elapsed = time.perf_counter() - start
+        cpu = server_cpu_seconds(pid) - cpu
+        hub = (await client.get("/bench/stats")).json()
+    return {
+        "server_cpu_seconds": round(cpu, 3),
+        "server_cpu_percent": round(cpu / elapsed * 100, 1),
+        "received": sum(received[1:]),
+        "streams_woken": hub["delivered"],
+    }
+
+
+def wait_until_ready(server: subprocess.Popen) -> None:
+    while server.poll() is None:
+        try:
+            httpx.get(f"http://127.0.0.1:{PORT}/bench/stats")
+            return
+        except httpx.TransportError:
+            time.sleep(0.25)
+    raise RuntimeError("uvicorn exited before accepting requests")
+
+
+if __name__ == "__main__":
+    require_development_mode()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument(
+        "--change-interval",
+        type=float,
+        default=15.0,
+        help="seconds between changes of the queue",
+    )
+    parser.add_argument("--broker", choices=["memory", "postgres"], default="memory")
+    args = parser.parse_args()
+
+    seed()
+    environment = os.environ | {
+        "POSTGRES_DATABASE": BENCHMARK_DATABASE,
+        "POSTGRES_ECHO": "false",
+        "OFFICE_HOURS_QUEUE_BROKER": args.broker,
+    }
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "backend.script.benchmarks.queue_push:app",
+            "--port",
+            str(PORT),
+            "--log-level",
+            "warning",
+        ],
+        env=environment,
+    )
+    try:
+        wait_until_ready(server)
+        results = {
+            mode: asyncio.run(drive(server.pid, mode, args))
+            for mode in ["polling", "push"]
+        }
+        print(json.dumps(results, indent=2))
+    finally:
+        server.terminate()
+        server.wait()
@@ -0,0 +1,137 @@
+"""Benchmark of ReservationService#get_map_reserved_times_by_date.
+
+Seeds a growing number of study rooms and reservations for a single day and compares
+the single-query grid engine against the previous per-room query strategy.
+
+Usage: python3 -m backend.script.benchmarks.reservation_map
+"""
+
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from . import benchmark_engine, measure, require_development_mode
+from ...entities import UserEntity
+from ...entities.room_entity import RoomEntity
+from ...entities.coworking import ReservationEntity, OperatingHoursEntity
+from ...entities.coworking.reservation_user_table import reservation_user_table
+from ...models.coworking import ReservationState
+from ...services import PermissionService
+from ...services.coworking import (
+    OperatingHoursService,
+    PolicyService,
+    ReservationService,
+    RoomUsageService,
+    SeatService,
+)
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+ROOM_COUNTS = [4, 16, 64]
+RESERVATIONS_PER_ROOM = [4, 16]
+USERS = 50
+
+
+def seed(session: Session, date: datetime, rooms: int, per_room: int) -> None:
+    """Insert rooms, users, operating hours and one day of reservations."""
+    opening = date.replace(hour=8, minute=0, second=0, microsecond=0)
+    session.execute(
+        insert(OperatingHoursEntity),
+        [{"id": 1, "start": opening, "end": opening + timedelta(hours=14)}],
+    )
+    session.execute(
+        insert(UserEntity),
+        [
+            {"id": i, "pid": 700000000 + i, "onyen": f"u{i}", "email": f"u{i}@unc.edu"}
+            for i in range(1, USERS + 1)
+        ],
+    )
+    room_ids = [f"SN{200 + i}" for i in range(rooms)] + ["SN156"]
+    session.execute(
+        insert(RoomEntity),
+        [
+            {
+                "id": room_id,
+                "capacity": 4,
+                "building": "Sitterson",
+                "room": room_id[2:],
+                "nickname": room_id,
+                "reservable": room_id != "SN156",
+            }
+            for room_id in room_ids
+        ],
+    )
+
+    reservations = []
+    users = []
+    for r, room_id in enumerate(room_ids[:-1]):
+        for k in range(per_room):
+            start = opening + timedelta(minutes=30 * ((k * 3) % 26))
+            id = len(reservations) + 1
+            reservations.append(
+                {
+                    "id": id,
+                    "start": start,
+                    "end": start + timedelta(minutes=30),
+                    "state": ReservationState.CONFIRMED,
+                    "walkin": False,
+                    "room_id": room_id,
+                    "created_at": opening,
+                    "updated_at": opening,
+                }
+            )
+            users.append({"reservation_id": id, "user_id": (r + k) % USERS + 1})
+    session.execute(insert(ReservationEntity), reservations)
+    session.execute(insert(reservation_user_table), users)
+    session.commit()
+
+
+def run() -> list[dict]:
+    results: list[dict] = []
+    date = (datetime.now() + timedelta(days=7)).replace(hour=12)
+    for rooms in ROOM_COUNTS:
+        for per_room in RESERVATIONS_PER_ROOM:
+            engine = benchmark_engine()
+            with Session(engine) as session:
+                seed(session, date, rooms, per_room)
+                permission_svc = PermissionService(session)
+                policy_svc = PolicyService()
+                reservation_svc = ReservationService(
+                    session,
+                    permission_svc,
+                    policy_svc,
+                    OperatingHoursService(session, permission_svc),
+                    SeatService(session),
+                    RoomUsageService(session, policy_svc),
+                )
+                subject = session.get(UserEntity, 1).to_model()
+
+                def per_room_queries():
+                    for room_id in reservation_svc._get_reservable_room_ids():
+                        reservation_svc._query_confirmed_reservations_by_date_and_room(
+                            date, room_id
+                        )
+
+                results.append(
+                    {
+                        "rooms": rooms,
+                        "reservations": rooms * per_room,
+                        "grid": measure(
+                            lambda: reservation_svc.get_map_reserved_times_by_date(
+                                date, subject
+                            )
+                        ),
+                        "per_room_queries": measure(per_room_queries),
+                    }
+                )
+            engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    require_development_mode()
+    print(json.dumps(run(), indent=2))
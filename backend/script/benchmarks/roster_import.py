@@ -0,0 +1,115 @@
+"""Benchmark of SectionMemberService#import_users_from_csv at 5,000 rows.
+
+Seeds the test roster data plus 2,500 existing users, then times a first import of a
+5,000 student Canvas roster, an identical re-upload and a re-upload in which 10% of the
+students were replaced, along with the number of statements each import issues.
+
+Usage: python3 -m backend.script.benchmarks.roster_import
+"""
+
+import json
+import time
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from . import benchmark_engine, require_development_mode
+from ...entities import UserEntity
+from ...services import PermissionService
+from ...services.academics import SectionMemberService
+from ...test.services import role_data, user_data, permission_data
+from ...test.services.academics import course_data, section_data, term_data
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+ROWS = 5_000
+EXISTING_USERS = 2_500
+CHURN = 0.1
+
+HEADER = "Student,ID,SIS User ID,SIS Login ID,Section\n"
+POINTS_POSSIBLE = "Points Possible,,,,\n"
+
+
+def roster_csv(first: int, rows: int) -> str:
+    """A Canvas roster of students numbered first through first + rows - 1."""
+    return (
+        HEADER
+        + POINTS_POSSIBLE
+        + "".join(
+            f'"Student{i}, Benchmark",{i},{800000000 + i},bench{i},COMP301.001.F24\n'
+            for i in range(first, first + rows)
+        )
+    )
+
+
+def seed(session: Session) -> None:
+    role_data.insert_fake_data(session)
+    user_data.insert_fake_data(session)
+    permission_data.insert_fake_data(session)
+    course_data.insert_fake_data(session)
+    term_data.insert_fake_data(session)
+    section_data.insert_fake_data(session)
+    session.execute(
+        insert(UserEntity),
+        [
+            {
+                "pid": 800000000 + i,
+                "onyen": f"bench{i}",
+                "email": f"bench{i}@email.unc.edu",
+                "first_name": "Benchmark",
+                "last_name": f"Student{i}",
+            }
+            for i in range(EXISTING_USERS)
+        ],
+    )
+    session.commit()
+
+
+def timed_import(session: Session, csv_data: str) -> dict:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    section_member_svc = SectionMemberService(session, PermissionService(session))
+    event.listen(session.get_bind(), "before_cursor_execute", record)
+    try:
+        start = time.perf_counter()
+        report = section_member_svc.import_users_from_csv(
+            user_data.instructor,
+            section_data.comp_301_001_current_term.id,
+            csv_data,
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", record)
+
+    return {
+        "ms": round(elapsed, 3),
+        "statements": len(statements),
+        "added": len(report.added),
+        "existing": len(report.existing),
+        "created": len(report.created),
+        "removed": len(report.removed),
+    }
+
+
+def run() -> dict:
+    engine = benchmark_engine()
+    churned = int(ROWS * CHURN)
+    with Session(engine) as session:
+        seed(session)
+        results = {
+            "first_import": timed_import(session, roster_csv(0, ROWS)),
+            "identical_reupload": timed_import(session, roster_csv(0, ROWS)),
+            "churned_reupload": timed_import(session, roster_csv(churned, ROWS)),
+        }
+    engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    require_development_mode()
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,199 @@
+"""Benchmark of substring search over users and events.
+
+Seeds 100,000 users, 500 organizations and 50,000 events, then compares the previous ILIKE
+criteria, an ILIKE per column and an EXISTS per organization column, against `matches` on
+the `search_text` columns. The plan reports whether PostgreSQL used the trigram indexes,
+which are only created where the pg_trgm extension is available.
+
+Usage: python3 -m backend.script.benchmarks.search
+"""
+
+import json
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy import String, cast, exists, insert, or_, select, text
+from sqlalchemy.orm import Session
+
+from . import benchmark_engine, measure, require_development_mode
+from ...entities import EventEntity, OrganizationEntity, UserEntity
+from ...services.search import matches, rank
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+USERS = 100_000
+ORGANIZATIONS = 500
+EVENTS = 50_000
+QUERIES = ["amy", "bassad", "@unc.edu", "9417", "workshop", "hack"]
+
+FIRST_NAMES = ["Amy", "Rhonda", "Sally", "Ina", "Alyssa", "Stewie", "Kris", "Ajay"]
+LAST_NAMES = ["Ambassador", "Root", "Student", "Instructor", "Jordan", "Gandecha"]
+TOPICS = ["Workshop", "Hackathon", "Social", "Info Session", "Tech Talk", "Study Hall"]
+
+
+def seed(session: Session) -> None:
+    rng = random.Random(423)
+    session.execute(
+        insert(UserEntity),
+        [
+            {
+                "id": i,
+                "pid": 700000000 + i,
+                "onyen": f"onyen{i}",
+                "email": f"onyen{i}@unc.edu",
+                "first_name": rng.choice(FIRST_NAMES),
+                "last_name": f"{rng.choice(LAST_NAMES)}{i % 97}",
+            }
+            for i in range(1, USERS + 1)
+        ],
+    )
+    session.execute(
+        insert(OrganizationEntity),
+        [
+            {
+                "id": i,
+                "name": f"Organization {i}",
+                "shorthand": f"ORG{i}",
+                "slug": f"org-{i}",
+                "logo": "",
+                "short_description": "",
+                "long_description": "",
+                "website": "",
+                "email": "",
+                "instagram": "",
+                "linked_in": "",
+                "youtube": "",
+                "heel_life": "",
+                "public": True,
+            }
+            for i in range(1, ORGANIZATIONS + 1)
+        ],
+    )
+    start = datetime.now().replace(minute=0, second=0, microsecond=0)
+    session.execute(
+        insert(EventEntity),
+        [
+            {
+                "id": i,
+                "name": f"{rng.choice(TOPICS)} #{i}",
+                "start": start + timedelta(hours=i),
+                "end": start + timedelta(hours=i + 1),
+                "location": "Sitterson Hall",
+                "description": f"{rng.choice(TOPICS)} hosted in the XL, session {i}.",
+                "public": True,
+                "registration_limit": 50,
+                "organization_id": i % ORGANIZATIONS + 1,
+            }
+            for i in range(1, EVENTS + 1)
+        ],
+    )
+    session.commit()
+    session.execute(text("ANALYZE"))
+
+
+def previous_user_search(query: str):
+    return (
+        select(UserEntity)
+        .where(
+            or_(
+                UserEntity.first_name.ilike(f"%{query}%"),
+                UserEntity.last_name.ilike(f"%{query}%"),
+                UserEntity.onyen.ilike(f"%{query}%"),
+                UserEntity.email.ilike(f"%{query}%"),
+                cast(UserEntity.pid, String).ilike(f"%{query}%"),
+            )
+        )
+        .limit(10)
+    )
+
+
+def user_search(query: str):
+    return (
+        select(UserEntity)
+        .where(matches(UserEntity.search_text, query))
+        .order_by(
+            rank(query, UserEntity.first_name, UserEntity.last_name, UserEntity.onyen),
+            UserEntity.id,
+        )
+        .limit(10)
+    )
+
+
+def previous_event_filter(query: str):
+    return select(EventEntity).where(
+        or_(
+            EventEntity.name.ilike(f"%{query}%"),
+            EventEntity.description.ilike(f"%{query}%"),
+            exists().where(
+                OrganizationEntity.id == EventEntity.organization_id,
+                OrganizationEntity.name.ilike(f"%{query}%"),
+            ),
+            exists().where(
+                OrganizationEntity.id == EventEntity.organization_id,
+                OrganizationEntity.slug.ilike(f"%{query}%"),
+            ),
+        )
+    )
+
+
+def event_filter(query: str):
+    return select(EventEntity).where(
+        or_(
+            matches(EventEntity.search_text, query),
+            EventEntity.organization_id.in_(
+                select(OrganizationEntity.id).where(
+                    matches(OrganizationEntity.search_text, query)
+                )
+            ),
+        )
+    )
+
+
+def plan(session: Session, statement) -> str:
+    """The access methods of statement's plan, e.g. 'Bitmap Index Scan, Seq Scan'."""
+    compiled = statement.compile(
+        dialect=session.get_bind().dialect, compile_kwargs={"literal_binds": True}
+    )
+    lines = session.execute(text(f"EXPLAIN {compiled}")).scalars()
+    scans = {
+        line.strip(" ->").split(" on ")[0].split("  ")[0]
+        for line in lines
+        if "Scan" in line
+    }
+    return ", ".join(sorted(scans))
+
+
+def run() -> dict:
+    engine = benchmark_engine()
+    results: dict = {"users": {}, "events": {}}
+    with Session(engine) as session:
+        seed(session)
+        results["trigram_indexes"] = (
+            session.execute(
+                text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            ).first()
+            is not None
+        )
+        for group, previous, current in [
+            ("users", previous_user_search, user_search),
+            ("events", previous_event_filter, event_filter),
+        ]:
+            for query in QUERIES:
+                results[group][query] = {
+                    "previous": measure(
+                        lambda: session.execute(previous(query)).all(), repeat=10
+                    ),
+                    "search_text": measure(
+                        lambda: session.execute(current(query)).all(), repeat=10
+                    ),
+                    "plan": plan(session, current(query)),
+                }
+    engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    require_development_mode()
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,37 @@
+"""
+Standalone worker that sweeps expired reservations on an interval.
+
+Deployments that run the API with RESERVATION_SWEEP_INTERVAL=0 can run this worker instead,
+so that time-based reservation transitions happen in exactly one process. Each sweep's counts
+are printed as a JSON line.
+
+Usage: python3 -m backend.script.reservation_sweeper [--once] [--interval SECONDS]
+"""
+
+import argparse
+import time
+
+from ..services.coworking.reservation_sweeper import sweep_expired_reservations
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--interval", type=float, default=60.0, help="Seconds between sweeps."
+    )
+    parser.add_argument("--once", action="store_true", help="Sweep once and exit.")
+    args = parser.parse_args()
+
+    while True:
+        print(sweep_expired_reservations().model_dump_json(), flush=True)
+        if args.once:
+            return
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
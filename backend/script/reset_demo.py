@@ -12,7 +12,6 @@ Usage: python3 -m script.reset_demo
 
 import sys
 import subprocess
-from sqlalchemy import text
 from sqlalchemy.orm import Session
 from ..database import engine
 from ..env import getenv
@@ -21,7 +20,7 @@ from .. import entities
 from ..test.services import role_data, user_data, permission_data, room_data
 from ..test.services.organization import organization_demo_data
 from ..test.services.event import event_demo_data
-from ..test.services.coworking import seat_data, operating_hours_data, time
+from ..test.services.coworking import seat_data, operating_hours_data, time as times
 from ..test.services.coworking.reservation import reservation_data
 from ..test.services.academics import course_data, term_data, section_data
 from ..test.services.office_hours import office_hours_data
@@ -32,24 +31,10 @@ __authors__ = ["Kris Jordan", "Ajay Gandecha"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
-# Ensures that the script can only be run in development mode
-if getenv("MODE") != "development":
-    print("This script can only be run in development mode.", file=sys.stderr)
-    print("Add MODE=development to your .env file in workspace's `backend/` directory")
-    exit(1)
 
-# Run Delete and Create Database Scripts
-subprocess.run(["python3", "-m", "backend.script.delete_database"])
-subprocess.run(["python3", "-m", "backend.script.create_database"])
-
-# Reset Tables
-entities.EntityBase.metadata.drop_all(engine)
-entities.EntityBase.metadata.create_all(engine)
-
-# Initialize the SQLAlchemy session
-with Session(engine) as session:
-    # Load all demo data
-    time = time.time_data()
+def insert_demo_data(session: Session) -> None:
+    """Load the demo data of every feature, which `script.synthetic_data` builds on."""
+    time = times.time_data()
     role_data.insert_fake_data(session)
     user_data.insert_fake_data(session)
     permission_data.insert_fake_data(session)
@@ -68,3 +53,30 @@ with Session(engine) as session:
 
     # Commit changes to the database
     session.commit()
+
+
+def reset_demo_database() -> None:
+    """Recreate the development database and its tables, then load the demo data."""
+    # Run Delete and Create Database Scripts
+    subprocess.run(["python3", "-m", "backend.script.delete_database"])
+    subprocess.run(["python3", "-m", "backend.script.create_database"])
+
+    # Reset Tables
+    entities.EntityBase.metadata.drop_all(engine)
+    entities.EntityBase.metadata.create_all(engine)
+
+    # Initialize the SQLAlchemy session
+    with Session(engine) as session:
+        insert_demo_data(session)
+
+
+if __name__ == "__main__":
+    # Ensures that the script can only be run in development mode
+    if getenv("MODE") != "development":
+        print("This script can only be run in development mode.", file=sys.stderr)
+        print(
+            "Add MODE=development to your .env file in workspace's `backend/` directory"
+        )
+        exit(1)
+
+    reset_demo_database()
@@ -0,0 +1,50 @@
+"""
+Standalone worker that reconciles the weekly ledger of study room time on an interval.
+
+Deployments that run the API with ROOM_USAGE_RECONCILE_INTERVAL=0 can run this worker
+instead. The number of ledger rows each reconciliation corrects is printed as a JSON line.
+
+Usage: python3 -m backend.script.room_usage_reconciler [--once] [--interval SECONDS]
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime
+
+from ..services.coworking.room_usage import reconcile_room_usage
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=3600.0,
+        help="Seconds between reconciliations.",
+    )
+    parser.add_argument("--once", action="store_true", help="Reconcile once and exit.")
+    args = parser.parse_args()
+
+    while True:
+        corrected = reconcile_room_usage()
+        print(
+            json.dumps(
+                {
+                    "corrected": corrected,
+                    "reconciled_at": datetime.now().isoformat(),
+                }
+            ),
+            flush=True,
+        )
+        if args.once:
+            return
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,602 @@
+"""
+This script resets the database to the demo data of `reset_demo`, then adds synthetic data
+at a configurable scale, up to that of production, for profiling and benchmarks.
+
+The demo data has a handful of rows per feature. On top of it, this script generates users,
+organizations with their events and registrations, courses with sections in every term and
+their rosters, course sites of the current term with office hours and tickets, coworking
+reservations around today, TA applications and articles. Rows are inserted with bulk
+`INSERT` statements in batches, and are drawn from a seeded random generator, so a scale and
+seed always generate the same data.
+
+Usage: python3 -m backend.script.synthetic_data [--preset production] [--users 30000] ...
+"""
+
+import argparse
+import random
+import sys
+from dataclasses import asdict, dataclass, fields, replace
+from datetime import datetime, timedelta
+from math import ceil
+from typing import Any, Sequence
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from ..database import engine
+from ..entities import (
+    ArticleEntity,
+    EventEntity,
+    EventRegistrationEntity,
+    OrganizationEntity,
+    UserEntity,
+)
+from ..entities.academics import (
+    CourseEntity,
+    SectionEntity,
+    SectionMemberEntity,
+    SectionRoomEntity,
+)
+from ..entities.application_entity import ApplicationEntity
+from ..entities.article_author_entity import article_author_table
+from ..entities.coworking import ReservationEntity, reservation_seat_table
+from ..entities.coworking.reservation_user_table import reservation_user_table
+from ..entities.office_hours import (
+    CourseSiteEntity,
+    OfficeHoursEntity,
+    OfficeHoursTicketEntity,
+    user_created_tickets_table,
+)
+from ..entities.section_application_table import section_application_table
+from ..env import getenv
+from ..models.articles import ArticleState
+from ..models.coworking import ReservationState
+from ..models.office_hours.event_type import (
+    OfficeHoursEventModeType,
+    OfficeHoursEventType,
+)
+from ..models.office_hours.ticket_state import TicketState
+from ..models.office_hours.ticket_type import TicketType
+from ..models.registration_type import RegistrationType
+from ..models.roster_role import RosterRole
+from ..models.room_assignment_type import RoomAssignmentType
+from ..test.services import room_data, user_data
+from ..test.services.academics import term_data
+from ..test.services.coworking import seat_data
+from .reset_demo import reset_demo_database
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+BATCH_SIZE = 5_000
+"""Rows inserted per statement."""
+
+FIRST_NAMES = ["Ava", "Ben", "Chen", "Dana", "Eli", "Fatima", "Gabe", "Hana", "Ivan"]
+LAST_NAMES = ["Ng", "Patel", "Smith", "Garcia", "Kim", "Okafor", "Rossi", "Zhang"]
+SUBJECTS = ["DATA", "INLS", "MATH", "PHYS", "STOR"]
+
+
+@dataclass(frozen=True)
+class Scale:
+    """The number of synthetic rows of each kind to generate."""
+
+    users: int
+    organizations: int
+    events: int
+    registrations_per_event: int
+    courses: int
+    sections_per_term: int
+    students_per_section: int
+    office_hours_per_site: int
+    tickets: int
+    reservations: int
+    applications: int
+    articles: int
+
+
+PRESETS = {
+    "small": Scale(
+        users=1_000,
+        organizations=10,
+        events=100,
+        registrations_per_event=20,
+        courses=20,
+        sections_per_term=60,
+        students_per_section=20,
+        office_hours_per_site=5,
+        tickets=1_000,
+        reservations=1_000,
+        applications=100,
+        articles=50,
+    ),
+    "production": Scale(
+        users=30_000,
+        organizations=80,
+        events=2_000,
+        registrations_per_event=40,
+        courses=150,
+        sections_per_term=600,
+        students_per_section=40,
+        office_hours_per_site=30,
+        tickets=40_000,
+        reservations=40_000,
+        applications=2_000,
+        articles=400,
+    ),
+}
+
+
+def _insert(
+    session: Session, target: Any, rows: Sequence[dict], returning: Any = None
+) -> list:
+    """Insert rows into target in batches, returning the `returning` column of each row."""
+    returned = []
+    for offset in range(0, len(rows), BATCH_SIZE):
+        batch = rows[offset : offset + BATCH_SIZE]
+        if returning is None:
+            session.execute(insert(target), batch)
+        else:
+            returned += session.scalars(
+                insert(target).returning(returning, sort_by_parameter_order=True),
+                batch,
+            ).all()
+    return returned
+
+
+def generate(session: Session, scale: Scale, seed: int = 0) -> None:
+    """Insert synthetic data at scale on top of the demo data of `reset_demo`.
+
+    Args:
+        session (Session): The session to insert with, committed once all data is inserted.
+        scale (Scale): The number of rows of each kind to generate.
+        seed (int): Seed of the random choices, such as the users registered for an event.
+    """
+    rng = random.Random(seed)
+    now = datetime.now().replace(second=0, microsecond=0)
+    users = _generate_users(session, scale)
+    _generate_events(session, rng, now, scale, users)
+    sites = _generate_sections(session, rng, scale, users)
+    _generate_office_hours(session, rng, now, scale, sites)
+    _generate_reservations(session, rng, now, scale, users)
+    _generate_applications(session, rng, scale, users, sites)
+    _generate_articles(session, rng, now, scale)
+    session.commit()
+
+
+def _generate_users(session: Session, scale: Scale) -> list[int]:
+    return _insert(
+        session,
+        UserEntity,
+        [
+            {
+                "pid": 730_000_000 + n,
+                "onyen": f"synth{n}",
+                "email": f"synth{n}@unc.edu",
+                "first_name": FIRST_NAMES[n % len(FIRST_NAMES)],
+                "last_name": f"{LAST_NAMES[n % len(LAST_NAMES)]}{n}",
+                "accepted_community_agreement": True,
+            }
+            for n in range(scale.users)
+        ],
+        UserEntity.id,
+    )
+
+
+def _generate_events(
+    session: Session, rng: random.Random, now: datetime, scale: Scale, users: list[int]
+) -> None:
+    """Organizations and their events over the past half year and next two months, each
+    organized by its first registrant."""
+    organizations = _insert(
+        session,
+        OrganizationEntity,
+        [
+            {
+                "name": f"Synthetic Club {n}",
+                "shorthand": f"SC{n}",
+                "slug": f"synthetic-club-{n}",
+                "logo": "",
+                "short_description": "A synthetic organization.",
+                "long_description": "",
+                "website": "",
+                "email": f"club{n}@unc.edu",
+                "instagram": "",
+                "linked_in": "",
+                "youtube": "",
+                "heel_life": "",
+                "public": True,
+            }
+            for n in range(scale.organizations)
+        ],
+        OrganizationEntity.id,
+    )
+    registrants = [
+        rng.sample(users, min(scale.registrations_per_event, len(users)))
+        for _ in range(scale.events)
+    ]
+    events = []
+    for n in range(scale.events):
+        start = now + timedelta(hours=rng.randrange(-180 * 24, 60 * 24))
+        events.append(
+            {
+                "name": f"Synthetic Event {n}",
+                "start": start,
+                "end": start + timedelta(hours=rng.choice([1, 2, 3])),
+                "location": "SN 014",
+                "description": "A synthetic event.",
+                "public": rng.random() < 0.9,
+                "registration_limit": 2 * scale.registrations_per_event,
+                "registered_count": max(len(registrants[n]) - 1, 0),
+                "organization_id": rng.choice(organizations),
+            }
+        )
+    event_ids = _insert(session, EventEntity, events, EventEntity.id)
+    _insert(
+        session,
+        EventRegistrationEntity,
+        [
+            {
+                "event_id": event_id,
+                "user_id": user_id,
+                "registration_type": (
+                    RegistrationType.ORGANIZER if i == 0 else RegistrationType.ATTENDEE
+                ),
+            }
+            for event_id, event_registrants in zip(event_ids, registrants)
+            for i, user_id in enumerate(event_registrants)
+        ],
+    )
+
+
+def _generate_sections(
+    session: Session, rng: random.Random, scale: Scale, users: list[int]
+) -> dict[int, list[tuple[int, RosterRole]]]:
+    """Courses with sections in every term of the demo data, each with an instructor, two
+    UTAs and its students. The sections of a course in the current term share a course site.
+
+    Returns:
+        dict[int, list[tuple[int, RosterRole]]]: The section member ids and roles of each
+            course site.
+    """
+    course_ids = [
+        f"{SUBJECTS[n % len(SUBJECTS)].lower()}{100 + n}" for n in range(scale.courses)
+    ]
+    _insert(
+        session,
+        CourseEntity,
+        [
+            {
+                "id": course_id,
+                "subject_code": course_id[:4].upper(),
+                "number": course_id[4:],
+                "title": f"Synthetic Course {course_id[4:]}",
+                "description": "A synthetic course.",
+                "credit_hours": 3,
+            }
+            for course_id in course_ids
+        ],
+    )
+    current_term = term_data.current_term.id
+    site_ids = _insert(
+        session,
+        CourseSiteEntity,
+        [
+            {"title": course_id.upper(), "term_id": current_term}
+            for course_id in course_ids
+        ],
+        CourseSiteEntity.id,
+    )
+    site_of_course = dict(zip(course_ids, site_ids))
+
+    sections = [
+        {
+            "course_id": course_ids[n % len(course_ids)],
+            "number": f"{n // len(course_ids) + 1:03}",
+            "term_id": term.id,
+            "meeting_pattern": rng.choice(
+                ["MWF 9:05AM - 9:55AM", "TTh 2:00PM - 3:15PM"]
+            ),
+            "course_site_id": (
+                site_of_course[course_ids[n % len(course_ids)]]
+                if term.id == current_term
+                else None
+            ),
+            "enrolled": scale.students_per_section,
+            "total_seats": 2 * scale.students_per_section,
+        }
+        for term in term_data.terms
+        for n in range(scale.sections_per_term)
+    ]
+    section_ids = _insert(session, SectionEntity, sections, SectionEntity.id)
+    lecture_rooms = [room.id for room in room_data.rooms if room.reservable]
+    _insert(
+        session,
+        SectionRoomEntity,
+        [
+            {
+                "section_id": section_id,
+                "room_id": rng.choice(lecture_rooms),
+                "assignment_type": RoomAssignmentType.LECTURE_ROOM,
+            }
+            for section_id in section_ids
+        ],
+    )
+
+    members = []
+    for section_id in section_ids:
+        roster = rng.sample(users, min(scale.students_per_section + 3, len(users)))
+        roles = [RosterRole.INSTRUCTOR, RosterRole.UTA, RosterRole.UTA]
+        for i, user_id in enumerate(roster):
+            members.append(
+                {
+                    "section_id": section_id,
+                    "user_id": user_id,
+                    "member_role": roles[i] if i < len(roles) else RosterRole.STUDENT,
+                }
+            )
+    member_ids = _insert(session, SectionMemberEntity, members, SectionMemberEntity.id)
+
+    site_of_section = {
+        section_id: section["course_site_id"]
+        for section_id, section in zip(section_ids, sections)
+    }
+    site_members: dict[int, list[tuple[int, RosterRole]]] = {}
+    for member_id, member in zip(member_ids, members):
+        site_id = site_of_section[member["section_id"]]
+        if site_id is not None:
+            site_members.setdefault(site_id, []).append(
+                (member_id, member["member_role"])
+            )
+    return site_members
+
+
+def _generate_office_hours(
+    session: Session,
+    rng: random.Random,
+    now: datetime,
+    scale: Scale,
+    site_members: dict[int, list[tuple[int, RosterRole]]],
+) -> None:
+    """Office hours of each course site, the last of which is underway, and their tickets.
+    The tickets of past office hours are closed, those of the current ones queued or called.
+    """
+    office_hours = []
+    for site_id in site_members:
+        for n in range(scale.office_hours_per_site):
+            start = now - timedelta(days=scale.office_hours_per_site - 1 - n, hours=1)
+            office_hours.append(
+                {
+                    "type": OfficeHoursEventType.OFFICE_HOURS,
+                    "mode": OfficeHoursEventModeType.IN_PERSON,
+                    "description": "Synthetic office hours.",
+                    "location_description": "In the XL",
+                    "start_time": start,
+                    "end_time": start + timedelta(hours=3),
+                    "course_site_id": site_id,
+                    "room_id": room_data.the_xl.id,
+                }
+            )
+    office_hours_ids = _insert(
+        session, OfficeHoursEntity, office_hours, OfficeHoursEntity.id
+    )
+    if not office_hours_ids:
+        return
+
+    tickets = []
+    creators = []
+    for n in range(scale.tickets):
+        i = rng.randrange(len(office_hours_ids))
+        event = office_hours[i]
+        members = site_members[event["course_site_id"]]
+        students = [member for member, role in members if role == RosterRole.STUDENT]
+        callers = [member for member, role in members if role != RosterRole.STUDENT]
+        current = event["end_time"] > now
+        state = (
+            rng.choice([TicketState.QUEUED, TicketState.QUEUED, TicketState.CALLED])
+            if current
+            else TicketState.CLOSED
+        )
+        created_at = event["start_time"] + timedelta(minutes=rng.randrange(0, 120))
+        called_at = created_at + timedelta(minutes=rng.randrange(1, 30))
+        tickets.append(
+            {
+                "description": f"Synthetic ticket {n}",
+                "type": rng.choice(list(TicketType)),
+                "state": state,
+                "created_at": created_at,
+                "called_at": None if state == TicketState.QUEUED else called_at,
+                "closed_at": (
+                    called_at + timedelta(minutes=rng.randrange(2, 20))
+                    if state == TicketState.CLOSED
+                    else None
+                ),
+                "office_hours_id": office_hours_ids[i],
+                "caller_id": (
+                    None if state == TicketState.QUEUED else rng.choice(callers)
+                ),
+            }
+        )
+        creators.append(rng.choice(students))
+    ticket_ids = _insert(
+        session, OfficeHoursTicketEntity, tickets, OfficeHoursTicketEntity.id
+    )
+    _insert(
+        session,
+        user_created_tickets_table,
+        [
+            {"ticket_id": ticket_id, "member_id": member_id}
+            for ticket_id, member_id in zip(ticket_ids, creators)
+        ],
+    )
+
+
+def _generate_reservations(
+    session: Session, rng: random.Random, now: datetime, scale: Scale, users: list[int]
+) -> None:
+    """Back to back reservations of each coworking seat from 30 days ago to a week from now,
+    checked out or cancelled in the past and confirmed in the future."""
+    seats = [seat.id for seat in seat_data.seats]
+    start = now.replace(minute=0) - timedelta(days=30)
+    per_seat = ceil(scale.reservations / len(seats))
+    slot = timedelta(days=37) / max(per_seat, 1)
+    duration = min(slot, timedelta(hours=2))
+
+    reservations = []
+    for n in range(scale.reservations):
+        reservation_start = start + (n // len(seats)) * slot
+        if reservation_start + duration < now:
+            state = rng.choice(
+                [ReservationState.CHECKED_OUT] * 4 + [ReservationState.CANCELLED]
+            )
+        else:
+            state = ReservationState.CONFIRMED
+        reservations.append(
+            {
+                "start": reservation_start,
+                "end": reservation_start + duration,
+                "state": state,
+                "walkin": rng.random() < 0.3,
+                "room_id": None,
+                "created_at": reservation_start - timedelta(days=1),
+                "updated_at": reservation_start - timedelta(days=1),
+            }
+        )
+    reservation_ids = _insert(
+        session, ReservationEntity, reservations, ReservationEntity.id
+    )
+    _insert(
+        session,
+        reservation_user_table,
+        [
+            {"reservation_id": reservation_id, "user_id": rng.choice(users)}
+            for reservation_id in reservation_ids
+        ],
+    )
+    _insert(
+        session,
+        reservation_seat_table,
+        [
+            {"reservation_id": reservation_id, "seat_id": seats[n % len(seats)]}
+            for n, reservation_id in enumerate(reservation_ids)
+        ],
+    )
+
+
+def _generate_applications(
+    session: Session,
+    rng: random.Random,
+    scale: Scale,
+    users: list[int],
+    site_members: dict[int, list[tuple[int, RosterRole]]],
+) -> None:
+    """New UTA applications of the current term, each preferring up to three sections."""
+    sections = session.scalars(
+        select(SectionEntity.id).where(
+            SectionEntity.course_site_id.in_(list(site_members))
+        )
+    ).all()
+    application_ids = _insert(
+        session,
+        ApplicationEntity,
+        [
+            {
+                "user_id": user_id,
+                "term_id": term_data.current_term.id,
+                "type": "new_uta",
+                "academic_hours": rng.randrange(12, 120),
+                "expected_graduation": "Spring 2026",
+                "program_pursued": "BS in Computer Science",
+                "comp_gpa": round(rng.uniform(2.5, 4.0), 2),
+            }
+            for user_id in rng.sample(users, min(scale.applications, len(users)))
+        ],
+        ApplicationEntity.id,
+    )
+    if not sections:
+        return
+    _insert(
+        session,
+        section_application_table,
+        [
+            {
+                "application_id": application_id,
+                "section_id": section_id,
+                "preference": preference,
+            }
+            for application_id in application_ids
+            for preference, section_id in enumerate(
+                rng.sample(sections, min(3, len(sections)))
+            )
+        ],
+    )
+
+
+def _generate_articles(
+    session: Session, rng: random.Random, now: datetime, scale: Scale
+) -> None:
+    """Articles published over the past year, authored by the root user."""
+    article_ids = _insert(
+        session,
+        ArticleEntity,
+        [
+            {
+                "slug": f"synthetic-article-{n}",
+                "state": ArticleState.PUBLISHED,
+                "title": f"Synthetic Article {n}",
+                "synopsis": "A synthetic article.",
+                "body": "Lorem ipsum dolor sit amet.",
+                "image_url": "",
+                "published": now - timedelta(hours=rng.randrange(1, 365 * 24)),
+                "is_announcement": False,
+            }
+            for n in range(scale.articles)
+        ],
+        ArticleEntity.id,
+    )
+    _insert(
+        session,
+        article_author_table,
+        [
+            {"article_id": article_id, "user_id": user_data.root.id}
+            for article_id in article_ids
+        ],
+    )
+
+
+def scale_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add `--preset`, `--seed` and an option overriding each field of Scale to parser."""
+    parser.add_argument("--preset", choices=list(PRESETS), default="small")
+    parser.add_argument("--seed", type=int, default=0)
+    for field in fields(Scale):
+        parser.add_argument(f"--{field.name.replace('_', '-')}", type=int)
+
+
+def parse_scale(args: argparse.Namespace) -> Scale:
+    """The Scale of the preset in args, with the fields given in args overridden."""
+    overrides = {
+        field.name: getattr(args, field.name)
+        for field in fields(Scale)
+        if getattr(args, field.name) is not None
+    }
+    return replace(PRESETS[args.preset], **overrides)
+
+
+if __name__ == "__main__":
+    # Ensures that the script can only be run in development mode
+    if getenv("MODE") != "development":
+        print("This script can only be run in development mode.", file=sys.stderr)
+        print(
+            "Add MODE=development to your .env file in workspace's `backend/` directory"
+        )
+        exit(1)
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    scale_arguments(parser)
+    args = parser.parse_args()
+    scale = parse_scale(args)
+
+    reset_demo_database()
+    with Session(engine) as session:
+        generate(session, scale, args.seed)
+    print(f"Generated {asdict(scale)}")
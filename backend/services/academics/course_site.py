@@ -5,7 +5,8 @@ APIs for working with course sites.
 from datetime import datetime
 from itertools import groupby
 from fastapi import Depends
-from sqlalchemy import select, or_, func
+from typing import Iterator
+from sqlalchemy import Select, select, or_, func
 from sqlalchemy.orm import Session, joinedload
 from ...database import db_session
 from ...models.user import User
@@ -31,7 +32,10 @@ from ...entities.academics.section_entity import SectionEntity
 from ...entities.office_hours import OfficeHoursEntity, CourseSiteEntity
 from ...entities.user_entity import UserEntity
 from ...entities.academics.section_member_entity import SectionMemberEntity
+from ..export import stream_rows
 from ..exceptions import CoursePermissionException, ResourceNotFoundException
+from ..pagination import keyset_page, paginated_length
+from ..search import matches
 
 __authors__ = ["Ajay Gandecha", "Kris Jordan"]
 __copyright__ = "Copyright 2024"
@@ -171,17 +175,13 @@ class CourseSiteService:
 
         Returns:
             Paginated[CourseMemberOverview]
+
+        Raises:
+            CoursePermissionException: If the user is not a member of the course.
+            InvalidCursorException: If the pagination cursor is malformed.
         """
 
-        # Start building the query
-        member_query = (
-            select(SectionMemberEntity)
-            .join(SectionEntity)
-            .join(UserEntity)
-            .where(SectionEntity.course_site_id == site_id)
-            .options(joinedload(SectionMemberEntity.section))
-            .options(joinedload(SectionMemberEntity.user))
-        )
+        member_query, is_student = self._roster_query(user, site_id)
 
         # Add order by sort from pagination parameters
         if pagination_params.order_by != "":
@@ -189,40 +189,33 @@ class CourseSiteService:
                 getattr(UserEntity, pagination_params.order_by)
             )
 
-        # Create query off of the member query for just the members matching
-        # with the current user (used to determine permissions)
-        user_member_query = member_query.where(SectionMemberEntity.user_id == user.id)
-        user_members = self._session.scalars(user_member_query).all()
-
-        # If the user is not a member of the looked up course, throw an error
-        if len(user_members) == 0:
-            raise CoursePermissionException(
-                "Not allowed to access the roster of a course you are not a member of."
-            )
-
-        # Determines if a user is a student
-        # NOTE: This can be used to limit roster data a user can see compared to
-        # an instructor in the future.
-        is_student = user_members[0].member_role == RosterRole.STUDENT
-
-        # In the cases where sections are taught by different instructors, ensure that
-        # the roster data only includes sections that the user has permissions for.
-        section_ids = [member.section_id for member in user_members]
-        member_query = member_query.where(SectionEntity.id.in_(section_ids))
-
         # Add filtering by inputted pagination parameters
         if pagination_params.filter != "":
-            query = pagination_params.filter
-            criteria = or_(
-                UserEntity.first_name.ilike(f"%{query}%"),
-                UserEntity.last_name.ilike(f"%{query}%"),
-                UserEntity.onyen.ilike(f"%{query}%"),
-            )
+            criteria = matches(UserEntity.search_text, pagination_params.filter)
             member_query = member_query.where(criteria)
 
         # Count the number of rows before applying pagination and filter.
         count_query = select(func.count()).select_from(member_query.subquery())
-        length = self._session.scalar(count_query)
+        length = paginated_length(self._session, count_query, pagination_params)
+
+        # Continue after the cursor rather than skipping rows when one is given
+        if pagination_params.cursor is not None:
+            section_member_entities, next_cursor = keyset_page(
+                self._session,
+                member_query,
+                pagination_params,
+                getattr(UserEntity, pagination_params.order_by or "first_name"),
+                SectionMemberEntity.id,
+            )
+            return Paginated(
+                items=[
+                    self._to_course_member_overview(member, is_student)
+                    for member in section_member_entities
+                ],
+                length=length,
+                next_cursor=next_cursor,
+                params=pagination_params,
+            )
 
         # Calculate offset and limit for pagination
         offset = pagination_params.page * pagination_params.page_size
@@ -248,6 +241,74 @@ class CourseSiteService:
             params=pagination_params,
         )
 
+    def get_course_site_roster_for_export(
+        self, user: User, site_id: int
+    ) -> Iterator[CourseMemberOverview]:
+        """
+        Stream the members of a course for an export, ordered as the roster pages are.
+
+        Returns:
+            Iterator[CourseMemberOverview]: The members, fetched in batches as iterated.
+
+        Raises:
+            CoursePermissionException: If the user is not a member of the course.
+        """
+        member_query, is_student = self._roster_query(user, site_id)
+        member_query = member_query.order_by(
+            SectionEntity.id,
+            UserEntity.first_name,
+            SectionMemberEntity.member_role,
+            SectionMemberEntity.id,
+        )
+        return stream_rows(
+            self._session,
+            member_query,
+            lambda member: self._to_course_member_overview(member, is_student),
+        )
+
+    def _roster_query(
+        self, user: User, site_id: int
+    ) -> tuple[Select[tuple[SectionMemberEntity]], bool]:
+        """
+        Select the members of the sections of a course that the user belongs to.
+
+        Returns:
+            tuple[Select[tuple[SectionMemberEntity]], bool]: The query of members and
+                whether the user is a student of the course.
+
+        Raises:
+            CoursePermissionException: If the user is not a member of the course.
+        """
+        member_query = (
+            select(SectionMemberEntity)
+            .join(SectionEntity)
+            .join(UserEntity)
+            .where(SectionEntity.course_site_id == site_id)
+            .options(joinedload(SectionMemberEntity.section))
+            .options(joinedload(SectionMemberEntity.user))
+        )
+
+        # Create query off of the member query for just the members matching
+        # with the current user (used to determine permissions)
+        user_member_query = member_query.where(SectionMemberEntity.user_id == user.id)
+        user_members = self._session.scalars(user_member_query).all()
+
+        # If the user is not a member of the looked up course, throw an error
+        if len(user_members) == 0:
+            raise CoursePermissionException(
+                "Not allowed to access the roster of a course you are not a member of."
+            )
+
+        # Determines if a user is a student
+        # NOTE: This can be used to limit roster data a user can see compared to
+        # an instructor in the future.
+        is_student = user_members[0].member_role == RosterRole.STUDENT
+
+        # In the cases where sections are taught by different instructors, ensure that
+        # the roster data only includes sections that the user has permissions for.
+        section_ids = [member.section_id for member in user_members]
+        return member_query.where(SectionEntity.id.in_(section_ids)), is_student
+
     def _to_course_member_overview(
         self, section_member: SectionMemberEntity, is_student: bool
     ) -> CourseMemberOverview:
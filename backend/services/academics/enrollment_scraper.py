@@ -0,0 +1,181 @@
+"""
+Scrapes the enrollment totals of COMP sections from UNC's class search reports.
+
+Each term's reports page is fetched concurrently with the others, and conditionally: the
+`ETag` and `Last-Modified` headers of the last response are sent back, so an unchanged page
+is answered with `304 Not Modified` and its previously parsed totals are reused. Pages are
+parsed for their section cards only, rather than building a tree of the whole document.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+from pydantic import BaseModel
+
+from ..exceptions import CourseDataScrapingException
+
+__authors__ = ["Ajay Gandecha", "agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+REPORTS_URL = "https://reports.unc.edu/class-search/tiled/?subject=COMP&term={term}"
+"""Tiled class search report of a term's COMP sections."""
+
+# Currently active terms, keyed by their name in the reports site.
+# This is hard-coded based on the availability and representation
+# of course enrollment data from UNC's course database.
+AVAILABLE_TERMS = {"2024+Summer+II": "24SSII", "2024+Fall": "24F"}
+
+
+class SectionEnrollmentData(BaseModel):
+    enrolled: int
+    total_seats: int
+
+
+Enrollments = dict[tuple[str, str], SectionEnrollmentData]
+"""Enrollment data of sections, keyed by course ID and section number."""
+
+_CARDS = SoupStrainer("div", class_="card")
+
+
+def parse_enrollments(html: bytes | str) -> Enrollments:
+    """Parses the enrollment data of the section cards of a reports page.
+
+    Args:
+        html (bytes | str): The reports page.
+
+    Returns:
+        Enrollments: The enrollment data of each section on the page.
+    """
+    soup = BeautifulSoup(html, "html.parser", parse_only=_CARDS)
+
+    enrollments: Enrollments = {}
+    for card in soup.find_all("div", class_="card"):
+        # Find the course code and section number from title <h2>
+        title_components = card.find("h2").text.split(" ")
+        subject_code = title_components[0]
+        course_number = title_components[2]
+        section_number = title_components[3]
+
+        # Find the available seats
+        seat_status = (
+            card.find("p", class_="card-available-seats")
+            .text.strip()
+            .split(" ")[0]
+            .split("/")
+        )
+        remaining_seats = int(seat_status[0])
+        total_seats = int(seat_status[1])
+
+        course_id = subject_code.lower() + course_number
+        enrollments[(course_id, section_number)] = SectionEnrollmentData(
+            enrolled=total_seats - remaining_seats, total_seats=total_seats
+        )
+    return enrollments
+
+
+@dataclass
+class _CachedPage:
+    etag: str | None
+    last_modified: str | None
+    enrollments: Enrollments
+
+
+class EnrollmentScraper:
+    """Fetches and parses the reports pages of terms, caching them by their validators."""
+
+    def __init__(
+        self,
+        terms: dict[str, str] = AVAILABLE_TERMS,
+        get: Callable[..., requests.Response] = requests.get,
+        timeout: float = 10.0,
+    ):
+        """Initializes a scraper with an empty cache.
+
+        Args:
+            terms (dict[str, str]): IDs of the terms to scrape, keyed by their name in the
+                reports site.
+            get (Callable[..., requests.Response]): Performs HTTP GET requests, like
+                `requests.get`.
+            timeout (float): Seconds to wait for each page.
+        """
+        self._terms = terms
+        self._get = get
+        self._timeout = timeout
+        self._lock = Lock()
+        self._pages: dict[str, _CachedPage] = {}
+        self._not_modified = 0
+
+    def scrape(self) -> dict[str, Enrollments]:
+        """Fetches the enrollment data of every term concurrently.
+
+        Returns:
+            dict[str, Enrollments]: The enrollment data of each term, keyed by term ID.
+
+        Raises:
+            CourseDataScrapingException: If a term's page cannot be fetched or parsed.
+        """
+        if len(self._terms) == 0:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(self._terms)) as executor:
+            enrollments = executor.map(self.fetch, self._terms)
+            return dict(zip(self._terms.values(), enrollments))
+
+    def fetch(self, term: str) -> Enrollments:
+        """Fetches the enrollment data of a term, reusing its parsed page when unchanged.
+
+        Args:
+            term (str): The name of the term in the reports site.
+
+        Raises:
+            CourseDataScrapingException: If the page cannot be fetched or parsed.
+        """
+        cached = self._pages.get(term)
+        headers = {}
+        if cached is not None and cached.etag is not None:
+            headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified is not None:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        try:
+            response = self._get(
+                REPORTS_URL.format(term=term), headers=headers, timeout=self._timeout
+            )
+            if response.status_code == 304 and cached is not None:
+                with self._lock:
+                    self._not_modified += 1
+                return cached.enrollments
+
+            response.raise_for_status()
+            enrollments = parse_enrollments(response.content)
+        except (requests.RequestException, AttributeError, IndexError, ValueError):
+            raise CourseDataScrapingException(
+                f"Error reading COMP data from UNC's database for term: {term}"
+            )
+
+        with self._lock:
+            self._pages[term] = _CachedPage(
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                enrollments=enrollments,
+            )
+        return enrollments
+
+    def invalidate(self) -> None:
+        """Discard every cached page."""
+        with self._lock:
+            self._pages.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Number of cached pages and of responses that were not modified."""
+        with self._lock:
+            return {"pages": len(self._pages), "not_modified": self._not_modified}
+
+
+enrollment_scraper = EnrollmentScraper()
+"""Process-wide EnrollmentScraper of the available terms."""
@@ -4,9 +4,32 @@ Service for hiring.
 
 from itertools import groupby
 from operator import attrgetter
+from typing import Iterator
 from fastapi import Depends
-from sqlalchemy import String, func, or_, select, update
-from sqlalchemy.orm import Session, joinedload, with_polymorphic, selectinload
+from sqlalchemy import (
+    Float,
+    Integer,
+    ScalarSelect,
+    Select,
+    String,
+    case,
+    cast,
+    column,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.orm import (
+    Session,
+    contains_eager,
+    joinedload,
+    with_polymorphic,
+    selectinload,
+)
 
 from backend.models.pagination import Paginated, PaginationParams
 from ...database import db_session
@@ -27,7 +50,10 @@ from ...entities.section_application_table import section_application_table
 from ...entities.academics.hiring.hiring_level_entity import HiringLevelEntity
 from ...entities.academics.hiring.hiring_assignment_entity import HiringAssignmentEntity
 
+from ..export import stream_rows
 from ..exceptions import CoursePermissionException, ResourceNotFoundException
+from ..pagination import keyset_page, paginated_length
+from ..search import matches
 from ...services import PermissionService
 from ...models.academics.hiring.application_review import (
     HiringStatus,
@@ -107,41 +133,56 @@ class HiringService:
                 subject, "hiring.get_status", f"course_site/{course_site_id}"
             )
 
-        # Step 2: Update the values for all reviews.
-
-        # Retrieve all reviews, indexed by ID for efficient searching.
-        hiring_status_reviews_by_id: dict[int, ApplicationReviewOverview] = {}
-        for pool in (
-            hiring_status.not_preferred,
-            hiring_status.not_processed,
-            hiring_status.preferred,
-        ):
-            for review_overview in pool:
-                assert review_overview.id is not None
-                hiring_status_reviews_by_id[review_overview.id] = review_overview
-
-        # Update every application associated with the site.
-        updates: list[dict] = []
-        for persisted in site_entity.application_reviews:
-            request = hiring_status_reviews_by_id[persisted.id]
-            if (
-                persisted.status != request.status
-                or persisted.preference != request.preference
-                or persisted.notes != request.notes
-            ):
-                updates.append(
-                    {
-                        "id": persisted.id,
-                        "status": request.status,
-                        "preference": request.preference,
-                        "notes": request.notes,
-                    }
+        # Step 2: Update the status, preference, and notes of every changed review of
+        # the site in a single statement, joining against the requested values.
+        rows = [
+            (
+                review_overview.id,
+                review_overview.status,
+                review_overview.preference,
+                review_overview.notes,
+            )
+            for pool in (
+                hiring_status.not_preferred,
+                hiring_status.not_processed,
+                hiring_status.preferred,
+            )
+            for review_overview in pool
+        ]
+        if len(rows) > 0:
+            requested = values(
+                column("id", Integer),
+                column("status", ApplicationReviewEntity.status.type),
+                column("preference", Integer),
+                column("notes", String),
+                name="requested",
+            ).data(rows)
+            # VALUES lists are untyped, so status must be cast to its enumeration
+            status = cast(requested.c.status, ApplicationReviewEntity.status.type)
+            result = self._session.execute(
+                update(ApplicationReviewEntity)
+                .where(
+                    ApplicationReviewEntity.id == requested.c.id,
+                    ApplicationReviewEntity.course_site_id == site_entity.id,
+                    or_(
+                        ApplicationReviewEntity.status.is_distinct_from(status),
+                        ApplicationReviewEntity.preference.is_distinct_from(
+                            requested.c.preference
+                        ),
+                        ApplicationReviewEntity.notes.is_distinct_from(
+                            requested.c.notes
+                        ),
+                    ),
                 )
-
-        # Bulk update
-        if len(updates) > 0:
-            self._session.execute(update(ApplicationReviewEntity), updates)
-            self._session.commit()
+                .values(
+                    status=status,
+                    preference=requested.c.preference,
+                    notes=requested.c.notes,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount > 0:
+                self._session.commit()
 
         # Reload the data and return the hiring status.
         return self.get_status(subject, course_site_id)
@@ -299,54 +340,75 @@ class HiringService:
         return self._session.scalars(membership_query).first() is not None
 
     def _create_missing_reviews(self, site: CourseSiteEntity) -> None:
-        need_review: list[int] = self._select_application_ids_without_reviews(site)
-
-        preference: int = self._count_unprocessed(site)
-        if len(need_review) > 0:
-            for application_id in need_review:
-                review = ApplicationReviewEntity(
-                    application_id=application_id,
-                    course_site_id=site.id,
-                    status=ApplicationReviewStatus.NOT_PROCESSED,
-                    preference=preference,
-                    notes="",
-                )
-                preference += 1
-                self._session.add(review)
+        """
+        Creates an unprocessed review of each application to the course site without one,
+        in a single `INSERT ... SELECT` statement.
+
+        New reviews are ordered by application ID after the existing unprocessed reviews.
+
+        Args:
+            site (CourseSiteEntity): The course site to create reviews for.
+        """
+        missing = self._select_application_ids_without_reviews(site).subquery()
+        first_preference = self._count_unprocessed(site)
+        new_reviews = select(
+            missing.c.application_id,
+            literal(site.id),
+            literal(
+                ApplicationReviewStatus.NOT_PROCESSED,
+                ApplicationReviewEntity.status.type,
+            ),
+            first_preference
+            + func.row_number().over(order_by=missing.c.application_id)
+            - 1,
+            literal(""),
+        )
+        result = self._session.execute(
+            insert(ApplicationReviewEntity).from_select(
+                ["application_id", "course_site_id", "status", "preference", "notes"],
+                new_reviews,
+            )
+        )
+        if result.rowcount > 0:
             self._session.commit()
 
-    def _count_unprocessed(self, course_site: CourseSiteEntity) -> int:
+    def _count_unprocessed(self, course_site: CourseSiteEntity) -> ScalarSelect[int]:
         """
-        Returns the maximum preference value for unprocessed applications.
+        Selects the number of unprocessed applications, or 1 if there are none.
 
         Args:
             course_site (CourseSiteEntity): The course site to check against.
 
         Returns:
-            int: The maximum preference value for unprocessed applications.
+            ScalarSelect[int]: The first preference of newly created reviews.
         """
         count_unprocessed = (
-            select(func.count(ApplicationReviewEntity.preference))
+            select(
+                func.coalesce(
+                    func.nullif(func.count(ApplicationReviewEntity.preference), 0), 1
+                )
+            )
             .where(ApplicationReviewEntity.course_site_id == course_site.id)
             .where(
                 ApplicationReviewEntity.status == ApplicationReviewStatus.NOT_PROCESSED
             )
         )
-        return self._session.scalar(count_unprocessed) or 1
+        return count_unprocessed.scalar_subquery()
 
     def _select_application_ids_without_reviews(
         self, course_site: CourseSiteEntity
-    ) -> list[int]:
+    ) -> Select[tuple[int]]:
         """
-        Returns a list of application IDs that do not have a review for a given course site.
+        Selects the IDs of applications that do not have a review for a given course site.
 
         Args:
             course_site (CourseSiteEntity): The course site to check against.
 
         Returns:
-            list[int]: A list of application IDs that do not have a review for the course site.
+            Select[tuple[int]]: The distinct IDs of applications to the course site without
+                a review for it.
         """
-        application_ids = (
+        return (
             select(section_application_table.c.application_id)
             .where(
                 section_application_table.c.section_id.in_(
@@ -362,8 +424,8 @@ class HiringService:
                     )
                 )
             )
+            .distinct()
         )
-        return list(self._session.scalars(application_ids).unique().all())
 
     def _load_application_reviews(
         self, course_site: CourseSiteEntity
@@ -563,87 +625,158 @@ class HiringService:
 
     # Hiring Admin Features
 
-    def _calculate_coverage(
-        self, enrollment: int, assignments: list[HiringAssignmentEntity]
-    ) -> float:
-        coverage: float = 0.0
-        for assignment in assignments:
-            if assignment.hiring_level.classification in {
-                HiringLevelClassification.MS,
-                HiringLevelClassification.PHD,
-            }:
-                coverage += assignment.hiring_level.load
-            elif assignment.hiring_level.classification == HiringLevelClassification.UG:
-                coverage += assignment.hiring_level.load * 0.25
-            else:
-                # IOR
-                coverage += 0
-
-        return (float(enrollment) / 60.0) - coverage
-
     def get_hiring_admin_overview(
         self, subject: User, term_id: str
     ) -> HiringAdminOverview:
-        """Get the overview for hiring during a given term for the site admin."""
+        """Get the overview for hiring during a given term for the site admin.
+
+        The enrollment, cost, and coverage of each course site are aggregated in SQL, and the
+        sections, instructors, and assignments of every course site of the term are each
+        loaded in a single query.
+        """
         # 1. Check for hiring permissions.
         self._permission.enforce(subject, "hiring.admin", "*")
-        # 2. Find the hiring information based on course sites for a given term
-        course_site_query = (
-            select(CourseSiteEntity)
-            .join(CourseSiteEntity.term)
-            .where(TermEntity.id == term_id)
-            .options(
-                joinedload(CourseSiteEntity.sections),
-            )
+
+        # 2. Aggregate the totals of each course site for the term
+        course_site_ids = select(CourseSiteEntity.id).where(
+            CourseSiteEntity.term_id == term_id
         )
-        course_site_entities = self._session.scalars(course_site_query).unique().all()
-
-        # 3. Assemble the overview models
-        hiring_course_site_overviews: list[HiringCourseSiteOverview] = []
-        for course_site_entity in course_site_entities:
-            # Find all of the data for a course site overview
-            section_entites = course_site_entity.sections
-            sections = [
-                section.to_catalog_identity_model() for section in section_entites
-            ]
-            instructors: list[PublicUser] = []
-            total_enrollment = 0
-            for section_entity in section_entites:
-                instructors += [
-                    staff.user.to_public_model()
-                    for staff in section_entity.staff
-                    if staff.member_role == RosterRole.INSTRUCTOR
-                ]
-                total_enrollment += section_entity.enrolled
-
-            assignments = sorted(
-                [
-                    assignment.to_overview_model()
-                    for assignment in course_site_entity.hiring_assignments
-                ],
-                key=lambda x: x.user.last_name,
+        totals = self._session.execute(self._course_site_totals_query(term_id)).all()
+
+        # 3. Load the sections, instructors, and assignments of the course sites
+        sections: dict[int, list[CatalogSectionIdentity]] = {}
+        section_query = (
+            select(SectionEntity)
+            .where(SectionEntity.course_site_id.in_(course_site_ids))
+            .order_by(SectionEntity.id)
+            .options(joinedload(SectionEntity.course))
+        )
+        for section_entity in self._session.scalars(section_query):
+            sections.setdefault(section_entity.course_site_id, []).append(
+                section_entity.to_catalog_identity_model()
             )
-            total_cost = sum([assignment.level.salary for assignment in assignments])
-            coverage = self._calculate_coverage(
-                total_enrollment, course_site_entity.hiring_assignments
+
+        instructors: dict[int, list[PublicUser]] = {}
+        instructor_ids = (
+            select(SectionEntity.course_site_id, SectionMemberEntity.user_id)
+            .join(SectionMemberEntity.section)
+            .where(SectionEntity.course_site_id.in_(course_site_ids))
+            .where(SectionMemberEntity.member_role == RosterRole.INSTRUCTOR)
+            .distinct()
+            .subquery()
+        )
+        instructor_query = (
+            select(instructor_ids.c.course_site_id, UserEntity)
+            .join(UserEntity, UserEntity.id == instructor_ids.c.user_id)
+            .order_by(UserEntity.last_name, UserEntity.first_name, UserEntity.id)
+        )
+        for course_site_id, user_entity in self._session.execute(instructor_query):
+            instructors.setdefault(course_site_id, []).append(
+                user_entity.to_public_model()
             )
 
-            # Create overview with found data
-            course_site_overview = HiringCourseSiteOverview(
-                course_site_id=course_site_entity.id,
-                sections=sections,
-                instructors=list(set(instructors)),
-                total_enrollment=total_enrollment,
-                total_cost=total_cost,
-                coverage=coverage,
-                assignments=assignments,
+        assignments: dict[int, list[HiringAssignmentOverview]] = {}
+        assignment_query = (
+            select(HiringAssignmentEntity)
+            .join(HiringAssignmentEntity.user)
+            .where(HiringAssignmentEntity.course_site_id.in_(course_site_ids))
+            .order_by(UserEntity.last_name, HiringAssignmentEntity.id)
+            .options(
+                contains_eager(HiringAssignmentEntity.user),
+                joinedload(HiringAssignmentEntity.hiring_level),
+            )
+        )
+        for assignment_entity in self._session.scalars(assignment_query):
+            assignments.setdefault(assignment_entity.course_site_id, []).append(
+                assignment_entity.to_overview_model()
             )
 
-            # Add overview to the list
-            hiring_course_site_overviews.append(course_site_overview)
+        # 4. Return hiring admin overview object
+        return HiringAdminOverview(
+            sites=[
+                HiringCourseSiteOverview(
+                    course_site_id=row.id,
+                    sections=sections.get(row.id, []),
+                    instructors=instructors.get(row.id, []),
+                    total_enrollment=row.total_enrollment,
+                    total_cost=row.total_cost,
+                    coverage=row.coverage,
+                    assignments=assignments.get(row.id, []),
+                )
+                for row in totals
+            ]
+        )
 
-        # 4. Return hiring adming overview object
-        return HiringAdminOverview(sites=hiring_course_site_overviews)
+    def _course_site_totals_query(self, term_id: str) -> Select:
+        """
+        Selects the total enrollment, cost, and coverage of each course site of a term.
+
+        Coverage is the enrollment in sixties less the load of the course site's assignments,
+        where graduate students carry their full load, undergraduates a quarter of theirs,
+        and instructors of record none.
+
+        Args:
+            term_id (str): The ID of the term.
+
+        Returns:
+            Select: Rows of the `id`, `total_enrollment`, `total_cost`, and `coverage` of
+                each course site, ordered by ID.
+        """
+        enrollment = (
+            select(
+                SectionEntity.course_site_id,
+                func.sum(SectionEntity.enrolled).label("total_enrollment"),
+            )
+            .where(SectionEntity.term_id == term_id)
+            .group_by(SectionEntity.course_site_id)
+            .subquery()
+        )
+        staffing = (
+            select(
+                HiringAssignmentEntity.course_site_id,
+                func.sum(HiringLevelEntity.salary).label("total_cost"),
+                func.sum(
+                    case(
+                        (
+                            HiringLevelEntity.classification.in_(
+                                [
+                                    HiringLevelClassification.MS,
+                                    HiringLevelClassification.PHD,
+                                ]
+                            ),
+                            HiringLevelEntity.load,
+                        ),
+                        (
+                            HiringLevelEntity.classification
+                            == HiringLevelClassification.UG,
+                            HiringLevelEntity.load * 0.25,
+                        ),
+                        else_=0.0,
+                    )
+                ).label("total_load"),
+            )
+            .join(HiringAssignmentEntity.hiring_level)
+            .join(HiringAssignmentEntity.course_site)
+            .where(CourseSiteEntity.term_id == term_id)
+            .group_by(HiringAssignmentEntity.course_site_id)
+            .subquery()
+        )
+        total_enrollment = func.coalesce(enrollment.c.total_enrollment, 0)
+        return (
+            select(
+                CourseSiteEntity.id,
+                total_enrollment.label("total_enrollment"),
+                func.coalesce(staffing.c.total_cost, 0.0).label("total_cost"),
+                (
+                    cast(total_enrollment, Float) / 60.0
+                    - func.coalesce(staffing.c.total_load, 0.0)
+                ).label("coverage"),
+            )
+            .outerjoin(enrollment, enrollment.c.course_site_id == CourseSiteEntity.id)
+            .outerjoin(staffing, staffing.c.course_site_id == CourseSiteEntity.id)
+            .where(CourseSiteEntity.term_id == term_id)
+            .order_by(CourseSiteEntity.id)
+        )
 
     def get_hiring_admin_course_overview(
         self, subject: User, course_site_id: str
@@ -813,6 +946,7 @@ class HiringService:
         # 2. Build query
         assignment_query = (
             select(HiringAssignmentEntity)
+            .join(HiringAssignmentEntity.user)
             .where(HiringAssignmentEntity.term_id == term_id)
             .where(
                 HiringAssignmentEntity.status.in_(
@@ -834,14 +968,8 @@ class HiringService:
 
         # Filter based on search entry
         if pagination_params.filter != "":
-            query = pagination_params.filter
-            criteria = or_(
-                UserEntity.first_name.ilike(f"%{query}%"),
-                UserEntity.last_name.ilike(f"%{query}%"),
-            )
-            assignment_query = assignment_query.join(HiringAssignmentEntity.user).where(
-                criteria
-            )
+            criteria = matches(UserEntity.search_text, pagination_params.filter)
+            assignment_query = assignment_query.where(criteria)
             count_query = count_query.join(HiringAssignmentEntity.user).where(criteria)
 
         # Load joined data into assignment_query
@@ -850,6 +978,26 @@ class HiringService:
             .joinedload(CourseSiteEntity.sections)
             .joinedload(SectionEntity.staff),
         )
+        length = paginated_length(self._session, count_query, pagination_params)
+
+        # Continue after the cursor rather than skipping rows when one is given
+        if pagination_params.cursor is not None:
+            assignment_entities, next_cursor = keyset_page(
+                self._session,
+                assignment_query,
+                pagination_params,
+                UserEntity.last_name,
+                HiringAssignmentEntity.id,
+            )
+            return Paginated(
+                items=[
+                    assignment.to_summary_overview_model()
+                    for assignment in assignment_entities
+                ],
+                length=length,
+                next_cursor=next_cursor,
+                params=pagination_params,
+            )
 
         # Calculate offset and limit for pagination
         offset = pagination_params.page * pagination_params.page_size
@@ -859,7 +1007,6 @@ class HiringService:
         )
 
         # 3. Fetch data and build summary model
-        length = self._session.scalar(count_query) or 0
         assignment_entities = self._session.scalars(assignment_query).unique().all()
 
         return Paginated(
@@ -873,30 +1020,39 @@ class HiringService:
 
     def get_hiring_summary_for_csv(
         self, subject: User, term_id: str
-    ) -> list[HiringAssignmentCsvRow]:
-        """Returns the hires to show on a summary page for a given term."""
+    ) -> Iterator[HiringAssignmentCsvRow]:
+        """Streams the hires of a term for an export, ordered by last name."""
         # 1. Check for hiring permissions.
         self._permission.enforce(subject, "hiring.summary", "*")
         # 2. Build query
         assignment_query = (
             select(HiringAssignmentEntity)
+            .join(HiringAssignmentEntity.user)
             .where(HiringAssignmentEntity.term_id == term_id)
             .where(
                 HiringAssignmentEntity.status.in_(
                     [HiringAssignmentStatus.COMMIT, HiringAssignmentStatus.FINAL]
                 )
             )
+            .order_by(UserEntity.last_name, HiringAssignmentEntity.id)
+            .options(
+                contains_eager(HiringAssignmentEntity.user),
+                joinedload(HiringAssignmentEntity.hiring_level),
+                joinedload(HiringAssignmentEntity.course_site)
+                .selectinload(CourseSiteEntity.sections)
+                .selectinload(SectionEntity.staff)
+                .joinedload(SectionMemberEntity.user),
+            )
+        )
+        # 3. Stream items
+        return stream_rows(
+            self._session, assignment_query, HiringAssignmentEntity.to_csv_row
         )
-        # 3. Return items
-        assignment_entities = self._session.scalars(assignment_query).all()
-        return [
-            assignment_entity.to_csv_row() for assignment_entity in assignment_entities
-        ]
 
     def get_course_site_hiring_status_csv(
         self, subject: User, course_site_id: int
-    ) -> list[ApplicationReviewCsvRow]:
-        """Retrieves the applications to a course for a CSV export."""
+    ) -> Iterator[ApplicationReviewCsvRow]:
+        """Streams the applications to a course for an export."""
         # Step 0: Load a Course Site
         site_entity = self._load_course_site(course_site_id)
 
@@ -906,10 +1062,27 @@ class HiringService:
                 subject, "hiring.get_status", f"course_site/{course_site_id}"
             )
 
-        # Step 2: Convert all applicants to rows and return
-        return [
-            application.to_csv_row() for application in site_entity.application_reviews
-        ]
+        # Step 2: Stream all applicants as rows
+        reviews_query = (
+            select(ApplicationReviewEntity)
+            .where(ApplicationReviewEntity.course_site_id == course_site_id)
+            .order_by(
+                ApplicationReviewEntity.status,
+                ApplicationReviewEntity.preference,
+                ApplicationReviewEntity.id,
+            )
+            .options(
+                joinedload(ApplicationReviewEntity.application).joinedload(
+                    ApplicationEntity.user
+                ),
+                joinedload(ApplicationReviewEntity.application)
+                .selectinload(ApplicationEntity.preferred_sections)
+                .joinedload(SectionEntity.course),
+            )
+        )
+        return stream_rows(
+            self._session, reviews_query, ApplicationReviewEntity.to_csv_row
+        )
 
     def get_hiring_assignments_for_course_site(
         self, subject: User, course_site_id: int, pagination_params: PaginationParams
@@ -939,10 +1112,7 @@ class HiringService:
         if pagination_params.filter != "":
             query = pagination_params.filter
             criteria = or_(
-                UserEntity.first_name.ilike(f"%{query}%"),
-                UserEntity.last_name.ilike(f"%{query}%"),
-                UserEntity.onyen.ilike(f"%{query}%"),
-                UserEntity.email.ilike(f"%{query}%"),
+                matches(UserEntity.search_text, query),
                 HiringLevelEntity.title.ilike(f"%{query}%"),
             )
             assignments_query = assignments_query.where(criteria)
@@ -2,13 +2,9 @@
 The Section Service allows the API to manipulate sections data in the database.
 """
 
-import requests
-from bs4 import BeautifulSoup
-
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import Integer, String, column, or_, select, update, values
 from sqlalchemy.orm import Session, joinedload
-from pydantic import BaseModel
 
 from ...database import db_session
 from ...models.academics import Section, CatalogSection
@@ -21,6 +17,7 @@ from ...entities.academics import SectionEntity, SectionMemberEntity
 from ...entities.academics import CourseEntity
 from ...entities.academics import SectionRoomEntity
 from ..permission import PermissionService
+from .enrollment_scraper import EnrollmentScraper, enrollment_scraper
 
 from ...services.academics.section_member import SectionMemberService
 
@@ -276,89 +273,57 @@ class SectionService:
         self._session.delete(section_entity)
         self._session.commit()
 
-    def update_enrollment_totals(self, subject: User):
+    def update_enrollment_totals(
+        self, subject: User, scraper: EnrollmentScraper = enrollment_scraper
+    ):
         """
         Updates the enrollment totals for COMP course sections in the database.
-        """
-        # Currently active terms.
-        # This is hard-coded based on the availability and representation
-        # of course enrollment data from UNC's course database.
-        AVAILABLE_TERMS = {"2024+Summer+II": "24SSII", "2024+Fall": "24F"}
-
-        # Store updates to make.
-        updates: dict[tuple[str, str], SectionEnrollmentData] = {}
-
-        # Update enrolllment totals for every available term.
-        for term in list(AVAILABLE_TERMS.keys()):
-            try:
-                # Retrieve the data from the UNC Reports site
-                html = requests.get(
-                    f"https://reports.unc.edu/class-search/tiled/?subject=COMP&term={term}"
-                ).content
-
-                # Create HTML parser
-                soup = BeautifulSoup(html, "html.parser")
-
-                # Find cards
-                cards = soup.find_all("div", class_="card")
-
-                # Iterate over all course cards
-                for card in cards:
-                    # Find the course code and section number from title <h2>
-                    title_components = card.find("h2").text.split(" ")
-                    subject_code = title_components[0]
-                    course_number = title_components[2]
-                    section_number = title_components[3]
-
-                    # Find the available seats
-                    seat_status = (
-                        card.find("p", class_="card-available-seats")
-                        .text.strip()
-                        .split(" ")[0]
-                        .split("/")
-                    )
-                    remaining_seats = seat_status[0]
-                    total_seats = seat_status[1]
-
-                    # Find section to update
-                    course_id = subject_code.lower() + course_number
-
-                    # Add items to list to update
-                    updates[(course_id, section_number)] = SectionEnrollmentData(
-                        enrolled=int(total_seats) - int(remaining_seats),
-                        total_seats=int(total_seats),
-                    )
-
-                # Make updates for the term
-                course_ids = list(set([update[0] for update in list(updates.keys())]))
-                section_numbers = list(
-                    set([update[1] for update in list(updates.keys())])
-                )
-                sections_query = select(SectionEntity).where(
-                    SectionEntity.term_id == AVAILABLE_TERMS[term],
-                    SectionEntity.course_id.in_(course_ids),
-                    SectionEntity.number.in_(section_numbers),
-                )
 
-                section_entities = self._session.scalars(sections_query).all()
-
-                # For every section, update the data
-                for section_entity in section_entities:
-                    if (section_entity.course_id, section_entity.number) in updates:
-                        new_enrollment_data = updates[
-                            (section_entity.course_id, section_entity.number)
-                        ]
-                        section_entity.enrolled = new_enrollment_data.enrolled
-                        section_entity.total_seats = new_enrollment_data.total_seats
-
-                # Save changes
-                self._session.commit()
-            except:
-                raise CourseDataScrapingException(
-                    f"Error reading COMP data from UNC's database for term: {term}"
-                )
+        Every term's totals are scraped concurrently, then written by a single
+        `UPDATE ... FROM (VALUES ...)` that only touches sections whose totals changed.
 
+        Args:
+            subject (User): The user updating the totals.
+            scraper (EnrollmentScraper): The source of the totals, by default the process-wide
+                scraper of the available terms.
 
-class SectionEnrollmentData(BaseModel):
-    enrolled: int
-    total_seats: int
+        Raises:
+            CourseDataScrapingException: If a term's totals cannot be scraped.
+        """
+        rows = [
+            (term_id, course_id, section_number, data.enrolled, data.total_seats)
+            for term_id, enrollments in scraper.scrape().items()
+            for (course_id, section_number), data in enrollments.items()
+        ]
+        if len(rows) == 0:
+            return
+
+        enrollments = values(
+            column("term_id", String),
+            column("course_id", String),
+            column("number", String),
+            column("enrolled", Integer),
+            column("total_seats", Integer),
+            name="enrollments",
+        ).data(rows)
+
+        self._session.execute(
+            update(SectionEntity)
+            .where(
+                SectionEntity.term_id == enrollments.c.term_id,
+                SectionEntity.course_id == enrollments.c.course_id,
+                SectionEntity.number == enrollments.c.number,
+                or_(
+                    SectionEntity.enrolled.is_distinct_from(enrollments.c.enrolled),
+                    SectionEntity.total_seats.is_distinct_from(
+                        enrollments.c.total_seats
+                    ),
+                ),
+            )
+            .values(
+                enrolled=enrollments.c.enrolled,
+                total_seats=enrollments.c.total_seats,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self._session.commit()
@@ -3,10 +3,12 @@ The Section Member Service allows the API to manipulate section member data in t
 """
 
 from io import StringIO
+from typing import Iterable, Iterator
 import csv
 
 from fastapi import Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import delete, or_, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from pydantic import BaseModel
@@ -24,7 +26,12 @@ from ...database import db_session
 from ...models import User
 from ...entities.academics import SectionEntity
 from ...entities import UserEntity
+from ...entities.office_hours import (
+    OfficeHoursTicketEntity,
+    user_created_tickets_table,
+)
 from ..permission import PermissionService
+from ..office_hours.queue_snapshot import bump_queue_version
 
 from ..exceptions import ResourceNotFoundException, CoursePermissionException
 
@@ -155,9 +162,29 @@ class SectionMemberService:
             for section_membership in section_memberships
         ]
 
-    def import_users_from_csv(self, subject: User, section_id: int, csv_data: str):
+    def import_users_from_csv(
+        self, subject: User, section_id: int, csv_data: str | Iterable[str]
+    ) -> "UploadResponse":
         """
-        Creates section members for a course section based on an inputted CSV file.
+        Synchronizes the students of a course section with a Canvas roster CSV file.
+
+        Rows are parsed as they are read and the roster is updated with set-based statements
+        in a single transaction: users are created and members added by bulk
+        `INSERT ... ON CONFLICT DO NOTHING`, and students missing from the file are removed by
+        a single `DELETE`.
+
+        Args:
+            subject (User): The instructor importing the roster.
+            section_id (int): ID of the section whose roster is imported.
+            csv_data (str | Iterable[str]): The CSV file, or an iterable of its lines.
+
+        Returns:
+            UploadResponse: The rows of the file added to, already on, created for and removed
+                from the roster.
+
+        Raises:
+            CoursePermissionException: If the subject is not an instructor of the section.
+            HTTPException: If the file is not a Canvas roster of a single section.
         """
         # Get the user membership of the course
         membership_query = select(SectionMemberEntity).where(
@@ -175,123 +202,188 @@ class SectionMemberService:
                 "Cannot create students for a course you are not an instructor of."
             )
 
-        # Read the csv data
-        file = StringIO(csv_data)
-        reader = csv.DictReader(file)
-
-        # Parse each row
-        students: list[StudentMemberJson] = []
-
-        unique_sections = set()
-
-        try:
-            for row in reader:
-                if reader.line_num != 2 and row["Student"] != "Student, Test":
-
-                    # Ensure that the uploaded CSV only contains one section
-                    unique_sections.add(row["Section"])
-                    if len(unique_sections) > 1:
-                        raise HTTPException(
-                            status_code=422, detail="CSV includes multiple sections."
-                        )
-
-                    name = row["Student"]
-                    pid = int(row["SIS User ID"])
-                    onyen = row["SIS Login ID"]
-                    students.append(StudentMemberJson(name=name, pid=pid, onyen=onyen))
-        except:
-            raise HTTPException(
-                status_code=422, detail="CSV is not formatted correctly."
-            )
+        # Parse the students of the csv data, keyed by PID
+        students: dict[int, StudentMemberJson] = {
+            student.pid: student for student in _read_roster(csv_data)
+        }
 
-        student_pids = [student.pid for student in students]
-
-        # There are three cases:
+        # There are four cases:
         #  Case 1: Student is already on the roster - we do not need to make any changes.
         #  Case 2: Students are not on the roster, but user profiles exist - just add a SectionMemberEntity.
         #  Case 3: User is not in the system - create a user and a relationship.
         #  Case 4: Student is already on the roster, but not in the CSV.
 
-        # Case 1: Determine students that are already on the roster
-        existing_roster_members_query = (
-            select(SectionMemberEntity)
+        # Case 1: Determine members that are already on the roster
+        roster_query = (
+            select(
+                UserEntity.pid,
+                UserEntity.onyen,
+                UserEntity.first_name,
+                UserEntity.last_name,
+                SectionMemberEntity.id,
+                SectionMemberEntity.member_role,
+            )
             .join(UserEntity)
             .where(SectionMemberEntity.section_id == section_id)
         )
-        existing_roster_member_entities = self._session.scalars(
-            existing_roster_members_query
-        ).all()
-        existing_roster_member_pids = [
-            member.user.pid for member in existing_roster_member_entities
-        ]
+        roster = {row.pid: row for row in self._session.execute(roster_query)}
+        existing = [student for pid, student in students.items() if pid in roster]
 
         # Case 2: Determine students that are not on the roster, but that exist in the database.
-        existing_users_query = select(UserEntity).where(
-            UserEntity.pid.in_(student_pids)
-        )
-        existing_user_entities = self._session.scalars(existing_users_query).all()
-        existing_users_pids = [member.pid for member in existing_user_entities]
-        for user in existing_user_entities:
-            if user.pid not in existing_roster_member_pids:
-                draft = SectionMemberDraft(user_id=user.id, section_id=section_id)
-                section_membership = SectionMemberEntity.from_draft_model(draft)
-                self._session.add(section_membership)
-
-        # Case 3: Find remaining students that do not exist
-        nonexisting_students = [
-            student for student in students if student.pid not in existing_users_pids
-        ]
-        new_student_entities = []
-
-        for student in nonexisting_students:
-            name_segments = student.name.split(",")
-            last_name = name_segments[0].strip() if len(name_segments) > 0 else ""
-            first_name = name_segments[1].strip() if len(name_segments) > 1 else ""
-            new_student = User(
-                pid=student.pid,
-                onyen=student.onyen,
-                first_name=first_name,
-                last_name=last_name,
-                email=f"{student.onyen}@email.unc.edu",
+        new_pids = [pid for pid in students if pid not in roster]
+        user_ids: dict[int, int] = {}
+        if len(new_pids) > 0:
+            users_query = select(UserEntity.pid, UserEntity.id).where(
+                UserEntity.pid.in_(new_pids)
+            )
+            user_ids = dict(self._session.execute(users_query).tuples().all())
+        added = [students[pid] for pid in new_pids if pid in user_ids]
+
+        # Case 3: Create users for the remaining students.
+        created = [students[pid] for pid in new_pids if pid not in user_ids]
+        if len(created) > 0:
+            created_users = self._session.execute(
+                insert(UserEntity)
+                .on_conflict_do_nothing(index_elements=[UserEntity.pid])
+                .returning(UserEntity.pid, UserEntity.id),
+                [_new_user_values(student) for student in created],
+            )
+            user_ids.update(created_users.tuples().all())
+
+        # Cases 2 and 3: Add memberships for the students that were not on the roster.
+        if len(user_ids) > 0:
+            self._session.execute(
+                insert(SectionMemberEntity).on_conflict_do_nothing(
+                    index_elements=[
+                        SectionMemberEntity.user_id,
+                        SectionMemberEntity.section_id,
+                    ]
+                ),
+                [
+                    {
+                        "user_id": user_id,
+                        "section_id": section_id,
+                        "member_role": RosterRole.STUDENT,
+                    }
+                    for user_id in user_ids.values()
+                ],
             )
-            new_student_entity = UserEntity.from_model(new_student)
-            new_student_entities.append(new_student_entity)
-            self._session.add(new_student_entity)
 
-        # Commit to save new students
+        # Case 4: Remove students not in the CSV file that are still on the roster.
+        removed_rows = [
+            row
+            for pid, row in roster.items()
+            if pid not in students and row.member_role == RosterRole.STUDENT
+        ]
+        if len(removed_rows) > 0:
+            self._delete_members([row.id for row in removed_rows])
+
+        # Commit all changes at once
         self._session.commit()
 
-        # Finish Case 3, adding memberships for new members
-        for new_student in new_student_entities:
-            draft = SectionMemberDraft(user_id=new_student.id, section_id=section_id)
-            section_membership = SectionMemberEntity.from_draft_model(draft)
-            self._session.add(section_membership)
+        return UploadResponse(
+            uploaded=len(students),
+            added=added,
+            existing=existing,
+            created=created,
+            removed=[
+                StudentMemberJson(
+                    name=f"{row.last_name}, {row.first_name}",
+                    pid=row.pid,
+                    onyen=row.onyen,
+                )
+                for row in removed_rows
+            ],
+        )
 
-        # Commit changes
-        self._session.commit()
+    def _delete_members(self, member_ids: list[int]) -> None:
+        """Deletes section members with set-based statements.
 
-        # Case 4: Remove students not in the CSV file that are still on the roster.
-        students_to_remove_query = (
-            select(SectionMemberEntity)
-            .join(UserEntity)
-            .where(
-                UserEntity.pid.not_in(student_pids),
-                UserEntity.pid.in_(existing_roster_member_pids),
+        Mirrors the ORM cascades of `SectionMemberEntity`: tickets called by the members are
+        deleted, and the members are removed as creators of tickets. The queues of the
+        affected office hours events are marked as changed.
+
+        Args:
+            member_ids (list[int]): IDs of the section members to delete.
+        """
+        called_tickets = select(OfficeHoursTicketEntity.id).where(
+            OfficeHoursTicketEntity.caller_id.in_(member_ids)
+        )
+        created_tickets = select(user_created_tickets_table.c.ticket_id).where(
+            user_created_tickets_table.c.member_id.in_(member_ids)
+        )
+        bump_queue_version(
+            self._session,
+            select(OfficeHoursTicketEntity.office_hours_id).where(
+                or_(
+                    OfficeHoursTicketEntity.id.in_(called_tickets),
+                    OfficeHoursTicketEntity.id.in_(created_tickets),
+                )
+            ),
+        )
+        self._session.execute(
+            delete(user_created_tickets_table).where(
+                or_(
+                    user_created_tickets_table.c.member_id.in_(member_ids),
+                    user_created_tickets_table.c.ticket_id.in_(called_tickets),
+                )
             )
-            .where(
-                SectionMemberEntity.section_id == section_id,
-                SectionMemberEntity.member_role == RosterRole.STUDENT,
+        )
+        self._session.execute(
+            delete(OfficeHoursTicketEntity).where(
+                OfficeHoursTicketEntity.caller_id.in_(member_ids)
             )
         )
-        students_to_remove = self._session.scalars(students_to_remove_query).all()
-        for student in students_to_remove:
-            self._session.delete(student)
+        self._session.execute(
+            delete(SectionMemberEntity).where(SectionMemberEntity.id.in_(member_ids))
+        )
+
+
+def _read_roster(csv_data: str | Iterable[str]) -> Iterator["StudentMemberJson"]:
+    """Lazily parses the students of a Canvas roster CSV file.
+
+    Skips Canvas' "Points Possible" row and test student.
+
+    Raises:
+        HTTPException: If a row is malformed or the file includes multiple sections.
+    """
+    lines = StringIO(csv_data) if isinstance(csv_data, str) else csv_data
+    reader = csv.DictReader(lines)
+    section = None
+    try:
+        for row in reader:
+            if reader.line_num == 2 or row["Student"] == "Student, Test":
+                continue
+
+            # Ensure that the uploaded CSV only contains one section
+            if section is None:
+                section = row["Section"]
+            elif row["Section"] != section:
+                raise HTTPException(
+                    status_code=422, detail="CSV includes multiple sections."
+                )
+
+            yield StudentMemberJson(
+                name=row["Student"],
+                pid=int(row["SIS User ID"]),
+                onyen=row["SIS Login ID"],
+            )
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(status_code=422, detail="CSV is not formatted correctly.")
 
-        # Commit changes a final time
-        self._session.commit()
 
-        # Return number added
-        return UploadResponse(uploaded=len(student_pids))
+def _new_user_values(student: "StudentMemberJson") -> dict:
+    """Column values of the user created for a student of a roster."""
+    name_segments = student.name.split(",")
+    last_name = name_segments[0].strip() if len(name_segments) > 0 else ""
+    first_name = name_segments[1].strip() if len(name_segments) > 1 else ""
+    return {
+        "pid": student.pid,
+        "onyen": student.onyen,
+        "first_name": first_name,
+        "last_name": last_name,
+        "email": f"{student.onyen}@email.unc.edu",
+    }
 
 
 class CSVModel(BaseModel):
@@ -306,3 +398,7 @@ class StudentMemberJson(BaseModel):
 
 class UploadResponse(BaseModel):
     uploaded: int
+    added: list[StudentMemberJson] = []
+    existing: list[StudentMemberJson] = []
+    created: list[StudentMemberJson] = []
+    removed: list[StudentMemberJson] = []
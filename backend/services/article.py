@@ -4,11 +4,13 @@ The Article Service allows the API to manipulate article data in the database.
 
 from fastapi import Depends
 from sqlalchemy import select, func, delete
-from sqlalchemy.orm import Session
-from datetime import datetime
+from sqlalchemy.orm import Session, joinedload, selectinload
+from datetime import datetime, timedelta
 
 from ..database import db_session
 from .exceptions import ResourceNotFoundException
+from .search import matches
+from .welcome_cache import WelcomeFragments, welcome_cache
 
 from ..services.event import EventService
 from ..services.permission import PermissionService
@@ -17,8 +19,6 @@ from ..services.coworking import PolicyService, OperatingHoursService
 from ..entities import (
     ArticleEntity,
     UserEntity,
-    EventEntity,
-    EventRegistrationEntity,
     article_author_table,
 )
 from ..entities.coworking import ReservationEntity, reservation_user_table
@@ -47,48 +47,31 @@ class ArticleService:
         permission_svc: PermissionService = Depends(),
         policies_svc: PolicyService = Depends(),
         operating_hours_svc: OperatingHoursService = Depends(),
+        event_svc: EventService = Depends(),
     ):
         """Initializes the session"""
         self._session = session
         self._permission_svc = permission_svc
         self._policies_svc = policies_svc
         self._operating_hours_svc = operating_hours_svc
+        self._event_svc = event_svc
 
     def get_welcome_overview(self, subject: User | None) -> WelcomeOverview:
-        """Retrieves the welcome overview."""
-        # First, retrieve the latest announcement.
-        announcement_query = (
-            select(ArticleEntity)
-            .where(ArticleEntity.is_announcement)
-            .where(ArticleEntity.state == ArticleState.PUBLISHED)
-            .order_by(ArticleEntity.published.desc())
-        )
-        announcement_entity = self._session.scalars(announcement_query).all()
-        announcement = (
-            announcement_entity[0].to_overview_model()
-            if len(announcement_entity) > 0
-            else None
-        )
+        """Retrieves the welcome overview.
 
-        # Next, retrieve the latest news.
-        # For now, this will load a maximum of 10 articles.
-        news_query = (
-            select(ArticleEntity)
-            .where(ArticleEntity.state == ArticleState.PUBLISHED)
-            .where(ArticleEntity.is_announcement == False)
-            .order_by(ArticleEntity.published.desc())
-            .limit(10)
-        )
-        news_entities = self._session.scalars(news_query).all()
-        news = [article.to_overview_model() for article in news_entities]
-
-        # Load operating hours
+        The announcement, news and operating hours shown to everyone are served from the
+        `welcome_cache`, so the overview of an unauthenticated visitor does not query the
+        database on a warm cache. A user's upcoming reservations and registered events are
+        each loaded with a constant number of queries.
+        """
         now = datetime.now()
-        operating_hours = self._operating_hours_svc.schedule(
-            TimeRange(
-                start=now, end=now + self._policies_svc.reservation_window(subject)
-            )
-        )
+        until = now + self._policies_svc.reservation_window(subject)
+        fragments = self._load_welcome_fragments(now, until)
+        operating_hours = [
+            hours
+            for hours in fragments.operating_hours
+            if hours.start <= until and hours.end >= now
+        ]
 
         # Load future reservations for a given user.
         # For now, this will load a maximum of 3 future reservations.
@@ -98,7 +81,13 @@ class ArticleService:
                 select(ReservationEntity)
                 .join(ReservationEntity.users)
                 .where(UserEntity.id == subject.id)
-                .where(ReservationEntity.start > datetime.now())
+                .where(ReservationEntity.start > now)
+                .order_by(ReservationEntity.start)
+                .limit(3)
+                .options(
+                    selectinload(ReservationEntity.seats),
+                    joinedload(ReservationEntity.room),
+                )
             )
             future_reservations_entities = self._session.scalars(
                 future_reservations_query
@@ -111,32 +100,73 @@ class ArticleService:
         # Finally, load future event registrations.
         registered_events = []
         if subject:
-            registered_events_query = (
-                select(EventRegistrationEntity)
-                .where(EventRegistrationEntity.user_id == subject.id)
-                .join(EventEntity)
-                .where(EventEntity.start >= now)
-                .order_by(EventEntity.start)
-            )
-
-            registered_events_entities = self._session.scalars(
-                registered_events_query
-            ).all()
-
-            registered_events = [
-                registration.event.to_overview_model(subject)
-                for registration in registered_events_entities
-            ]
+            registered_events = self._event_svc.get_upcoming_registered_events(subject)
 
         # Construct the welcome overview and return
         return WelcomeOverview(
-            announcement=announcement,
-            latest_news=news,
+            announcement=fragments.announcement,
+            latest_news=fragments.latest_news,
             operating_hours=operating_hours,
             upcoming_reservations=future_reservations,
             registered_events=registered_events,
         )
 
+    def _load_welcome_fragments(
+        self, now: datetime, until: datetime
+    ) -> WelcomeFragments:
+        """Loads the parts of the welcome overview shared by every visitor, if not cached.
+
+        Operating hours are loaded past `until` for as long as the fragments may be cached,
+        so that the overview of every visitor within that time can be served from them.
+        """
+        fragments = welcome_cache.get(until)
+        if fragments is not None:
+            return fragments
+        version = welcome_cache.version
+
+        # First, retrieve the latest announcement.
+        announcement_query = (
+            select(ArticleEntity)
+            .where(ArticleEntity.is_announcement)
+            .where(ArticleEntity.state == ArticleState.PUBLISHED)
+            .order_by(ArticleEntity.published.desc())
+            .limit(1)
+            .options(
+                joinedload(ArticleEntity.organization),
+                selectinload(ArticleEntity.authors),
+            )
+        )
+        announcement_entity = self._session.scalars(announcement_query).one_or_none()
+        announcement = (
+            announcement_entity.to_overview_model() if announcement_entity else None
+        )
+
+        # Next, retrieve the latest news.
+        # For now, this will load a maximum of 10 articles.
+        news_query = (
+            select(ArticleEntity)
+            .where(ArticleEntity.state == ArticleState.PUBLISHED)
+            .where(ArticleEntity.is_announcement == False)
+            .order_by(ArticleEntity.published.desc())
+            .limit(10)
+            .options(
+                joinedload(ArticleEntity.organization),
+                selectinload(ArticleEntity.authors),
+            )
+        )
+        news_entities = self._session.scalars(news_query).all()
+        news = [article.to_overview_model() for article in news_entities]
+
+        # Load operating hours
+        horizon = until + timedelta(seconds=welcome_cache.ttl)
+        operating_hours = self._operating_hours_svc.schedule(
+            TimeRange(start=now, end=horizon)
+        )
+
+        fragments = WelcomeFragments(announcement, news, operating_hours, horizon)
+        welcome_cache.put(fragments, version)
+        return fragments
+
     def get_article(self, slug: str) -> ArticleOverview:
         """Access a single article by slug"""
         article_query = select(ArticleEntity).where(ArticleEntity.slug == slug)
@@ -164,6 +194,11 @@ class ArticleService:
 
         statement = select(ArticleEntity).order_by(ArticleEntity.published.desc())
         length_statement = select(func.count()).select_from(ArticleEntity)
+        if pagination_params.filter != "":
+            criteria = matches(ArticleEntity.search_text, pagination_params.filter)
+            statement = statement.where(criteria)
+            length_statement = length_statement.where(criteria)
+
         offset = pagination_params.page * pagination_params.page_size
         limit = pagination_params.page_size
         statement = statement.offset(offset).limit(limit)
@@ -194,6 +229,7 @@ class ArticleService:
                 )
             )
         self._session.commit()
+        welcome_cache.invalidate()
 
         # 5. Return
         return article_entity.to_overview_model()
@@ -240,6 +276,7 @@ class ArticleService:
                 )
             )
         self._session.commit()
+        welcome_cache.invalidate()
 
         # 5. Return
         return article_entity.to_overview_model()
@@ -259,3 +296,4 @@ class ArticleService:
         # 3. Delete the article
         self._session.delete(article_entity)
         self._session.commit()
+        welcome_cache.invalidate()
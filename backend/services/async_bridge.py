@@ -0,0 +1,95 @@
+"""
+Run synchronous services on an AsyncSession from `async def` routes.
+
+Services are written against a synchronous `Session` and declare their collaborators with
+FastAPI's `Depends`. Rather than duplicating hot read paths as asyncio code, `run_service`
+constructs a service's dependency graph around the synchronous facade of an AsyncSession and
+calls it through `AsyncSession.run_sync`. SQLAlchemy then performs every statement on the
+asyncpg driver, suspending the route's coroutine instead of blocking a threadpool thread while
+the database responds.
+
+Usage:
+
+    @api.get("")
+    async def get_coworking_status(
+        subject: User = Depends(registered_user),
+        session: AsyncSession = Depends(async_db_session),
+    ) -> Status:
+        return await run_service(
+            session, StatusService, lambda svc: svc.get_coworking_status(subject)
+        )
+"""
+
+import inspect
+from typing import Any, Callable, TypeVar, get_type_hints
+
+from fastapi import params
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..database import db_session
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+S = TypeVar("S")
+R = TypeVar("R")
+
+
+def build_service(service: type[S], session: Session) -> S:
+    """Construct a service and its `Depends()` collaborators around session.
+
+    As with FastAPI's dependency cache, each service class is constructed at most once, so
+    collaborators such as PermissionService are shared by every service that depends on them.
+
+    Args:
+        service (type[S]): The service class to construct.
+        session (Session): The session injected wherever a service depends on `db_session`.
+
+    Returns:
+        S: The constructed service.
+
+    Raises:
+        TypeError: If a dependency is neither `db_session` nor a class.
+    """
+    return _build(service, session, {})
+
+
+def _build(service: type[S], session: Session, built: dict[type, Any]) -> S:
+    if service in built:
+        return built[service]
+
+    hints = get_type_hints(service.__init__)
+    kwargs: dict[str, Any] = {}
+    for name, parameter in inspect.signature(service.__init__).parameters.items():
+        if not isinstance(parameter.default, params.Depends):
+            continue
+        dependency = parameter.default.dependency or hints.get(name)
+        if dependency is db_session:
+            kwargs[name] = session
+        elif inspect.isclass(dependency):
+            kwargs[name] = _build(dependency, session, built)
+        else:
+            raise TypeError(
+                f"Cannot construct {service.__name__}: unsupported dependency {name}"
+            )
+
+    built[service] = instance = service(**kwargs)
+    return instance
+
+
+async def run_service(
+    session: AsyncSession, service: type[S], call: Callable[[S], R]
+) -> R:
+    """Construct service around session and await call(service) on the asyncio driver.
+
+    Args:
+        session (AsyncSession): The session of the request, see `async_db_session`.
+        service (type[S]): The service class to construct.
+        call (Callable[[S], R]): Invokes the service method of interest.
+
+    Returns:
+        R: The value returned by call.
+    """
+    return await session.run_sync(lambda sync: call(build_service(service, sync)))
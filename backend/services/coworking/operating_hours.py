@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from .exceptions import OperatingHoursCannotOverlapException
 from ..exceptions import ResourceNotFoundException
 from ..permission import PermissionService
+from ..welcome_cache import welcome_cache
 from ...models import User
 from ...database import db_session
 from ...models.coworking import OperatingHours, TimeRange
@@ -91,6 +92,7 @@ class OperatingHoursService:
         entity = OperatingHoursEntity(start=time_range.start, end=time_range.end)
         self._session.add(entity)
         self._session.commit()
+        welcome_cache.invalidate()
         return entity.to_model()
 
     def delete(self, subject: User, operating_hours: OperatingHours) -> None:
@@ -114,3 +116,4 @@ class OperatingHoursService:
         )
         self._session.delete(operating_hours_entity)
         self._session.commit()
+        welcome_cache.invalidate()
@@ -1,10 +1,10 @@
 """Service that manages reservations in the coworking space."""
 
 from fastapi import Depends
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from random import random
 from typing import Sequence
-from sqlalchemy import or_, and_
+from sqlalchemy import Row, or_, and_, select
 from sqlalchemy.orm import Session, joinedload
 from backend.entities.room_entity import RoomEntity
 
@@ -27,9 +27,13 @@ from ...models.coworking import (
 )
 from ...entities import UserEntity
 from ...entities.coworking import ReservationEntity, SeatEntity
+from ...entities.coworking.reservation_user_table import reservation_user_table
 from .seat import SeatService
 from .policy import PolicyService
 from .operating_hours import OperatingHoursService
+from .reservation_map import ReservationMapGrid
+from .room_usage import RoomUsageService, week_of
+from .seat_availability_engine import seat_availability_engine
 from ..permission import PermissionService
 
 __authors__ = ["Kris Jordan", "Matt Vu", "Yuvraj Jain"]
@@ -52,6 +56,7 @@ class ReservationService:
         policy_svc: PolicyService = Depends(),
         operating_hours_svc: OperatingHoursService = Depends(),
         seats_svc: SeatService = Depends(),
+        room_usage_svc: RoomUsageService = Depends(),
     ):
         """Initializes a new ReservationService.
 
@@ -63,6 +68,7 @@ class ReservationService:
         self._policy_svc = policy_svc
         self._operating_hours_svc = operating_hours_svc
         self._seat_svc = seats_svc
+        self._room_usage_svc = room_usage_svc
 
     def get_reservation(self, subject: User, id: int) -> Reservation:
         """Lookup a reservation by ID.
@@ -155,7 +161,7 @@ class ReservationService:
             .all()
         )
 
-        reservations = self._state_transition_reservation_entities_by_time(
+        reservations = self._filter_expired_reservation_entities(
             datetime.now(), reservations
         )
 
@@ -183,7 +189,7 @@ class ReservationService:
             .all()
         )
 
-        reservations = self._state_transition_reservation_entities_by_time(
+        reservations = self._filter_expired_reservation_entities(
             datetime.now(), reservations
         )
 
@@ -192,40 +198,33 @@ class ReservationService:
     def _check_user_reservation_duration(
         self, user: UserIdentity, bounds: TimeRange
     ) -> bool:
-        """Helper method to check if the total reservation duration for a user exceeds 6 hours.
+        """Helper method to check if a room reservation fits in the user's weekly limit.
 
         Args:
             user (User): The user for whom to check reservation duration.
             bounds (TimeRange): The time range to check for reservation duration.
 
         Returns:
-            True if a user has >= 6 total hours reserved
+            True if the user's reserved time in the week of bounds stays within the limit
             False if a user has exceeded the limit
         """
-        reservations = self.get_current_reservations_for_user(user, user)
-        total_duration = timedelta()
-        total_duration += bounds.end - bounds.start
+        remaining = self._room_usage_svc.get_remaining(user, week_of(bounds.start))
+        return bounds.end - bounds.start <= remaining
 
-        for reservation in reservations:
-            if reservation.room:
-                total_duration += reservation.end - reservation.start
-        if total_duration > self._policy_svc.room_reservation_weekly_limit():
-            return False
-        return True
-
-    def get_total_time_user_reservations(self, user: UserIdentity) -> str:
-        """Calculate the total duration (in hours) of study room reservations for the given user.
+    def get_total_time_user_reservations(
+        self, user: UserIdentity, week: date | None = None
+    ) -> str:
+        """Calculate the study room time (in hours) the given user may still reserve in a week.
         Args:
-            user (UserIdentity): The user for whom to calculate the total reservation time.
+            user (UserIdentity): The user for whom to calculate the remaining reservation time.
+            week (date | None): The Monday starting the week. Defaults to the current week.
         Returns:
-            str: The total reservation time in hours.
+            str: The remaining reservation time in hours.
         """
-        reservations = self.get_current_reservations_for_user(user, user)
-        duration = timedelta()
-        for reservation in reservations:
-            if reservation.room:
-                duration += reservation.end - reservation.start
-        str_duration = str(6 - (round((duration.total_seconds() / 3600) * 2) / 2))
+        remaining = self._room_usage_svc.get_remaining(
+            user, week or week_of(datetime.now())
+        )
+        str_duration = str(round((remaining.total_seconds() / 3600) * 2) / 2)
         if str_duration[2] == "0":
             return str_duration.rstrip("0").rstrip(".")
         return str_duration
@@ -267,28 +266,30 @@ class ReservationService:
             This method assumes individual user reservations. Group reservations require adjustments to
             the implementation. Future reservations are shown up to the current time.
         """
-        reserved_date_map: dict[str, list[int]] = {}
-
-        # Query DB to get reservable rooms.
-        rooms = self._get_reservable_rooms()
+        # Query DB to get reservable room IDs.
+        room_ids = self._get_reservable_room_ids()
 
         # Generate a 1 day time range to get operating hours on date.
-        date_midnight = date.replace(hour=0, minute=0, second=0)
+        date_midnight = date.replace(hour=0, minute=0, second=0, microsecond=0)
         tomorrow_midnight = date_midnight + timedelta(days=1)
         day_range = TimeRange(start=date_midnight, end=tomorrow_midnight)
 
         # Check if operating hours exist on date
         try:
-            operating_hours_on_date = self._operating_hours_svc.schedule(day_range)[0]
+            schedule = self._operating_hours_svc.schedule(day_range)
+            # Prefer the hours opening on date to those of the day before running past midnight
+            operating_hours_on_date = next(
+                (hours for hours in schedule if hours.start >= date_midnight),
+                schedule[0],
+            )
         except:
             # TODO: Possibly consider thowing exception and handling on the frontend?
             # If operating hours don't exist, then return an all grayed out table
             # from 10 am to 6 pm which is the standard office hours.
-            for room in rooms:
-                if room.id:
-                    reserved_date_map[room.id] = [RoomState.UNAVAILABLE.value] * 16
             return ReservationMapDetails(
-                reserved_date_map=reserved_date_map,
+                reserved_date_map={
+                    room_id: [RoomState.UNAVAILABLE.value] * 16 for room_id in room_ids
+                },
                 operating_hours_start=datetime.now().replace(hour=10, minute=0),
                 operating_hours_end=datetime.now().replace(hour=18, minute=0),
                 number_of_time_slots=16,
@@ -311,58 +312,40 @@ class ReservationService:
             2 * operating_hours_time_delta.total_seconds() / 3600
         )
 
-        # Need current time to gray out slots in the past on that day.
+        # Reservations are not painted in slots that have already passed today.
         current_time = datetime.now()
-        current_time_idx = self._idx_calculation(current_time, operating_hours_start)
-
-        for room in rooms:
-            time_slots_for_room = [0] * operating_hours_duration
-
-            # # Making slots up till current time gray
-            # This code no longer required, but may be required in the future.
-            # Please keep this here for now.
-            # if date.date() == current_time.date():
-            #     for i in range(0, current_time_idx):
-            #         time_slots_for_room[i] = RoomState.UNAVAILABLE.value
+        lower_bound = 0
+        if date.date() == current_time.date():
+            lower_bound = self._idx_calculation(current_time, operating_hours_start)
+
+        # The XL is not shown on the map, but the subject's XL reservations still
+        # gray out the study rooms during the same slots.
+        include_xl = "SN156" in room_ids
+        grid = ReservationMapGrid(
+            [room_id for room_id in room_ids if room_id != "SN156"],
+            operating_hours_start,
+            operating_hours_duration,
+            lower_bound,
+        )
 
-            if room.id == "SN156":
-                reservations = self._query_xl_reservations_by_date_for_user(
-                    date, subject
-                )
+        # Currently only assuming single user.
+        # TODO: If making group reservations, need to change this.
+        for (
+            room_id,
+            start,
+            end,
+            subject_reserved,
+        ) in self._query_map_reservations_by_date(date, subject, room_ids, include_xl):
+            if room_id is None:
+                grid.occupy_subject(start, end)
             else:
-                reservations = self._query_confirmed_reservations_by_date_and_room(
-                    date, room.id
-                )
-            for reservation in reservations:
-                start_idx = self._idx_calculation(
-                    reservation.start, operating_hours_start
-                )
-                end_idx = self._idx_calculation(reservation.end, operating_hours_start)
-
-                if date.date() == current_time.date():
-                    if end_idx < current_time_idx:
-                        continue
-                    start_idx = max(current_time_idx, start_idx)
-
-                for idx in range(start_idx, end_idx):
-                    # Currently only assuming single user.
-                    # TODO: If making group reservations, need to change this.
-                    if reservation.users[0].id == subject.id:
-                        time_slots_for_room[idx] = RoomState.SUBJECT_RESERVED.value
-                    else:
-                        if time_slots_for_room[idx] != RoomState.SUBJECT_RESERVED.value:
-                            time_slots_for_room[idx] = RoomState.RESERVED.value
-            reserved_date_map[room.id] = time_slots_for_room
-
-        self._transform_date_map_for_unavailable(reserved_date_map)
-        if "SN156" in reserved_date_map:
-            del reserved_date_map["SN156"]
-        self._transform_date_map_for_officehours(
-            date, reserved_date_map, operating_hours_start, operating_hours_duration
-        )
+                grid.reserve(room_id, start, end, subject_reserved)
+
+        grid.block_subject_conflicts()
+        grid.block_office_hours(date, self._policy_svc.office_hours(date=date))
 
         return ReservationMapDetails(
-            reserved_date_map=reserved_date_map,
+            reserved_date_map=grid.to_map(),
             operating_hours_start=operating_hours_start,
             operating_hours_end=operating_hours_end,
             number_of_time_slots=operating_hours_duration,
@@ -511,6 +494,62 @@ class ReservationService:
 
         return [reservation.to_model() for reservation in reservations]
 
+    def _query_map_reservations_by_date(
+        self,
+        date: datetime,
+        subject: User,
+        room_ids: Sequence[str],
+        include_xl: bool,
+    ) -> Sequence[Row[tuple[str | None, datetime, datetime, bool]]]:
+        """
+        Queries the spans of all active room reservations on a given date in a single statement.
+
+        Each row is a `(room_id, start, end, subject_reserved)` tuple. When include_xl is True,
+        the subject's own XL reservations are included with a `room_id` of None.
+
+        Args:
+            date (datetime): The date for which to query reservations.
+            subject (User): The user whose reservations are flagged as subject_reserved.
+            room_ids (Sequence[str]): The IDs of rooms whose reservations are queried.
+            include_xl (bool): Whether to include the subject's XL reservations.
+
+        Returns:
+            Sequence[Row]: The spans of the reservations ordered by start.
+        """
+        start = date.replace(hour=0, minute=0, second=0, microsecond=0)
+        subject_reserved = (
+            select(reservation_user_table.c.reservation_id)
+            .where(
+                reservation_user_table.c.reservation_id == ReservationEntity.id,
+                reservation_user_table.c.user_id == subject.id,
+            )
+            .exists()
+        )
+        in_scope = ReservationEntity.room_id.in_(room_ids)
+        if include_xl:
+            in_scope = or_(
+                in_scope, and_(ReservationEntity.room_id == None, subject_reserved)
+            )
+
+        query = (
+            select(
+                ReservationEntity.room_id,
+                ReservationEntity.start,
+                ReservationEntity.end,
+                subject_reserved.label("subject_reserved"),
+            )
+            .where(
+                ReservationEntity.start < start + timedelta(hours=24),
+                ReservationEntity.end > start,
+                ReservationEntity.state.not_in(
+                    [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
+                ),
+                in_scope,
+            )
+            .order_by(ReservationEntity.start)
+        )
+        return self._session.execute(query).all()
+
     def _query_xl_reservations_by_date_for_user(
         self, date: datetime, subject: User
     ) -> Sequence[Reservation]:
@@ -533,6 +572,22 @@ class ReservationService:
 
         return [reservation.to_model() for reservation in reservations]
 
+    def _get_reservable_room_ids(self) -> Sequence[str]:
+        """
+        Retrieves the IDs of all reservable rooms, and the XL (SN156), ordered by ID.
+
+        Unlike `_get_reservable_rooms`, this does not load the seats of each room.
+
+        Returns:
+            Sequence[str]: The IDs of the reservable rooms.
+        """
+        query = (
+            select(RoomEntity.id)
+            .where(or_(RoomEntity.reservable == True, RoomEntity.id == "SN156"))
+            .order_by(RoomEntity.id)
+        )
+        return self._session.scalars(query).all()
+
     def _get_reservable_rooms(self) -> Sequence[RoomDetails]:
         """
         Retrieves a list of all reservable rooms.
@@ -583,63 +638,69 @@ class ReservationService:
             .all()
         )
 
-        reservations = self._state_transition_reservation_entities_by_time(
+        reservations = self._filter_expired_reservation_entities(
             datetime.now(), reservations
         )
 
         return [reservation.to_model() for reservation in reservations]
 
-    def _state_transition_reservation_entities_by_time(
+    def _filter_expired_reservation_entities(
         self, cutoff: datetime, reservations: Sequence[ReservationEntity]
     ) -> Sequence[ReservationEntity]:
-        """Private, internal helper method for transitioning reservation entities
-        based on time. Three transitions are time-based:
+        """Private, internal helper method for excluding reservations that have expired by
+        cutoff but have not yet been transitioned by the ReservationSweepService.
 
-        1. Draft -> Cancelled following PolicyService#reservation_draft_timeout() after
-           the reservation's created at.
-        2. Confirmed -> Cancelled following PolicyService#reservation_checkin_timeout() after
-            the reservation's start.
-        3. Checked In -> Checked Out following the reservation's end.
+        Read paths use this rather than transitioning reservations themselves so that they
+        remain pure reads.
 
         Args:
-            moment (datetime): The time in which checks of expiration are made against. In
+            cutoff (datetime): The time in which checks of expiration are made against. In
                 production, this is the current time.
-            reservations (Sequence[ReservationEntity]): The list of entities to state transition.
+            reservations (Sequence[ReservationEntity]): The list of entities to filter.
 
         Returns:
-            Sequence[ReservationEntity] - All ReservationEntities that were not state transitioned.
+            Sequence[ReservationEntity] - All ReservationEntities that have not expired.
         """
-        valid: list[ReservationEntity] = []
-        dirty = False
-        for reservation in reservations:
-            if (
-                reservation.state == ReservationState.DRAFT
-                and reservation.created_at
-                + self._policy_svc.reservation_draft_timeout()
-                < cutoff
-            ):
-                reservation.state = ReservationState.CANCELLED
-                dirty = True
-            elif (
-                reservation.state == ReservationState.CONFIRMED
-                and reservation.start + self._policy_svc.reservation_checkin_timeout()
-                < cutoff
-            ):
-                reservation.state = ReservationState.CANCELLED
-                dirty = True
-            elif (
-                reservation.state == ReservationState.CHECKED_IN
-                and reservation.end <= cutoff
-            ):
-                reservation.state = ReservationState.CHECKED_OUT
-                dirty = True
-            else:
-                valid.append(reservation)
+        return [
+            reservation
+            for reservation in reservations
+            if self._expired_state(cutoff, reservation) is None
+        ]
 
-        if dirty:
-            self._session.commit()
+    def _expired_state(
+        self, cutoff: datetime, reservation: ReservationEntity
+    ) -> ReservationState | None:
+        """The state a reservation has transitioned to by cutoff with the passage of time.
 
-        return valid
+        Three transitions are time-based:
+
+        1. Draft -> Cancelled following PolicyService#reservation_draft_timeout() after
+           the reservation's created at.
+        2. Confirmed -> Cancelled following PolicyService#reservation_checkin_timeout() after
+            the reservation's start.
+        3. Checked In -> Checked Out following the reservation's end.
+
+        Returns:
+            ReservationState | None - The state after expiration, or None if it has not expired.
+        """
+        if (
+            reservation.state == ReservationState.DRAFT
+            and reservation.created_at + self._policy_svc.reservation_draft_timeout()
+            < cutoff
+        ):
+            return ReservationState.CANCELLED
+        elif (
+            reservation.state == ReservationState.CONFIRMED
+            and reservation.start + self._policy_svc.reservation_checkin_timeout()
+            < cutoff
+        ):
+            return ReservationState.CANCELLED
+        elif (
+            reservation.state == ReservationState.CHECKED_IN
+            and reservation.end <= cutoff
+        ):
+            return ReservationState.CHECKED_OUT
+        return None
 
     def seat_availability(
         self, seats: Sequence[Seat], bounds: TimeRange
@@ -684,6 +745,46 @@ class ReservationService:
         if len(open_availability_list.availability) == 0:
             return []
 
+        threshold = (
+            self._policy_svc.minimum_reservation_duration()
+            - MINUMUM_RESERVATION_EPSILON
+        )
+
+        # Answer from the incrementally maintained reservation index when it covers the bounds.
+        seat_availability_engine.sync(self._session, self._policy_svc)
+        if seat_availability_engine.covers(bounds):
+            available_seats = seat_availability_engine.seat_availability(
+                seats, open_availability_list, now, threshold
+            )
+        else:
+            available_seats = self._seat_availability_from_reservations(
+                seats, open_availability_list, threshold
+            )
+
+        # Sort by nearest available ASC, duration DESC, reservable (False before True), with entropy
+        # The rationale for entropy is when XL is wide open for walkins, within the given seat search
+        # we'd like to mix up the order in which seats are assigned rather than always giving away
+        # the same sequence of seats (and causing more consisten wear and tear to it).
+        available_seats.sort(
+            key=lambda sa: (
+                sa.availability[0].start,
+                -1 * sa.availability[0].duration(),
+                sa.reservable,
+                random(),
+            )
+        )
+
+        return available_seats
+
+    def _seat_availability_from_reservations(
+        self,
+        seats: Sequence[Seat],
+        open_availability_list: AvailabilityList,
+        threshold: timedelta,
+    ) -> list[SeatAvailability]:
+        """Computes seat availability by loading the seats' reservations from the database.
+
+        Used for bounds beyond the horizon of the SeatAvailabilityEngine."""
         # Start from a position where all seats begin with same availability as
         # open_availability_list. From there, reservations will subtract availability
         # from the given seat.
@@ -704,29 +805,12 @@ class ReservationService:
         )
 
         # Remove seats with availability below threshold
-        available_seats: list[SeatAvailability] = list(
+        return list(
             self._prune_seats_below_availability_threshold(
-                list(seat_availability_dict.values()),
-                self._policy_svc.minimum_reservation_duration()
-                - MINUMUM_RESERVATION_EPSILON,
+                list(seat_availability_dict.values()), threshold
             )
         )
 
-        # Sort by nearest available ASC, duration DESC, reservable (False before True), with entropy
-        # The rationale for entropy is when XL is wide open for walkins, within the given seat search
-        # we'd like to mix up the order in which seats are assigned rather than always giving away
-        # the same sequence of seats (and causing more consisten wear and tear to it).
-        available_seats.sort(
-            key=lambda sa: (
-                sa.availability[0].start,
-                -1 * sa.availability[0].duration(),
-                sa.reservable,
-                random(),
-            )
-        )
-
-        return available_seats
-
     def draft_reservation(
         self, subject: User, request: ReservationRequest
     ) -> Reservation:
@@ -873,7 +957,9 @@ class ReservationService:
         )
 
         self._session.add(draft)
+        self._room_usage_svc.adjust(draft, self._room_usage_svc.usage(draft))
         self._session.commit()
+        seat_availability_engine.apply(draft, self._policy_svc)
         return draft.to_model()
 
     def change_reservation(
@@ -914,10 +1000,17 @@ class ReservationService:
                     subject, "coworking.reservation.manage", f"user/{user_id}"
                 )
 
-        # Handle Requested State Changes
+        # Apply time-based transitions the sweeper has not made yet before any change
+        usage = self._room_usage_svc.usage(entity)
         dirty = False
+        expired_state = self._expired_state(datetime.now(), entity)
+        if expired_state is not None:
+            entity.state = expired_state
+            dirty = True
+
+        # Handle Requested State Changes
         if delta.state is not None and delta.state != entity.state:
-            dirty = dirty or self._change_state(entity, delta.state)
+            dirty = self._change_state(entity, delta.state) or dirty
             if entity.state == ReservationState.CHECKED_OUT:
                 entity.end = datetime.now()
 
@@ -935,7 +1028,11 @@ class ReservationService:
             raise NotImplementedError("Changing start/end not yet supported")
 
         if dirty:  # and valid():
+            self._room_usage_svc.adjust(
+                entity, self._room_usage_svc.usage(entity) - usage
+            )
             self._session.commit()
+            seat_availability_engine.apply(entity, self._policy_svc)
 
         return entity.to_model()
 
@@ -1082,10 +1179,22 @@ class ReservationService:
         # Ensure permissions to manage reservation checkins
         self._permission_svc.enforce(subject, "coworking.reservation.manage", f"user/*")
 
+        # Apply time-based transitions the sweeper has not made yet
+        expired_state = self._expired_state(datetime.now(), entity)
+        if expired_state is not None:
+            usage = self._room_usage_svc.usage(entity)
+            entity.state = expired_state
+            self._room_usage_svc.adjust(
+                entity, self._room_usage_svc.usage(entity) - usage
+            )
+            self._session.commit()
+            seat_availability_engine.apply(entity, self._policy_svc)
+
         # Update state iff ReservationState is current CONFIRMED
         if entity.state == ReservationState.CONFIRMED:
             entity.state = ReservationState.CHECKED_IN
             self._session.commit()
+            seat_availability_engine.apply(entity, self._policy_svc)
         elif entity.state in (
             ReservationState.CANCELLED,
             ReservationState.CHECKED_OUT,
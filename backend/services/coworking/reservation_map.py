@@ -0,0 +1,127 @@
+"""Room-by-slot grid used to build the study room reservation map."""
+
+from datetime import datetime, timedelta, time
+from typing import Sequence
+
+from ...models.coworking import RoomState
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+SLOT_DURATION = timedelta(minutes=30)
+"""Every column of the reservation map represents a 30-minute time slot."""
+
+
+def _translation(mapping: dict[RoomState, RoomState]) -> bytes:
+    """Build a `bytes.translate` table that rewrites RoomState values according to mapping."""
+    table = bytearray(range(256))
+    for source, target in mapping.items():
+        table[source.value] = target.value
+    return bytes(table)
+
+
+# Painting another user's reservation never overwrites the subject's own reservation.
+_RESERVE = _translation({RoomState.AVAILABLE: RoomState.RESERVED})
+
+# Slots that are still available become unavailable while the subject is busy elsewhere.
+_BLOCK = _translation({RoomState.AVAILABLE: RoomState.UNAVAILABLE})
+
+
+class ReservationMapGrid:
+    """Dense grid of RoomState values with one row per room and one column per time slot.
+
+    Rows are stored as `bytearray`s so that each interval is painted with a single slice
+    assignment or `translate` call rather than a Python loop over its slots. Intervals are
+    clamped to the grid, and to `lower_bound`, before painting.
+    """
+
+    def __init__(
+        self,
+        room_ids: Sequence[str],
+        start: datetime,
+        number_of_time_slots: int,
+        lower_bound: int = 0,
+    ):
+        """Initializes an all-available grid.
+
+        Args:
+            room_ids (Sequence[str]): The rooms of the map, in display order.
+            start (datetime): The start of the first time slot.
+            number_of_time_slots (int): The number of 30-minute slots in the grid.
+            lower_bound (int): Reservations are not painted before this slot index.
+        """
+        self._start = start
+        self._length = max(number_of_time_slots, 0)
+        self._lower_bound = max(lower_bound, 0)
+        self._rows: dict[str, bytearray] = {
+            room_id: bytearray(self._length) for room_id in room_ids
+        }
+        self._subject_slots: list[tuple[int, int]] = []
+
+    def index(self, moment: datetime) -> int:
+        """Index of the time slot containing moment, which may fall outside of the grid."""
+        return (moment - self._start) // SLOT_DURATION
+
+    def _clamp(self, start: datetime, end: datetime, lower: int) -> tuple[int, int]:
+        return max(self.index(start), lower), min(self.index(end), self._length)
+
+    def reserve(
+        self, room_id: str, start: datetime, end: datetime, subject_reserved: bool
+    ) -> None:
+        """Paint a reservation of room_id.
+
+        Args:
+            room_id (str): The room that is reserved.
+            start (datetime): The start of the reservation.
+            end (datetime): The end of the reservation.
+            subject_reserved (bool): Whether the reservation belongs to the subject.
+        """
+        row = self._rows.get(room_id)
+        if row is None:
+            return
+        lo, hi = self._clamp(start, end, self._lower_bound)
+        if lo >= hi:
+            return
+        if subject_reserved:
+            row[lo:hi] = bytes([RoomState.SUBJECT_RESERVED.value]) * (hi - lo)
+            self._subject_slots.append((lo, hi))
+        else:
+            row[lo:hi] = row[lo:hi].translate(_RESERVE)
+
+    def occupy_subject(self, start: datetime, end: datetime) -> None:
+        """Record a span in which the subject is busy outside of the map's rooms (i.e. in the XL)."""
+        lo, hi = self._clamp(start, end, self._lower_bound)
+        if lo < hi:
+            self._subject_slots.append((lo, hi))
+
+    def block_subject_conflicts(self) -> None:
+        """Mark available slots unavailable in every room while the subject has a reservation."""
+        for lo, hi in self._subject_slots:
+            for row in self._rows.values():
+                row[lo:hi] = row[lo:hi].translate(_BLOCK)
+
+    def block_office_hours(
+        self, date: datetime, office_hours: dict[str, list[tuple[time, time]]]
+    ) -> None:
+        """Mark every slot of a room unavailable while it hosts office hours.
+
+        Args:
+            date (datetime): The date the office hours times are on.
+            office_hours (dict[str, list[tuple[time, time]]]): Office hours spans keyed by room ID.
+        """
+        day = date.date()
+        for room_id, hours in office_hours.items():
+            row = self._rows.get(room_id)
+            if row is None:
+                continue
+            for start, end in hours:
+                lo, hi = self._clamp(
+                    datetime.combine(day, start), datetime.combine(day, end), 0
+                )
+                if lo < hi:
+                    row[lo:hi] = bytes([RoomState.UNAVAILABLE.value]) * (hi - lo)
+
+    def to_map(self) -> dict[str, list[int]]:
+        """Convert the grid to the `reserved_date_map` of a ReservationMapDetails."""
+        return {room_id: list(row) for room_id, row in self._rows.items()}
@@ -0,0 +1,143 @@
+"""
+Scheduled sweeper that applies the time-based state transitions of reservations.
+
+Three transitions happen with the passage of time rather than a user's action:
+
+1. Draft -> Cancelled following PolicyService#reservation_draft_timeout() after the
+   reservation's created at.
+2. Confirmed -> Cancelled following PolicyService#reservation_checkin_timeout() after the
+   reservation's start.
+3. Checked In -> Checked Out following the reservation's end.
+
+Each is made with a single set-based UPDATE, so a sweep costs three statements no matter how
+many reservations expire, and one more to release the study room time of the cancelled
+reservations from the weekly ledger of RoomUsageService. Read paths of ReservationService
+only filter out reservations that have expired but not yet been swept. The sweeper runs as an
+asyncio task of the API process, see `backend/main.py`, or as a standalone worker, see
+`backend/script/reservation_sweeper.py`.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+
+from fastapi import Depends
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from ...database import db_session, engine
+from ...entities.coworking import ReservationEntity
+from ...models.coworking import ReservationState, ReservationSweep
+from .policy import PolicyService
+from .room_usage import RoomUsageService
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+logger = logging.getLogger(__name__)
+
+
+class ReservationSweepService:
+    """Moves expired reservations to their next state in bulk."""
+
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        policy_svc: PolicyService = Depends(),
+        room_usage_svc: RoomUsageService = Depends(),
+    ):
+        """Initializes a new ReservationSweepService.
+
+        Args:
+            session (Session): The database session to use, typically injected by FastAPI.
+            policy_svc (PolicyService): The policies that determine when reservations expire.
+            room_usage_svc (RoomUsageService): The ledger cancelled room time is released from.
+        """
+        self._session = session
+        self._policy_svc = policy_svc
+        self._room_usage_svc = room_usage_svc
+
+    def sweep(self, now: datetime | None = None) -> ReservationSweep:
+        """Transition every reservation that has expired by now and commit.
+
+        Args:
+            now (datetime | None): The time expiration is checked against. Defaults to the
+                current time.
+
+        Returns:
+            ReservationSweep: The number of reservations moved by each transition.
+        """
+        now = now or datetime.now()
+        RS = ReservationState
+        drafts_cancelled = self._transition(
+            RS.DRAFT,
+            RS.CANCELLED,
+            ReservationEntity.created_at
+            < now - self._policy_svc.reservation_draft_timeout(),
+            now,
+        )
+        unclaimed_cancelled = self._transition(
+            RS.CONFIRMED,
+            RS.CANCELLED,
+            ReservationEntity.start
+            < now - self._policy_svc.reservation_checkin_timeout(),
+            now,
+        )
+        checked_out = self._transition(
+            RS.CHECKED_IN, RS.CHECKED_OUT, ReservationEntity.end <= now, now
+        )
+        self._room_usage_svc.release(drafts_cancelled + unclaimed_cancelled)
+        self._session.commit()
+
+        return ReservationSweep(
+            drafts_cancelled=len(drafts_cancelled),
+            unclaimed_cancelled=len(unclaimed_cancelled),
+            checked_out=len(checked_out),
+            swept_at=now,
+        )
+
+    def _transition(
+        self, source: ReservationState, target: ReservationState, expired, now: datetime
+    ) -> list[int]:
+        # updated_at is set explicitly so that SeatAvailabilityEngine syncs see the change.
+        return list(
+            self._session.scalars(
+                update(ReservationEntity)
+                .where(ReservationEntity.state == source, expired)
+                .values(state=target, updated_at=now)
+                .returning(ReservationEntity.id)
+                .execution_options(synchronize_session=False)
+            )
+        )
+
+
+def sweep_expired_reservations() -> ReservationSweep:
+    """Run one sweep in a session of its own and log its counts."""
+    with Session(engine) as session:
+        policy_svc = PolicyService()
+        report = ReservationSweepService(
+            session, policy_svc, RoomUsageService(session, policy_svc)
+        ).sweep()
+    logger.info(
+        "Swept reservations: %d drafts cancelled, %d unclaimed cancelled, %d checked out",
+        report.drafts_cancelled,
+        report.unclaimed_cancelled,
+        report.checked_out,
+    )
+    return report
+
+
+async def run_reservation_sweeper(interval: float) -> None:
+    """Sweep expired reservations every interval seconds until cancelled.
+
+    Sweeps run in a worker thread so that the event loop is never blocked on the database.
+    Several API worker processes may each run a sweeper; concurrent sweeps are harmless
+    because an UPDATE only matches reservations still in the source state.
+    """
+    while True:
+        try:
+            await asyncio.to_thread(sweep_expired_reservations)
+        except Exception:
+            logger.exception("Reservation sweep failed")
+        await asyncio.sleep(interval)
@@ -0,0 +1,249 @@
+"""
+Ledger of the study room time each user has reserved per calendar week.
+
+A user may reserve PolicyService#room_reservation_weekly_limit() of study room time per
+calendar week, Monday through Sunday, and a room reservation counts toward the week it starts
+in while it is drafted, confirmed, checked in or checked out. Rather than summing the user's
+reservations on every draft and quota display, ReservationService adjusts the user's row of the
+ledger in the same transaction as each change to a room reservation, and the sweeper releases
+the time of the reservations it cancels, so that a quota check reads a single row by its
+primary key.
+
+Drift, such as from reservations written outside of the services, is corrected by reconciling
+the ledger's current and future weeks with the reservations. Reconciliation runs as an asyncio
+task of the API process, see `backend/main.py`, or as a standalone worker, see
+`backend/script/room_usage_reconciler.py`.
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Sequence
+
+from fastapi import Depends
+from sqlalchemy import Date, cast, func, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ...database import db_session, engine
+from ...entities.coworking import ReservationEntity, RoomUsageEntity
+from ...entities.coworking.reservation_user_table import reservation_user_table
+from ...models.coworking import ReservationState
+from ...models.user import UserIdentity
+from .policy import PolicyService
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+logger = logging.getLogger(__name__)
+
+COUNTED_STATES = (
+    ReservationState.DRAFT,
+    ReservationState.CONFIRMED,
+    ReservationState.CHECKED_IN,
+    ReservationState.CHECKED_OUT,
+)
+"""States in which a room reservation counts toward its users' weekly quotas."""
+
+
+def week_of(moment: datetime) -> date:
+    """The Monday starting the calendar week of moment."""
+    return moment.date() - timedelta(days=moment.weekday())
+
+
+class RoomUsageService:
+    """Maintains and reads the weekly study room time reserved by each user."""
+
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        policy_svc: PolicyService = Depends(),
+    ):
+        """Initializes a new RoomUsageService.
+
+        Args:
+            session (Session): The database session to use, typically injected by FastAPI.
+            policy_svc (PolicyService): The policies that limit study room time.
+        """
+        self._session = session
+        self._policy_svc = policy_svc
+
+    def get_reserved(self, user: UserIdentity, week: date) -> timedelta:
+        """The study room time a user has reserved in a week.
+
+        Args:
+            user (UserIdentity): The user whose reserved time is read.
+            week (date): The Monday starting the week, see `week_of`.
+
+        Returns:
+            timedelta: The time reserved, read from the user's row of the ledger.
+        """
+        reserved = self._session.scalar(
+            select(RoomUsageEntity.reserved).where(
+                RoomUsageEntity.user_id == user.id, RoomUsageEntity.week == week
+            )
+        )
+        return reserved or timedelta()
+
+    def get_remaining(self, user: UserIdentity, week: date) -> timedelta:
+        """The study room time a user may still reserve in a week."""
+        return self._policy_svc.room_reservation_weekly_limit() - self.get_reserved(
+            user, week
+        )
+
+    def usage(self, reservation: ReservationEntity) -> timedelta:
+        """The time a reservation counts toward each of its users' quotas in its state."""
+        if reservation.room_id is None or reservation.state not in COUNTED_STATES:
+            return timedelta()
+        return reservation.end - reservation.start
+
+    def adjust(self, reservation: ReservationEntity, change: timedelta) -> None:
+        """Add change to the time reserved by each of a reservation's users in the week it
+        starts, within the session's transaction.
+
+        Args:
+            reservation (ReservationEntity): The reservation whose usage changed.
+            change (timedelta): The change of its usage, see `usage`.
+        """
+        if not change or not reservation.users:
+            return
+        week = week_of(reservation.start)
+        statement = insert(RoomUsageEntity).values(
+            [
+                {"user_id": user.id, "week": week, "reserved": change}
+                for user in reservation.users
+            ]
+        )
+        self._session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[RoomUsageEntity.user_id, RoomUsageEntity.week],
+                set_={
+                    "reserved": RoomUsageEntity.reserved + statement.excluded.reserved
+                },
+            )
+        )
+
+    def release(self, reservation_ids: Sequence[int]) -> None:
+        """Subtract the time of room reservations cancelled in bulk from their users' weeks,
+        within the session's transaction.
+
+        Args:
+            reservation_ids (Sequence[int]): Reservations just moved from a counted state
+                to cancelled. Those not of a room are ignored.
+        """
+        if not reservation_ids:
+            return
+        week = cast(func.date_trunc("week", ReservationEntity.start), Date)
+        released = (
+            select(
+                reservation_user_table.c.user_id,
+                week.label("week"),
+                func.sum(ReservationEntity.end - ReservationEntity.start).label(
+                    "reserved"
+                ),
+            )
+            .join(
+                reservation_user_table,
+                reservation_user_table.c.reservation_id == ReservationEntity.id,
+            )
+            .where(
+                ReservationEntity.id.in_(reservation_ids),
+                ReservationEntity.room_id.is_not(None),
+            )
+            .group_by(reservation_user_table.c.user_id, week)
+            .subquery()
+        )
+        self._session.execute(
+            update(RoomUsageEntity)
+            .where(
+                RoomUsageEntity.user_id == released.c.user_id,
+                RoomUsageEntity.week == released.c.week,
+            )
+            .values(reserved=RoomUsageEntity.reserved - released.c.reserved)
+            .execution_options(synchronize_session=False)
+        )
+
+    def reconcile(self, now: datetime | None = None) -> int:
+        """Recompute the ledger's rows of the current and future weeks from the reservations
+        and commit.
+
+        The ledger is locked against concurrent adjustments while it is recomputed, so a
+        reservation committed meanwhile is either counted here or adjusts the ledger after.
+
+        Args:
+            now (datetime | None): The time whose week is the first reconciled. Defaults to
+                the current time.
+
+        Returns:
+            int: The number of rows of the ledger that were corrected.
+        """
+        since = datetime.combine(week_of(now or datetime.now()), time())
+        self._session.execute(
+            text(f"LOCK TABLE {RoomUsageEntity.__tablename__} IN EXCLUSIVE MODE")
+        )
+
+        week = cast(func.date_trunc("week", ReservationEntity.start), Date)
+        expected = {
+            (user_id, reservation_week): reserved
+            for user_id, reservation_week, reserved in self._session.execute(
+                select(
+                    reservation_user_table.c.user_id,
+                    week,
+                    func.sum(ReservationEntity.end - ReservationEntity.start),
+                )
+                .join(
+                    reservation_user_table,
+                    reservation_user_table.c.reservation_id == ReservationEntity.id,
+                )
+                .where(
+                    ReservationEntity.room_id.is_not(None),
+                    ReservationEntity.state.in_(COUNTED_STATES),
+                    ReservationEntity.start >= since,
+                )
+                .group_by(reservation_user_table.c.user_id, week)
+            )
+        }
+
+        corrected = 0
+        for entity in self._session.scalars(
+            select(RoomUsageEntity)
+            .where(RoomUsageEntity.week >= since.date())
+            .execution_options(populate_existing=True)
+        ):
+            reserved = expected.pop((entity.user_id, entity.week), timedelta())
+            if entity.reserved != reserved:
+                entity.reserved = reserved
+                corrected += 1
+        for (user_id, reservation_week), reserved in expected.items():
+            self._session.add(
+                RoomUsageEntity(
+                    user_id=user_id, week=reservation_week, reserved=reserved
+                )
+            )
+            corrected += 1
+        self._session.commit()
+        return corrected
+
+
+def reconcile_room_usage() -> int:
+    """Reconcile the ledger in a session of its own and log the rows corrected."""
+    with Session(engine) as session:
+        corrected = RoomUsageService(session, PolicyService()).reconcile()
+    logger.info("Reconciled room usage: %d rows corrected", corrected)
+    return corrected
+
+
+async def run_room_usage_reconciler(interval: float) -> None:
+    """Reconcile the ledger every interval seconds until cancelled.
+
+    Reconciliations run in a worker thread so that the event loop is never blocked on the
+    database. Concurrent reconciliations of several API worker processes are serialized by
+    the ledger's lock.
+    """
+    while True:
+        try:
+            await asyncio.to_thread(reconcile_room_usage)
+        except Exception:
+            logger.exception("Room usage reconciliation failed")
+        await asyncio.sleep(interval)
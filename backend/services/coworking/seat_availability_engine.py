@@ -0,0 +1,370 @@
+"""
+Process-wide index of seat reservations used to answer seat availability queries.
+
+The XL status endpoint is polled continuously and every poll asks ReservationService for the
+availability of every seat. Rather than loading, transitioning and subtracting every active
+reservation as pydantic models on each poll, the SeatAvailabilityEngine keeps each seat's
+reserved intervals as compact, sorted integer arrays and subtracts them from operating hours
+with a single linear sweep per seat.
+
+The index is loaded once for a horizon of upcoming time and then kept current incrementally:
+ReservationService applies every reservation it drafts, confirms, cancels, checks in or checks
+out, and each query first applies rows other worker processes changed since the last sync, found
+through `coworking__reservation.updated_at`. The index is fully reloaded every `refresh` seconds.
+"""
+
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timedelta
+import time
+from threading import Lock
+from typing import Iterable, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ...entities.coworking import ReservationEntity
+from ...entities.coworking.reservation_seat_table import reservation_seat_table
+from ...models.coworking import (
+    AvailabilityList,
+    ReservationState,
+    Seat,
+    SeatAvailability,
+    TimeRange,
+)
+from .policy import PolicyService
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+_EPOCH = datetime(1970, 1, 1)
+_RESOLUTION = timedelta(microseconds=1)
+
+_ACTIVE_STATES = (
+    ReservationState.DRAFT,
+    ReservationState.CONFIRMED,
+    ReservationState.CHECKED_IN,
+)
+
+
+def to_epoch(moment: datetime) -> int:
+    """Convert a naive datetime to integer microseconds since the epoch."""
+    return (moment - _EPOCH) // _RESOLUTION
+
+
+def from_epoch(value: int) -> datetime:
+    """Convert integer microseconds since the epoch back to a naive datetime."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+class _SeatIntervals:
+    """Reserved intervals of a single seat as parallel arrays sorted by start."""
+
+    __slots__ = ("starts", "ends", "expires", "ids")
+
+    def __init__(self):
+        self.starts = array("q")
+        self.ends = array("q")
+        self.expires = array("q")
+        self.ids = array("q")
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def insert(self, id: int, start: int, end: int, expires: int) -> None:
+        i = bisect_left(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+        self.expires.insert(i, expires)
+        self.ids.insert(i, id)
+
+    def remove(self, id: int, start: int) -> None:
+        i = bisect_left(self.starts, start)
+        while i < len(self.starts) and self.starts[i] == start:
+            if self.ids[i] == id:
+                del self.starts[i], self.ends[i], self.expires[i], self.ids[i]
+                return
+            i += 1
+
+    def free(
+        self, open_ranges: Sequence[tuple[int, int]], now: int
+    ) -> list[tuple[int, int]]:
+        """Subtract every interval that has not expired by now from open_ranges.
+
+        Args:
+            open_ranges (Sequence[tuple[int, int]]): Sorted, non-overlapping open intervals.
+            now (int): Intervals that expire before now are ignored.
+
+        Returns:
+            list[tuple[int, int]]: The sorted, non-overlapping intervals that remain free.
+        """
+        last = bisect_left(self.starts, open_ranges[-1][1])
+        busy = [
+            (self.starts[i], self.ends[i])
+            for i in range(last)
+            if self.expires[i] >= now and self.ends[i] > open_ranges[0][0]
+        ]
+
+        free: list[tuple[int, int]] = []
+        b = 0
+        for start, end in open_ranges:
+            cursor = start
+            while b < len(busy) and busy[b][0] < end:
+                busy_start, busy_end = busy[b]
+                if busy_start > cursor:
+                    free.append((cursor, busy_start))
+                if busy_end > cursor:
+                    cursor = busy_end
+                if busy_end > end:
+                    # The interval also overlaps the next open range.
+                    break
+                b += 1
+            if cursor < end:
+                free.append((cursor, end))
+        return free
+
+
+class SeatAvailabilityEngine:
+    """Incrementally maintained index of active seat reservations within a horizon.
+
+    A reservation is indexed by each of its seats along with the moment it stops counting
+    against availability, mirroring the time-based transitions of the ReservationSweepService: a
+    draft expires after the draft timeout, a confirmed reservation after the check-in timeout and
+    a checked-in reservation at its end. Expired intervals are skipped by queries, so answers are
+    correct between sweeps.
+    """
+
+    def __init__(
+        self,
+        horizon: timedelta = timedelta(days=14),
+        refresh: float = 300.0,
+        slack: timedelta = timedelta(minutes=1),
+    ):
+        """Initialize an unloaded engine.
+
+        Args:
+            horizon (timedelta): How far past the time of a full load reservations are indexed.
+            refresh (float): Seconds between full reloads of the index.
+            slack (timedelta): How far before the previous sync changed rows are re-read, which
+                covers transactions that committed after the rows they wrote were stamped.
+        """
+        self._horizon = horizon
+        self._refresh = refresh
+        self._slack = slack
+        self._lock = Lock()
+        self._loaded = False
+        self._reload_at = 0.0
+        self._since = _EPOCH
+        self._from = 0
+        self._until = 0
+        self._seats: dict[int, _SeatIntervals] = {}
+        self._reservations: dict[int, tuple[tuple[int, ...], int]] = {}
+        self._loads = 0
+        self._syncs = 0
+        self._applied = 0
+
+    def covers(self, bounds: TimeRange) -> bool:
+        """Whether the index holds every reservation that could overlap bounds."""
+        return (
+            self._loaded
+            and to_epoch(bounds.start) >= self._from
+            and to_epoch(bounds.end) <= self._until
+        )
+
+    def sync(self, session: Session, policy_svc: PolicyService) -> None:
+        """Bring the index up to date, fully reloading it when it is unloaded or due.
+
+        Args:
+            session (Session): The session used to read reservations.
+            policy_svc (PolicyService): The policies that determine when reservations expire.
+        """
+        started = datetime.now()
+        if not self._loaded or time.monotonic() >= self._reload_at:
+            self._load(session, policy_svc, started)
+            return
+
+        query = self._query().where(ReservationEntity.updated_at >= self._since)
+        rows = session.execute(query).all()
+        with self._lock:
+            for id, reservation in self._group(rows).items():
+                self._upsert(id, *reservation, policy_svc)
+            self._since = started - self._slack
+            self._syncs += 1
+
+    def apply(self, reservation: ReservationEntity, policy_svc: PolicyService) -> None:
+        """Index the current state of a reservation that was just committed.
+
+        Args:
+            reservation (ReservationEntity): The drafted or changed reservation.
+            policy_svc (PolicyService): The policies that determine when reservations expire.
+        """
+        if not self._loaded:
+            return
+        seat_ids = tuple(seat.id for seat in reservation.seats)
+        with self._lock:
+            self._upsert(
+                reservation.id,
+                seat_ids,
+                reservation.start,
+                reservation.end,
+                reservation.state,
+                reservation.created_at,
+                policy_svc,
+            )
+
+    def seat_availability(
+        self,
+        seats: Sequence[Seat],
+        open_availability: AvailabilityList,
+        now: datetime,
+        threshold: timedelta,
+    ) -> list[SeatAvailability]:
+        """Availability of seats while open, excluding ranges shorter than threshold.
+
+        Args:
+            seats (Sequence[Seat]): The seats to check the availability of.
+            open_availability (AvailabilityList): Operating hours constrained to the query bounds.
+            now (datetime): Reservations that have expired by now do not reduce availability.
+            threshold (timedelta): The minimum duration of an available range.
+
+        Returns:
+            list[SeatAvailability]: The seats with at least one range of availability, unsorted.
+        """
+        open_ranges = [
+            (to_epoch(time_range.start), to_epoch(time_range.end))
+            for time_range in open_availability.availability
+        ]
+        minimum = threshold // _RESOLUTION
+        cutoff = to_epoch(now)
+
+        free_by_seat: list[tuple[Seat, list[tuple[int, int]]]] = []
+        with self._lock:
+            for seat in seats:
+                if seat.id is None:
+                    continue
+                intervals = self._seats.get(seat.id)
+                free = intervals.free(open_ranges, cutoff) if intervals else open_ranges
+                free = [(start, end) for start, end in free if end - start >= minimum]
+                if len(free) > 0:
+                    free_by_seat.append((seat, free))
+
+        available: list[SeatAvailability] = [
+            SeatAvailability(
+                availability=[
+                    TimeRange(start=from_epoch(start), end=from_epoch(end))
+                    for start, end in free
+                ],
+                **seat.model_dump(),
+            )
+            for seat, free in free_by_seat
+        ]
+        return available
+
+    def invalidate(self) -> None:
+        """Discard the index so that the next sync fully reloads it."""
+        with self._lock:
+            self._loaded = False
+            self._seats.clear()
+            self._reservations.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Load, incremental sync, applied change and indexed interval counts of the engine."""
+        with self._lock:
+            return {
+                "loads": self._loads,
+                "syncs": self._syncs,
+                "applied": self._applied,
+                "reservations": len(self._reservations),
+                "intervals": sum(len(seat) for seat in self._seats.values()),
+            }
+
+    # Private helper methods
+
+    def _query(self):
+        return select(
+            ReservationEntity.id,
+            reservation_seat_table.c.seat_id,
+            ReservationEntity.start,
+            ReservationEntity.end,
+            ReservationEntity.state,
+            ReservationEntity.created_at,
+        ).join(
+            reservation_seat_table,
+            reservation_seat_table.c.reservation_id == ReservationEntity.id,
+        )
+
+    def _group(self, rows: Iterable) -> dict[int, tuple]:
+        """Group (id, seat_id, start, end, state, created_at) rows by reservation."""
+        reservations: dict[int, tuple] = {}
+        for id, seat_id, start, end, state, created_at in rows:
+            if id in reservations:
+                seat_ids = reservations[id][0] + (seat_id,)
+                reservations[id] = (seat_ids, *reservations[id][1:])
+            else:
+                reservations[id] = ((seat_id,), start, end, state, created_at)
+        return reservations
+
+    def _load(
+        self, session: Session, policy_svc: PolicyService, started: datetime
+    ) -> None:
+        since = started - self._slack
+        until = started + self._horizon
+        query = self._query().where(
+            ReservationEntity.state.in_(_ACTIVE_STATES),
+            ReservationEntity.end > since,
+            ReservationEntity.start < until,
+        )
+        rows = session.execute(query).all()
+        with self._lock:
+            self._seats.clear()
+            self._reservations.clear()
+            self._from = to_epoch(since)
+            self._until = to_epoch(until)
+            for id, reservation in self._group(rows).items():
+                self._upsert(id, *reservation, policy_svc)
+            # Changes committed while loading are re-read by the next incremental sync.
+            self._since = since
+            self._reload_at = time.monotonic() + self._refresh
+            self._loaded = True
+            self._loads += 1
+
+    def _upsert(
+        self,
+        id: int,
+        seat_ids: tuple[int, ...],
+        start: datetime,
+        end: datetime,
+        state: ReservationState,
+        created_at: datetime,
+        policy_svc: PolicyService,
+    ) -> None:
+        """Replace the indexed intervals of a reservation. Caller must hold the lock."""
+        self._applied += 1
+        previous = self._reservations.pop(id, None)
+        if previous is not None:
+            for seat_id in previous[0]:
+                self._seats[seat_id].remove(id, previous[1])
+
+        start_at, end_at = to_epoch(start), to_epoch(end)
+        if state not in _ACTIVE_STATES or end_at <= self._from:
+            return
+        if start_at >= self._until:
+            return
+
+        if state == ReservationState.DRAFT:
+            expires = created_at + policy_svc.reservation_draft_timeout()
+        elif state == ReservationState.CONFIRMED:
+            expires = start + policy_svc.reservation_checkin_timeout()
+        else:
+            expires = end
+
+        for seat_id in seat_ids:
+            if seat_id not in self._seats:
+                self._seats[seat_id] = _SeatIntervals()
+            self._seats[seat_id].insert(id, start_at, end_at, to_epoch(expires))
+        self._reservations[id] = (seat_ids, start_at)
+
+
+seat_availability_engine = SeatAvailabilityEngine()
+"""Process-wide SeatAvailabilityEngine shared by all ReservationService instances."""
@@ -2,11 +2,13 @@
 The Event Service allows the API to manipulate event data in the database.
 """
 
-from typing import Sequence
+from collections import defaultdict
+from typing import Iterator, Sequence
 
 from fastapi import Depends
-from sqlalchemy import func, select, and_, func, or_, exists, or_
-from sqlalchemy.orm import Session, aliased
+from sqlalchemy import func, select, and_, func, or_, exists, or_, update, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased, joinedload
 from backend.entities.user_entity import UserEntity
 from backend.models.event_registration import EventRegistration, NewEventRegistration
 from ..models.public_user import PublicUser
@@ -16,6 +18,9 @@ from backend.models.registration_type import RegistrationType
 
 from ..models import User, Paginated, EventPaginationParams
 from ..database import db_session
+from .export import stream_rows
+from .pagination import keyset_page, paginated_length
+from .search import matches
 from backend.models.event import (
     EventDraft,
     EventOverview,
@@ -73,9 +78,12 @@ class EventService:
 
         Returns:
             Paginated[Event]: The paginated list of events.
+
+        Raises:
+            InvalidCursorException: If the pagination cursor is malformed.
         """
 
-        statement = select(EventEntity)
+        statement = select(EventEntity).options(joinedload(EventEntity.organization))
         length_statement = select(func.count()).select_from(EventEntity)
         if pagination_params.range_start != "":
             range_start = pagination_params.range_start
@@ -91,43 +99,112 @@ class EventService:
             query = pagination_params.filter
 
             criteria = or_(
-                EventEntity.name.ilike(f"%{query}%"),
-                EventEntity.description.ilike(f"%{query}%"),
-                exists().where(
-                    OrganizationEntity.id == EventEntity.organization_id,
-                    OrganizationEntity.name.ilike(f"%{query}%"),
-                ),
-                exists().where(
-                    OrganizationEntity.id == EventEntity.organization_id,
-                    OrganizationEntity.slug.ilike(f"%{query}%"),
+                matches(EventEntity.search_text, query),
+                EventEntity.organization_id.in_(
+                    select(OrganizationEntity.id).where(
+                        matches(OrganizationEntity.search_text, query)
+                    )
                 ),
             )
             statement = statement.where(criteria)
             length_statement = length_statement.where(criteria)
 
+        descending = pagination_params.ascending == "false"
+        order_by = (
+            getattr(EventEntity, pagination_params.order_by)
+            if pagination_params.order_by != ""
+            else None
+        )
+
+        length = paginated_length(self._session, length_statement, pagination_params)
+
+        if pagination_params.cursor is not None:
+            entities, next_cursor = keyset_page(
+                self._session,
+                statement,
+                pagination_params,
+                order_by,
+                EventEntity.id,
+                descending,
+            )
+            return Paginated(
+                items=self._to_overview_models(entities, subject),
+                length=length,
+                next_cursor=next_cursor,
+                params=pagination_params,
+            )
+
         offset = pagination_params.page * pagination_params.page_size
         limit = pagination_params.page_size
 
-        if pagination_params.order_by != "":
-            statement = (
-                statement.order_by(getattr(EventEntity, pagination_params.order_by))
-                if pagination_params.ascending
-                else statement.order_by(
-                    getattr(EventEntity, pagination_params.order_by).desc()
-                )
-            )
+        if order_by is not None:
+            statement = statement.order_by(order_by.desc() if descending else order_by)
 
         statement = statement.offset(offset).limit(limit)
 
-        length = self._session.execute(length_statement).scalar()
-        entities = self._session.execute(statement).scalars()
+        entities = self._session.execute(statement).scalars().all()
 
         return Paginated(
-            items=[entity.to_overview_model(subject) for entity in entities],
+            items=self._to_overview_models(entities, subject),
             length=length,
             params=pagination_params,
         )
 
+    def _to_overview_models(
+        self, entities: Sequence[EventEntity], subject: User | None = None
+    ) -> list[EventOverview]:
+        """Converts events into overview models with a constant number of queries.
+
+        Rather than lazy loading every event's registrations, organizers are loaded by a
+        single join and the subject's own registrations by a single targeted query. Attendee
+        counts are read from `EventEntity.registered_count`. Organizations should be eagerly
+        loaded.
+
+        Args:
+            entities: The events to convert.
+            subject: The user viewing the events, if any.
+
+        Returns:
+            list[EventOverview]: The overviews, in the order of entities.
+        """
+        event_ids = [entity.id for entity in entities]
+        if len(event_ids) == 0:
+            return []
+
+        organizers: dict[int, list[PublicUser]] = defaultdict(list)
+        organizer_rows = self._session.execute(
+            select(EventRegistrationEntity.event_id, UserEntity)
+            .join(UserEntity, UserEntity.id == EventRegistrationEntity.user_id)
+            .where(
+                EventRegistrationEntity.event_id.in_(event_ids),
+                EventRegistrationEntity.registration_type == RegistrationType.ORGANIZER,
+            )
+        ).all()
+        for event_id, user_entity in organizer_rows:
+            organizers[event_id].append(user_entity.to_public_model())
+
+        subject_registrations: dict[int, RegistrationType] = {}
+        if subject is not None:
+            subject_registrations = dict(
+                self._session.execute(
+                    select(
+                        EventRegistrationEntity.event_id,
+                        EventRegistrationEntity.registration_type,
+                    ).where(
+                        EventRegistrationEntity.event_id.in_(event_ids),
+                        EventRegistrationEntity.user_id == subject.id,
+                    )
+                ).all()
+            )
+
+        return [
+            entity.to_overview_model_with(
+                organizers[entity.id],
+                subject_registrations.get(entity.id),
+            )
+            for entity in entities
+        ]
+
     def create(self, subject: User, event: EventDraft) -> EventOverview:
         """
         Creates a event based on the input object and adds it to the table.
@@ -299,6 +376,11 @@ class EventService:
                 EventRegistrationEntity, (event_entity.id, organizer_id)
             )
             if event_registration_entity:
+                if (
+                    event_registration_entity.registration_type
+                    == RegistrationType.ATTENDEE
+                ):
+                    self._change_registered_count(event_entity.id, -1)
                 event_registration_entity.registration_type = RegistrationType.ORGANIZER
             else:
                 new_registration = NewEventRegistration(
@@ -456,15 +538,6 @@ class EventService:
                 f"organization/{event_entity.organization_id}",
             )
 
-        # Get the registration status.
-        # NOTE: It is preferred to use the service function rather than the list of
-        # registrations passed in from `event` in the case that registrations are added
-        # between when `event` was fetched and this function runs.
-
-        # Raise exception if event is full.
-        if event.number_registered >= event.registration_limit:
-            raise EventRegistrationException(event.id)
-
         # Enable idemopotency in returning existing registration, if one exists.
         # Permission to manage / read registration is enforced in EventService#get_registration
         existing_registration = self.get_registration(subject, attendee, event)
@@ -474,6 +547,14 @@ class EventService:
             )
             return user_entity.to_public_model()
 
+        # Claim a seat, raising an exception if the event is full.
+        # NOTE: The conditional update locks the event's row, so concurrent registrations
+        # are serialized by the database rather than by `event.number_registered`, which
+        # may be stale by the time this function runs.
+        if not self._change_registered_count(event.id, 1):
+            self._session.rollback()
+            raise EventRegistrationException(event.id)
+
         # Add new object to table and commit changes
         new_event_registration = NewEventRegistration(
             user_id=attendee.id,
@@ -484,7 +565,13 @@ class EventService:
             new_event_registration
         )
         self._session.add(event_registration_entity)
-        self._session.commit()
+        try:
+            self._session.commit()
+        except IntegrityError:
+            # A concurrent request registered the attendee first; its seat is kept and
+            # the rollback releases the seat claimed above.
+            self._session.rollback()
+            return self._session.get_one(UserEntity, attendee.id).to_public_model()
 
         # Return registration
         return event_registration_entity.to_flat_model()
@@ -516,15 +603,43 @@ class EventService:
         ):
             return
 
-        # Delete object and commit
-        self._session.delete(
-            self._session.get(
-                EventRegistrationEntity,
-                (event.id, attendee.id),
+        # Delete object, release its seat and commit
+        deleted = self._session.execute(
+            delete(EventRegistrationEntity).where(
+                EventRegistrationEntity.event_id == event.id,
+                EventRegistrationEntity.user_id == attendee.id,
+                EventRegistrationEntity.registration_type == RegistrationType.ATTENDEE,
             )
         )
+        if deleted.rowcount > 0:
+            self._change_registered_count(event.id, -1)
         self._session.commit()
 
+    def _change_registered_count(self, event_id: int, change: int) -> bool:
+        """
+        Atomically add change to an event's registered count in the current transaction.
+
+        Increments only succeed while the event has seats remaining.
+
+        Args:
+            event_id: The id of the event
+            change: The number of attendees registered, negative when unregistered
+
+        Returns:
+            bool: Whether the event's count was changed
+        """
+        statement = (
+            update(EventEntity)
+            .where(EventEntity.id == event_id)
+            .values(registered_count=EventEntity.registered_count + change)
+            .returning(EventEntity.id)
+        )
+        if change > 0:
+            statement = statement.where(
+                EventEntity.registered_count + change <= EventEntity.registration_limit
+            )
+        return self._session.execute(statement).first() is not None
+
     def get_registrations_of_user(
         self, subject: User, user: User, time_range: TimeRange
     ) -> Sequence[PublicUser]:
@@ -578,6 +693,7 @@ class EventService:
 
         Raises:
             PermissionException: If the subject does not have the required permission.
+            InvalidCursorException: If the pagination cursor is malformed.
         """
         event_entity = self._session.get(EventEntity, event_id)
         organizer_ids = [
@@ -629,31 +745,42 @@ class EventService:
 
         # Filter results by query
         if pagination_params.filter != "":
-            query = pagination_params.filter
-            criteria = or_(
-                UserEntity.first_name.ilike(f"%{query}%"),
-                UserEntity.last_name.ilike(f"%{query}%"),
-                UserEntity.onyen.ilike(f"%{query}%"),
-            )
+            criteria = matches(UserEntity.search_text, pagination_params.filter)
 
             statement = statement.where(criteria)
             length_statement = length_statement.where(criteria)
 
+        order_by = (
+            getattr(UserEntity, pagination_params.order_by)
+            if pagination_params.order_by != ""
+            else None
+        )
+        length = paginated_length(self._session, length_statement, pagination_params)
+
+        # Continue after the cursor rather than skipping rows when one is given
+        if pagination_params.cursor is not None:
+            entities, next_cursor = keyset_page(
+                self._session, statement, pagination_params, order_by, UserEntity.id
+            )
+            return Paginated(
+                items=[entity.to_model() for entity in entities],
+                length=length,
+                next_cursor=next_cursor,
+                params=pagination_params,
+            )
+
         # Calculate where to begin retrieving rows and how many to retrieve
         offset = pagination_params.page * pagination_params.page_size
         limit = pagination_params.page_size
 
         # Order results by order by attribute
-        if pagination_params.order_by != "":
-            statement = statement.order_by(
-                getattr(UserEntity, pagination_params.order_by)
-            )
+        if order_by is not None:
+            statement = statement.order_by(order_by)
 
         # Retrieve limited items
         statement = statement.offset(offset).limit(limit)
 
         # Execute statement and retrieve entities
-        length = self._session.execute(length_statement).scalar()
         entities = self._session.execute(statement).scalars()
 
         # Convert `UserEntity`s to model and return page
@@ -663,6 +790,61 @@ class EventService:
             params=pagination_params,
         )
 
+    def get_registered_users_of_event_for_export(
+        self, subject: User, event_id: int
+    ) -> Iterator[PublicUser]:
+        """
+        Stream the registered users of an event for an export, ordered by name.
+
+        Args:
+            subject: The user performing the action.
+            event_id: a valid int representing a unique Event
+
+        Returns:
+            Iterator[PublicUser]: The registered users, fetched in batches as iterated.
+
+        Raises:
+            ResourceNotFoundException: If the event does not exist.
+            PermissionException: If the subject does not have the required permission.
+        """
+        event_entity = self._session.get(EventEntity, event_id)
+        if event_entity is None:
+            raise ResourceNotFoundException(
+                f"No event found with matching ID: {event_id}"
+            )
+
+        # Check whether the subject organizes the event without loading its registrations
+        is_organizer = self._session.scalar(
+            select(
+                exists().where(
+                    EventRegistrationEntity.event_id == event_id,
+                    EventRegistrationEntity.user_id == subject.id,
+                    EventRegistrationEntity.registration_type
+                    == RegistrationType.ORGANIZER,
+                )
+            )
+        )
+        if not is_organizer:
+            self._permission.enforce(
+                subject,
+                "organization.events.manage_registrations",
+                f"organization/{event_entity.organization_id}",
+            )
+
+        statement = (
+            select(UserEntity)
+            .join(
+                EventRegistrationEntity,
+                EventRegistrationEntity.user_id == UserEntity.id,
+            )
+            .where(
+                EventRegistrationEntity.event_id == event_id,
+                EventRegistrationEntity.registration_type == RegistrationType.ATTENDEE,
+            )
+            .order_by(UserEntity.last_name, UserEntity.first_name, UserEntity.id)
+        )
+        return stream_rows(self._session, statement, UserEntity.to_public_model)
+
     def get_event_status(self, subject: User) -> EventStatusOverview:
         """Returns the event status."""
         # 1. Get the featured event.
@@ -694,26 +876,35 @@ class EventService:
             )
 
         # 2. Find all of the events the current user is registered for.
+        registered_events = self.get_upcoming_registered_events(subject)
+
+        # 3. Return the event status.
+        return EventStatusOverview(
+            featured=featured_event, registered=registered_events
+        )
+
+    def get_upcoming_registered_events(self, subject: User) -> list[EventOverview]:
+        """
+        Get the upcoming events a user is registered for, in the order they start.
+
+        The events are loaded with a constant number of queries, see `_to_overview_models`.
+
+        Args:
+            subject: The user whose registrations to load.
+
+        Returns:
+            list[EventOverview]: The upcoming events.
+        """
         registered_events_query = (
-            select(EventRegistrationEntity)
+            select(EventEntity)
+            .join(EventRegistrationEntity)
             .where(EventRegistrationEntity.user_id == subject.id)
-            .join(EventEntity)
             .where(EventEntity.start >= datetime.now())
             .order_by(EventEntity.start)
+            .options(joinedload(EventEntity.organization))
         )
-
-        registered_events_entities = self._session.scalars(
-            registered_events_query
-        ).all()
-
-        registered_events = [
-            registration.event.to_overview_model(subject)
-            for registration in registered_events_entities
-        ]
-
-        # 3. Return the event status.
-        return EventStatusOverview(
-            featured=featured_event, registered=registered_events
+        return self._to_overview_models(
+            self._session.scalars(registered_events_query).all(), subject
         )
 
     def get_event_status_unauthenticated(self) -> EventStatusOverview:
@@ -38,3 +38,10 @@ class CourseDataScrapingException(Exception):
 
     def __init__(self, reason: str):
         super().__init__(f"{reason}")
+
+
+class InvalidCursorException(Exception):
+    """InvalidCursorException is raised when a pagination cursor is malformed or does not match the requested ordering."""
+
+    def __init__(self, cursor: str):
+        super().__init__(f"Invalid pagination cursor: {cursor}")
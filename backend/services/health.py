@@ -12,6 +12,8 @@ In this context health does not refer to correctness as much as running, connect
 from fastapi import Depends
 from sqlalchemy import text
 from ..database import Session, db_session
+from ..models.pool_status import PoolStatus
+from ..pool_monitor import MonitoredQueuePool
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -29,3 +31,8 @@ class HealthService:
         result = self._session.execute(stmt)
         row = result.all()[0]
         return str(f"{row[0]} @ {row[1]}")
+
+    def pool_status(self) -> PoolStatus:
+        """Report the gauges and checkout statistics of the session's connection pool."""
+        pool: MonitoredQueuePool = self._session.get_bind().engine.pool
+        return pool.monitor.status(pool)
@@ -2,7 +2,6 @@
 Service for office hour events.
 """
 
-import math
 from fastapi import Depends
 from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
@@ -26,6 +25,7 @@ from ...entities.office_hours import (
 )
 from ...entities.academics.section_member_entity import SectionMemberEntity
 from ..exceptions import CoursePermissionException, ResourceNotFoundException
+from .queue_snapshot import QueueSnapshot, bump_queue_version, queue_snapshot_cache
 
 __authors__ = ["Ajay Gandecha"]
 __copyright__ = "Copyright 2024"
@@ -52,18 +52,9 @@ class OfficeHoursService:
         Returns:
             OfficeHourQueueOverview
         """
-        # Create query off of the member query for just the members matching
-        # with the current user (used to determine permissions)
-        user_member_query = (
-            select(SectionMemberEntity)
-            .where(SectionMemberEntity.user_id == user.id)
-            .join(SectionEntity)
-            .join(CourseSiteEntity)
-            .join(OfficeHoursEntity)
-            .where(OfficeHoursEntity.id == office_hours_id)
-        )
-
-        user_members = self._session.scalars(user_member_query).unique().all()
+        # Find the current user's memberships in the course (used to determine
+        # permissions), along with the version of the queue
+        user_members = self._user_members_with_queue_version(user, office_hours_id)
 
         # If the user is not a member of the looked up course, throw an error
         if len(user_members) == 0 or user_members[0].member_role == RosterRole.STUDENT:
@@ -71,27 +62,11 @@ class OfficeHoursService:
                 "Not allowed to access the queue of a course you are not a UTA, GTA, or instructor for."
             )
 
-        # Start building the query
-        queue_query = (
-            select(OfficeHoursEntity)
-            .where(OfficeHoursEntity.id == office_hours_id)
-            .options(
-                joinedload(OfficeHoursEntity.tickets)
-                .joinedload(OfficeHoursTicketEntity.caller)
-                .joinedload(SectionMemberEntity.user)
-            )
-            .options(
-                joinedload(OfficeHoursEntity.tickets)
-                .joinedload(OfficeHoursTicketEntity.creators)
-                .joinedload(SectionMemberEntity.user)
-            )
-        )
-
         # Load data
-        queue_entity = self._session.scalars(queue_query).unique().one_or_none()
+        snapshot = self._queue_snapshot(office_hours_id, user_members[0].queue_version)
 
         # Return data
-        return self._to_oh_queue_overview(user, queue_entity)
+        return snapshot.queue_overview(user.id)
 
     def get_office_hour_get_help_overview(
         self, user: User, office_hours_id: int
@@ -102,19 +77,9 @@ class OfficeHoursService:
         Returns:
             OfficeHourGetHelpOverview
         """
-        # Create query off of the member query for just the members matching
-        # with the current user (used to determine permissions)
-        user_member_query = (
-            select(SectionMemberEntity)
-            .where(SectionMemberEntity.user_id == user.id)
-            .join(SectionEntity)
-            .join(CourseSiteEntity)
-            .join(OfficeHoursEntity)
-            .where(OfficeHoursEntity.id == office_hours_id)
-            .options(joinedload(SectionMemberEntity.created_oh_tickets))
-        )
-
-        user_members = self._session.scalars(user_member_query).unique().all()
+        # Find the current user's memberships in the course (used to determine
+        # permissions), along with the version of the queue
+        user_members = self._user_members_with_queue_version(user, office_hours_id)
 
         # If the user is not a member of the looked up course, throw an error
         if len(user_members) == 0:
@@ -128,10 +93,51 @@ class OfficeHoursService:
                     "You cannot access office hours for a class you are not enrolled in."
                 )
 
+        # Load data
+        snapshot = self._queue_snapshot(office_hours_id, user_member.queue_version)
+
+        # Return data, with the user's ticket and queue position, if any
+        return snapshot.get_help_overview(user_member.id)
+
+    def _user_members_with_queue_version(self, user: User, office_hours_id: int):
+        """
+        Loads the user's section memberships in the course of an office hours event.
+
+        Returns:
+            Sequence[Row]: Rows of the `id` and `member_role` of each membership and the
+                `queue_version` of the event.
+        """
+        user_member_query = (
+            select(
+                SectionMemberEntity.id,
+                SectionMemberEntity.member_role,
+                OfficeHoursEntity.queue_version,
+            )
+            .where(SectionMemberEntity.user_id == user.id)
+            .join(SectionEntity)
+            .join(CourseSiteEntity)
+            .join(OfficeHoursEntity)
+            .where(OfficeHoursEntity.id == office_hours_id)
+        )
+        return self._session.execute(user_member_query).all()
+
+    def _queue_snapshot(self, office_hours_id: int, version: int) -> QueueSnapshot:
+        """
+        Returns the snapshot of an office hours event's queue at version, loading the event's
+        tickets only when no such snapshot is cached.
+
+        Returns:
+            QueueSnapshot
+        """
+        snapshot = queue_snapshot_cache.get(office_hours_id, version)
+        if snapshot is not None:
+            return snapshot
+
         # Start building the query
         queue_query = (
             select(OfficeHoursEntity)
             .where(OfficeHoursEntity.id == office_hours_id)
+            .options(joinedload(OfficeHoursEntity.room))
             .options(
                 joinedload(OfficeHoursEntity.tickets)
                 .joinedload(OfficeHoursTicketEntity.caller)
@@ -142,102 +148,48 @@ class OfficeHoursService:
                 .joinedload(OfficeHoursTicketEntity.creators)
                 .joinedload(SectionMemberEntity.user)
             )
+            .execution_options(populate_existing=True)
         )
 
         # Load data
-        queue_entity = self._session.scalars(queue_query).unique().one_or_none()
-
-        # Get ticket for user, if any
-        active_tickets = [
-            ticket
-            for ticket in queue_entity.tickets
-            if user_member.id in [creator.id for creator in ticket.creators]
-            and ticket.state in [TicketState.QUEUED, TicketState.CALLED]
-        ]
-
-        active_ticket = active_tickets[0] if len(active_tickets) > 0 else None
-
-        # Find queue position
-        queue_tickets = [
-            ticket
-            for ticket in queue_entity.tickets
-            if ticket.state == TicketState.QUEUED
-        ]
-
-        queue_position = (
-            queue_tickets.index(active_ticket) + 1
-            if active_ticket and active_ticket.state == TicketState.QUEUED
-            else -1
+        queue_entity = self._session.scalars(queue_query).unique().one()
+
+        # Index the tickets for polls
+        snapshot = QueueSnapshot(
+            id=queue_entity.id,
+            version=queue_entity.queue_version,
+            type=queue_entity.type.to_string(),
+            mode=queue_entity.mode.to_string(),
+            start_time=queue_entity.start_time,
+            end_time=queue_entity.end_time,
+            location=queue_entity.room.nickname,
+            location_description=queue_entity.location_description,
         )
-
-        # Return data
-        return OfficeHourGetHelpOverview(
-            event_type=queue_entity.type.to_string(),
-            event_mode=queue_entity.mode.to_string(),
-            event_start_time=queue_entity.start_time,
-            event_end_time=queue_entity.end_time,
-            event_location=queue_entity.room.nickname,
-            event_location_description=queue_entity.location_description,
-            ticket=(
-                self._to_oh_ticket_overview(active_ticket) if active_ticket else None
-            ),
-            queue_position=queue_position,
+        # Tickets are loaded in no particular order, so order them first come, first served
+        tickets = sorted(
+            queue_entity.tickets, key=lambda ticket: (ticket.created_at, ticket.id)
         )
+        for ticket in tickets:
+            overview = self._to_oh_ticket_overview(ticket)
+            if ticket.state == TicketState.QUEUED:
+                snapshot.queue.append(overview)
+                snapshot.queue_positions[ticket.id] = len(snapshot.queue)
+            elif ticket.state == TicketState.CALLED and ticket.caller:
+                snapshot.called.append((ticket.caller.user_id, overview))
+            elif ticket.state == TicketState.CLOSED:
+                snapshot.history.append(overview)
+                snapshot.minutes_by_caller.setdefault(ticket.caller.user_id, []).append(
+                    (ticket.closed_at - ticket.called_at).total_seconds() / 60.0
+                )
 
-    def _to_oh_queue_overview(
-        self, user: User, oh_event: OfficeHoursEntity
-    ) -> OfficeHourQueueOverview:
-        active_tickets = [
-            ticket
-            for ticket in oh_event.tickets
-            if ticket.state == TicketState.CALLED and ticket.caller.user_id == user.id
-        ]
-        called_tickets = [
-            ticket
-            for ticket in oh_event.tickets
-            if ticket.state == TicketState.CALLED
-            and ticket.caller
-            and ticket.caller.user_id != user.id
-        ]
-        completed_tickets = [
-            ticket for ticket in oh_event.tickets if ticket.state == TicketState.CLOSED
-        ]
-        personal_completed_tickets = [
-            ticket for ticket in completed_tickets if ticket.caller.user_id == user.id
-        ]
-        personal_minutes = [
-            (ticket.closed_at - ticket.called_at).total_seconds() / 60.0
-            for ticket in personal_completed_tickets
-        ]
-        personal_average_minutes = (
-            math.floor(sum(personal_minutes) / len(personal_minutes))
-            if len(personal_minutes) > 0
-            else 0
-        )
-        queued_tickets = [
-            ticket for ticket in oh_event.tickets if ticket.state == TicketState.QUEUED
-        ]
-        return OfficeHourQueueOverview(
-            id=oh_event.id,
-            type=oh_event.type.to_string(),
-            start_time=oh_event.start_time,
-            end_time=oh_event.end_time,
-            active=(
-                self._to_oh_ticket_overview(active_tickets[0])
-                if len(active_tickets) > 0
-                else None
-            ),
-            other_called=[
-                self._to_oh_ticket_overview(ticket) for ticket in called_tickets
-            ],
-            queue=[self._to_oh_ticket_overview(ticket) for ticket in queued_tickets],
-            personal_tickets_called=len(personal_completed_tickets),
-            average_minutes=personal_average_minutes,
-            total_tickets_called=len(completed_tickets),
-            history=[
-                self._to_oh_ticket_overview(ticket) for ticket in completed_tickets
-            ],
-        )
+            if ticket.state in [TicketState.QUEUED, TicketState.CALLED]:
+                # A student may queue again while their called ticket is open, so the
+                # latest open ticket is the one they are waiting on
+                for creator in ticket.creators:
+                    snapshot.open_ticket_by_creator[creator.id] = overview
+
+        queue_snapshot_cache.put(snapshot)
+        return snapshot
 
     def get_oh_event_role(
         self, user: User, office_hours_id: int
@@ -321,6 +273,7 @@ class OfficeHoursService:
         office_hours_entity.end_time = event.end_time
         office_hours_entity.course_site_id = event.course_site_id
         office_hours_entity.room_id = event.room_id
+        bump_queue_version(self._session, office_hours_entity.id)
 
         self._session.commit()
 
@@ -0,0 +1,254 @@
+"""
+Push notifications of changes to office hours queues.
+
+Rather than polling, staff and students may hold a server-sent events stream open on their
+queue, see `api/office_hours/office_hours.py`. When a service bumps an event's queue version,
+`bump_queue_version` publishes the event's ID to `queue_hub`, and once the transaction commits
+the hub wakes every stream subscribed to that event. Each woken stream reloads its overview,
+which the snapshot cache serves after the first of them rebuilds it.
+
+The hub reaches other processes through its `QueueBroker`:
+
+    OFFICE_HOURS_QUEUE_BROKER=memory (default): Changes are delivered to the streams of the
+        committing process only. Streams in other worker processes notice the change when they
+        re-check their queue at their next heartbeat.
+    OFFICE_HOURS_QUEUE_BROKER=postgres: Changes are published with NOTIFY in the committing
+        transaction and each worker LISTENs on a dedicated asyncpg connection, so every stream
+        is woken as soon as the change commits.
+"""
+
+import asyncio
+import logging
+from threading import Lock
+from typing import Callable, Iterable, Protocol
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from ...env import getenv
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+HEARTBEAT_SECONDS = float(getenv("OFFICE_HOURS_QUEUE_HEARTBEAT", "15"))
+"""Seconds between heartbeats of an idle queue stream."""
+
+CHANNEL = "office_hours_queue"
+"""The PostgreSQL notification channel of `PostgresQueueBroker`."""
+
+_PENDING = "office_hours_queue_pending"
+_LISTENING = "office_hours_queue_listening"
+
+logger = logging.getLogger(__name__)
+
+
+class QueueBroker(Protocol):
+    """Carries the IDs of office hours events whose queues changed to a `QueueHub`."""
+
+    reaches_other_processes: bool
+    """Whether changes committed by one process are delivered to every process."""
+
+    def bind(self, deliver: Callable[[int], None]) -> None:
+        """Set the callback receiving the ID of each event whose queue changed."""
+
+    def publish(self, session: Session, office_hours_ids: list[int]) -> None:
+        """Deliver office_hours_ids if and once the session's transaction commits."""
+
+    async def start(self) -> None:
+        """Begin receiving changes, from the event loop of the application."""
+
+    async def stop(self) -> None:
+        """Stop receiving changes."""
+
+
+class InMemoryQueueBroker:
+    """Delivers changes within the process that committed them."""
+
+    reaches_other_processes = False
+
+    def __init__(self):
+        self._deliver: Callable[[int], None] = lambda office_hours_id: None
+
+    def bind(self, deliver: Callable[[int], None]) -> None:
+        self._deliver = deliver
+
+    def publish(self, session: Session, office_hours_ids: list[int]) -> None:
+        if not session.info.get(_LISTENING, False):
+            event.listen(session, "after_commit", self._after_commit)
+            event.listen(session, "after_rollback", self._after_rollback)
+            session.info[_LISTENING] = True
+        session.info.setdefault(_PENDING, set()).update(office_hours_ids)
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    def _after_commit(self, session: Session) -> None:
+        for office_hours_id in session.info.pop(_PENDING, ()):
+            self._deliver(office_hours_id)
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(_PENDING, None)
+
+
+class PostgresQueueBroker:
+    """Delivers changes to every process through PostgreSQL's LISTEN and NOTIFY."""
+
+    reaches_other_processes = True
+
+    def __init__(self, dsn: str):
+        """Initialize a broker which listens once started.
+
+        Args:
+            dsn (str): The libpq connection string of the database, without a driver.
+        """
+        self._dsn = dsn
+        self._deliver: Callable[[int], None] = lambda office_hours_id: None
+        self._connection = None
+
+    def bind(self, deliver: Callable[[int], None]) -> None:
+        self._deliver = deliver
+
+    def publish(self, session: Session, office_hours_ids: list[int]) -> None:
+        # PostgreSQL sends notifications upon commit, once per distinct payload
+        for office_hours_id in office_hours_ids:
+            session.execute(select(func.pg_notify(CHANNEL, str(office_hours_id))))
+
+    async def start(self) -> None:
+        import asyncpg
+
+        self._connection = await asyncpg.connect(self._dsn)
+        await self._connection.add_listener(CHANNEL, self._on_notification)
+
+    async def stop(self) -> None:
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+    def _on_notification(self, connection, pid: int, channel: str, payload: str):
+        self._deliver(int(payload))
+
+
+class QueueSubscription:
+    """A stream's subscription to changes of an office hours event's queue."""
+
+    def __init__(self, hub: "QueueHub", office_hours_id: int):
+        self.office_hours_id = office_hours_id
+        self._hub = hub
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
+
+    def notify(self) -> None:
+        """Wake the subscriber, from any thread."""
+        try:
+            self._loop.call_soon_threadsafe(self._changed.set)
+        except RuntimeError:
+            # The subscriber's event loop has closed
+            ...
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for the queue to change.
+
+        Args:
+            timeout (float): Seconds to wait for.
+
+        Returns:
+            bool: Whether the queue changed since the last wait, rather than timing out.
+        """
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._changed.clear()
+        return True
+
+    def close(self) -> None:
+        """Stop receiving changes."""
+        self._hub._unsubscribe(self)
+
+
+class QueueHub:
+    """Fans out changes of office hours queues to the streams subscribed to them."""
+
+    def __init__(self, broker: QueueBroker):
+        """Initialize a hub without subscribers.
+
+        Args:
+            broker (QueueBroker): Carries changes from publishers to the hub.
+        """
+        self.broker = broker
+        self._lock = Lock()
+        self._subscriptions: dict[int, set[QueueSubscription]] = {}
+        self._delivered = 0
+        broker.bind(self.deliver)
+
+    def publish(self, session: Session, office_hours_ids: Iterable[int]) -> None:
+        """Notify subscribers of events once the session's transaction commits.
+
+        Args:
+            session (Session): The session changing the events' tickets.
+            office_hours_ids (Iterable[int]): The IDs of the events.
+        """
+        office_hours_ids = list(office_hours_ids)
+        if len(office_hours_ids) > 0:
+            self.broker.publish(session, office_hours_ids)
+
+    def subscribe(self, office_hours_id: int) -> QueueSubscription:
+        """Subscribe to changes of an event's queue, from within the event loop.
+
+        The subscription must be closed once the subscriber disconnects.
+        """
+        subscription = QueueSubscription(self, office_hours_id)
+        with self._lock:
+            self._subscriptions.setdefault(office_hours_id, set()).add(subscription)
+        return subscription
+
+    def deliver(self, office_hours_id: int) -> None:
+        """Wake the subscribers of an event whose queue changed, from any thread."""
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(office_hours_id, ()))
+            self._delivered += len(subscriptions)
+        for subscription in subscriptions:
+            subscription.notify()
+
+    def _unsubscribe(self, subscription: QueueSubscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.office_hours_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if len(subscriptions) == 0:
+                    del self._subscriptions[subscription.office_hours_id]
+
+    async def start(self) -> None:
+        """Start the hub's broker, falling back to an in-memory broker if it fails."""
+        try:
+            await self.broker.start()
+        except Exception:
+            logger.exception("Office hours queue broker failed to start")
+            self.broker = InMemoryQueueBroker()
+            self.broker.bind(self.deliver)
+
+    async def stop(self) -> None:
+        """Stop the hub's broker."""
+        await self.broker.stop()
+
+    def stats(self) -> dict[str, int]:
+        """Number of subscribed streams and of notifications delivered to them."""
+        with self._lock:
+            return {
+                "subscribers": sum(map(len, self._subscriptions.values())),
+                "delivered": self._delivered,
+            }
+
+
+def _broker_from_env() -> QueueBroker:
+    if getenv("OFFICE_HOURS_QUEUE_BROKER", "memory") == "postgres":
+        from ...database import _engine_str
+
+        return PostgresQueueBroker(_engine_str(dialect="postgresql"))
+    return InMemoryQueueBroker()
+
+
+queue_hub = QueueHub(_broker_from_env())
+"""Process-wide QueueHub of office hours queues."""
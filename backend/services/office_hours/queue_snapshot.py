@@ -0,0 +1,193 @@
+"""
+In-memory snapshots of office hours queues, versioned by `office_hours.queue_version`.
+
+Staff and students poll their queue every few seconds during office hours. Rather than loading
+every ticket with its creators and caller on each poll, `OfficeHoursService` reads the event's
+`queue_version` along with the subject's membership and serves a snapshot built at that version.
+Services that change an event's tickets call `bump_queue_version` in the same transaction, so
+every worker process sees the change on its next poll, and streams subscribed to the event are
+pushed the change once it commits (see `queue_channel.py`).
+"""
+
+import math
+from dataclasses import dataclass, field
+from datetime import datetime
+from threading import Lock
+
+from sqlalchemy import Select, update
+from sqlalchemy.orm import Session
+
+from ...entities.office_hours import OfficeHoursEntity
+from .queue_channel import queue_hub
+from ...models.academics.my_courses import (
+    OfficeHourGetHelpOverview,
+    OfficeHourQueueOverview,
+    OfficeHourTicketOverview,
+)
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+@dataclass
+class QueueSnapshot:
+    """The tickets of an office hours event at a version of its queue, indexed for polls."""
+
+    id: int
+    version: int
+    type: str
+    mode: str
+    start_time: datetime
+    end_time: datetime
+    location: str
+    location_description: str
+
+    # Called tickets, paired with the user ID of their caller
+    called: list[tuple[int, OfficeHourTicketOverview]] = field(default_factory=list)
+    # Queued tickets, in order of creation
+    queue: list[OfficeHourTicketOverview] = field(default_factory=list)
+    # Closed tickets
+    history: list[OfficeHourTicketOverview] = field(default_factory=list)
+    # Minutes spent on each closed ticket, keyed by the user ID of its caller
+    minutes_by_caller: dict[int, list[float]] = field(default_factory=dict)
+    # The latest queued or called ticket of each section member who created one
+    open_ticket_by_creator: dict[int, OfficeHourTicketOverview] = field(
+        default_factory=dict
+    )
+    # One-based positions of queued tickets, keyed by ticket ID
+    queue_positions: dict[int, int] = field(default_factory=dict)
+    # Queue overviews already served, keyed by the user ID of the staff member
+    _queue_overviews: dict[int, OfficeHourQueueOverview] = field(default_factory=dict)
+
+    def queue_overview(self, user_id: int) -> OfficeHourQueueOverview:
+        """The queue as seen by a staff member.
+
+        Args:
+            user_id (int): The user ID of the staff member.
+        """
+        overview = self._queue_overviews.get(user_id)
+        if overview is not None:
+            return overview
+
+        active = [ticket for caller, ticket in self.called if caller == user_id]
+        personal_minutes = self.minutes_by_caller.get(user_id, [])
+        overview = OfficeHourQueueOverview(
+            id=self.id,
+            type=self.type,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            active=active[0] if len(active) > 0 else None,
+            other_called=[
+                ticket for caller, ticket in self.called if caller != user_id
+            ],
+            queue=self.queue,
+            personal_tickets_called=len(personal_minutes),
+            average_minutes=(
+                math.floor(sum(personal_minutes) / len(personal_minutes))
+                if len(personal_minutes) > 0
+                else 0
+            ),
+            total_tickets_called=len(self.history),
+            history=self.history,
+        )
+        self._queue_overviews[user_id] = overview
+        return overview
+
+    def get_help_overview(self, member_id: int) -> OfficeHourGetHelpOverview:
+        """The event and open ticket of a student.
+
+        Args:
+            member_id (int): The section member ID of the student.
+        """
+        ticket = self.open_ticket_by_creator.get(member_id)
+        return OfficeHourGetHelpOverview(
+            event_type=self.type,
+            event_mode=self.mode,
+            event_start_time=self.start_time,
+            event_end_time=self.end_time,
+            event_location=self.location,
+            event_location_description=self.location_description,
+            ticket=ticket,
+            queue_position=(
+                self.queue_positions.get(ticket.id, -1) if ticket is not None else -1
+            ),
+        )
+
+
+class QueueSnapshotCache:
+    """Bounded cache of the latest snapshot of each office hours event's queue."""
+
+    def __init__(self, maxsize: int = 256):
+        """Initialize an empty cache.
+
+        Args:
+            maxsize (int): The maximum number of events whose snapshots are retained.
+        """
+        self._maxsize = maxsize
+        self._lock = Lock()
+        self._snapshots: dict[int, QueueSnapshot] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, office_hours_id: int, version: int) -> QueueSnapshot | None:
+        """The snapshot of an event's queue at version, if cached."""
+        snapshot = self._snapshots.get(office_hours_id)
+        with self._lock:
+            if snapshot is not None and snapshot.version == version:
+                self._hits += 1
+                return snapshot
+            self._misses += 1
+            return None
+
+    def put(self, snapshot: QueueSnapshot) -> None:
+        """Cache snapshot, replacing any older snapshot of its event."""
+        with self._lock:
+            current = self._snapshots.get(snapshot.id)
+            if current is not None and current.version > snapshot.version:
+                return
+            if current is None and len(self._snapshots) >= self._maxsize:
+                self._snapshots.pop(next(iter(self._snapshots)))
+            self._snapshots[snapshot.id] = snapshot
+
+    def invalidate(self) -> None:
+        """Discard every cached snapshot."""
+        with self._lock:
+            self._snapshots.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Hit, miss and current size counts of the cache."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._snapshots),
+            }
+
+
+queue_snapshot_cache = QueueSnapshotCache()
+"""Process-wide QueueSnapshotCache of office hours queues."""
+
+
+def bump_queue_version(session: Session, office_hours_id: int | Select) -> None:
+    """Mark the queues of office hours events as changed, in the session's transaction.
+
+    Subscribers of the events are notified once the transaction commits.
+
+    Args:
+        session (Session): The session changing the events' tickets.
+        office_hours_id (int | Select): The ID of an event, or a select of event IDs.
+    """
+    criteria = (
+        OfficeHoursEntity.id.in_(office_hours_id)
+        if isinstance(office_hours_id, Select)
+        else OfficeHoursEntity.id == office_hours_id
+    )
+    changed = session.scalars(
+        update(OfficeHoursEntity)
+        .where(criteria)
+        .values(queue_version=OfficeHoursEntity.queue_version + 1)
+        .returning(OfficeHoursEntity.id)
+        .execution_options(synchronize_session=False)
+    )
+    queue_hub.publish(session, changed)
@@ -27,6 +27,7 @@ from ...entities.office_hours import (
 from ...entities.academics.section_member_entity import SectionMemberEntity
 from ..exceptions import CoursePermissionException, ResourceNotFoundException
 from ...entities.office_hours import user_created_tickets_table
+from .queue_snapshot import bump_queue_version
 
 __authors__ = ["Ajay Gandecha"]
 __copyright__ = "Copyright 2024"
@@ -104,6 +105,7 @@ class OfficeHourTicketService:
         ticket_entity.caller_id = user_members[0].id
         ticket_entity.called_at = datetime.now()
         ticket_entity.state = TicketState.CALLED
+        bump_queue_version(self._session, ticket_entity.office_hours_id)
 
         # Save changes
         self._session.commit()
@@ -149,6 +151,7 @@ class OfficeHourTicketService:
 
         # Cancel the ticket
         ticket_entity.state = TicketState.CANCELED
+        bump_queue_version(self._session, ticket_entity.office_hours_id)
 
         # Save changes
         self._session.commit()
@@ -198,6 +201,7 @@ class OfficeHourTicketService:
         # Close the ticket
         ticket_entity.closed_at = datetime.now()
         ticket_entity.state = TicketState.CLOSED
+        bump_queue_version(self._session, ticket_entity.office_hours_id)
 
         # Save changes
         self._session.commit()
@@ -278,8 +282,8 @@ class OfficeHourTicketService:
         # Add new object to table and commit changes
         self._session.add(oh_ticket_entity)
 
-        # Commit so can get ticket id
-        self._session.commit()
+        # Flush so can get ticket id
+        self._session.flush()
 
         # Now, Associate ticket with Creators
         for section_member_entity in user_members:
@@ -292,6 +296,7 @@ class OfficeHourTicketService:
                 )
             )
 
+        bump_queue_version(self._session, ticket.office_hours_id)
         self._session.commit()
 
         # Return details model
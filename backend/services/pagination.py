@@ -0,0 +1,214 @@
+"""
+Keyset pagination and cached lengths for services that return `Paginated` results.
+
+OFFSET pagination reads and discards every row that precedes the requested page, and each page
+counts every matching row again. When `PaginationParams.cursor` is set, services instead fetch
+the rows that follow the sort key and id of the previous page's last row. That position is
+encoded in the opaque `Paginated.next_cursor`, so every page costs a single range scan.
+
+Clients that do not need an exact total pass `count=False`. They receive the length of the same
+query counted within the last `ttl` seconds by this process, see `LengthCache`.
+"""
+
+import base64
+import binascii
+import json
+import time
+from datetime import datetime
+from threading import Lock
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, and_, or_, tuple_
+from sqlalchemy.orm import Session
+
+from ..models.pagination import PaginationParams
+from .exceptions import InvalidCursorException
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """Encode the sort key and id of a row as an opaque, URL-safe cursor.
+
+    Args:
+        values (list[Any]): The row's values of the sort columns, each a str, int, float,
+            bool, datetime or None.
+
+    Returns:
+        str: The cursor.
+    """
+    payload = [
+        {"dt": value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    data = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """Decode the values encoded by `encode_cursor`.
+
+    Raises:
+        InvalidCursorException: If cursor was not produced by `encode_cursor`.
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(data)
+        if not isinstance(payload, list):
+            raise ValueError(payload)
+        return [
+            datetime.fromisoformat(value["dt"]) if isinstance(value, dict) else value
+            for value in payload
+        ]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise InvalidCursorException(cursor)
+
+
+def keyset_page(
+    session: Session,
+    statement: Select,
+    pagination_params: PaginationParams,
+    sort: ColumnElement | None,
+    key: ColumnElement,
+    descending: bool = False,
+) -> tuple[list[Any], str | None]:
+    """Fetch the page of statement's entities that follows `pagination_params.cursor`.
+
+    Rows are ordered by sort, then by key to break ties. NULL sort values follow PostgreSQL's
+    defaults: last in ascending order and first in descending order.
+
+    Args:
+        session (Session): The session to execute statement in.
+        statement (Select): A filtered select of a single entity, without ordering or limits.
+        pagination_params (PaginationParams): The page size and the cursor, which is "" for
+            the first page.
+        sort (ColumnElement | None): The column requested by `order_by`, if any.
+        key (ColumnElement): A unique, non-null column of the entity, typically its id.
+        descending (bool): Whether to order from greatest to least.
+
+    Returns:
+        tuple[list[Any], str | None]: The page's entities and the cursor of the next page, or
+            None when this is the last page.
+
+    Raises:
+        InvalidCursorException: If the cursor is malformed or was issued for other columns.
+    """
+    columns = [key] if sort is None else [sort, key]
+    if pagination_params.cursor:
+        values = decode_cursor(pagination_params.cursor)
+        if len(values) != len(columns):
+            raise InvalidCursorException(pagination_params.cursor)
+        statement = statement.where(_after(sort, key, values, descending))
+
+    limit = pagination_params.page_size
+    statement = (
+        statement.add_columns(*columns)
+        .order_by(*(column.desc() if descending else column for column in columns))
+        .limit(limit + 1)
+    )
+    rows = session.execute(statement).unique().all()
+
+    next_cursor = (
+        encode_cursor(list(rows[limit - 1][1:])) if len(rows) > limit else None
+    )
+    return [row[0] for row in rows[:limit]], next_cursor
+
+
+def _after(
+    sort: ColumnElement | None,
+    key: ColumnElement,
+    values: list[Any],
+    descending: bool,
+) -> ColumnElement[bool]:
+    """Criteria of the rows ordered after the row whose sort values are values."""
+    if sort is None:
+        return key < values[0] if descending else key > values[0]
+
+    sort_value, key_value = values
+    if sort_value is None:
+        ties = and_(sort.is_(None), key < key_value if descending else key > key_value)
+        return or_(sort.is_not(None), ties) if descending else ties
+
+    # Row comparisons let PostgreSQL range scan an index on (sort, key).
+    if descending:
+        return tuple_(sort, key) < tuple_(sort_value, key_value)
+    return or_(tuple_(sort, key) > tuple_(sort_value, key_value), sort.is_(None))
+
+
+class LengthCache:
+    """Bounded TTL cache of the number of rows matched by count statements.
+
+    Lengths are keyed by the statement's SQL and parameters. They are neither invalidated by
+    writes nor shared across worker processes, so a cached length may be up to `ttl` seconds
+    stale; callers that need an exact total count instead.
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 1024):
+        """Initialize an empty cache.
+
+        Args:
+            ttl (float): Seconds a length may be served before it is counted again.
+            maxsize (int): The maximum number of statements retained.
+        """
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._lock = Lock()
+        self._entries: dict[tuple[str, str], tuple[float, int]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def length(self, session: Session, statement: Select, exact: bool = False) -> int:
+        """The number of rows counted by statement.
+
+        Args:
+            session (Session): The session to count in on a miss.
+            statement (Select): A statement selecting a single count.
+            exact (bool): Count even if a fresh length is cached, then cache the result.
+
+        Returns:
+            int: The count, possibly served from the cache.
+        """
+        compiled = statement.compile(dialect=session.get_bind().dialect)
+        cache_key = (compiled.string, repr(sorted(compiled.params.items())))
+
+        entry = self._entries.get(cache_key)
+        if not exact and entry is not None and entry[0] >= time.monotonic():
+            with self._lock:
+                self._hits += 1
+            return entry[1]
+
+        length = session.execute(statement).scalar() or 0
+        with self._lock:
+            self._misses += 1
+            if cache_key not in self._entries and len(self._entries) >= self._maxsize:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[cache_key] = (time.monotonic() + self._ttl, length)
+        return length
+
+    def invalidate(self) -> None:
+        """Discard every cached length."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Hit, miss and current size counts of the cache."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._entries),
+            }
+
+
+length_cache = LengthCache()
+"""Process-wide LengthCache of paginated queries."""
+
+
+def paginated_length(
+    session: Session, statement: Select, pagination_params: PaginationParams
+) -> int:
+    """Count statement exactly, or serve a cached length when `pagination_params.count` is
+    False."""
+    return length_cache.length(session, statement, exact=pagination_params.count)
@@ -7,13 +7,19 @@ exposed via the API.
 
 import re
 from fastapi import Depends
-from functools import lru_cache
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 from ..database import db_session
 from ..models import User, Permission, Role, RoleDetails
 from ..entities import UserEntity, PermissionEntity, RoleEntity
 from ..services.exceptions import UserPermissionException
+from .permission_index import (
+    PermissionIndex,
+    expand_pattern,
+    pattern_cache,
+    permission_index_cache,
+)
+from .user_details_cache import user_details_cache
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -31,6 +37,7 @@ class PermissionService:
         Args:
             session (Session): The SQLAlchemy session to use for database operations."""
         self._session = session
+        self._indices: dict[int | None, PermissionIndex] = {}
 
     def get_permissions(self, subject: User) -> list[Permission]:
         """Get the permissions for a user.
@@ -83,6 +90,7 @@ class PermissionService:
 
         self._session.add(permission_entity)
         self._session.commit()
+        self.invalidate()
         return True
 
     def revoke(self, revoker: User, permission: Permission) -> bool:
@@ -110,6 +118,7 @@ class PermissionService:
 
         self._session.delete(permission_entity)
         self._session.commit()
+        self.invalidate()
         return True
 
     def enforce(self, subject: User, action: str, resource: str) -> None:
@@ -132,20 +141,54 @@ class PermissionService:
     def check(self, subject: User, action: str, resource: str) -> bool:
         """Check if a user has permission to carry out an action on a resource.
 
+        Checks are answered from the subject's compiled PermissionIndex, so only the first
+        check of a subject (per request, or per process while cached) reads from the database.
+
         Args:
             subject (User): The user to check permissions for.
 
         Returns:
             bool: True if the user has permission to carry out the action on the resource, False otherwise.
         """
-        # Check user permissions
-        user_perms = self._get_user_permissions(subject)
-        if self._has_permission(user_perms, action, resource):
-            return True
+        return self._get_permission_index(subject).check(action, resource)
+
+    def invalidate(self) -> None:
+        """Discard compiled permission indices, and cached UserDetails which list permissions,
+        after a change to permissions or role membership.
+
+        Services that modify permissions or role membership outside of `grant` and `revoke`
+        must call this after committing their change."""
+        self._indices.clear()
+        permission_index_cache.invalidate()
+        user_details_cache.invalidate()
+
+    def _get_permission_index(self, subject: User) -> PermissionIndex:
+        """Get the compiled permission index of a user, building it on first use.
 
-        # Check role permissions
-        role_permissions = self._get_user_roles_permissions(subject)
-        return self._has_permission(role_permissions, action, resource)
+        Args:
+            subject (User): The user to get the permission index for.
+
+        Returns:
+            PermissionIndex: The compiled index of the user's and their roles' permissions.
+        """
+        index = self._indices.get(subject.id)
+        if index is not None:
+            return index
+
+        index = permission_index_cache.get(subject.id) if subject.id else None
+        if index is None:
+            version = permission_index_cache.version
+            permissions = self._get_user_permissions(
+                subject
+            ) + self._get_user_roles_permissions(subject)
+            index = PermissionIndex(
+                (permission.action, permission.resource) for permission in permissions
+            )
+            if subject.id:
+                permission_index_cache.put(subject.id, index, version)
+
+        self._indices[subject.id] = index
+        return index
 
     def _get_user_permissions(self, subject: User) -> list[PermissionEntity]:
         """Get the permissions for a user.
@@ -218,16 +261,15 @@ class PermissionService:
         else:
             return False
 
-    @lru_cache()
     def _expand_pattern(self, pattern: str) -> re.Pattern:
         """Expand a permission pattern into a regular expression.
 
-        This function is memoized to avoid recompiling the same regular expression multiple times.
+        Compiled patterns are memoized in the process-wide, bounded `pattern_cache` rather than
+        per service instance, so they are reused across requests.
 
         Args:
             pattern (str): The pattern to expand.
 
         Returns:
             re.Pattern: The compiled regular expression."""
-        search = pattern.replace("*", ".*")
-        return re.compile(f"^{search}$")
+        return pattern_cache.compile(f"^{expand_pattern(pattern)}$")
@@ -0,0 +1,193 @@
+"""
+Compiled permission indices let PermissionService answer checks without database round trips.
+
+A user's permissions are compiled once into a PermissionIndex. Indices are memoized for the
+duration of a request by the PermissionService instance FastAPI shares across a request's
+dependencies, and across requests by the process-wide PermissionIndexCache below. Compiled
+regular expressions are shared by every index and service through the PatternCache.
+"""
+
+import re
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Iterable
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+_SEPARATOR = "\x00"
+"""Joins an action and resource into a single subject for the combined automaton."""
+
+
+class PatternCache:
+    """Bounded, thread-safe LRU cache of compiled regular expressions keyed by their source.
+
+    Unlike `functools.lru_cache` on a method, entries are not keyed on a service instance, so
+    compiled patterns are reused across requests and do not keep services or their sessions alive.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize an empty cache.
+
+        Args:
+            maxsize (int): The maximum number of compiled patterns retained.
+        """
+        self._maxsize = maxsize
+        self._lock = Lock()
+        self._patterns: OrderedDict[str, re.Pattern] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def compile(self, source: str) -> re.Pattern:
+        """Get the compiled regular expression of source, compiling it on a miss.
+
+        Args:
+            source (str): The regular expression to compile.
+
+        Returns:
+            re.Pattern: The compiled regular expression."""
+        with self._lock:
+            pattern = self._patterns.get(source)
+            if pattern is not None:
+                self._hits += 1
+                self._patterns.move_to_end(source)
+                return pattern
+            self._misses += 1
+
+        pattern = re.compile(source)
+        with self._lock:
+            self._patterns[source] = pattern
+            if len(self._patterns) > self._maxsize:
+                self._patterns.popitem(last=False)
+        return pattern
+
+    def stats(self) -> dict[str, int]:
+        """Hit, miss, current size and maximum size counts of the cache."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._patterns),
+                "maxsize": self._maxsize,
+            }
+
+    def clear(self) -> None:
+        """Remove all compiled patterns and reset statistics."""
+        with self._lock:
+            self._patterns.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+pattern_cache = PatternCache()
+"""Process-wide PatternCache of compiled permission patterns."""
+
+
+def expand_pattern(pattern: str) -> str:
+    """Expand a permission pattern, where `*` matches anything, into a regular expression."""
+    return pattern.replace("*", ".*")
+
+
+class PermissionIndex:
+    """All of a user's (action, resource) permission patterns compiled into one automaton.
+
+    Each permission becomes one alternative of a single regular expression matched against
+    `action + NUL + resource`, so a check is one exact-match set lookup and at most one
+    regular expression match regardless of how many permissions the user holds. Pattern
+    semantics are identical to PermissionService#_check_permission: `*` matches anything.
+    """
+
+    def __init__(self, permissions: Iterable[tuple[str, str]]):
+        """Compile an index from (action, resource) pattern pairs.
+
+        Args:
+            permissions (Iterable[tuple[str, str]]): The action and resource patterns to compile.
+        """
+        self._exact: set[tuple[str, str]] = set()
+        alternatives: list[str] = []
+        for action, resource in permissions:
+            self._exact.add((action, resource))
+            alternatives.append(
+                f"(?:(?:{expand_pattern(action)}){_SEPARATOR}(?:{expand_pattern(resource)}))"
+            )
+        self._automaton: re.Pattern | None = (
+            pattern_cache.compile("|".join(alternatives)) if alternatives else None
+        )
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def check(self, action: str, resource: str) -> bool:
+        """Check whether any compiled permission grants action on resource.
+
+        Args:
+            action (str): The action in question.
+            resource (str): The resource in question.
+
+        Returns:
+            bool: True if the action on the resource is permitted, False otherwise.
+        """
+        if (action, resource) in self._exact:
+            return True
+        if self._automaton is None:
+            return False
+        return self._automaton.fullmatch(f"{action}{_SEPARATOR}{resource}") is not None
+
+
+class PermissionIndexCache:
+    """Process-wide cache of PermissionIndex objects keyed by user ID.
+
+    Entries are stamped with the cache's version when their permissions were read. Any change
+    to permissions or role membership bumps the version through `invalidate`, which makes every
+    older entry stale. Because the version only lives in this process, entries also expire after
+    `ttl` seconds to bound how long other worker processes may serve stale permissions.
+    """
+
+    def __init__(self, ttl: float = 30.0, maxsize: int = 4096):
+        """Initialize an empty cache.
+
+        Args:
+            ttl (float): Seconds an entry may be served before it is rebuilt.
+            maxsize (int): The maximum number of users whose indices are retained.
+        """
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._lock = Lock()
+        self._version = 0
+        self._entries: dict[int, tuple[int, float, PermissionIndex]] = {}
+
+    @property
+    def version(self) -> int:
+        """The current version; capture it before reading permissions that will be `put`."""
+        return self._version
+
+    def get(self, user_id: int) -> PermissionIndex | None:
+        """Get the current index of a user or None if there is no fresh entry."""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        version, expires, index = entry
+        if version != self._version or expires < time.monotonic():
+            return None
+        return index
+
+    def put(self, user_id: int, index: PermissionIndex, version: int) -> None:
+        """Store a user's index if no invalidation happened since version was captured."""
+        with self._lock:
+            if version != self._version:
+                return
+            if user_id not in self._entries and len(self._entries) >= self._maxsize:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[user_id] = (version, time.monotonic() + self._ttl, index)
+
+    def invalidate(self) -> None:
+        """Mark every cached index stale after a permission or role membership change."""
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+
+
+permission_index_cache = PermissionIndexCache()
+"""Process-wide PermissionIndexCache shared by all PermissionService instances."""
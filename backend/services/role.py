@@ -120,6 +120,7 @@ class RoleService:
         if user:
             role.users.append(user)
             self._session.commit()
+            self._permission.invalidate()
         return self.details(subject, id)
 
     def is_member(self, subject: User, id: int, userId: int) -> bool:
@@ -152,4 +153,5 @@ class RoleService:
         user = self._session.get(UserEntity, userId)
         role.users.remove(user)
         self._session.commit()
+        self._permission.invalidate()
         return True
@@ -0,0 +1,53 @@
+"""
+Substring search over the `search_text` columns of entities, see `entities/search.py`.
+
+Services filter by `matches(Entity.search_text, query)` rather than ORing an ILIKE per column,
+so that a single trigram index serves each search, and order ranked results by `rank`.
+"""
+
+from sqlalchemy import ColumnElement, case, func
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+def matches(search_text: ColumnElement[str], query: str) -> ColumnElement[bool]:
+    """Criteria of the rows whose search_text contains query, ignoring case.
+
+    Wildcards in query, `%` and `_`, are matched literally.
+
+    Args:
+        search_text (ColumnElement[str]): The `search_text` column of an entity.
+        query (str): The text searched for.
+
+    Returns:
+        ColumnElement[bool]: The criteria, which may be served by a trigram index.
+    """
+    return search_text.contains(query.lower(), autoescape=True)
+
+
+def rank(query: str, *columns: ColumnElement[str]) -> ColumnElement[int]:
+    """Relevance of a matching row to query, lower is better.
+
+    A row ranks 0 if one of columns equals query, 1 if one starts with query and 2 otherwise,
+    ignoring case.
+
+    Args:
+        query (str): The text searched for.
+        *columns (ColumnElement[str]): The columns ranked, most significant first.
+
+    Returns:
+        ColumnElement[int]: An expression to order results by.
+    """
+    query = query.lower()
+    return func.least(
+        *(
+            case(
+                (func.lower(column) == query, 0),
+                (func.lower(column).startswith(query, autoescape=True), 1),
+                else_=2,
+            )
+            for column in columns
+        )
+    )
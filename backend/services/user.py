@@ -4,13 +4,16 @@ The User Service provides access to the User model and its associated database o
 """
 
 from fastapi import Depends
-from sqlalchemy import select, or_, func, cast, String
+from sqlalchemy import event, select, func
 from sqlalchemy.orm import Session
 from ..database import db_session
 from ..models import User, UserDetails, Paginated, PaginationParams, PublicUser
 from ..entities import UserEntity
 from .exceptions import ResourceNotFoundException
 from .permission import PermissionService
+from .pagination import keyset_page, paginated_length
+from .search import matches, rank
+from .user_details_cache import user_details_cache
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -50,6 +53,40 @@ class UserService:
             user_details = UserDetails(**user_fields)
             return user_details
 
+    def get_cached(self, pid: int) -> tuple[UserDetails | None, int]:
+        """Get a User by PID, serving recently resolved users from the process-wide cache.
+
+        Used to authenticate requests. Cached details are invalidated by `create`, `update`
+        and `PermissionService.invalidate`.
+
+        Args:
+            pid: The PID of the user.
+
+        Returns:
+            tuple[UserDetails | None, int]: The user or None if not found, and the number of
+                statements the cache avoided (0 when the user was loaded from the database).
+        """
+        cached = user_details_cache.get(pid)
+        if cached is not None:
+            return cached
+
+        version = user_details_cache.version
+        statements = 0
+
+        def count_statement(_):
+            nonlocal statements
+            statements += 1
+
+        event.listen(self._session, "do_orm_execute", count_statement)
+        try:
+            user = self.get(pid)
+        finally:
+            event.remove(self._session, "do_orm_execute", count_statement)
+
+        if user is not None:
+            user_details_cache.put(pid, user, statements, version)
+        return user, 0
+
     def get_by_id(self, id: int) -> User:
         """Get a User by their id.
 
@@ -97,15 +134,21 @@ class UserService:
         Returns:
             list[User]: The list of users matching the query.
         """
-        statement = select(UserEntity)
-        criteria = or_(
-            UserEntity.first_name.ilike(f"%{query}%"),
-            UserEntity.last_name.ilike(f"%{query}%"),
-            UserEntity.onyen.ilike(f"%{query}%"),
-            UserEntity.email.ilike(f"%{query}%"),
-            cast(UserEntity.pid, String).ilike(f"%{query}%"),
+        statement = (
+            select(UserEntity)
+            .where(matches(UserEntity.search_text, query))
+            .order_by(
+                rank(
+                    query,
+                    UserEntity.first_name,
+                    UserEntity.last_name,
+                    UserEntity.onyen,
+                    UserEntity.email,
+                ),
+                UserEntity.id,
+            )
+            .limit(10)
         )
-        statement = statement.where(criteria).limit(10)
         entities = self._session.execute(statement).scalars()
         return [entity.to_model() for entity in entities]
 
@@ -125,32 +168,43 @@ class UserService:
 
         Raises:
             PermissionException: If the subject does not have the required permission.
+            InvalidCursorException: If the pagination cursor is malformed.
         """
         self._permission.enforce(subject, "user.list", "user/")
 
         statement = select(UserEntity)
         length_statement = select(func.count()).select_from(UserEntity)
         if pagination_params.filter != "":
-            query = pagination_params.filter
-            criteria = or_(
-                UserEntity.first_name.ilike(f"%{query}%"),
-                UserEntity.last_name.ilike(f"%{query}%"),
-                UserEntity.onyen.ilike(f"%{query}%"),
-            )
+            criteria = matches(UserEntity.search_text, pagination_params.filter)
             statement = statement.where(criteria)
             length_statement = length_statement.where(criteria)
 
+        order_by = (
+            getattr(UserEntity, pagination_params.order_by)
+            if pagination_params.order_by != ""
+            else None
+        )
+        length = paginated_length(self._session, length_statement, pagination_params)
+
+        if pagination_params.cursor is not None:
+            entities, next_cursor = keyset_page(
+                self._session, statement, pagination_params, order_by, UserEntity.id
+            )
+            return Paginated(
+                items=[entity.to_model() for entity in entities],
+                length=length,
+                next_cursor=next_cursor,
+                params=pagination_params,
+            )
+
         offset = pagination_params.page * pagination_params.page_size
         limit = pagination_params.page_size
 
-        if pagination_params.order_by != "":
-            statement = statement.order_by(
-                getattr(UserEntity, pagination_params.order_by)
-            )
+        if order_by is not None:
+            statement = statement.order_by(order_by)
 
         statement = statement.offset(offset).limit(limit)
 
-        length = self._session.execute(length_statement).scalar()
         entities = self._session.execute(statement).scalars()
 
         return Paginated(
@@ -179,6 +233,7 @@ class UserService:
         entity = UserEntity.from_model(user)
         self._session.add(entity)
         self._session.commit()
+        user_details_cache.invalidate(entity.pid)
         return entity.to_model()
 
     def update(self, subject: User, user: User) -> User:
@@ -199,6 +254,9 @@ class UserService:
         if subject != user:
             self._permission.enforce(subject, "user.update", f"user/{user.id}")
         entity = self._session.get(UserEntity, user.id)
+        previous_pid = entity.pid
         entity.update(user)
         self._session.commit()
+        user_details_cache.invalidate(previous_pid)
+        user_details_cache.invalidate(entity.pid)
         return entity.to_model()
@@ -0,0 +1,116 @@
+"""
+Process-wide cache of resolved UserDetails used to authenticate requests.
+
+Every authenticated request resolves its bearer token's PID to a UserDetails, including the
+user's permissions. The UserDetailsCache lets `registered_user` skip those queries for users
+seen recently. Entries are invalidated by `UserService.create/update` for a single PID and by
+`PermissionService.invalidate` (grants, revocations and role membership changes) for all PIDs.
+"""
+
+import time
+from threading import Lock
+
+from ..models import UserDetails
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+class UserDetailsCache:
+    """Bounded TTL cache of UserDetails keyed by PID.
+
+    Entries are stamped with the cache's version when they were read so that an invalidation
+    racing with a database read cannot store stale details. Because versions only live in this
+    process, entries also expire after `ttl` seconds to bound staleness across worker processes.
+    """
+
+    def __init__(self, ttl: float = 30.0, maxsize: int = 4096):
+        """Initialize an empty cache.
+
+        Args:
+            ttl (float): Seconds an entry may be served before it is reloaded.
+            maxsize (int): The maximum number of users retained.
+        """
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._lock = Lock()
+        self._version = 0
+        self._entries: dict[int, tuple[int, float, UserDetails, int]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._avoided_queries = 0
+
+    @property
+    def version(self) -> int:
+        """The current version; capture it before reading details that will be `put`."""
+        return self._version
+
+    def get(self, pid: int) -> tuple[UserDetails, int] | None:
+        """Get a copy of the cached details of a user.
+
+        Args:
+            pid (int): The PID of the user.
+
+        Returns:
+            tuple[UserDetails, int] | None: The user's details and the number of statements it
+                took to load them, or None if there is no fresh entry.
+        """
+        entry = self._entries.get(pid)
+        if entry is None or entry[1] < time.monotonic():
+            with self._lock:
+                self._misses += 1
+            return None
+
+        _, _, details, statements = entry
+        with self._lock:
+            self._hits += 1
+            self._avoided_queries += statements
+        # Callers such as GitHubService mutate the subject, so never hand out the cached model.
+        return details.model_copy(deep=True), statements
+
+    def put(
+        self, pid: int, details: UserDetails, statements: int, version: int
+    ) -> None:
+        """Store a user's details if no invalidation happened since version was captured.
+
+        Args:
+            pid (int): The PID of the user.
+            details (UserDetails): The user's details.
+            statements (int): The number of statements it took to load details.
+            version (int): The cache version captured before details were loaded.
+        """
+        with self._lock:
+            if version != self._version:
+                return
+            if pid not in self._entries and len(self._entries) >= self._maxsize:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[pid] = (
+                version,
+                time.monotonic() + self._ttl,
+                details.model_copy(deep=True),
+                statements,
+            )
+
+    def invalidate(self, pid: int | None = None) -> None:
+        """Discard the cached details of one user, or of all users when pid is None."""
+        with self._lock:
+            self._version += 1
+            if pid is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(pid, None)
+
+    def stats(self) -> dict[str, int]:
+        """Hit, miss, avoided query and current size counts of the cache."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "avoided_queries": self._avoided_queries,
+                "size": len(self._entries),
+            }
+
+
+user_details_cache = UserDetailsCache()
+"""Process-wide UserDetailsCache used by `registered_user`."""
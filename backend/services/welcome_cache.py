@@ -0,0 +1,105 @@
+"""
+Process-wide cache of the parts of the welcome overview shared by every visitor.
+
+The landing page requests the welcome overview on every visit. Its latest announcement, latest
+news and upcoming operating hours are the same for everyone, so `ArticleService` composes each
+overview from the WelcomeFragments cached here plus the visitor's own reservations and
+registrations. Fragments are invalidated by `ArticleService.create_article/edit_article/
+delete_article` and `OperatingHoursService.create/delete`.
+"""
+
+import time
+from datetime import datetime
+from threading import Lock
+from typing import NamedTuple
+
+from ..models.articles import ArticleOverview
+from ..models.coworking import OperatingHours
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+class WelcomeFragments(NamedTuple):
+    """The parts of the welcome overview shared by every visitor.
+
+    Models are shared by every overview composed from the fragments and must not be mutated.
+    """
+
+    announcement: ArticleOverview | None
+    latest_news: list[ArticleOverview]
+    operating_hours: list[OperatingHours]
+    """Operating hours overlapping the time from loading the fragments until `horizon`."""
+    horizon: datetime
+
+
+class WelcomeCache:
+    """TTL cache of the WelcomeFragments.
+
+    Fragments are stamped with the cache's version when they were read so that an invalidation
+    racing with a database read cannot store stale fragments. Because versions only live in this
+    process, fragments also expire after `ttl` seconds to bound staleness across worker
+    processes, including changes to the organizations and authors of articles.
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        """Initialize an empty cache.
+
+        Args:
+            ttl (float): Seconds fragments may be served before they are reloaded.
+        """
+        self.ttl = ttl
+        self._lock = Lock()
+        self._version = 0
+        self._entry: tuple[float, WelcomeFragments] | None = None
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def version(self) -> int:
+        """The current version; capture it before reading fragments that will be `put`."""
+        return self._version
+
+    def get(self, until: datetime) -> WelcomeFragments | None:
+        """Get the cached fragments if they are fresh and cover operating hours until a time.
+
+        Args:
+            until (datetime): The end of the operating hours the overview shows.
+
+        Returns:
+            WelcomeFragments | None: The fragments, or None if there are no fresh fragments.
+        """
+        entry = self._entry
+        with self._lock:
+            if entry is None or entry[0] < time.monotonic() or entry[1].horizon < until:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return entry[1]
+
+    def put(self, fragments: WelcomeFragments, version: int) -> None:
+        """Store fragments if no invalidation happened since version was captured.
+
+        Args:
+            fragments (WelcomeFragments): The fragments.
+            version (int): The cache version captured before fragments were loaded.
+        """
+        with self._lock:
+            if version == self._version:
+                self._entry = (time.monotonic() + self.ttl, fragments)
+
+    def invalidate(self) -> None:
+        """Discard the cached fragments."""
+        with self._lock:
+            self._version += 1
+            self._entry = None
+
+    def stats(self) -> dict[str, int]:
+        """Hit and miss counts of the cache."""
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses}
+
+
+welcome_cache = WelcomeCache()
+"""Process-wide WelcomeCache used by `ArticleService.get_welcome_overview`."""
@@ -84,6 +84,27 @@ def test_get_course_site_roster_filter(course_site_svc: CourseSiteService):
         assert item.last_name == filter
 
 
+def test_get_course_site_roster_keyset(course_site_svc: CourseSiteService):
+    """Ensures that following roster cursors visits every member in order once."""
+    pagination_params = PaginationParams(page_size=2, order_by="last_name", cursor="")
+    members: list[CourseMemberOverview] = []
+    while pagination_params.cursor is not None:
+        roster = course_site_svc.get_course_site_roster(
+            user_data.instructor, office_hours_data.comp_110_site.id, pagination_params
+        )
+        members.extend(roster.items)
+        pagination_params.cursor = roster.next_cursor
+
+    everyone = course_site_svc.get_course_site_roster(
+        user_data.instructor, office_hours_data.comp_110_site.id, PaginationParams()
+    )
+    assert sorted(member.pid for member in members) == sorted(
+        member.pid for member in everyone.items
+    )
+    for i in range(len(members) - 1):
+        assert members[i].last_name <= members[i + 1].last_name
+
+
 def test_get_course_site_roster_not_member(course_site_svc: CourseSiteService):
     """Ensures that non-members are unable to access course rosters."""
     pagination_params = PaginationParams()
@@ -94,6 +115,31 @@ def test_get_course_site_roster_not_member(course_site_svc: CourseSiteService):
         pytest.fail()
 
 
+def test_get_course_site_roster_for_export(course_site_svc: CourseSiteService):
+    """Ensures that roster exports stream every member visible to the instructor."""
+    members = list(
+        course_site_svc.get_course_site_roster_for_export(
+            user_data.instructor, office_hours_data.comp_110_site.id
+        )
+    )
+    everyone = course_site_svc.get_course_site_roster(
+        user_data.instructor, office_hours_data.comp_110_site.id, PaginationParams()
+    )
+    assert [member.pid for member in members] == [
+        member.pid for member in everyone.items
+    ]
+
+
+def test_get_course_site_roster_for_export_not_member(
+    course_site_svc: CourseSiteService,
+):
+    """Ensures that non-members are unable to export course rosters."""
+    with pytest.raises(CoursePermissionException):
+        course_site_svc.get_course_site_roster_for_export(
+            user_data.ambassador, office_hours_data.comp_110_site.id
+        )
+
+
 def test_get_current_office_hour_events(course_site_svc: CourseSiteService):
     """Ensures that members are able to access current office hour events."""
     office_hours = course_site_svc.get_current_office_hour_events(
@@ -0,0 +1,61 @@
+"""Saved UNC class search reports pages, served offline to `EnrollmentScraper`."""
+
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from . import term_data
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+REPORTS_DIRECTORY = Path(__file__).parent / "reports"
+
+# Saved pages of the terms of the test data, keyed by their name in the reports site
+pages = {
+    "2024+Summer+II": "COMP_2024_Summer_II.html",
+    "2023+Fall": "COMP_2023_Fall.html",
+}
+
+# IDs of the terms of the saved pages in the test data
+terms = {
+    "2024+Summer+II": term_data.current_term.id,
+    "2023+Fall": term_data.f_23.id,
+}
+
+
+class SavedReports:
+    """Stands in for `requests.get`, serving the saved page of the requested term.
+
+    Responses carry an ETag of the page's file name, so conditional requests for an unchanged
+    page are answered with `304 Not Modified`.
+    """
+
+    def __init__(self, pages: dict[str, str] = pages):
+        self.pages = pages
+        self.requests: list[tuple[str, dict]] = []
+
+    def __call__(self, url: str, headers: dict | None = None, timeout=None):
+        headers = headers or {}
+        self.requests.append((url, headers))
+
+        # parse_qs decodes the "+" of term names into spaces
+        term = parse_qs(urlparse(url).query)["term"][0].replace(" ", "+")
+        response = requests.Response()
+        response.url = url
+        if term not in self.pages:
+            response.status_code = 404
+            response._content = b""
+            return response
+
+        etag = f'"{self.pages[term]}"'
+        response.headers["ETag"] = etag
+        if headers.get("If-None-Match") == etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = (REPORTS_DIRECTORY / self.pages[term]).read_bytes()
+        return response
@@ -3,6 +3,8 @@
 # PyTest
 import pytest
 from unittest.mock import create_autospec
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 
 from backend.services.exceptions import (
     UserPermissionException,
@@ -11,6 +13,7 @@ from backend.services.exceptions import (
 )
 
 # Tested Dependencies
+from .....models.pagination import PaginationParams
 from .....models.academics.hiring.application_review import (
     HiringStatus,
     ApplicationReviewOverview,
@@ -19,10 +22,14 @@ from .....models.academics.hiring.application_review import (
 from .....services.academics import HiringService
 from .....services.application import ApplicationService
 from .....services.academics.course_site import CourseSiteService
+from .....entities import UserEntity
+from .....entities.application_entity import ApplicationEntity
+from .....entities.section_application_table import section_application_table
 
 # Injected Service Fixtures
 from .fixtures import hiring_svc
 from ..course_site_test import course_site_svc
+from ...query_budget import QueryBudget, count_statements
 
 # Import the setup_teardown fixture explicitly to load entities in database
 from ...core_data import setup_insert_data_fixture as insert_order_0
@@ -116,6 +123,72 @@ def test_update_status(hiring_svc: HiringService):
     )
 
 
+def test_status_cycle_statements_are_bounded(
+    hiring_svc: HiringService, session: Session
+):
+    """Ensures getting and reordering the status of 1,000 applicants takes a fixed number of statements."""
+    applicants = 1_000
+    user_ids = session.scalars(
+        insert(UserEntity).returning(UserEntity.id),
+        [
+            {
+                "pid": 800000000 + i,
+                "onyen": f"applicant{i}",
+                "email": f"applicant{i}@unc.edu",
+                "first_name": "Applicant",
+                "last_name": str(i),
+            }
+            for i in range(applicants)
+        ],
+    ).all()
+    application_ids = session.scalars(
+        insert(ApplicationEntity).returning(ApplicationEntity.id),
+        [
+            {
+                "user_id": user_id,
+                "term_id": term_data.current_term.id,
+                "type": "new_uta",
+            }
+            for user_id in user_ids
+        ],
+    ).all()
+    session.execute(
+        insert(section_application_table),
+        [
+            {
+                "section_id": section_data.comp_110_001_current_term.id,
+                "application_id": application_id,
+                "preference": 0,
+            }
+            for application_id in application_ids
+        ],
+    )
+    session.commit()
+
+    with count_statements(session) as log:
+        status = hiring_svc.get_status(
+            user_data.instructor, office_hours_data.comp_110_site.id
+        )
+        get_statements = len(log)
+
+        # Reverse the unprocessed column and move its first half to preferred
+        not_processed = status.not_processed
+        for preference, review in enumerate(reversed(not_processed)):
+            review.preference = preference
+        for review in not_processed[: len(not_processed) // 2]:
+            review.status = ApplicationReviewStatus.PREFERRED
+        new_status = hiring_svc.update_status(
+            user_data.instructor, office_hours_data.comp_110_site.id, status
+        )
+
+    assert len(status.not_processed) == applicants + 2
+    assert len(new_status.preferred) == 1 + (applicants + 2) // 2
+    assert new_status.not_processed[0].id == not_processed[-1].id
+    assert log.executemany == []
+    assert get_statements <= 9
+    assert len(log) - get_statements <= 11
+
+
 def test_update_status_site_not_found(hiring_svc: HiringService):
     """Ensures that updating hiring is not possible if a course site does not exist."""
     status = hiring_svc.get_status(
@@ -154,6 +227,45 @@ def test_get_hiring_admin_overview(hiring_svc: HiringService):
     assert hiring_admin_overview is not None
     assert len(hiring_admin_overview.sites) == 2
 
+    comp_110 = hiring_admin_overview.sites[0]
+    assert comp_110.course_site_id == office_hours_data.comp_110_site.id
+    assert [section.id for section in comp_110.sections] == [
+        section_data.comp_110_001_current_term.id,
+        section_data.comp_110_002_current_term.id,
+    ]
+    assert [instructor.id for instructor in comp_110.instructors] == [
+        user_data.instructor.id
+    ]
+    total_enrollment = (
+        section_data.comp_110_001_current_term.enrolled
+        + section_data.comp_110_002_current_term.enrolled
+    )
+    assert comp_110.total_enrollment == total_enrollment
+    assert comp_110.total_cost == hiring_data.uta_level.salary
+    assert comp_110.coverage == pytest.approx(
+        total_enrollment / 60.0 - hiring_data.uta_level.load * 0.25
+    )
+    assert [assignment.user.id for assignment in comp_110.assignments] == [
+        user_data.student.id
+    ]
+
+    comp_301 = hiring_admin_overview.sites[1]
+    assert comp_301.total_cost == 0.0
+    assert comp_301.assignments == []
+    assert comp_301.coverage == pytest.approx(comp_301.total_enrollment / 60.0)
+
+
+def test_get_hiring_admin_overview_statements_are_bounded(
+    hiring_svc: HiringService, query_budget: QueryBudget
+):
+    """Ensures the hiring admin overview takes a fixed number of statements per term."""
+    # Warm the permission cache of the administrator
+    hiring_svc.get_hiring_admin_overview(user_data.root, term_data.current_term.id)
+
+    # The totals, sections with courses, instructors and assignments with levels.
+    with query_budget(4):
+        hiring_svc.get_hiring_admin_overview(user_data.root, term_data.current_term.id)
+
 
 def test_get_hiring_admin_overview_checks_permission(hiring_svc: HiringService):
     """Ensures that nobody else is able to check the hiring data."""
@@ -296,6 +408,53 @@ def test_create_missing_course_sites_for_term(
     assert len(overview_post.sites) > len(overview_pre.sites)
 
 
+def test_get_hiring_summary_overview_keyset(hiring_svc: HiringService):
+    """Ensures that cursors page through the hiring summary ordered by last name."""
+    hiring_svc.create_hiring_assignment(
+        user_data.root, hiring_data.new_hiring_assignment
+    )
+    pagination_params = PaginationParams(page_size=1, cursor="")
+    last_names: list[str] = []
+    while pagination_params.cursor is not None:
+        summary = hiring_svc.get_hiring_summary_overview(
+            user_data.root, term_data.current_term.id, pagination_params
+        )
+        assert summary.length == 2
+        last_names.extend(assignment.user.last_name for assignment in summary.items)
+        pagination_params.cursor = summary.next_cursor
+    assert last_names == ["Ambassador", "Student"]
+
+
+def test_get_hiring_summary_for_csv(hiring_svc: HiringService):
+    """Ensures that the hiring summary export streams hires ordered by last name."""
+    hiring_svc.create_hiring_assignment(
+        user_data.root, hiring_data.new_hiring_assignment
+    )
+    rows = list(
+        hiring_svc.get_hiring_summary_for_csv(user_data.root, term_data.current_term.id)
+    )
+    assert [row.last_name for row in rows] == ["Ambassador", "Student"]
+    assert all(row.instructors for row in rows)
+
+
+def test_get_course_site_hiring_status_csv(hiring_svc: HiringService):
+    """Ensures that the applications export streams each review of the course site."""
+    hiring_status = hiring_svc.get_status(
+        user_data.instructor, office_hours_data.comp_110_site.id
+    )
+    rows = list(
+        hiring_svc.get_course_site_hiring_status_csv(
+            user_data.instructor, office_hours_data.comp_110_site.id
+        )
+    )
+    reviews = (
+        hiring_status.not_preferred
+        + hiring_status.preferred
+        + hiring_status.not_processed
+    )
+    assert len(rows) == len(reviews)
+
+
 def test_get_phd_applicants(hiring_svc: HiringService):
     user = user_data.root
     term = term_data.current_term
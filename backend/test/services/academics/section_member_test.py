@@ -51,11 +51,19 @@ def test_get_section_member_by_id_exception_if_invalid_id(
 
 
 def test_create_from_csv(section_member_svc: SectionMemberService):
-    section_member_svc.import_users_from_csv(
+    report = section_member_svc.import_users_from_csv(
         user_data.instructor,
         section_data.comp_301_001_current_term.id,
         csv_data=section_data.roster_csv,
     )
+    assert report.uploaded == 4
+    assert [student.pid for student in report.added] == [
+        user_data.root.pid,
+        user_data.user.pid,
+    ]
+    assert [student.pid for student in report.created] == [345345345, 89898989]
+    assert report.existing == []
+    assert [student.pid for student in report.removed] == [user_data.student.pid]
 
 
 def test_create_from_csv_twice(section_member_svc: SectionMemberService):
@@ -64,11 +72,23 @@ def test_create_from_csv_twice(section_member_svc: SectionMemberService):
         section_data.comp_301_001_current_term.id,
         csv_data=section_data.roster_csv,
     )
-    section_member_svc.import_users_from_csv(
+    report = section_member_svc.import_users_from_csv(
         user_data.instructor,
         section_data.comp_301_001_current_term.id,
         csv_data=section_data.roster_csv,
     )
+    assert len(report.existing) == 4
+    assert report.added == [] and report.created == [] and report.removed == []
+
+
+def test_create_from_csv_lines(section_member_svc: SectionMemberService):
+    """Test that a roster can be streamed from the lines of a file."""
+    report = section_member_svc.import_users_from_csv(
+        user_data.instructor,
+        section_data.comp_301_001_current_term.id,
+        csv_data=iter(section_data.roster_csv.splitlines(keepends=True)),
+    )
+    assert report.uploaded == 4
 
 
 def test_create_from_csv_remove(section_member_svc: SectionMemberService):
@@ -77,11 +97,20 @@ def test_create_from_csv_remove(section_member_svc: SectionMemberService):
         section_data.comp_301_001_current_term.id,
         csv_data=section_data.roster_csv,
     )
-    section_member_svc.import_users_from_csv(
+    report = section_member_svc.import_users_from_csv(
         user_data.instructor,
         section_data.comp_301_001_current_term.id,
         csv_data=section_data.smaller_roster_csv,
     )
+    assert report.added == [] and report.created == []
+    assert [student.pid for student in report.existing] == [
+        user_data.root.pid,
+        89898989,
+    ]
+    assert [student.pid for student in report.removed] == [
+        user_data.user.pid,
+        345345345,
+    ]
 
 
 def test_create_from_csv_not_instructor(section_member_svc: SectionMemberService):
@@ -4,11 +4,16 @@ from unittest.mock import create_autospec
 import pytest
 from backend.models.roster_role import RosterRole
 from backend.services.exceptions import (
+    CourseDataScrapingException,
     ResourceNotFoundException,
     UserPermissionException,
 )
 from backend.services.permission import PermissionService
 from ....services.academics import SectionService, SectionMemberService
+from ....services.academics.enrollment_scraper import (
+    EnrollmentScraper,
+    parse_enrollments,
+)
 from ....models.academics import SectionDetails, CatalogSection
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
@@ -24,6 +29,8 @@ from .section_data import fake_data_fixture as insert_order_3
 from . import term_data
 from . import section_data
 from .. import user_data
+from .enrollment_reports import SavedReports, REPORTS_DIRECTORY
+from . import enrollment_reports
 
 __authors__ = ["Ajay Gandecha"]
 __copyright__ = "Copyright 2023"
@@ -223,4 +230,48 @@ def test_user_add_section_member(section_member_svc: SectionMemberService):
 
 
 def test_update_enrollments(section_svc: SectionService):
-    section_svc.update_enrollment_totals(user_data.root)
+    scraper = EnrollmentScraper(enrollment_reports.terms, SavedReports())
+    section_svc.update_enrollment_totals(user_data.root, scraper)
+
+    comp_110_001 = section_svc.get_by_id(section_data.comp_110_001_current_term.id)
+    assert (comp_110_001.enrolled, comp_110_001.total_seats) == (238, 250)
+    comp_110_002 = section_svc.get_by_id(section_data.comp_110_002_current_term.id)
+    assert (comp_110_002.enrolled, comp_110_002.total_seats) == (250, 250)
+    comp_301_001 = section_svc.get_by_id(section_data.comp_301_001.id)
+    assert (comp_301_001.enrolled, comp_301_001.total_seats) == (100, 120)
+
+    # Sections missing from the reports are unchanged
+    comp_311_001 = section_svc.get_by_id(section_data.comp_311_001_current_term.id)
+    assert (comp_311_001.enrolled, comp_311_001.total_seats) == (100, 200)
+
+
+def test_update_enrollments_conditional_requests(section_svc: SectionService):
+    saved_reports = SavedReports()
+    scraper = EnrollmentScraper(enrollment_reports.terms, saved_reports)
+    section_svc.update_enrollment_totals(user_data.root, scraper)
+    section_svc.update_enrollment_totals(user_data.root, scraper)
+
+    assert len(saved_reports.requests) == 4
+    assert all("If-None-Match" in headers for _, headers in saved_reports.requests[2:])
+    assert scraper.stats() == {"pages": 2, "not_modified": 2}
+    comp_110_001 = section_svc.get_by_id(section_data.comp_110_001_current_term.id)
+    assert comp_110_001.enrolled == 238
+
+
+def test_update_enrollments_missing_term(section_svc: SectionService):
+    scraper = EnrollmentScraper({"2099+Fall": "99F"}, SavedReports())
+    with pytest.raises(CourseDataScrapingException):
+        section_svc.update_enrollment_totals(user_data.root, scraper)
+
+
+def test_parse_enrollments_malformed():
+    with pytest.raises(IndexError):
+        parse_enrollments((REPORTS_DIRECTORY / "malformed.html").read_bytes())
+
+
+def test_parse_enrollments_only_cards():
+    enrollments = parse_enrollments(
+        (REPORTS_DIRECTORY / "COMP_2024_Summer_II.html").read_bytes()
+    )
+    assert len(enrollments) == 5
+    assert enrollments[("comp590", "087")].enrolled == 25
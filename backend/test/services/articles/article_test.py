@@ -12,6 +12,7 @@ from ....models.pagination import PaginationParams
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
 from ..fixtures import article_svc
+from ..query_budget import QueryBudget
 
 # Import the setup_teardown fixture explicitly to load entities in database
 from ..core_data import setup_insert_data_fixture as insert_fake_data_one
@@ -48,6 +49,34 @@ def test_get_welcome_unauthenticated(article_svc: ArticleService):
     )
 
 
+def test_get_welcome_unauthenticated_cached(
+    article_svc: ArticleService, query_budget: QueryBudget
+):
+    """Ensures that a warm cache serves logged out users without querying."""
+    article_svc.get_welcome_overview(None)
+    with query_budget(0):
+        article_svc.get_welcome_overview(None)
+
+
+def test_get_welcome_overview_queries_are_bounded(
+    article_svc: ArticleService, query_budget: QueryBudget
+):
+    """Ensures that a user's reservations and events take a constant number of queries."""
+    article_svc.get_welcome_overview(None)
+    with query_budget(5):
+        article_svc.get_welcome_overview(user_data.student)
+
+
+def test_get_welcome_overview_after_delete(article_svc: ArticleService):
+    """Ensures that deleting an article invalidates the cached welcome overview."""
+    article_svc.get_welcome_overview(None)
+    article_svc.delete_article(user_data.root, article_data.article_one.id)
+    welcome_overview = article_svc.get_welcome_overview(None)
+    assert article_data.article_one.id not in [
+        article.id for article in welcome_overview.latest_news
+    ]
+
+
 def test_get_by_slug(article_svc: ArticleService):
     """Ensures that users can get articles."""
     article = article_svc.get_article(article_data.article_one.slug)
@@ -69,6 +98,14 @@ def test_list(article_svc: ArticleService):
     assert len(articles.items) == 3
 
 
+def test_list_filter(article_svc: ArticleService):
+    """Ensures that articles are filtered by their title and synopsis."""
+    pagination_params = PaginationParams(page=0, page_size=10, filter="RUBBER DUCK")
+    articles = article_svc.list(user_data.root, pagination_params)
+    assert articles.length == 1
+    assert articles.items[0].id == article_data.article_two.id
+
+
 def test_list_not_admin(article_svc: ArticleService):
     """Ensures that non-admins cannot access all articles."""
     with pytest.raises(UserPermissionException):
@@ -0,0 +1,90 @@
+"""Tests for running synchronous services on an AsyncSession."""
+
+import asyncio
+import pytest
+from typing import Awaitable, Callable
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from ...database import _engine_str
+from ...models.coworking import Status
+from ...services.async_bridge import build_service, run_service
+from ...services.coworking import StatusService
+from .conftest import POSTGRES_DATABASE
+
+# Since there are relationship dependencies between the entities, order matters.
+from .coworking.time import *
+from .core_data import setup_insert_data_fixture as insert_order_0
+from .coworking.operating_hours_data import fake_data_fixture as insert_order_1
+from .room_data import fake_data_fixture as insert_order_2
+from .coworking.seat_data import fake_data_fixture as insert_order_3
+from .coworking.reservation.reservation_data import fake_data_fixture as insert_order_4
+
+from .core_data import user_data
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+def run_async(fn: Callable[[AsyncSession], Awaitable]):
+    """Run fn with an AsyncSession of the test database on a fresh event loop."""
+
+    async def main():
+        engine = create_async_engine(
+            _engine_str(POSTGRES_DATABASE, dialect="postgresql+asyncpg")
+        )
+        try:
+            async with AsyncSession(engine) as session:
+                return await fn(session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def _summary(status: Status):
+    return (
+        [reservation.id for reservation in status.my_reservations],
+        sorted(seat.id for seat in status.seat_availability),
+        [(hours.start, hours.end) for hours in status.operating_hours],
+    )
+
+
+def test_build_service_shares_collaborators(session: Session):
+    status_svc = build_service(StatusService, session)
+    reservation_svc = status_svc._reservation_svc
+    assert reservation_svc._session is session
+    assert reservation_svc._operating_hours_svc is status_svc._operating_hours_svc
+    assert reservation_svc._permission_svc is (
+        status_svc._operating_hours_svc._permission_svc
+    )
+
+
+def test_build_service_rejects_unsupported_dependencies(session: Session):
+    class UnsupportedService:
+        def __init__(self, value: int = Depends(lambda: 1)):
+            self.value = value
+
+    with pytest.raises(TypeError):
+        build_service(UnsupportedService, session)
+
+
+@pytest.mark.commits
+def test_run_service_matches_sync_service(session: Session):
+    expected = build_service(StatusService, session).get_coworking_status(
+        user_data.user
+    )
+
+    status = run_async(
+        lambda async_session: run_service(
+            async_session,
+            StatusService,
+            lambda status_svc: status_svc.get_coworking_status(user_data.user),
+        )
+    )
+
+    assert len(status.my_reservations) > 0
+    assert _summary(status) == _summary(expected)
@@ -1,16 +1,43 @@
-"""Shared pytest fixtures for database dependent tests."""
+"""Shared pytest fixtures for database dependent tests.
+
+The schema is created once in a template database, `{POSTGRES_DATABASE}_test_template`, which
+is rebuilt only when the schema of `entities` changes. Each test run clones the template into
+its own database, one per worker process when tests run in parallel with `pytest -n`, and drops
+the clone once the run completes. Each test then runs in a transaction of a single connection
+that is rolled back once it completes, with the `session`'s commits releasing savepoints within
+it. Tests which need their commits to be visible to other connections are marked `commits`, and
+their tables are truncated instead.
+"""
+
+import hashlib
+import os
 
 import pytest
 
-from sqlalchemy import create_engine, text, Engine
+from sqlalchemy import create_engine, text, Connection, Engine
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 from ...database import _engine_str
+from ...pool_monitor import MonitoredQueuePool
 from ...env import getenv
 from ... import entities
+from ...services.permission_index import permission_index_cache
+from ...services.user_details_cache import user_details_cache
+from ...services.welcome_cache import welcome_cache
+from ...services.pagination import length_cache
+from ...services.coworking.seat_availability_engine import seat_availability_engine
+from ...services.office_hours.queue_snapshot import queue_snapshot_cache
+from .query_budget import QueryBudget, within_budget
 
-POSTGRES_DATABASE = f'{getenv("POSTGRES_DATABASE")}_test'
+TEMPLATE_DATABASE = f'{getenv("POSTGRES_DATABASE")}_test_template'
+POSTGRES_DATABASE = f'{getenv("POSTGRES_DATABASE")}_test' + (
+    f'_{os.environ["PYTEST_XDIST_WORKER"]}'
+    if "PYTEST_XDIST_WORKER" in os.environ
+    else ""
+)
 POSTGRES_USER = getenv("POSTGRES_USER")
 
 __authors__ = ["Kris Jordan"]
@@ -18,41 +45,152 @@ __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
+def pytest_configure(config: pytest.Config):
+    config.addinivalue_line(
+        "markers",
+        "commits: the test's commits must be visible to other connections, so its data is "
+        "truncated after it rather than rolled back",
+    )
+
+
+def schema_version() -> str:
+    """A digest of the DDL of every table and index of the entities."""
+    dialect = postgresql.dialect()
+    digest = hashlib.sha256()
+    for table in entities.EntityBase.metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+    return digest.hexdigest()
+
+
+def drop_database(conn, database: str):
+    try:
+        conn.execute(text(f"DROP DATABASE IF EXISTS {database}"))
+    except OperationalError:
+        print(
+            "Could not drop database because it's being accessed by others (psql open?)"
+        )
+        exit(1)
+
+
 def reset_database():
-    engine = create_engine(_engine_str(""))
-    with engine.connect() as connection:
+    """Clone the template database into the test database, first (re)creating the template
+    if it is missing or of an earlier schema."""
+    engine = create_engine(_engine_str(""), isolation_level="AUTOCOMMIT")
+    version = schema_version()
+    with engine.connect() as conn:
+        # Workers share the template, so only one may build or clone it at once
+        conn.execute(
+            text("SELECT pg_advisory_lock(hashtext(:name))"),
+            {"name": TEMPLATE_DATABASE},
+        )
         try:
-            conn = connection.execution_options(autocommit=False)
-            conn.execute(text("ROLLBACK"))  # Get out of transactional mode...
-            conn.execute(text(f"DROP DATABASE {POSTGRES_DATABASE}"))
-        except ProgrammingError:
-            ...
-        except OperationalError:
-            print(
-                "Could not drop database because it's being accessed by others (psql open?)"
-            )
-            exit(1)
+            template_version = conn.execute(
+                text(
+                    "SELECT shobj_description(oid, 'pg_database') FROM pg_database "
+                    "WHERE datname = :name"
+                ),
+                {"name": TEMPLATE_DATABASE},
+            ).scalar()
+            if template_version != version:
+                drop_database(conn, TEMPLATE_DATABASE)
+                conn.execute(text(f"CREATE DATABASE {TEMPLATE_DATABASE}"))
+                template = create_engine(_engine_str(TEMPLATE_DATABASE))
+                entities.EntityBase.metadata.create_all(template)
+                template.dispose()
+                conn.execute(
+                    text(f"COMMENT ON DATABASE {TEMPLATE_DATABASE} IS '{version}'")
+                )
 
-        conn.execute(text(f"CREATE DATABASE {POSTGRES_DATABASE}"))
-        conn.execute(
-            text(
-                f"GRANT ALL PRIVILEGES ON DATABASE {POSTGRES_DATABASE} TO {POSTGRES_USER}"
+            drop_database(conn, POSTGRES_DATABASE)
+            conn.execute(
+                text(
+                    f"CREATE DATABASE {POSTGRES_DATABASE} TEMPLATE {TEMPLATE_DATABASE}"
+                )
             )
-        )
+            conn.execute(
+                text(
+                    f"GRANT ALL PRIVILEGES ON DATABASE {POSTGRES_DATABASE} TO {POSTGRES_USER}"
+                )
+            )
+        finally:
+            conn.execute(
+                text("SELECT pg_advisory_unlock(hashtext(:name))"),
+                {"name": TEMPLATE_DATABASE},
+            )
+    engine.dispose()
+
+
+def invalidate_caches():
+    """Clear the process-wide caches, which may hold data of an earlier test."""
+    permission_index_cache.invalidate()
+    user_details_cache.invalidate()
+    seat_availability_engine.invalidate()
+    length_cache.invalidate()
+    queue_snapshot_cache.invalidate()
+    welcome_cache.invalidate()
+
+
+def restart_sequences(connection: Connection):
+    """Sequences are not rolled back, so restart those advanced by earlier tests."""
+    connection.execute(
+        text("SELECT setval(oid::regclass, 1, false) FROM pg_class WHERE relkind = 'S'")
+    )
+
+
+def drop_test_database():
+    """Drop the test database cloned by `reset_database`, keeping the template for later runs."""
+    engine = create_engine(_engine_str(""), isolation_level="AUTOCOMMIT")
+    with engine.connect() as conn:
+        # Connections leaked by a failed test would otherwise leave the clone behind
+        conn.execute(text(f"DROP DATABASE IF EXISTS {POSTGRES_DATABASE} WITH (FORCE)"))
+    engine.dispose()
 
 
 @pytest.fixture(scope="session")
-def test_engine() -> Engine:
+def test_engine():
     reset_database()
-    return create_engine(_engine_str(POSTGRES_DATABASE))
+    engine = create_engine(_engine_str(POSTGRES_DATABASE), poolclass=MonitoredQueuePool)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+        drop_test_database()
 
 
 @pytest.fixture(scope="function")
-def session(test_engine: Engine):
-    entities.EntityBase.metadata.drop_all(test_engine)
-    entities.EntityBase.metadata.create_all(test_engine)
-    session = Session(test_engine)
-    try:
-        yield session
-    finally:
-        session.close()
+def session(request: pytest.FixtureRequest, test_engine: Engine):
+    invalidate_caches()
+    if request.node.get_closest_marker("commits") is not None:
+        with test_engine.begin() as connection:
+            restart_sequences(connection)
+        session = Session(test_engine)
+        try:
+            yield session
+        finally:
+            session.close()
+            tables = ", ".join(
+                f'"{table.name}"'
+                for table in entities.EntityBase.metadata.sorted_tables
+            )
+            with test_engine.begin() as connection:
+                connection.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+        return
+
+    with test_engine.connect() as connection:
+        transaction = connection.begin()
+        restart_sequences(connection)
+        session = Session(connection, join_transaction_mode="create_savepoint")
+        try:
+            yield session
+        finally:
+            session.close()
+            transaction.rollback()
+
+
+@pytest.fixture()
+def query_budget(session: Session) -> QueryBudget:
+    """Context manager failing a test when its block issues more statements than a budget,
+    see `query_budget.py`."""
+    return lambda budget: within_budget(session, budget)
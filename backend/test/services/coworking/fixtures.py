@@ -11,8 +11,10 @@ from ....services.coworking import (
     OperatingHoursService,
     SeatService,
     ReservationService,
+    ReservationSweepService,
     PolicyService,
     StatusService,
+    RoomUsageService,
 )
 
 __authors__ = [
@@ -56,6 +58,12 @@ def policy_svc():
     return PolicyService()
 
 
+@pytest.fixture()
+def room_usage_svc(session: Session, policy_svc: PolicyService):
+    """RoomUsageService fixture."""
+    return RoomUsageService(session, policy_svc)
+
+
 @pytest.fixture()
 def reservation_svc(
     session: Session,
@@ -63,13 +71,27 @@ def reservation_svc(
     permission_svc: PermissionService,
     operating_hours_svc: OperatingHoursService,
     seat_svc: SeatService,
+    room_usage_svc: RoomUsageService,
 ):
     """ReservationService fixture."""
     return ReservationService(
-        session, permission_svc, policy_svc, operating_hours_svc, seat_svc
+        session,
+        permission_svc,
+        policy_svc,
+        operating_hours_svc,
+        seat_svc,
+        room_usage_svc,
     )
 
 
+@pytest.fixture()
+def sweep_svc(
+    session: Session, policy_svc: PolicyService, room_usage_svc: RoomUsageService
+):
+    """ReservationSweepService fixture."""
+    return ReservationSweepService(session, policy_svc, room_usage_svc)
+
+
 @pytest.fixture()
 def status_svc():
     policies_mock = create_autospec(PolicyService)
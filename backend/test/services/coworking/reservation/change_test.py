@@ -4,7 +4,7 @@ import pytest
 from unittest.mock import create_autospec
 
 from .....services import PermissionService, UserPermissionException
-from .....services.coworking import ReservationService
+from .....services.coworking import ReservationService, PolicyService
 from .....services.coworking.reservation import ReservationException
 from .....models.coworking import ReservationState
 from .....services.exceptions import ResourceNotFoundException
@@ -21,6 +21,7 @@ from ..fixtures import (
     seat_svc,
     policy_svc,
     operating_hours_svc,
+    room_usage_svc,
 )
 from ..time import *
 
@@ -98,6 +99,22 @@ def test_change_reservation_state_noop(reservation_svc: ReservationService):
     assert ReservationState.CONFIRMED != reservation.state
 
 
+def test_change_reservation_confirm_expired_draft_noop(
+    reservation_svc: ReservationService, policy_svc: PolicyService
+):
+    """A draft past its timeout is cancelled rather than confirmed, even before a sweep."""
+    policy_mock = create_autospec(PolicyService)
+    policy_mock.reservation_draft_timeout.return_value = -ONE_DAY
+    policy_mock.reservation_checkin_timeout.return_value = (
+        policy_svc.reservation_checkin_timeout()
+    )
+    reservation_svc._policy_svc = policy_mock
+    reservation = reservation_svc.change_reservation(
+        user_data.user, ReservationPartial(id=5, state=ReservationState.CONFIRMED)
+    )
+    assert reservation.state == ReservationState.CANCELLED
+
+
 def test_change_reservation_cancel_draft(reservation_svc: ReservationService):
     reservation = reservation_svc.change_reservation(
         user_data.user, ReservationPartial(id=5, state=ReservationState.CANCELLED)
@@ -19,6 +19,7 @@ from ..fixtures import (
     seat_svc,
     policy_svc,
     operating_hours_svc,
+    room_usage_svc,
 )
 from ..time import *
 
@@ -419,42 +420,58 @@ def test_draft_reservation_different_room_time_conflict(
 def test_draft_reservation_crosses_weekly_limit(
     reservation_svc: ReservationService, time: dict[str, datetime]
 ):
-    user_data.user.accepted_community_agreement = True
+    user_data.ambassador.accepted_community_agreement = True
     
-    # Make filler reservations to reach weekly limit
+    # Make filler reservations to reach weekly limit, all on one day so that they
+    # fall in the same calendar week
+    day = operating_hours_data.three_days_from_today.start.replace(
+        hour=8, minute=0, second=0, microsecond=0
+    )
     temp_draft_1 = ReservationRequest(
         seats=[],
         room=room_data.group_a,
-        start=operating_hours_data.three_days_from_today.start,
-        end=operating_hours_data.three_days_from_today.start + timedelta(hours=2),
-        users=[user_data.user],
+        start=day,
+        end=day + timedelta(hours=2),
+        users=[user_data.ambassador],
     )
 
     reservation_svc.draft_reservation(
-        user_data.user, temp_draft_1
+        user_data.ambassador, temp_draft_1
     )
 
     temp_draft_2 = ReservationRequest(
         seats=[],
         room=room_data.group_a,
-        start=operating_hours_data.three_days_from_today.start + timedelta(hours=2),
-        end=operating_hours_data.three_days_from_today.start + timedelta(hours=4),
-        users=[user_data.user],
+        start=day + timedelta(hours=2),
+        end=day + timedelta(hours=4),
+        users=[user_data.ambassador],
+    )
+
+    reservation_svc.draft_reservation(
+        user_data.ambassador, temp_draft_2
+    )
+
+    temp_draft_3 = ReservationRequest(
+        seats=[],
+        room=room_data.group_a,
+        start=day + timedelta(hours=4),
+        end=day + timedelta(hours=6),
+        users=[user_data.ambassador],
     )
 
     reservation_svc.draft_reservation(
-        user_data.user, temp_draft_2
+        user_data.ambassador, temp_draft_3
     )
 
     exceed_limit_draft = ReservationRequest(
         seats=[],
         room=room_data.group_a,
-        start=operating_hours_data.three_days_from_today.start + timedelta(hours=4),
-        end=operating_hours_data.three_days_from_today.start + timedelta(hours=6),
-        users=[user_data.user],
+        start=day + timedelta(hours=6),
+        end=day + timedelta(hours=7),
+        users=[user_data.ambassador],
     )
 
     with pytest.raises(ReservationException):
         reservation_svc.draft_reservation(
-            user_data.user, exceed_limit_draft
+            user_data.ambassador, exceed_limit_draft
         )
\ No newline at end of file
@@ -2,9 +2,10 @@
 
 from backend.models.coworking.availability import RoomState
 from backend.models.coworking.reservation import ReservationState
-from datetime import date
+from datetime import date, time as time_of_day
 
 from .....services.coworking import ReservationService
+from .....services.coworking.reservation_map import ReservationMapGrid
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
 # Dependent fixtures (seat_svc) are required to be imported in the testing module.
@@ -14,6 +15,7 @@ from ..fixtures import (
     seat_svc,
     policy_svc,
     operating_hours_svc,
+    room_usage_svc,
 )
 from ..time import *
 
@@ -164,6 +166,79 @@ def test_query_xl_reservations_by_date_for_user(reservation_svc: ReservationServ
     assert reservations[0].users[0].first_name == 'Sally'
 
 
+def test_query_map_reservations_by_date(
+    reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    """All of a day's room reservations are returned as spans with the subject flagged.
+
+    The subject's XL reservations may overlap the day when the suite runs late in the
+    evening, so only the rows of rooms are asserted on.
+    """
+    rows = reservation_svc._query_map_reservations_by_date(
+        time[NOW] + timedelta(days=2), user_data.user, ["SN135", "SN137"], True
+    )
+    rows = [row for row in rows if row.room_id is not None]
+    assert len(rows) == 1
+    room_id, start, end, subject_reserved = rows[0]
+    assert room_id == "SN135"
+    assert start == reservation_data.reservation_6.start
+    assert end == reservation_data.reservation_6.end
+    assert subject_reserved
+
+    rows = reservation_svc._query_map_reservations_by_date(
+        time[NOW] + timedelta(days=2), user_data.root, ["SN135", "SN137"], True
+    )
+    rows = [row for row in rows if row.room_id is not None]
+    assert len(rows) == 1
+    assert not rows[0].subject_reserved
+
+
+def test_query_map_reservations_by_date_includes_subject_xl(
+    reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    """The subject's XL reservations are included only when the XL is part of the map."""
+    rows = reservation_svc._query_map_reservations_by_date(
+        time[NOW], user_data.user, ["SN135"], True
+    )
+    assert any(row.room_id is None and row.subject_reserved for row in rows)
+
+    rows = reservation_svc._query_map_reservations_by_date(
+        time[NOW], user_data.user, ["SN135"], False
+    )
+    assert all(row.room_id is not None for row in rows)
+
+
+def test_reservation_map_grid():
+    """The grid paints reservations, subject conflicts, and office hours over clamped slots."""
+    start = datetime(year=2024, month=5, day=1, hour=10)
+    grid = ReservationMapGrid(["SN135", "SN137", "SN141"], start, 8)
+    grid.reserve("SN135", start, start + timedelta(hours=1), False)
+    grid.reserve("SN137", start + timedelta(minutes=30), start + timedelta(hours=2), True)
+    grid.reserve("SN137", start, start + timedelta(hours=1), False)
+    grid.reserve("SN141", start - timedelta(hours=1), start + timedelta(minutes=30), False)
+    grid.reserve("SN141", start + timedelta(hours=3), start + timedelta(hours=9), False)
+    grid.occupy_subject(start + timedelta(hours=2, minutes=30), start + timedelta(hours=3))
+    grid.block_subject_conflicts()
+    grid.block_office_hours(
+        start, {"SN135": [(time_of_day(hour=13, minute=30), time_of_day(hour=19))], "SN999": []}
+    )
+
+    assert grid.to_map() == {
+        "SN135": [1, 1, 3, 3, 0, 3, 0, 3],
+        "SN137": [1, 4, 4, 4, 0, 3, 0, 0],
+        "SN141": [1, 3, 3, 3, 0, 3, 1, 1],
+    }
+
+
+def test_reservation_map_grid_lower_bound():
+    """Reservations are not painted before the lower bound, but office hours are."""
+    start = datetime(year=2024, month=5, day=1, hour=10)
+    grid = ReservationMapGrid(["SN135"], start, 4, lower_bound=2)
+    grid.reserve("SN135", start, start + timedelta(hours=2), True)
+    grid.block_office_hours(start, {"SN135": [(time_of_day(hour=10), time_of_day(hour=10, minute=30))]})
+    assert grid.to_map() == {"SN135": [3, 0, 4, 4]}
+
+
 def test_get_map_reserved_times_by_date(
     reservation_svc: ReservationService, time: dict[str, datetime]
 ):
@@ -16,6 +16,7 @@ from ..fixtures import (
     seat_svc,
     policy_svc,
     operating_hours_svc,
+    room_usage_svc,
 )
 from ..time import *
 
@@ -4,7 +4,8 @@ from backend.models.coworking.availability import RoomState
 from backend.models.coworking.reservation import ReservationState
 from datetime import date
 
-from .....services.coworking import ReservationService
+from .....services.coworking import ReservationService, ReservationSweepService
+from .....services.coworking.room_usage import week_of
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
 # Dependent fixtures (seat_svc) are required to be imported in the testing module.
@@ -14,6 +15,8 @@ from ..fixtures import (
     seat_svc,
     policy_svc,
     operating_hours_svc,
+    room_usage_svc,
+    sweep_svc,
 )
 
 from ..time import *
@@ -40,7 +43,9 @@ __copyright__ = "Copyright 2024"
 __license__ = "MIT"
 
 def test_get_total_time_user_reservations_student(reservation_svc: ReservationService):
-    hours = reservation_svc.get_total_time_user_reservations(user_data.user)
+    hours = reservation_svc.get_total_time_user_reservations(
+        user_data.user, week_of(reservation_data.reservation_6.start)
+    )
     assert hours == "4.5"
 
 
@@ -49,6 +54,14 @@ def test_get_total_time_user_reservations_ambassador(reservation_svc: Reservatio
     assert hours == "6"
 
 
-def test_get_total_time_user_reservations_root(reservation_svc: ReservationService):
-    hours = reservation_svc.get_total_time_user_reservations(user_data.root)
-    assert hours == "6"
\ No newline at end of file
+def test_get_total_time_user_reservations_root(
+    reservation_svc: ReservationService, sweep_svc: ReservationSweepService
+):
+    """An unclaimed reservation counts toward the quota until it is swept."""
+    week = week_of(reservation_data.reservation_7.start)
+    hours = reservation_svc.get_total_time_user_reservations(user_data.root, week)
+    assert hours == "5.5"
+
+    sweep_svc.sweep()
+    hours = reservation_svc.get_total_time_user_reservations(user_data.root, week)
+    assert hours == "6"
@@ -7,6 +7,7 @@ from .....entities.coworking import ReservationEntity
 from .....models.coworking import Reservation, ReservationState, ReservationRequest
 from .....models.user import UserIdentity
 from .....models.coworking.seat import SeatIdentity
+from .....services.coworking import PolicyService, RoomUsageService
 from ..time import *
 
 from ...core_data import user_data
@@ -193,6 +194,11 @@ def insert_fake_data(session: Session, time: dict[str, datetime]):
     reset_table_id_seq(
         session, ReservationEntity, ReservationEntity.id, len(reservations) + 1
     )
+    # Reconcile from the earliest reservation, whose week precedes the current week when
+    # inserted just after midnight on a Monday
+    RoomUsageService(session, PolicyService()).reconcile(
+        min(reservation.start for reservation in reservations)
+    )
 
 
 def delete_future_data(session: Session, time: dict[str, datetime]):
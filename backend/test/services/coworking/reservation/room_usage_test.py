@@ -0,0 +1,168 @@
+"""RoomUsageService tests of the weekly ledger of study room time"""
+
+from datetime import date
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from .....entities.coworking import RoomUsageEntity
+from .....models.coworking import (
+    ReservationPartial,
+    ReservationRequest,
+    ReservationState,
+    TimeRange,
+)
+from .....services.coworking import (
+    PolicyService,
+    ReservationService,
+    ReservationSweepService,
+    RoomUsageService,
+)
+from .....services.coworking.room_usage import week_of
+from ...query_budget import QueryBudget
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+# Dependent fixtures (seat_svc) are required to be imported in the testing module.
+from ..fixtures import (
+    reservation_svc,
+    permission_svc,
+    seat_svc,
+    policy_svc,
+    operating_hours_svc,
+    room_usage_svc,
+    sweep_svc,
+)
+from ..time import *
+
+# Import the setup_teardown fixture explicitly to load entities in database.
+# The order in which these fixtures run is dependent on their imported alias.
+# Since there are relationship dependencies between the entities, order matters.
+from ...core_data import setup_insert_data_fixture as insert_order_0
+from ..operating_hours_data import fake_data_fixture as insert_order_1
+from ...room_data import fake_data_fixture as insert_order_2
+from ..seat_data import fake_data_fixture as insert_order_3
+from .reservation_data import fake_data_fixture as insert_order_4
+
+# Import the fake model data in a namespace for test assertions
+from ...core_data import user_data
+from ... import room_data
+from .. import operating_hours_data
+from . import reservation_data
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+def _draft_room(reservation_svc: ReservationService, hours: int = 2):
+    """Drafts a room reservation for the ambassador on a day without other reservations."""
+    start = operating_hours_data.three_days_from_today.start.replace(
+        hour=8, minute=0, second=0, microsecond=0
+    )
+    return reservation_svc.draft_reservation(
+        user_data.ambassador,
+        ReservationRequest(
+            seats=[],
+            room=room_data.group_a,
+            start=start,
+            end=start + timedelta(hours=hours),
+            users=[user_data.ambassador],
+        ),
+    )
+
+
+def test_week_of():
+    """Weeks start on the Monday of the calendar week."""
+    sunday = datetime(2024, 10, 27, 23, 59)
+    assert week_of(sunday) == date(2024, 10, 21)
+    assert week_of(sunday + timedelta(minutes=1)) == date(2024, 10, 28)
+
+
+def test_reconciled_fake_data(room_usage_svc: RoomUsageService):
+    """Room reservations count toward the week they start in."""
+    week = week_of(reservation_data.reservation_6.start)
+    assert room_usage_svc.get_reserved(user_data.user, week) == timedelta(hours=1.5)
+    assert room_usage_svc.get_reserved(user_data.ambassador, week) == timedelta()
+
+
+def test_draft_adds_to_week(
+    reservation_svc: ReservationService, room_usage_svc: RoomUsageService
+):
+    draft = _draft_room(reservation_svc)
+    reserved = room_usage_svc.get_reserved(user_data.ambassador, week_of(draft.start))
+    assert reserved == timedelta(hours=2)
+
+
+def test_seat_draft_does_not_add_to_week(
+    reservation_svc: ReservationService, room_usage_svc: RoomUsageService
+):
+    draft = reservation_svc.draft_reservation(
+        user_data.ambassador, reservation_data.test_request()
+    )
+    reserved = room_usage_svc.get_reserved(user_data.ambassador, week_of(draft.start))
+    assert reserved == timedelta()
+
+
+def test_cancel_releases_week(
+    reservation_svc: ReservationService, room_usage_svc: RoomUsageService
+):
+    draft = _draft_room(reservation_svc)
+    reservation_svc.change_reservation(
+        user_data.ambassador,
+        ReservationPartial(id=draft.id, state=ReservationState.CONFIRMED),
+    )
+    reservation_svc.change_reservation(
+        user_data.ambassador,
+        ReservationPartial(id=draft.id, state=ReservationState.CANCELLED),
+    )
+    reserved = room_usage_svc.get_reserved(user_data.ambassador, week_of(draft.start))
+    assert reserved == timedelta()
+
+
+def test_sweep_releases_expired_drafts(
+    reservation_svc: ReservationService,
+    room_usage_svc: RoomUsageService,
+    sweep_svc: ReservationSweepService,
+    policy_svc: PolicyService,
+):
+    draft = _draft_room(reservation_svc)
+    report = sweep_svc.sweep(
+        draft.created_at + policy_svc.reservation_draft_timeout() + ONE_MINUTE
+    )
+    assert report.drafts_cancelled >= 1
+    reserved = room_usage_svc.get_reserved(user_data.ambassador, week_of(draft.start))
+    assert reserved == timedelta()
+
+
+def test_reconcile_corrects_drift(session: Session, room_usage_svc: RoomUsageService):
+    week = week_of(reservation_data.reservation_6.start)
+    session.execute(
+        update(RoomUsageEntity)
+        .where(RoomUsageEntity.user_id == user_data.user.id)
+        .values(reserved=timedelta(hours=5))
+    )
+    session.add(
+        RoomUsageEntity(
+            user_id=user_data.ambassador.id, week=week, reserved=timedelta(hours=1)
+        )
+    )
+    session.commit()
+
+    assert room_usage_svc.reconcile() == 2
+    assert room_usage_svc.get_reserved(user_data.user, week) == timedelta(hours=1.5)
+    assert room_usage_svc.get_reserved(user_data.ambassador, week) == timedelta()
+    assert room_usage_svc.reconcile() == 0
+
+
+def test_quota_check_reads_one_row(
+    reservation_svc: ReservationService, query_budget: QueryBudget
+):
+    start = reservation_data.reservation_6.start
+    with query_budget(1):
+        assert reservation_svc._check_user_reservation_duration(
+            user_data.user, TimeRange(start=start, end=start + timedelta(hours=4))
+        )
+    with query_budget(1):
+        assert not reservation_svc._check_user_reservation_duration(
+            user_data.user, TimeRange(start=start, end=start + timedelta(hours=5))
+        )
@@ -1,9 +1,23 @@
 """ReservationService#seat_availability tests"""
 
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from .....entities.coworking import ReservationEntity
 from .....services.coworking import ReservationService, PolicyService
+from .....services.coworking.seat_availability_engine import (
+    SeatAvailabilityEngine,
+    seat_availability_engine,
+)
 from .....models.coworking import (
+    AvailabilityList,
+    ReservationPartial,
+    ReservationRequest,
+    ReservationState,
     TimeRange,
 )
+from .....models.user import UserIdentity
+from .....models.coworking.seat import SeatIdentity
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
 # Dependent fixtures (seat_svc) are required to be imported in the testing module.
@@ -13,6 +27,7 @@ from ..fixtures import (
     seat_svc,
     policy_svc,
     operating_hours_svc,
+    room_usage_svc,
 )
 from ..time import *
 
@@ -145,3 +160,128 @@ def test_seat_availability_xl_closing_soon(
     )
     available_seats = reservation_svc.seat_availability(seat_data.seats, near_closing)
     assert len(available_seats) == 0
+
+
+def _availability(seats) -> dict[int, list[tuple[datetime, datetime]]]:
+    return {
+        seat.id: [
+            (time_range.start, time_range.end) for time_range in seat.availability
+        ]
+        for seat in seats
+    }
+
+
+def test_seat_availability_engine_matches_reservations(
+    reservation_svc: ReservationService, policy_svc: PolicyService
+):
+    """The engine and the reservation-subtracting fallback agree for every bound."""
+    # Bounds start in the future so that both strategies see the same bounds.
+    now = datetime.now() + ONE_MINUTE
+    threshold = policy_svc.minimum_reservation_duration() - ONE_MINUTE
+    loads = seat_availability_engine.stats()["loads"]
+    for bounds in [
+        TimeRange(start=now, end=now + 2 * ONE_HOUR),
+        TimeRange(
+            start=operating_hours_data.today.end - ONE_HOUR - FIVE_MINUTES,
+            end=operating_hours_data.today.end,
+        ),
+        TimeRange(
+            start=operating_hours_data.tomorrow.start,
+            end=operating_hours_data.tomorrow.end,
+        ),
+    ]:
+        engine = reservation_svc.seat_availability(seat_data.seats, bounds.model_copy())
+        open_hours = reservation_svc._operating_hours_svc.schedule(bounds)
+        open_availability = AvailabilityList(
+            availability=[TimeRange(start=o.start, end=o.end) for o in open_hours]
+        )
+        open_availability.constrain(bounds)
+        expected = reservation_svc._seat_availability_from_reservations(
+            seat_data.seats, open_availability, threshold
+        )
+        assert _availability(engine) == _availability(expected)
+    assert seat_availability_engine.stats()["loads"] == loads + 1
+
+
+def test_seat_availability_engine_applies_draft_and_cancel(
+    reservation_svc: ReservationService,
+):
+    """Drafting and cancelling a reservation update availability without a reload."""
+    bounds = TimeRange(start=datetime.now(), end=datetime.now() + THIRTY_MINUTES)
+    seat = seat_data.monitor_seat_01
+    available = reservation_svc.seat_availability([seat], bounds.model_copy())
+    assert len(available) == 1
+    loads = seat_availability_engine.stats()["loads"]
+
+    draft = reservation_svc.draft_reservation(
+        user_data.ambassador,
+        ReservationRequest(
+            start=bounds.start,
+            end=bounds.end,
+            users=[UserIdentity(id=user_data.ambassador.id)],
+            seats=[SeatIdentity(id=seat.id)],
+        ),
+    )
+    assert len(reservation_svc.seat_availability([seat], bounds.model_copy())) == 0
+
+    reservation_svc.change_reservation(
+        user_data.ambassador,
+        ReservationPartial(id=draft.id, state=ReservationState.CANCELLED),
+    )
+    assert len(reservation_svc.seat_availability([seat], bounds.model_copy())) == 1
+    assert seat_availability_engine.stats()["loads"] == loads
+
+
+def test_seat_availability_engine_syncs_changes_from_other_processes(
+    reservation_svc: ReservationService, session: Session
+):
+    """Reservations changed outside of this process are picked up by the next query."""
+    bounds = TimeRange(start=datetime.now(), end=datetime.now() + THIRTY_MINUTES)
+    seats = [seat_data.monitor_seat_00]
+    available = reservation_svc.seat_availability(seats, bounds.model_copy())
+    assert available[0].availability[0].start == reservation_data.reservation_1.end
+    loads = seat_availability_engine.stats()["loads"]
+
+    session.execute(
+        update(ReservationEntity)
+        .where(ReservationEntity.id == reservation_data.reservation_1.id)
+        .values(state=ReservationState.CHECKED_OUT, updated_at=datetime.now())
+    )
+    session.commit()
+
+    available = reservation_svc.seat_availability(seats, bounds.model_copy())
+    assert available[0].availability[0].start < reservation_data.reservation_1.end
+    assert seat_availability_engine.stats()["loads"] == loads
+
+
+def test_seat_availability_engine_ignores_expired_drafts(
+    reservation_svc: ReservationService, policy_svc: PolicyService
+):
+    """A draft stops counting against availability at its timeout without a write."""
+    tomorrow = TimeRange(
+        start=operating_hours_data.tomorrow.start,
+        end=operating_hours_data.tomorrow.end,
+    )
+    seats = [seat_data.reservable_seats[0]]
+    assert len(reservation_svc.seat_availability(seats, tomorrow.model_copy())) == 0
+
+    engine = SeatAvailabilityEngine()
+    engine.sync(reservation_svc._session, policy_svc)
+    later = datetime.now() + policy_svc.reservation_draft_timeout() + ONE_MINUTE
+    open_availability = AvailabilityList(availability=[tomorrow])
+    available = engine.seat_availability(seats, open_availability, later, ONE_MINUTE)
+    assert _availability(available) == {seats[0].id: [(tomorrow.start, tomorrow.end)]}
+
+
+def test_seat_availability_beyond_engine_horizon(
+    reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    """Bounds past the engine's horizon are answered from the database."""
+    reservation_svc.seat_availability(
+        seat_data.seats, TimeRange(start=time[NOW], end=time[IN_THIRTY_MINUTES])
+    )
+    far = TimeRange(
+        start=time[NOW] + timedelta(days=30), end=time[NOW] + timedelta(days=31)
+    )
+    assert not seat_availability_engine.covers(far)
+    assert reservation_svc.seat_availability(seat_data.seats, far) == []
@@ -1,4 +1,4 @@
-"""ReservationService#_state_transition tests"""
+"""ReservationService#_filter_expired_reservation_entities tests"""
 
 import pytest
 from unittest.mock import create_autospec
@@ -27,6 +27,7 @@ from ..fixtures import (
     seat_svc,
     policy_svc,
     operating_hours_svc,
+    room_usage_svc,
 )
 from ..time import *
 
@@ -50,21 +51,21 @@ __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
-def test_state_transition_reservation_entities_by_time_noop(
+def test_filter_expired_reservation_entities_noop(
     session: Session, reservation_svc: ReservationService, time: dict[str, datetime]
 ):
     entities: list[ReservationEntity] = [
         session.get(ReservationEntity, reservation.id)
         for reservation in reservation_data.active_reservations
     ]
-    collected = reservation_svc._state_transition_reservation_entities_by_time(
+    collected = reservation_svc._filter_expired_reservation_entities(
         time[NOW], entities
     )
     assert collected is not entities
     assert collected == entities
 
 
-def test_state_transition_reservation_entities_by_time_expired_active(
+def test_filter_expired_reservation_entities_expired_active(
     session: Session, reservation_svc: ReservationService
 ):
     entities: list[ReservationEntity] = [
@@ -72,16 +73,14 @@ def test_state_transition_reservation_entities_by_time_expired_active(
         for reservation in reservation_data.active_reservations
     ]
     cutoff = entities[0].end
-    collected = reservation_svc._state_transition_reservation_entities_by_time(
-        cutoff, entities
-    )
+    collected = reservation_svc._filter_expired_reservation_entities(cutoff, entities)
 
     assert len(collected) == len(entities) - 1
     reservation = session.get(ReservationEntity, entities[0].id, populate_existing=True)
-    assert reservation.state == ReservationState.CHECKED_OUT
+    assert reservation.state == ReservationState.CHECKED_IN
 
 
-def test_state_transition_reservation_entities_by_time_active_draft(
+def test_filter_expired_reservation_entities_active_draft(
     session: Session, reservation_svc: ReservationService, policy_svc: PolicyService
 ):
     entities: list[ReservationEntity] = [
@@ -89,14 +88,12 @@ def test_state_transition_reservation_entities_by_time_active_draft(
         for reservation in reservation_data.draft_reservations
     ]
     cutoff = entities[0].created_at + policy_svc.reservation_draft_timeout()
-    collected = reservation_svc._state_transition_reservation_entities_by_time(
-        cutoff, entities
-    )
+    collected = reservation_svc._filter_expired_reservation_entities(cutoff, entities)
     assert len(collected) == len(entities)
     assert collected[0].state == ReservationState.DRAFT
 
 
-def test_state_transition_reservation_entities_by_time_expired_draft(
+def test_filter_expired_reservation_entities_expired_draft(
     session: Session, reservation_svc: ReservationService, policy_svc: PolicyService
 ):
     policy_mock = create_autospec(PolicyService)
@@ -114,18 +111,16 @@ def test_state_transition_reservation_entities_by_time_expired_draft(
         + policy_svc.reservation_draft_timeout()
         + timedelta(seconds=1)
     )
-    collected = reservation_svc._state_transition_reservation_entities_by_time(
-        cutoff, entities
-    )
+    collected = reservation_svc._filter_expired_reservation_entities(cutoff, entities)
     assert len(collected) == len(entities) - 1
 
     reservation = session.get(ReservationEntity, entities[0].id, populate_existing=True)
-    assert reservation.state == ReservationState.CANCELLED
+    assert reservation.state == ReservationState.DRAFT
 
     policy_mock.reservation_draft_timeout.assert_called_once()
 
 
-def test_state_transition_reservation_entities_by_time_checkin_timeout(
+def test_filter_expired_reservation_entities_checkin_timeout(
     session: Session, reservation_svc: ReservationService, policy_svc: PolicyService
 ):
     policy_mock = create_autospec(PolicyService)
@@ -143,12 +138,10 @@ def test_state_transition_reservation_entities_by_time_checkin_timeout(
         + policy_svc.reservation_checkin_timeout()
         + timedelta(seconds=1)
     )
-    collected = reservation_svc._state_transition_reservation_entities_by_time(
-        cutoff, entities
-    )
+    collected = reservation_svc._filter_expired_reservation_entities(cutoff, entities)
     assert len(collected) == len(entities) - 1
 
     reservation = session.get(ReservationEntity, entities[0].id, populate_existing=True)
-    assert reservation.state == ReservationState.CANCELLED
+    assert reservation.state == ReservationState.CONFIRMED
 
     policy_mock.reservation_checkin_timeout.assert_called_once()
@@ -0,0 +1,133 @@
+"""ReservationSweepService#sweep tests"""
+
+from collections import Counter
+from unittest.mock import create_autospec
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .....entities.coworking import ReservationEntity
+from .....services.coworking import (
+    ReservationService,
+    ReservationSweepService,
+    PolicyService,
+    RoomUsageService,
+)
+from .....models.coworking import ReservationState
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+# Dependent fixtures (seat_svc) are required to be imported in the testing module.
+from ..fixtures import (
+    reservation_svc,
+    permission_svc,
+    seat_svc,
+    policy_svc,
+    operating_hours_svc,
+    room_usage_svc,
+)
+from ..time import *
+
+# Import the setup_teardown fixture explicitly to load entities in database.
+# The order in which these fixtures run is dependent on their imported alias.
+# Since there are relationship dependencies between the entities, order matters.
+from ...core_data import setup_insert_data_fixture as insert_order_0
+from ..operating_hours_data import fake_data_fixture as insert_order_1
+from ...room_data import fake_data_fixture as insert_order_2
+from ..seat_data import fake_data_fixture as insert_order_3
+from .reservation_data import fake_data_fixture as insert_order_4
+
+# Import the fake model data in a namespace for test assertions
+from ...core_data import user_data
+from .. import operating_hours_data
+from . import reservation_data
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+def _states(session: Session) -> dict[int, ReservationState]:
+    session.expire_all()
+    return {
+        entity.id: entity.state
+        for entity in session.scalars(select(ReservationEntity)).all()
+    }
+
+
+def test_sweep_checks_out_ended_reservations(
+    session: Session, policy_svc: PolicyService, room_usage_svc: RoomUsageService
+):
+    """A checked in reservation is checked out by the first sweep after its end."""
+    now = reservation_data.reservation_1.end
+    report = ReservationSweepService(session, policy_svc, room_usage_svc).sweep(now)
+
+    assert report.checked_out == 1
+    assert report.swept_at == now
+    entity = session.get(ReservationEntity, reservation_data.reservation_1.id)
+    session.refresh(entity)
+    assert entity.state == ReservationState.CHECKED_OUT
+    assert entity.updated_at == now
+
+
+def test_sweep_matches_read_path_expiration(
+    session: Session,
+    reservation_svc: ReservationService,
+    policy_svc: PolicyService,
+    room_usage_svc: RoomUsageService,
+):
+    """A sweep transitions exactly the reservations read paths consider expired."""
+    now = operating_hours_data.tomorrow.end + ONE_DAY
+    entities = session.scalars(select(ReservationEntity)).all()
+    expected = {
+        entity.id: reservation_svc._expired_state(now, entity) or entity.state
+        for entity in entities
+    }
+    transitions = Counter(
+        (entity.state, reservation_svc._expired_state(now, entity))
+        for entity in entities
+    )
+
+    report = ReservationSweepService(session, policy_svc, room_usage_svc).sweep(now)
+
+    RS = ReservationState
+    assert report.drafts_cancelled == transitions[(RS.DRAFT, RS.CANCELLED)]
+    assert report.unclaimed_cancelled == transitions[(RS.CONFIRMED, RS.CANCELLED)]
+    assert report.checked_out == transitions[(RS.CHECKED_IN, RS.CHECKED_OUT)]
+    assert report.drafts_cancelled + report.unclaimed_cancelled > 0
+    assert _states(session) == expected
+
+
+def test_sweep_is_idempotent(
+    session: Session, policy_svc: PolicyService, room_usage_svc: RoomUsageService
+):
+    """A second sweep at the same time finds nothing left to transition."""
+    now = operating_hours_data.tomorrow.end + ONE_DAY
+    sweeper = ReservationSweepService(session, policy_svc, room_usage_svc)
+    sweeper.sweep(now)
+    report = sweeper.sweep(now)
+    assert report.drafts_cancelled == 0
+    assert report.unclaimed_cancelled == 0
+    assert report.checked_out == 0
+
+
+def test_read_paths_do_not_transition(
+    session: Session, reservation_svc: ReservationService, policy_svc: PolicyService
+):
+    """Reading reservations excludes expired drafts without writing their new state."""
+    policy_mock = create_autospec(PolicyService)
+    policy_mock.reservation_window.return_value = policy_svc.reservation_window(
+        user_data.user
+    )
+    policy_mock.reservation_draft_timeout.return_value = -ONE_DAY
+    policy_mock.reservation_checkin_timeout.return_value = (
+        policy_svc.reservation_checkin_timeout()
+    )
+    reservation_svc._policy_svc = policy_mock
+    before = _states(session)
+
+    reservations = reservation_svc.get_current_reservations_for_user(
+        user_data.user, user_data.user
+    )
+
+    assert reservation_data.reservation_5.id not in [r.id for r in reservations]
+    assert _states(session) == before
@@ -2,7 +2,10 @@
 
 # PyTest
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
 from unittest.mock import create_autospec
+from sqlalchemy.orm import Session
 from backend.models.pagination import PaginationParams
 
 from backend.services.exceptions import (
@@ -11,6 +14,8 @@ from backend.services.exceptions import (
     ResourceNotFoundException,
 )
 from backend.services.organization import OrganizationService
+from backend.services.permission import PermissionService
+from backend.entities.event_entity import EventEntity
 
 # Time helpers
 from ....models.coworking.time_range import TimeRange
@@ -26,6 +31,7 @@ from ..fixtures import (
     event_svc_integration,
     organization_svc_integration,
 )
+from ..query_budget import QueryBudget
 
 # Explicitly import Data Fixture to load entities in database
 from ..core_data import setup_insert_data_fixture
@@ -44,7 +50,7 @@ from .event_test_data import (
     invalid_event,
     event_three,
 )
-from ..user_data import root, ambassador, user
+from ..user_data import root, ambassador, user, instructor, uta, student
 from ..organization import organization_test_data
 
 from .event_demo_data import date_maker
@@ -90,6 +96,46 @@ def test_list_filter(event_svc_integration: EventService):
     assert len(fetched_events.items) == 1
 
 
+def test_list_filter_organization(event_svc_integration: EventService):
+    """Test that events are filtered by the name of their organization."""
+    pagination_params = EventPaginationParams(filter="social good")
+    fetched_events = event_svc_integration.get_paginated_events(
+        pagination_params, ambassador
+    )
+    assert fetched_events.length == len(events)
+
+
+def test_list_keyset_descending(event_svc_integration: EventService):
+    """Test that cursors page through events from latest to earliest, breaking ties by id."""
+    pagination_params = EventPaginationParams(
+        order_by="start", ascending="false", page_size=1, cursor=""
+    )
+    fetched_ids: list[int] = []
+    while pagination_params.cursor is not None:
+        fetched_events = event_svc_integration.get_paginated_events(
+            pagination_params, ambassador
+        )
+        assert fetched_events.length == len(events)
+        fetched_ids.extend(event.id for event in fetched_events.items)
+        pagination_params.cursor = fetched_events.next_cursor
+
+    assert fetched_ids == [3, 2, 1]
+
+
+def test_list_queries_are_bounded(
+    event_svc_integration: EventService, query_budget: QueryBudget
+):
+    """Test that a page of events is loaded in a constant number of queries."""
+    # The length, the page with organizations, organizers and the subject's registrations.
+    with query_budget(4):
+        fetched_events = event_svc_integration.get_paginated_events(
+            EventPaginationParams(order_by="id"), root
+        )
+    assert len(fetched_events.items) == len(events)
+    for overview in fetched_events.items:
+        assert overview == event_svc_integration.get_by_id(overview.id, root)
+
+
 def test_create_enforces_permission(event_svc_integration: EventService):
     """Test that the service enforces permissions when attempting to create an event."""
 
@@ -439,6 +485,56 @@ def test_register_to_full_event(
         event_svc_integration.register(user, user, event_details)
 
 
+@pytest.mark.commits
+def test_register_concurrently_to_nearly_full_event(session: Session):
+    """Tests that parallel registrations for the last seat of an event claim it once."""
+    session.get_one(EventEntity, event_three.id).registration_limit = 2
+    session.commit()
+
+    attendees = [root, user, instructor, uta, student]
+    barrier = Barrier(len(attendees))
+
+    def register(attendee):
+        with Session(session.get_bind()) as attendee_session:
+            event_svc = EventService(
+                attendee_session, PermissionService(attendee_session)
+            )
+            event_details = event_svc.get_by_id(event_three.id)
+            barrier.wait()
+            try:
+                event_svc.register(attendee, attendee, event_details)
+                return True
+            except EventRegistrationException:
+                return False
+
+    with ThreadPoolExecutor(max_workers=len(attendees)) as executor:
+        registered = list(executor.map(register, attendees))
+
+    assert registered.count(True) == 1
+    session.expire_all()
+    event_entity = session.get_one(EventEntity, event_three.id)
+    assert event_entity.registered_count == 2
+    assert len(event_entity.registrations) == 2
+
+
+def test_registered_count_is_maintained(event_svc_integration: EventService):
+    """Tests that registering, unregistering and promoting attendees maintain the count."""
+    event_details = event_svc_integration.get_by_id(event_one.id, root)
+    assert event_details.number_registered == 1
+
+    event_svc_integration.register(root, root, event_details)
+    event_svc_integration.register(root, root, event_details)
+    assert event_svc_integration.get_by_id(event_one.id).number_registered == 2
+
+    event_svc_integration.update(root, updated_event_one_organizers)
+    assert event_svc_integration.get_by_id(event_one.id).number_registered == 1
+
+    event_svc_integration.unregister(root, root, event_details)
+    event_svc_integration.unregister(root, root, event_details)
+    event_svc_integration.unregister(root, ambassador, event_details)
+    assert event_svc_integration.get_by_id(event_one.id).number_registered == 0
+
+
 def test_get_registered_users_of_event(event_svc_integration: EventService):
     """Tests querying for registered users of events as a paginated list"""
     pagination_params = PaginationParams(
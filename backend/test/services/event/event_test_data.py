@@ -273,6 +273,17 @@ def insert_fake_data(session: Session):
         registration_entity = EventRegistrationEntity.from_new_model(registration)
         session.add(registration_entity)
 
+    # Maintain the registered counts of events, as `EventService.register` does
+    for event_entity in entities:
+        event_entity.registered_count = len(
+            [
+                registration
+                for registration in registrations
+                if registration.event_id == event_entity.id
+                and registration.registration_type == RegistrationType.ATTENDEE
+            ]
+        )
+
     # Reset table IDs to prevent ID conflicts
     reset_table_id_seq(session, EventEntity, EventEntity.id, len(events) + 1)
 
@@ -0,0 +1,116 @@
+"""Tests for streaming exports from server-side cursors."""
+
+import csv
+import gc
+import io
+import json
+import os
+
+from sqlalchemy import func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from ...entities import EventRegistrationEntity, UserEntity
+from ...models.public_user import PublicUser
+from ...models.registration_type import RegistrationType
+from ...services import EventService
+from ...services.export import ExportFormat, write_rows
+
+# Data Setup and Injected Service Fixtures
+from .core_data import setup_insert_data_fixture
+from .fixtures import user_svc_integration, event_svc_integration
+
+# Data Models for Fake Data Inserted in Setup
+from .event.event_test_data import event_one
+from .user_data import ambassador, root, user
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+SYNTHETIC_ROWS = 100_000
+PEAK_RSS_GROWTH_BOUND = 64 * 1024 * 1024
+"""Bytes an export may grow the process's resident set by, regardless of its size."""
+
+
+def resident_set_size() -> int:
+    """Bytes resident in memory for this process, from Linux's /proc/self/statm."""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def register_synthetic_attendees(session: Session, event_id: int, count: int) -> None:
+    """Registers count new users for an event, generating the rows in the database."""
+    n = func.generate_series(1, count).column_valued("n")
+    session.execute(
+        insert(UserEntity).from_select(
+            ["pid", "onyen", "email", "first_name", "last_name"],
+            select(
+                literal(800_000_000) + n,
+                func.concat("export", n),
+                func.concat("export", n, "@unc.edu"),
+                literal("Export"),
+                func.concat("Attendee", n),
+            ),
+        )
+    )
+    session.execute(
+        insert(EventRegistrationEntity).from_select(
+            ["event_id", "user_id", "registration_type"],
+            select(
+                literal(event_id),
+                UserEntity.id,
+                literal(
+                    RegistrationType.ATTENDEE,
+                    EventRegistrationEntity.registration_type.type,
+                ),
+            ).where(UserEntity.onyen.startswith("export")),
+        )
+    )
+    session.commit()
+
+
+def test_export_registered_users_of_event(event_svc_integration: EventService):
+    """Ensures organizers can export the attendees of their event."""
+    rows = list(
+        event_svc_integration.get_registered_users_of_event_for_export(
+            user, event_one.id
+        )
+    )
+    assert [row.id for row in rows] == [ambassador.id]
+
+
+def test_export_writes_csv_and_ndjson():
+    """Ensures rows are written under a header of the model's fields or as JSON lines."""
+    public = [PublicUser.model_validate(u.model_dump()) for u in [root, ambassador]]
+
+    document = "".join(write_rows(public, PublicUser, ExportFormat.CSV))
+    records = list(csv.DictReader(io.StringIO(document)))
+    assert list(records[0]) == list(PublicUser.model_fields)
+    assert [record["onyen"] for record in records] == [root.onyen, ambassador.onyen]
+
+    document = "".join(write_rows(public, PublicUser, ExportFormat.NDJSON))
+    lines = document.splitlines()
+    assert [json.loads(line)["onyen"] for line in lines] == [
+        root.onyen,
+        ambassador.onyen,
+    ]
+
+
+def test_export_memory_is_bounded(
+    session: Session, event_svc_integration: EventService
+):
+    """Ensures exporting 100k rows holds peak RSS under a bound independent of the rows."""
+    register_synthetic_attendees(session, event_one.id, SYNTHETIC_ROWS)
+    gc.collect()
+
+    rows = event_svc_integration.get_registered_users_of_event_for_export(
+        root, event_one.id
+    )
+    baseline = peak = resident_set_size()
+    written = 0
+    for chunk in write_rows(rows, PublicUser, ExportFormat.NDJSON):
+        written += chunk.count("\n")
+        peak = max(peak, resident_set_size())
+
+    assert written == SYNTHETIC_ROWS + 1
+    assert peak - baseline < PEAK_RSS_GROWTH_BOUND
@@ -74,6 +74,11 @@ def article_svc(session: Session):
         PermissionService(session),
         PolicyService(),
         OperatingHoursService(session, PermissionService(session)),
+        EventService(
+            session,
+            PermissionService(session),
+            UserService(session, PermissionService(session)),
+        ),
     )
 
 
@@ -4,9 +4,17 @@
 from ...services.health import HealthService
 
 # Library Requirements
+import logging
+import pytest
 from datetime import datetime, timezone
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.exc import TimeoutError
 from sqlalchemy.orm import Session
 
+from ...database import _engine_str
+from ...pool_monitor import MonitoredQueuePool
+from .conftest import POSTGRES_DATABASE
+
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
@@ -17,3 +25,68 @@ def test_health_check(session: Session):
     now = str(datetime.now(tz=timezone.utc))[:16]
     result = health_service.check()
     assert f"OK @ {now}" in health_service.check()
+
+
+@pytest.fixture()
+def small_engine(test_engine: Engine):
+    """An engine with a monitored pool of one connection plus one overflow connection."""
+    engine = create_engine(
+        _engine_str(POSTGRES_DATABASE),
+        poolclass=MonitoredQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.1,
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_pool_status(session: Session):
+    session.execute(text("SELECT 1"))
+    status = HealthService(session).pool_status()
+    assert status.in_use == 1
+    assert status.checkouts >= 1
+    assert status.checkout_latency[-1].le_ms is None
+    assert status.checkout_latency[-1].count == status.checkouts
+
+
+def test_pool_status_gauges(small_engine: Engine):
+    first = small_engine.connect()
+    second = small_engine.connect()
+    status = HealthService(Session(small_engine)).pool_status()
+    assert status.size == 1
+    assert status.in_use == 2
+    assert status.overflow == 1
+    assert status.peak_in_use == 2
+
+    second.close()
+    first.close()
+    status = HealthService(Session(small_engine)).pool_status()
+    assert status.in_use == 0
+    assert status.idle == 1
+    assert status.checkouts == 2
+
+
+def test_pool_checkout_timeout(small_engine: Engine):
+    connections = [small_engine.connect(), small_engine.connect()]
+    with pytest.raises(TimeoutError):
+        small_engine.connect()
+    for connection in connections:
+        connection.close()
+    assert small_engine.pool.monitor.status(small_engine.pool).timeouts == 1
+
+
+def test_pool_slow_checkout_logged(small_engine: Engine, caplog):
+    small_engine.pool.monitor.slow_checkout_ms = 0
+    with caplog.at_level(logging.WARNING, logger="backend.pool_monitor"):
+        small_engine.connect().close()
+    assert "Slow connection checkout" in caplog.text
+    assert small_engine.pool.monitor.status(small_engine.pool).slow_checkouts == 1
+
+
+def test_pool_monitor_survives_dispose(small_engine: Engine):
+    small_engine.connect().close()
+    monitor = small_engine.pool.monitor
+    small_engine.dispose()
+    assert small_engine.pool.monitor is monitor
+    assert monitor.status(small_engine.pool).checkouts == 1
@@ -1,18 +1,23 @@
 """Tests for the OfficeHoursService."""
 
 import pytest
+from datetime import timedelta
+from sqlalchemy.orm import Session
 
+from ....entities.office_hours import OfficeHoursTicketEntity
 from ....models.academics.my_courses import (
     OfficeHourQueueOverview,
     OfficeHourGetHelpOverview,
     OfficeHourEventRoleOverview,
 )
 from ....models.office_hours.office_hours import NewOfficeHours, OfficeHours
-from ....services.office_hours import OfficeHoursService
+from ....models.office_hours.ticket_type import TicketType
+from ....services.office_hours import OfficeHoursService, OfficeHourTicketService
 from ....services.exceptions import CoursePermissionException, ResourceNotFoundException
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
-from .fixtures import oh_svc
+from .fixtures import oh_svc, oh_ticket_svc
+from ..query_budget import count_statements
 
 # Import the setup_teardown fixture explicitly to load entities in database
 from ..core_data import setup_insert_data_fixture as insert_order_0
@@ -62,6 +67,84 @@ def test_get_office_hour_queue_not_staff(oh_svc: OfficeHoursService):
         pytest.fail()
 
 
+def test_get_office_hour_queue_serves_snapshot(
+    oh_svc: OfficeHoursService, session: Session
+):
+    """Ensures that polls of an unchanged queue do not reload its tickets."""
+    office_hours_id = office_hours_data.comp_110_current_office_hours.id
+    queue = oh_svc.get_office_hour_queue(user_data.instructor, office_hours_id)
+
+    with count_statements(session) as log:
+        assert (
+            oh_svc.get_office_hour_queue(user_data.instructor, office_hours_id) == queue
+        )
+        oh_svc.get_office_hour_get_help_overview(user_data.student, office_hours_id)
+
+    # One membership and version query per poll
+    assert len(log) == 2
+
+
+def test_get_office_hour_queue_after_ticket_changes(
+    oh_svc: OfficeHoursService, oh_ticket_svc: OfficeHourTicketService
+):
+    """Ensures that ticket changes are reflected by the next poll of the queue."""
+    office_hours_id = office_hours_data.comp_110_current_office_hours.id
+    oh_svc.get_office_hour_queue(user_data.instructor, office_hours_id)
+    oh_svc.get_office_hour_get_help_overview(user_data.student, office_hours_id)
+
+    oh_ticket_svc.close_ticket(
+        user_data.instructor, office_hours_data.comp_110_called_ticket.id
+    )
+    oh_ticket_svc.call_ticket(
+        user_data.instructor, office_hours_data.comp_110_queued_ticket.id
+    )
+
+    queue = oh_svc.get_office_hour_queue(user_data.instructor, office_hours_id)
+    assert queue.active is not None
+    assert queue.active.id == office_hours_data.comp_110_queued_ticket.id
+    assert queue.queue == []
+    assert queue.total_tickets_called == 2
+
+    overview = oh_svc.get_office_hour_get_help_overview(
+        user_data.student, office_hours_id
+    )
+    assert overview.ticket is not None
+    assert overview.ticket.state == "Called"
+    assert overview.queue_position == -1
+
+
+def test_get_office_hour_queue_in_order_of_creation(
+    session: Session, oh_svc: OfficeHoursService
+):
+    """Ensures the queue is ordered first come, first served, regardless of ticket IDs."""
+    office_hours_id = office_hours_data.comp_110_current_office_hours.id
+    queued = office_hours_data.comp_110_queued_ticket
+    earlier = OfficeHoursTicketEntity(
+        description="Queued a minute before the first ticket",
+        type=TicketType.CONCEPTUAL_HELP,
+        created_at=queued.created_at - timedelta(minutes=1),
+        office_hours_id=office_hours_id,
+    )
+    later = OfficeHoursTicketEntity(
+        description="Queued a minute after the first ticket",
+        type=TicketType.CONCEPTUAL_HELP,
+        created_at=queued.created_at + timedelta(minutes=1),
+        office_hours_id=office_hours_id,
+    )
+    session.add_all([later, earlier])
+    session.commit()
+
+    queue = oh_svc.get_office_hour_queue(user_data.instructor, office_hours_id)
+    assert [ticket.id for ticket in queue.queue] == [earlier.id, queued.id, later.id]
+
+    overview = oh_svc.get_office_hour_get_help_overview(
+        user_data.student, office_hours_id
+    )
+    assert overview.ticket is not None
+    assert overview.ticket.id == queued.id
+    assert overview.queue_position == 2
+
+
 def test_get_help_overview(oh_svc: OfficeHoursService):
     """Ensures students can access the get help overview information."""
     overview = oh_svc.get_office_hour_get_help_overview(
@@ -0,0 +1,107 @@
+"""Tests for pushing changes of office hours queues to their subscribers."""
+
+import asyncio
+from typing import Awaitable, Callable
+
+from sqlalchemy.orm import Session
+
+from ....services.office_hours import OfficeHourTicketService
+from ....services.office_hours.queue_channel import (
+    InMemoryQueueBroker,
+    QueueHub,
+    queue_hub,
+)
+from ....services.office_hours.queue_snapshot import bump_queue_version
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import oh_ticket_svc
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from ..academics.term_data import fake_data_fixture as insert_order_1
+from ..academics.course_data import fake_data_fixture as insert_order_2
+from ..academics.section_data import fake_data_fixture as insert_order_3
+from ..room_data import fake_data_fixture as insert_order_4
+from ..office_hours.office_hours_data import fake_data_fixture as insert_order_5
+
+# Import the fake model data in a namespace for test assertions
+from .. import user_data
+from ..office_hours import office_hours_data
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+def run_async(fn: Callable[[], Awaitable]):
+    """Run fn on a fresh event loop, as subscriptions belong to the loop of their stream."""
+    return asyncio.run(fn())
+
+
+def test_ticket_changes_wake_subscribers(oh_ticket_svc: OfficeHourTicketService):
+    """Ensures calling and closing a ticket wakes the subscribers of its event only."""
+    comp_110 = office_hours_data.comp_110_current_office_hours.id
+    future = office_hours_data.comp_110_future_office_hours.id
+
+    async def main():
+        subscription = queue_hub.subscribe(comp_110)
+        other = queue_hub.subscribe(future)
+        try:
+            oh_ticket_svc.call_ticket(
+                user_data.instructor, office_hours_data.comp_110_queued_ticket.id
+            )
+            assert await subscription.wait(1)
+            assert not await subscription.wait(0.01)
+
+            oh_ticket_svc.close_ticket(
+                user_data.instructor, office_hours_data.comp_110_queued_ticket.id
+            )
+            assert await subscription.wait(1)
+            assert not await other.wait(0.01)
+        finally:
+            subscription.close()
+            other.close()
+
+    run_async(main)
+    assert queue_hub.stats()["subscribers"] == 0
+
+
+def test_changes_are_delivered_upon_commit(session: Session):
+    """Ensures subscribers are woken once the change commits, and not upon rollback."""
+    hub = QueueHub(InMemoryQueueBroker())
+    comp_110 = office_hours_data.comp_110_current_office_hours.id
+
+    async def main():
+        subscription = hub.subscribe(comp_110)
+        try:
+            hub.publish(session, [comp_110])
+            assert not await subscription.wait(0.01)
+            session.rollback()
+            assert not await subscription.wait(0.01)
+
+            hub.publish(session, [comp_110])
+            hub.publish(session, [comp_110])
+            session.commit()
+            assert await subscription.wait(1)
+            assert hub.stats() == {"subscribers": 1, "delivered": 1}
+        finally:
+            subscription.close()
+
+    run_async(main)
+    assert hub.stats()["subscribers"] == 0
+
+
+def test_bump_queue_version_publishes_events(session: Session):
+    """Ensures bumping the queue version of an event wakes its subscribers."""
+    comp_110 = office_hours_data.comp_110_current_office_hours.id
+
+    async def main():
+        subscription = queue_hub.subscribe(comp_110)
+        try:
+            bump_queue_version(session, comp_110)
+            session.commit()
+            assert await subscription.wait(1)
+        finally:
+            subscription.close()
+
+    run_async(main)
@@ -0,0 +1,340 @@
+"""Tests for streaming office hours queues as server-sent events."""
+
+import asyncio
+import json
+import pytest
+from typing import Awaitable, Callable
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from ....api.authentication import async_registered_user
+from ....api.office_hours import office_hours as office_hours_api
+from ....database import _engine_str, async_db_session
+from ....entities.academics.section_member_entity import SectionMemberEntity
+from ....entities.office_hours import OfficeHoursEntity, OfficeHoursTicketEntity
+from ....models.roster_role import RosterRole
+from ....models.user import User
+from ....services.exceptions import CoursePermissionException
+from ....services.office_hours import OfficeHourTicketService, OfficeHoursService
+from ....services.office_hours.queue_channel import queue_hub
+from ..conftest import POSTGRES_DATABASE
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import oh_svc, oh_ticket_svc
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from ..academics.term_data import fake_data_fixture as insert_order_1
+from ..academics.course_data import fake_data_fixture as insert_order_2
+from ..academics.section_data import fake_data_fixture as insert_order_3
+from ..room_data import fake_data_fixture as insert_order_4
+from ..office_hours.office_hours_data import fake_data_fixture as insert_order_5
+
+# Import the fake model data in a namespace for test assertions
+from .. import user_data
+from ..academics import section_data
+from ..office_hours import office_hours_data
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+HEARTBEAT_SECONDS = 0.05
+"""The heartbeat of streams under test, short enough to observe several per test."""
+
+QUEUE_EVENTS = "/api/office-hours/{id}/queue/events".format(
+    id=office_hours_data.comp_110_current_office_hours.id
+)
+GET_HELP_EVENTS = "/api/office-hours/{id}/get-help/events".format(
+    id=office_hours_data.comp_110_current_office_hours.id
+)
+
+
+class EventStream:
+    """A server-sent events response read as it is streamed.
+
+    TestClient and httpx's ASGITransport return a response only once its body is complete,
+    so the stream's ASGI application is driven directly, and disconnects upon `disconnect`.
+    """
+
+    def __init__(self, app: FastAPI, path: str):
+        self._messages: asyncio.Queue[dict] = asyncio.Queue()
+        self._disconnected = asyncio.Event()
+        self._requested = False
+        self._buffer = ""
+        self.complete = False
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+            "server": ("testserver", 80),
+            "client": ("testclient", 50000),
+        }
+        self.task = asyncio.create_task(app(scope, self._receive, self._messages.put))
+
+    async def _receive(self) -> dict:
+        if not self._requested:
+            self._requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await self._disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def status(self) -> int:
+        """The status code of the response."""
+        message = await asyncio.wait_for(self._messages.get(), 5)
+        assert message["type"] == "http.response.start"
+        return message["status"]
+
+    async def next(self) -> tuple[str, dict | None]:
+        """The next event of the stream, as its name and data, or ("heartbeat", None)."""
+        while "\n\n" not in self._buffer:
+            assert not self.complete, "The stream ended"
+            message = await asyncio.wait_for(self._messages.get(), 5)
+            self._buffer += message.get("body", b"").decode()
+            self.complete = not message.get("more_body", False)
+        event, self._buffer = self._buffer.split("\n\n", 1)
+        if event == ": heartbeat":
+            return "heartbeat", None
+        name, data = event.split("\n")
+        assert name.startswith("event: ") and data.startswith("data: ")
+        return name.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+    async def next_change(self) -> dict:
+        """The data of the next `change` event, skipping heartbeats."""
+        async with asyncio.timeout(5):
+            while (event := await self.next())[0] == "heartbeat":
+                ...
+        assert event[0] == "change"
+        return event[1]
+
+    async def end(self) -> None:
+        """Wait for the stream to end of its own accord."""
+        while not self.complete:
+            message = await asyncio.wait_for(self._messages.get(), 5)
+            self.complete = not message.get("more_body", False)
+        await asyncio.wait_for(self.task, 5)
+
+    async def disconnect(self) -> None:
+        """Disconnect the client and wait for the stream to stop."""
+        self._disconnected.set()
+        await asyncio.wait_for(self.task, 5)
+
+
+@pytest.fixture()
+def stream_events(monkeypatch: pytest.MonkeyPatch):
+    """Runs a test's coroutine, given a function opening streams as a user, on a fresh
+    event loop with an asyncio engine of the test database."""
+    monkeypatch.setattr(office_hours_api, "HEARTBEAT_SECONDS", HEARTBEAT_SECONDS)
+
+    def run(fn: Callable[[Callable[[User, str], EventStream]], Awaitable]):
+        async def main():
+            engine = create_async_engine(
+                _engine_str(POSTGRES_DATABASE, dialect="postgresql+asyncpg"),
+                poolclass=NullPool,
+            )
+            # Streams re-check their queue in sessions of their own
+            monkeypatch.setattr(office_hours_api, "async_engine", engine)
+
+            async def test_db_session():
+                async with AsyncSession(engine, expire_on_commit=False) as session:
+                    yield session
+
+            streams: list[EventStream] = []
+
+            def open_stream(subject: User, path: str) -> EventStream:
+                app = FastAPI()
+                app.include_router(office_hours_api.api)
+                app.dependency_overrides[async_registered_user] = lambda: subject
+                app.dependency_overrides[async_db_session] = test_db_session
+                app.add_exception_handler(CoursePermissionException, forbidden)
+                streams.append(EventStream(app, path))
+                return streams[-1]
+
+            try:
+                return await fn(open_stream)
+            finally:
+                for stream in streams:
+                    await stream.disconnect()
+                await engine.dispose()
+
+        asyncio.run(main())
+        assert queue_hub.stats()["subscribers"] == 0
+
+    return run
+
+
+def forbidden(request: Request, e: CoursePermissionException):
+    """The handler of CoursePermissionException in `backend/main.py`."""
+    return JSONResponse(status_code=403, content={"message": str(e)})
+
+
+@pytest.mark.commits
+def test_queue_events_stream_overview_then_changes(
+    stream_events,
+    oh_svc: OfficeHoursService,
+    oh_ticket_svc: OfficeHourTicketService,
+):
+    """Ensures the queue stream begins with the overview, then sends only the fields
+    changed by calling a ticket, and closes its subscription upon disconnecting."""
+    comp_110 = office_hours_data.comp_110_current_office_hours.id
+    ticket = office_hours_data.comp_110_queued_ticket.id
+
+    async def main(open_stream):
+        stream = open_stream(user_data.uta, QUEUE_EVENTS)
+        assert await stream.status() == 200
+        event, overview = await stream.next()
+        assert event == "overview"
+        assert overview == oh_svc.get_office_hour_queue(
+            user_data.uta, comp_110
+        ).model_dump(mode="json")
+        assert [called["id"] for called in overview["queue"]] == [ticket]
+        assert queue_hub.stats()["subscribers"] == 1
+
+        called = oh_ticket_svc.call_ticket(user_data.uta, ticket)
+        assert await stream.next_change() == {
+            "active": called.model_dump(mode="json"),
+            "queue": [],
+        }
+        assert oh_svc.get_office_hour_queue(user_data.uta, comp_110).model_dump(
+            mode="json"
+        ) == {**overview, "active": called.model_dump(mode="json"), "queue": []}
+
+        await stream.disconnect()
+        assert queue_hub.stats()["subscribers"] == 0
+
+    stream_events(main)
+
+
+@pytest.mark.commits
+def test_get_help_events_stream_closed_ticket(
+    stream_events,
+    oh_svc: OfficeHoursService,
+    oh_ticket_svc: OfficeHourTicketService,
+):
+    """Ensures the get help stream sends the student's ticket once it is called, and no
+    ticket once it is closed."""
+    comp_110 = office_hours_data.comp_110_current_office_hours.id
+    ticket = office_hours_data.comp_110_queued_ticket.id
+    # Leave the student a single open ticket
+    oh_ticket_svc.close_ticket(
+        user_data.instructor, office_hours_data.comp_110_called_ticket.id
+    )
+
+    async def main(open_stream):
+        stream = open_stream(user_data.student, GET_HELP_EVENTS)
+        assert await stream.status() == 200
+        event, overview = await stream.next()
+        assert event == "overview"
+        assert overview["ticket"]["id"] == ticket
+        assert overview["ticket"]["state"] == "Queued"
+        assert overview["queue_position"] == 1
+
+        called = oh_ticket_svc.call_ticket(user_data.instructor, ticket)
+        assert await stream.next_change() == {
+            "ticket": called.model_dump(mode="json"),
+            "queue_position": -1,
+        }
+
+        oh_ticket_svc.close_ticket(user_data.instructor, ticket)
+        assert await stream.next_change() == {"ticket": None}
+        assert oh_svc.get_office_hour_get_help_overview(
+            user_data.student, comp_110
+        ).model_dump(mode="json") == {**overview, "ticket": None, "queue_position": -1}
+
+        await stream.disconnect()
+
+    stream_events(main)
+
+
+@pytest.mark.commits
+def test_in_memory_streams_recheck_at_heartbeat(
+    stream_events, session: Session, oh_svc: OfficeHoursService
+):
+    """Ensures idle streams send heartbeats, and notice changes committed without notifying
+    them, as by another worker process, when re-checking their queue at a heartbeat."""
+    comp_110 = office_hours_data.comp_110_current_office_hours.id
+    ticket = office_hours_data.comp_110_queued_ticket.id
+    assert not queue_hub.broker.reaches_other_processes
+
+    async def main(open_stream):
+        stream = open_stream(user_data.instructor, QUEUE_EVENTS)
+        assert await stream.status() == 200
+        event, _ = await stream.next()
+        assert event == "overview"
+        assert await stream.next() == ("heartbeat", None)
+        assert await stream.next() == ("heartbeat", None)
+
+        session.execute(
+            update(OfficeHoursTicketEntity)
+            .where(OfficeHoursTicketEntity.id == ticket)
+            .values(description="Never mind, it was a typo")
+        )
+        session.execute(
+            update(OfficeHoursEntity)
+            .where(OfficeHoursEntity.id == comp_110)
+            .values(queue_version=OfficeHoursEntity.queue_version + 1)
+        )
+        session.commit()
+        assert queue_hub.stats()["delivered"] == delivered
+
+        change = await stream.next_change()
+        assert change == {
+            "queue": oh_svc.get_office_hour_queue(
+                user_data.instructor, comp_110
+            ).model_dump(mode="json")["queue"]
+        }
+        assert change["queue"][0]["description"] == "Never mind, it was a typo"
+
+        await stream.disconnect()
+
+    delivered = queue_hub.stats()["delivered"]
+    stream_events(main)
+
+
+@pytest.mark.commits
+def test_stream_ends_once_access_is_lost(stream_events, session: Session):
+    """Ensures a stream ends, closing its subscription, once a re-check of its queue raises
+    CoursePermissionException."""
+
+    async def main(open_stream):
+        stream = open_stream(user_data.uta, QUEUE_EVENTS)
+        assert await stream.status() == 200
+        event, _ = await stream.next()
+        assert event == "overview"
+
+        session.execute(
+            update(SectionMemberEntity)
+            .where(SectionMemberEntity.id == section_data.comp110_uta.id)
+            .values(member_role=RosterRole.STUDENT)
+        )
+        session.commit()
+
+        await stream.end()
+        assert queue_hub.stats()["subscribers"] == 0
+
+    stream_events(main)
+
+
+@pytest.mark.commits
+def test_stream_without_access_is_not_subscribed(stream_events):
+    """Ensures a stream refused its first overview leaves no subscription behind."""
+
+    async def main(open_stream):
+        stream = open_stream(user_data.student, QUEUE_EVENTS)
+        assert await stream.status() == 403
+        await stream.end()
+        assert queue_hub.stats()["subscribers"] == 0
+
+    stream_events(main)
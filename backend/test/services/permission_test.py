@@ -1,14 +1,20 @@
 """Tests for the PermissionService class."""
 
+import gc
 import pytest
+import tracemalloc
+import weakref
+from sqlalchemy.orm import Session
 
 # Tested Dependencies
 from ...models import Permission, User
-from ...services import PermissionService
+from ...services import PermissionService, RoleService
+from ...services.permission_index import PermissionIndex, PatternCache, pattern_cache
 
 # Data Setup and Injected Service Fixtures
 from .core_data import setup_insert_data_fixture
 from .fixtures import permission_svc
+from .query_budget import QueryBudget
 
 # Data Models for Fake Data Inserted in Setup
 from .role_data import ambassador_role
@@ -127,3 +133,122 @@ def test_check_specific_permission(permission_svc: PermissionService):
 def test_get_user_roles_permissions(permission_svc: PermissionService):
     """Test covers an edge case of _get_user_roles_permissions when user does not exist"""
     assert permission_svc._get_user_roles_permissions(User(id=423)) == []
+
+
+def test_permission_index_matches_check_permission(permission_svc: PermissionService):
+    """Tests that a compiled index agrees with checking its permissions one at a time"""
+    patterns = [
+        ("checkin.delete", "checkin/*"),
+        ("permission.grant", "checkin*"),
+        ("coworking.reservation.*", "user/*"),
+        ("organization.*", "organization/cads"),
+    ]
+    index = PermissionIndex(patterns)
+    requests = [
+        ("checkin.delete", "checkin/1"),
+        ("checkin.delete", "checkin"),
+        ("permission.grant", "checkin"),
+        ("permission.grant", "*"),
+        ("coworking.reservation.read", "user/3"),
+        ("coworking.reservation", "user/3"),
+        ("organization.update", "organization/cads"),
+        ("organization.update", "organization/cadsx"),
+    ]
+    for action, resource in requests:
+        expected = any(
+            permission_svc._check_permission(
+                Permission(action=a, resource=r), action, resource
+            )
+            for a, r in patterns
+        )
+        assert index.check(action, resource) is expected
+    assert PermissionIndex([]).check("checkin.create", "checkin") is False
+
+
+def test_check_reuses_compiled_index(
+    permission_svc: PermissionService, session: Session, query_budget: QueryBudget
+):
+    """Tests that checks after the first one for a subject do not query the database"""
+    assert permission_svc.check(ambassador, "checkin.create", "checkin")
+
+    with query_budget(0):
+        assert permission_svc.check(ambassador, "checkin.create", "checkin")
+        assert permission_svc.check(ambassador, "coworking.reservation.read", "user/1")
+        assert permission_svc.check(ambassador, "checkin.delete", "checkin") is False
+        assert PermissionService(session).check(ambassador, "checkin.create", "checkin")
+
+
+def test_revoke_invalidates_other_services(
+    permission_svc: PermissionService, session: Session
+):
+    """Tests that a revocation is seen by services that already compiled the subject's index"""
+    other_svc = PermissionService(session)
+    assert other_svc.check(ambassador, "checkin.create", "checkin")
+    permission_svc.revoke(root, ambassador_permission)
+    assert (
+        PermissionService(session).check(ambassador, "checkin.create", "checkin")
+        is False
+    )
+
+
+def test_add_member_invalidates_index(
+    permission_svc: PermissionService, session: Session
+):
+    """Tests that adding a user to a role is reflected in checks of a cached index"""
+    assert permission_svc.check(user, "checkin.create", "checkin") is False
+    RoleService(session, permission_svc).add_member(root, ambassador_role.id, user)
+    assert permission_svc.check(user, "checkin.create", "checkin")
+    assert PermissionService(session).check(user, "checkin.create", "checkin")
+
+
+def test_pattern_cache_statistics():
+    """Tests that the pattern cache counts hits and misses and evicts beyond its bound"""
+    cache = PatternCache(maxsize=2)
+    a = cache.compile("^a.*$")
+    assert cache.compile("^a.*$") is a
+    cache.compile("^b$")
+    cache.compile("^c$")
+    assert cache.stats() == {"hits": 1, "misses": 3, "size": 2, "maxsize": 2}
+    cache.compile("^a.*$")
+    assert cache.stats()["misses"] == 4
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 2}
+
+
+def test_expand_pattern_does_not_retain_service(session: Session):
+    """Tests that compiling a pattern does not keep the PermissionService or its Session alive"""
+    svc = PermissionService(session)
+    assert svc._expand_pattern("checkin.*").fullmatch("checkin.create")
+    ref = weakref.ref(svc)
+    del svc
+    gc.collect()
+    assert ref() is None
+
+
+def test_pattern_cache_memory_is_flat_across_requests(session: Session):
+    """Tests that memory stays flat while simulating 100k requests, each with its own service"""
+    permission = Permission(action="coworking.reservation.*", resource="user/*")
+
+    def simulate(requests: int):
+        for i in range(requests):
+            svc = PermissionService(session)
+            assert svc._check_permission(
+                permission, "coworking.reservation.read", f"user/{i % 50}"
+            )
+
+    simulate(1_000)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        hits = pattern_cache.stats()["hits"]
+        simulate(100_000)
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert after - before < 64 * 1024
+    stats = pattern_cache.stats()
+    assert stats["hits"] - hits == 200_000
+    assert stats["size"] <= stats["maxsize"]
@@ -0,0 +1,90 @@
+"""Count the SQL statements issued on the test Session to pin query budgets.
+
+Correctness tests do not notice a service method that starts lazily loading a relationship
+per row. Tests that count statements do:
+
+    def test_list_queries_are_bounded(event_svc: EventService, query_budget: QueryBudget):
+        with query_budget(4):
+            event_svc.get_paginated_events(EventPaginationParams(), root)
+
+`count_statements` records the statements instead, for tests asserting on them directly.
+"""
+
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+SAVEPOINT_STATEMENTS = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+"""Statements of the savepoints the test Session commits and rolls back, which are not counted."""
+
+
+class StatementLog:
+    """Statements issued while counting, in order."""
+
+    def __init__(self):
+        self.statements: list[str] = []
+        self.executemany: list[str] = []
+        """Statements sent through executemany, which psycopg2 issues once per row."""
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    def __str__(self) -> str:
+        return "\n".join(f"{i}. {s}" for i, s in enumerate(self.statements, 1))
+
+
+@contextmanager
+def count_statements(session: Session) -> Iterator[StatementLog]:
+    """Record the statements issued on the connections of session's engine, other than those
+    of savepoints.
+
+    Args:
+        session (Session): The session whose engine to record.
+
+    Returns:
+        Iterator[StatementLog]: The log, complete once the block exits.
+    """
+    log = StatementLog()
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith(SAVEPOINT_STATEMENTS):
+            return
+        log.statements.append(statement)
+        if executemany:
+            log.executemany.append(statement)
+
+    bind = session.get_bind()
+    event.listen(bind, "before_cursor_execute", record)
+    try:
+        yield log
+    finally:
+        event.remove(bind, "before_cursor_execute", record)
+
+
+@contextmanager
+def within_budget(session: Session, budget: int) -> Iterator[StatementLog]:
+    """Fail unless the block issues at most budget statements on session's engine.
+
+    Args:
+        session (Session): The session whose engine to record.
+        budget (int): The maximum number of statements.
+
+    Returns:
+        Iterator[StatementLog]: The log, complete once the block exits.
+    """
+    with count_statements(session) as log:
+        yield log
+    assert (
+        len(log) <= budget
+    ), f"{len(log)} statements exceed the budget of {budget}:\n{log}"
+
+
+QueryBudget = Callable[[int], ContextManager[StatementLog]]
+"""The type of the `query_budget` fixture, `within_budget` bound to the test Session."""
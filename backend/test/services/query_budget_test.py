@@ -0,0 +1,108 @@
+"""Query budgets of the API's hottest service methods.
+
+Each test runs on the fake data and again on `scale_data`, which adds `SCALE` rows to every
+relationship the method loads. The budget is the same for both, so a method that starts loading
+a relationship per row, or whose statements otherwise grow with the data, fails here first.
+"""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from ...models import EventPaginationParams
+from ...services import ArticleService, EventService
+from ...services.academics import HiringService, SectionService
+from ...services.academics.course_site import CourseSiteService
+from ...services.async_bridge import build_service
+from ...services.coworking import StatusService
+from ...services.office_hours import OfficeHoursService
+
+# Injected Service Fixtures
+from .fixtures import article_svc, event_svc_integration, user_svc_integration
+from .academics.fixtures import permission_svc, section_svc, course_site_svc
+from .academics.hiring.fixtures import hiring_svc
+from .office_hours.fixtures import oh_svc
+from .query_budget import QueryBudget
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from .coworking.time import *
+from .core_data import setup_insert_data_fixture as insert_order_0
+from .room_data import fake_data_fixture as insert_order_1
+from .coworking.operating_hours_data import fake_data_fixture as insert_order_2
+from .coworking.seat_data import fake_data_fixture as insert_order_3
+from .coworking.reservation.reservation_data import fake_data_fixture as insert_order_4
+from .academics.term_data import fake_data_fixture as insert_order_5
+from .academics.course_data import fake_data_fixture as insert_order_6
+from .academics.section_data import fake_data_fixture as insert_order_7
+from .office_hours.office_hours_data import fake_data_fixture as insert_order_8
+from .academics.hiring.hiring_data import fake_data_fixture as insert_order_9
+
+# Test data
+from . import scale_data, user_data
+from .academics import term_data
+from .office_hours import office_hours_data
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+@pytest.fixture(params=["fake", "scaled"], autouse=True)
+def scale_data_fixture(request: pytest.FixtureRequest, session: Session):
+    """Runs each test on the fake data, then with the synthetic data of `scale_data` added.
+
+    Named to follow the `insert_order_N` fixtures, which autouse fixtures run in the order of.
+    """
+    if request.param == "scaled":
+        scale_data.insert_fake_data(session)
+    yield
+
+
+def test_get_paginated_events(
+    event_svc_integration: EventService, query_budget: QueryBudget
+):
+    """The length, the page with organizations, its organizers and the subject's registrations."""
+    with query_budget(4):
+        event_svc_integration.get_paginated_events(
+            EventPaginationParams(page_size=100), user_data.root
+        )
+
+
+def test_get_coworking_status(session: Session, query_budget: QueryBudget):
+    """Reservations with their users and seats, seats, availability and operating hours."""
+    status_svc = build_service(StatusService, session)
+    with query_budget(8):
+        status_svc.get_coworking_status(user_data.user)
+
+
+def test_get_office_hour_queue(oh_svc: OfficeHoursService, query_budget: QueryBudget):
+    """The memberships and queue version, then the event with its tickets and their people."""
+    with query_budget(2):
+        oh_svc.get_office_hour_queue(
+            user_data.instructor, office_hours_data.comp_110_current_office_hours.id
+        )
+
+
+def test_get_hiring_status(hiring_svc: HiringService, query_budget: QueryBudget):
+    """The reviews of a course site, created for new applications, with their applicants."""
+    with query_budget(9):
+        hiring_svc.get_status(user_data.instructor, office_hours_data.comp_110_site.id)
+
+
+def test_get_user_course_sites(
+    course_site_svc: CourseSiteService, query_budget: QueryBudget
+):
+    """The user's memberships with their sections, terms, courses and course sites."""
+    with query_budget(1):
+        course_site_svc.get_user_course_sites(user_data.student)
+
+
+def test_get_welcome_overview(article_svc: ArticleService, query_budget: QueryBudget):
+    """The shared fragments of the overview, then the user's reservations and events."""
+    with query_budget(6):
+        article_svc.get_welcome_overview(user_data.student)
+
+
+def test_get_sections_by_term(section_svc: SectionService, query_budget: QueryBudget):
+    """The term's sections with their members, rooms and courses."""
+    with query_budget(1):
+        section_svc.get_by_term(term_data.current_term.id)
@@ -0,0 +1,74 @@
+"""Tests for profiling the statements and time of requests by route."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ...request_profiler import ProfilingMiddleware, RequestProfiles
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+
+def profiled_client(session: Session, profiles: RequestProfiles) -> TestClient:
+    """A client of an app whose route issues one statement three times and another once."""
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, server_timing=True, profiles=profiles)
+
+    @app.get("/items/{id}")
+    def get_item(id: int) -> int:
+        for _ in range(3):
+            session.execute(text("SELECT 1"))
+        return session.execute(text("SELECT :id"), {"id": id}).scalar_one()
+
+    return TestClient(app)
+
+
+def test_profiles_statements_by_route(session: Session):
+    """Ensures statements are attributed to the route template of their request."""
+    profiles = RequestProfiles()
+    client = profiled_client(session, profiles)
+    session.execute(text("SELECT 1"))
+
+    assert client.get("/items/1").json() == 1
+    response = client.get("/items/2")
+
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert '"4 statements"' in response.headers["Server-Timing"]
+    [profile] = profiles.profiles()
+    assert profile.route == "GET /items/{id}"
+    assert profile.requests == 2
+    assert profile.statements == 8
+    assert profile.statements_max == 4
+    assert profile.duplicate_statements == 4
+    assert profile.handler_ms_max >= profile.db_ms_max > 0
+
+
+def test_profiles_report_repeated_statements(session: Session):
+    """Ensures statements repeated within a request are reported as N+1 signatures."""
+    profiles = RequestProfiles()
+    client = profiled_client(session, profiles)
+    client.get("/items/1")
+    client.get("/items/2")
+
+    [profile] = profiles.profiles()
+    [repeated] = profile.repeated_statements
+    assert repeated.statement == "SELECT 1"
+    assert repeated.requests == 2
+    assert repeated.max_per_request == 3
+
+
+def test_profiles_unmatched_requests(session: Session):
+    """Ensures requests that match no route share a single label."""
+    profiles = RequestProfiles()
+    client = profiled_client(session, profiles)
+    assert client.get("/missing").status_code == 404
+
+    [profile] = profiles.profiles()
+    assert profile.route == "GET (unmatched)"
+    assert profile.statements == 0
+
+    profiles.reset()
+    assert profiles.profiles() == []
@@ -0,0 +1,331 @@
+"""Synthetic data scaling up the fake data behind the API's hottest service methods.
+
+The fake data loads a handful of rows per relationship, too few to tell a method loading a
+relationship in one statement from one loading it per row. This data adds `SCALE` rows to each:
+events with their organizers and registrations, sections with their staff and course sites, the
+tickets of an office hours queue, applications to a course site, articles and coworking
+reservations. It is inserted with bulk `INSERT` statements, on top of the fake data of
+`core_data`, `academics`, `room_data`, `office_hours`, `hiring`, `articles` and `coworking`.
+"""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from ...entities import (
+    ArticleEntity,
+    EventEntity,
+    EventRegistrationEntity,
+    UserEntity,
+)
+from ...entities.academics import (
+    SectionEntity,
+    SectionMemberEntity,
+    SectionRoomEntity,
+)
+from ...entities.application_entity import ApplicationEntity
+from ...entities.article_author_entity import article_author_table
+from ...entities.coworking import ReservationEntity, reservation_seat_table
+from ...entities.coworking.reservation_user_table import reservation_user_table
+from ...entities.office_hours import (
+    CourseSiteEntity,
+    OfficeHoursTicketEntity,
+    user_created_tickets_table,
+)
+from ...entities.section_application_table import section_application_table
+from ...models.articles import ArticleState
+from ...models.coworking import ReservationState
+from ...models.office_hours.ticket_state import TicketState
+from ...models.office_hours.ticket_type import TicketType
+from ...models.registration_type import RegistrationType
+from ...models.roster_role import RosterRole
+from ...models.room_assignment_type import RoomAssignmentType
+
+from . import room_data, user_data
+from .academics import course_data, section_data, term_data
+from .coworking import seat_data
+from .office_hours import office_hours_data
+from .organization import organization_test_data
+
+__authors__ = ["agent"]
+__copyright__ = "Copyright 2026"
+__license__ = "MIT"
+
+SCALE = 50
+"""Rows added to each relationship of the fake data."""
+
+
+def insert_fake_data(session: Session):
+    """Inserts the synthetic data, after the fake data it builds on."""
+    now = datetime.now()
+    users = _insert_users(session, 4 * SCALE)
+    _insert_events(session, now, users[:SCALE])
+    _insert_sections(session, users[SCALE : 2 * SCALE])
+    _insert_tickets(session, now, users[2 * SCALE : 3 * SCALE])
+    _insert_applications(session, users[3 * SCALE :])
+    _insert_articles(session, now)
+    _insert_reservations(session, now, users[:SCALE])
+    session.commit()
+
+
+def _insert_users(session: Session, count: int) -> list[int]:
+    return list(
+        session.scalars(
+            insert(UserEntity).returning(UserEntity.id, sort_by_parameter_order=True),
+            [
+                {
+                    "pid": 900_000_000 + n,
+                    "onyen": f"scale{n}",
+                    "email": f"scale{n}@unc.edu",
+                    "first_name": "Scale",
+                    "last_name": f"User{n}",
+                }
+                for n in range(count)
+            ],
+        )
+    )
+
+
+def _insert_events(session: Session, now: datetime, organizers: list[int]):
+    """Events organized by one user each and attended by root and the other organizers."""
+    event_ids = session.scalars(
+        insert(EventEntity).returning(EventEntity.id, sort_by_parameter_order=True),
+        [
+            {
+                "name": f"Scale Event {n}",
+                "start": now + timedelta(days=1, hours=n),
+                "end": now + timedelta(days=1, hours=n + 1),
+                "location": "SN 014",
+                "description": "A synthetic event.",
+                "public": True,
+                "registration_limit": 2 * SCALE,
+                "registered_count": SCALE,
+                "organization_id": organization_test_data.cads.id,
+            }
+            for n in range(SCALE)
+        ],
+    ).all()
+    session.execute(
+        insert(EventRegistrationEntity),
+        [
+            {
+                "event_id": event_id,
+                "user_id": user_id,
+                "registration_type": (
+                    RegistrationType.ORGANIZER
+                    if user_id == organizer
+                    else RegistrationType.ATTENDEE
+                ),
+            }
+            for event_id, organizer in zip(event_ids, organizers)
+            for user_id in [user_data.root.id, *organizers]
+        ],
+    )
+
+
+def _insert_sections(session: Session, instructors: list[int]):
+    """Sections of the current term, each with its own course site and instructor, and the
+    student enrolled in all of them."""
+    site_ids = session.scalars(
+        insert(CourseSiteEntity).returning(
+            CourseSiteEntity.id, sort_by_parameter_order=True
+        ),
+        [
+            {"title": f"COMP 110 Scale {n}", "term_id": term_data.current_term.id}
+            for n in range(SCALE)
+        ],
+    ).all()
+    section_ids = session.scalars(
+        insert(SectionEntity).returning(SectionEntity.id, sort_by_parameter_order=True),
+        [
+            {
+                "course_id": course_data.comp_110.id,
+                "number": f"{100 + n}",
+                "term_id": term_data.current_term.id,
+                "meeting_pattern": "MWF 9:05AM - 9:55AM",
+                "course_site_id": site_id,
+                "enrolled": 1,
+                "total_seats": 100,
+            }
+            for n, site_id in enumerate(site_ids)
+        ],
+    ).all()
+    session.execute(
+        insert(SectionRoomEntity),
+        [
+            {
+                "section_id": section_id,
+                "room_id": room_data.group_b.id,
+                "assignment_type": RoomAssignmentType.LECTURE_ROOM,
+            }
+            for section_id in section_ids
+        ],
+    )
+    session.execute(
+        insert(SectionMemberEntity),
+        [
+            {"section_id": section_id, "user_id": user_id, "member_role": role}
+            for section_id, instructor in zip(section_ids, instructors)
+            for user_id, role in [
+                (instructor, RosterRole.INSTRUCTOR),
+                (user_data.student.id, RosterRole.STUDENT),
+            ]
+        ],
+    )
+
+
+def _insert_tickets(session: Session, now: datetime, students: list[int]):
+    """Tickets of the current COMP 110 office hours, one per new student, queued, called and
+    closed in turn by a new UTA."""
+    section_id = section_data.comp_110_001_current_term.id
+    caller_id = session.scalars(
+        insert(SectionMemberEntity).returning(SectionMemberEntity.id),
+        [
+            {
+                "section_id": section_id,
+                "user_id": students[0],
+                "member_role": RosterRole.UTA,
+            }
+        ],
+    ).one()
+    member_ids = session.scalars(
+        insert(SectionMemberEntity).returning(
+            SectionMemberEntity.id, sort_by_parameter_order=True
+        ),
+        [
+            {
+                "section_id": section_id,
+                "user_id": user_id,
+                "member_role": RosterRole.STUDENT,
+            }
+            for user_id in students[1:]
+        ],
+    ).all()
+    states = [TicketState.QUEUED, TicketState.CALLED, TicketState.CLOSED]
+    ticket_ids = session.scalars(
+        insert(OfficeHoursTicketEntity).returning(
+            OfficeHoursTicketEntity.id, sort_by_parameter_order=True
+        ),
+        [
+            {
+                "description": f"Synthetic ticket {n}",
+                "type": TicketType.ASSIGNMENT_HELP,
+                "state": states[n % 3],
+                "created_at": now - timedelta(minutes=n),
+                "called_at": now if states[n % 3] != TicketState.QUEUED else None,
+                "closed_at": (
+                    now + timedelta(minutes=5)
+                    if states[n % 3] == TicketState.CLOSED
+                    else None
+                ),
+                "office_hours_id": office_hours_data.comp_110_current_office_hours.id,
+                "caller_id": caller_id if states[n % 3] != TicketState.QUEUED else None,
+            }
+            for n in range(len(member_ids))
+        ],
+    ).all()
+    session.execute(
+        insert(user_created_tickets_table),
+        [
+            {"ticket_id": ticket_id, "member_id": member_id}
+            for ticket_id, member_id in zip(ticket_ids, member_ids)
+        ],
+    )
+
+
+def _insert_applications(session: Session, applicants: list[int]):
+    """New UTA applications of the current term preferring a COMP 110 section."""
+    application_ids = session.scalars(
+        insert(ApplicationEntity).returning(
+            ApplicationEntity.id, sort_by_parameter_order=True
+        ),
+        [
+            {
+                "user_id": user_id,
+                "term_id": term_data.current_term.id,
+                "type": "new_uta",
+            }
+            for user_id in applicants
+        ],
+    ).all()
+    session.execute(
+        insert(section_application_table),
+        [
+            {
+                "section_id": section_data.comp_110_001_current_term.id,
+                "application_id": application_id,
+                "preference": 0,
+            }
+            for application_id in application_ids
+        ],
+    )
+
+
+def _insert_articles(session: Session, now: datetime):
+    """Published articles authored by root."""
+    article_ids = session.scalars(
+        insert(ArticleEntity).returning(ArticleEntity.id, sort_by_parameter_order=True),
+        [
+            {
+                "slug": f"scale-article-{n}",
+                "state": ArticleState.PUBLISHED,
+                "title": f"Scale Article {n}",
+                "synopsis": "A synthetic article.",
+                "body": "",
+                "image_url": "",
+                "published": now - timedelta(days=n + 1),
+                "is_announcement": False,
+            }
+            for n in range(SCALE)
+        ],
+    ).all()
+    session.execute(
+        insert(article_author_table),
+        [
+            {"article_id": article_id, "user_id": user_data.root.id}
+            for article_id in article_ids
+        ],
+    )
+
+
+def _insert_reservations(session: Session, now: datetime, users: list[int]):
+    """Confirmed reservations of the coworking seats, one per user and as many of the user's."""
+    start = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    seats = seat_data.seats
+    reservations = [
+        (user_id, seats[n % len(seats)].id, start + timedelta(hours=n // len(seats)))
+        for n, user_id in enumerate(users)
+    ] + [
+        (user_data.user.id, seats[0].id, start + timedelta(days=1, hours=n))
+        for n in range(SCALE)
+    ]
+    reservation_ids = session.scalars(
+        insert(ReservationEntity).returning(
+            ReservationEntity.id, sort_by_parameter_order=True
+        ),
+        [
+            {
+                "start": reservation_start,
+                "end": reservation_start + timedelta(hours=1),
+                "state": ReservationState.CONFIRMED,
+                "walkin": False,
+                "room_id": None,
+            }
+            for _, _, reservation_start in reservations
+        ],
+    ).all()
+    session.execute(
+        insert(reservation_user_table),
+        [
+            {"reservation_id": reservation_id, "user_id": user_id}
+            for reservation_id, (user_id, _, _) in zip(reservation_ids, reservations)
+        ],
+    )
+    session.execute(
+        insert(reservation_seat_table),
+        [
+            {"reservation_id": reservation_id, "seat_id": seat_id}
+            for reservation_id, (_, seat_id, _) in zip(reservation_ids, reservations)
+        ],
+    )
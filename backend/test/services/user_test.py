@@ -3,10 +3,11 @@
 import pytest
 
 # Tested Dependencies
+from ...models import Permission
 from ...models.user import User, NewUser
 from ...models.pagination import PaginationParams
 from ...services import UserService, PermissionService
-from ...services.exceptions import ResourceNotFoundException
+from ...services.exceptions import InvalidCursorException, ResourceNotFoundException
 
 # Data Setup and Injected Service Fixtures
 from .core_data import setup_insert_data_fixture
@@ -98,6 +99,31 @@ def test_search_by_email(user_svc: UserService):
     assert users[0].email == ambassador.email
 
 
+def test_search_full_name(user_svc: UserService):
+    """Test that a user can be retrieved by searching for their full name."""
+    users = user_svc.search(ambassador, "Amy Amb")
+    assert [user.id for user in users] == [ambassador.id]
+
+
+def test_search_ranks_prefix_matches_first(user_svc: UserService):
+    """Test that users with a field starting with the query precede other matches."""
+
+    def rank(user: User) -> int:
+        fields = [user.first_name, user.last_name, user.onyen, user.email]
+        return 1 if any(field.lower().startswith("s") for field in fields) else 2
+
+    users = user_svc.search(ambassador, "s")
+    ranks = [rank(user) for user in users]
+    assert ranks == sorted(ranks)
+    assert ranks[0] == 1 and ranks[-1] == 2
+
+
+def test_search_wildcards_are_literal(user_svc: UserService):
+    """Test that LIKE wildcards in a query only match themselves."""
+    assert user_svc.search(ambassador, "%") == []
+    assert user_svc.search(ambassador, "_") == []
+
+
 def test_search_match_multiple(user_svc: UserService):
     """Test that many users result from an ambiguous search pattern."""
     users = user_svc.search(ambassador, "@unc.edu")
@@ -170,6 +196,53 @@ def test_list_filter(user_svc: UserService):
     assert users.items[0].id == ambassador.id
 
 
+def test_list_keyset(user_svc: UserService):
+    """Test that following cursors visits every user in order exactly once."""
+    pagination_params = PaginationParams(page_size=2, order_by="first_name", cursor="")
+    visited: list[User] = []
+    while pagination_params.cursor is not None:
+        users = user_svc.list(ambassador, pagination_params)
+        assert users.length == len(user_data.users)
+        visited.extend(users.items)
+        pagination_params = pagination_params.model_copy(
+            update={"cursor": users.next_cursor}
+        )
+
+    expected = sorted(user_data.users, key=lambda user: (user.first_name, user.id))
+    assert [user.id for user in visited] == [user.id for user in expected]
+
+
+def test_list_keyset_filter(user_svc: UserService):
+    """Test that keyset pages are filtered and end with no next cursor."""
+    pagination_params = PaginationParams(page_size=3, filter="amy", cursor="")
+    users = user_svc.list(ambassador, pagination_params)
+    assert [user.id for user in users.items] == [ambassador.id]
+    assert users.next_cursor is None
+
+
+def test_list_invalid_cursor(user_svc: UserService):
+    """Test that malformed cursors are rejected."""
+    pagination_params = PaginationParams(order_by="first_name", cursor="not-a-cursor")
+    with pytest.raises(InvalidCursorException):
+        user_svc.list(ambassador, pagination_params)
+
+
+def test_list_cached_length(user_svc: UserService):
+    """Test that lengths are served from a recent count unless an exact count is asked for."""
+    pagination_params = PaginationParams(page_size=2, count=False)
+    assert user_svc.list(ambassador, pagination_params).length == len(user_data.users)
+
+    user_svc.create(
+        root,
+        User(pid=123456789, onyen="keyset", email="keyset@unc.edu"),
+    )
+    assert user_svc.list(ambassador, pagination_params).length == len(user_data.users)
+
+    pagination_params.count = True
+    users = user_svc.list(ambassador, pagination_params)
+    assert users.length == len(user_data.users) + 1
+
+
 def test_list_enforces_permission(
     user_svc: UserService, permission_svc_mock: PermissionService
 ):
@@ -294,3 +367,48 @@ def test_update_profile_then_accept_community_agreement(user_svc: UserService):
     assert updated_user.accepted_community_agreement == False
     updated_user.accepted_community_agreement = True
     assert updated_user.accepted_community_agreement == True
+
+
+def test_get_cached(user_svc_integration: UserService):
+    """Test that a resolved user is served from the cache without querying again."""
+    user, avoided = user_svc_integration.get_cached(ambassador.pid)
+    assert user is not None and user.id == ambassador.id
+    assert avoided == 0
+
+    cached, avoided = user_svc_integration.get_cached(ambassador.pid)
+    assert cached == user
+    assert cached is not user
+    assert avoided >= 3
+
+
+def test_get_cached_not_found(user_svc_integration: UserService):
+    """Test that unknown PIDs are not cached."""
+    assert user_svc_integration.get_cached(423) == (None, 0)
+    assert user_svc_integration.get_cached(423) == (None, 0)
+
+
+def test_get_cached_invalidated_by_update(user_svc_integration: UserService):
+    """Test that updating a user invalidates their cached details."""
+    user_svc_integration.get_cached(user.pid)
+    updated = user_svc_integration.get_cached(user.pid)[0]
+    assert updated is not None
+    updated.first_name = "Updated"
+    user_svc_integration.update(root, updated)
+
+    cached, avoided = user_svc_integration.get_cached(user.pid)
+    assert cached is not None and cached.first_name == "Updated"
+    assert avoided == 0
+
+
+def test_get_cached_invalidated_by_grant(user_svc_integration: UserService):
+    """Test that granting a permission invalidates cached user details."""
+    user_svc_integration.get_cached(user.pid)
+    PermissionService(user_svc_integration._session).grant(
+        root, user, Permission(action="checkin.create", resource="checkin")
+    )
+    cached, avoided = user_svc_integration.get_cached(user.pid)
+    assert cached is not None
+    assert avoided == 0
+    assert [(p.action, p.resource) for p in cached.permissions] == [
+        ("checkin.create", "checkin")
+    ]
@@ -57,6 +57,7 @@ export const DEFAULT_TIME_RANGE_PARAMS = {
 export interface Paginated<T, ParamType> {
   items: T[];
   length: number;
+  next_cursor?: string | null;
   params: ParamType;
 }
 